@@ -41,6 +41,8 @@ CREATE INDEX idx_memory_blocks_type_state_visibility ON memory_blocks (type, sta
 
 CREATE INDEX idx_memory_blocks_namespace ON memory_blocks (namespace_id);
 
+CREATE INDEX idx_memory_blocks_namespace_type_created ON memory_blocks (namespace_id, type, created_at);
+
 CREATE TABLE IF NOT EXISTS block_links (
     to_id VARCHAR(255) NOT NULL,
     from_id VARCHAR(255) NOT NULL,
@@ -54,6 +56,12 @@ CREATE TABLE IF NOT EXISTS block_links (
 
 CREATE INDEX idx_block_links_to_id ON block_links (to_id);
 
+CREATE INDEX idx_block_links_from_keyset ON block_links (from_id, priority, created_at, to_id, relation);
+
+CREATE INDEX idx_block_links_to_keyset ON block_links (to_id, priority, created_at, from_id, relation);
+
+CREATE INDEX idx_block_links_keyset ON block_links (priority, created_at, from_id, to_id, relation);
+
 CREATE TABLE IF NOT EXISTS node_schemas (
     node_type VARCHAR(255) NOT NULL,
     schema_version INT NOT NULL,
@@ -75,6 +83,8 @@ CREATE TABLE IF NOT EXISTS block_properties (
     CONSTRAINT chk_at_most_one_value_nonnull CHECK ( (CASE WHEN property_value_text IS NOT NULL THEN 1 ELSE 0 END + CASE WHEN property_value_number IS NOT NULL THEN 1 ELSE 0 END + CASE WHEN property_value_json IS NOT NULL THEN 1 ELSE 0 END) <= 1 )
 );
 
+CREATE INDEX idx_block_properties_name_text ON block_properties (property_name, property_value_text(255));
+
 CREATE TABLE IF NOT EXISTS block_proofs (
     id INTEGER PRIMARY KEY AUTO_INCREMENT,
     block_id VARCHAR(255) NOT NULL,
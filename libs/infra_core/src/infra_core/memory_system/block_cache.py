@@ -0,0 +1,131 @@
+"""
+In-process read-through cache of hydrated MemoryBlock objects.
+
+Agent runs tend to re-read the same blocks many times (get_memory_block,
+semantic search hydration, link and graph traversal). Each read costs a
+branch checkout plus a memory_blocks and a block_properties query. This
+module keeps recently read blocks in a bounded LRU with a TTL.
+
+Entries are keyed by (branch, working-set hash, block_id). The working-set
+hash is Dolt's content address for the branch's working data, so any change
+to the branch - from this process or any other - moves lookups to a new key
+and stale entries simply age out. Local writes additionally invalidate the
+block explicitly.
+
+Cached blocks are deep-copied on the way in and out so callers can mutate
+the blocks they receive without corrupting the cache.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .schemas.memory_block import MemoryBlock
+
+logger = logging.getLogger(__name__)
+
+# Cache key: (branch, working-set hash, block_id)
+CacheKey = Tuple[str, str, str]
+
+
+class BlockCache:
+    """
+    Thread-safe LRU/TTL cache of MemoryBlock objects.
+
+    A max_size of 0 disables the cache: every get() misses and put() is a no-op.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 300.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[CacheKey, Tuple[float, MemoryBlock]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "invalidations": 0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.max_size > 0
+
+    def get(self, branch: str, state_hash: str, block_id: str) -> Optional[MemoryBlock]:
+        """Return a copy of the cached block, or None on a miss or expired entry."""
+        if not self.enabled:
+            return None
+        key = (branch, state_hash, block_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._metrics["misses"] += 1
+                return None
+            stored_at, block = entry
+            if self.ttl > 0 and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self._metrics["expirations"] += 1
+                self._metrics["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._metrics["hits"] += 1
+        return block.model_copy(deep=True)
+
+    def put(self, branch: str, state_hash: str, block: MemoryBlock) -> None:
+        """Store a copy of `block`, evicting the least recently used entries if full."""
+        if not self.enabled:
+            return
+        key = (branch, state_hash, block.id)
+        snapshot = block.model_copy(deep=True)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._metrics["evictions"] += 1
+
+    def invalidate(self, block_id: Optional[str] = None, branch: Optional[str] = None) -> int:
+        """
+        Drop cached entries.
+
+        Args:
+            block_id: Only drop entries for this block (on every branch unless `branch` is given)
+            branch: Only drop entries for this branch
+
+        Returns:
+            Number of entries removed. With neither argument, the whole cache is cleared.
+        """
+        with self._lock:
+            if block_id is None and branch is None:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                doomed = [
+                    key
+                    for key in self._entries
+                    if (block_id is None or key[2] == block_id)
+                    and (branch is None or key[0] == branch)
+                ]
+                for key in doomed:
+                    del self._entries[key]
+                removed = len(doomed)
+            self._metrics["invalidations"] += removed
+        if removed:
+            logger.debug(f"Invalidated {removed} cached blocks (block_id={block_id}, branch={branch})")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of cache size and hit/miss/eviction counters."""
+        with self._lock:
+            lookups = self._metrics["hits"] + self._metrics["misses"]
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hit_rate": (self._metrics["hits"] / lookups) if lookups else 0.0,
+                **self._metrics,
+            }
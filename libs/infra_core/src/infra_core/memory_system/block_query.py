@@ -0,0 +1,350 @@
+"""
+BlockQuery: composable filters for listing memory blocks.
+
+Block listing used to load every block on a branch and filter in Python. This
+module provides a fluent builder, in the spirit of LinkQuery, whose predicates
+compile to a single SQL statement over memory_blocks:
+
+- type / namespace filters become indexed equality predicates
+- tag filters become JSON_CONTAINS predicates on memory_blocks.tags
+- metadata filters become EXISTS lookups against block_properties, matching the
+  variant column PropertyMapper would have written the value to
+- ORDER BY / LIMIT are pushed down, with keyset pagination via opaque cursors
+  built from the last SQL row of a page (see BlockPage); NULL sort values are
+  paged explicitly, sorting before every value as MySQL orders them
+
+The same predicates can be evaluated in memory with BlockQuery.matches().
+"""
+
+import base64
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .schemas.memory_block import MemoryBlock
+
+# Columns that may be used for ORDER BY and keyset pagination
+SORTABLE_FIELDS = ("id", "created_at", "updated_at", "type", "namespace_id")
+
+
+def _encode_cursor(sort_value: Any, block_id: str) -> str:
+    """Encode the last row's sort key as an opaque, URL-safe cursor."""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    payload = json.dumps([sort_value, block_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Tuple[Any, str]:
+    """Decode a cursor produced by _encode_cursor."""
+    try:
+        sort_value, block_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except Exception:
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}")
+    if not isinstance(block_id, str):
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}")
+    return sort_value, block_id
+
+
+def _keyset_predicate(column: str, op: str, sort_value: Any, last_id: str) -> Tuple[str, List[Any]]:
+    """
+    Select rows after (sort_value, last_id) when ordering by a nullable column, then id.
+
+    NULLs sort before every value (first ascending, last descending), as in MySQL,
+    and are matched with IS NULL since a comparison against NULL is never true.
+    """
+    if sort_value is None:
+        if op == ">":
+            # Ascending: the rest of the NULL run, then every non-NULL value
+            return f"(({column} IS NULL AND mb.id > %s) OR {column} IS NOT NULL)", [last_id]
+        return f"({column} IS NULL AND mb.id < %s)", [last_id]
+    predicate = f"{column} {op} %s OR ({column} = %s AND mb.id {op} %s)"
+    if op == "<":
+        # Descending: NULL rows come after every value
+        predicate += f" OR {column} IS NULL"
+    return f"({predicate})", [sort_value, sort_value, last_id]
+
+
+def _metadata_predicate(key: str, value: Any) -> Tuple[str, List[Any]]:
+    """
+    Compile a metadata equality filter to a block_properties lookup.
+
+    Values are matched against the same variant column PropertyMapper uses
+    when decomposing metadata, so a filter matches exactly the blocks whose
+    composed metadata would compare equal to `value`.
+    """
+    lookup = "SELECT 1 FROM block_properties bp WHERE bp.block_id = mb.id AND bp.property_name = %s"
+
+    if value is None:
+        # Missing properties and properties stored with every variant NULL both compose to None
+        return (
+            f"NOT EXISTS ({lookup} AND (bp.property_value_text IS NOT NULL "
+            "OR bp.property_value_number IS NOT NULL OR bp.property_value_json IS NOT NULL))",
+            [key],
+        )
+    if isinstance(value, Enum):
+        return f"EXISTS ({lookup} AND bp.property_value_text = %s)", [key, str(value.value)]
+    if isinstance(value, bool):
+        return f"EXISTS ({lookup} AND bp.property_value_text = %s)", [
+            key,
+            "true" if value else "false",
+        ]
+    if isinstance(value, (int, float)):
+        return f"EXISTS ({lookup} AND bp.property_value_number = %s)", [key, float(value)]
+    if isinstance(value, datetime):
+        return f"EXISTS ({lookup} AND bp.property_value_text = %s)", [key, value.isoformat()]
+    if isinstance(value, (list, tuple, dict)):
+        return f"EXISTS ({lookup} AND bp.property_value_json = CAST(%s AS JSON))", [
+            key,
+            json.dumps(list(value) if isinstance(value, tuple) else value),
+        ]
+    return f"EXISTS ({lookup} AND bp.property_value_text = %s)", [key, str(value)]
+
+
+class BlockPage(NamedTuple):
+    """
+    One page of BlockQuery results.
+
+    Rows that fail to hydrate are dropped from `blocks`, so paging decisions use
+    `row_count` and `next_cursor`, which describe the SQL page itself.
+    """
+
+    blocks: List[MemoryBlock]
+    row_count: int
+    next_cursor: Optional[str] = None
+
+
+class BlockQuery:
+    """
+    Fluent builder for memory block listing queries.
+
+    Example:
+        query = (
+            BlockQuery()
+            .namespace("cogni-project-management")
+            .types(["task", "bug"])
+            .metadata({"status": "in_progress"})
+            .order_by("created_at", descending=True)
+            .limit(50)
+        )
+        sql, params = query.to_sql()
+    """
+
+    def __init__(self):
+        self._types: Optional[List[str]] = None
+        self._case_insensitive = False
+        self._namespace_id: Optional[str] = None
+        self._tags: Optional[List[str]] = None
+        self._match_all_tags = True
+        self._metadata: Dict[str, Any] = {}
+        self._order_field: Optional[str] = None
+        self._descending = False
+        self._limit: Optional[int] = None
+        self._cursor: Optional[str] = None
+
+    def type(self, block_type: str, case_insensitive: bool = False) -> "BlockQuery":
+        """Filter by a single block type."""
+        return self.types([block_type], case_insensitive=case_insensitive)
+
+    def types(self, block_types: List[str], case_insensitive: bool = False) -> "BlockQuery":
+        """Filter to blocks whose type is one of `block_types`."""
+        if not block_types:
+            raise ValueError("At least one block type is required")
+        self._types = list(block_types)
+        self._case_insensitive = case_insensitive
+        return self
+
+    def namespace(self, namespace_id: str) -> "BlockQuery":
+        """Filter by namespace ID."""
+        self._namespace_id = namespace_id
+        return self
+
+    def tags(self, tags: List[str], match_all: bool = True) -> "BlockQuery":
+        """Filter by tags; all must match unless match_all is False."""
+        self._tags = list(tags)
+        self._match_all_tags = match_all
+        return self
+
+    def metadata(self, filters: Dict[str, Any]) -> "BlockQuery":
+        """Filter by exact metadata values."""
+        self._metadata.update(filters)
+        return self
+
+    def order_by(self, field: str, descending: bool = False) -> "BlockQuery":
+        """
+        Order results by a memory_blocks column, with id as the tie-breaker.
+
+        Raises:
+            ValueError: If field is not one of SORTABLE_FIELDS
+        """
+        if field not in SORTABLE_FIELDS:
+            raise ValueError(f"Cannot order by '{field}'. Must be one of {SORTABLE_FIELDS}")
+        self._order_field = field
+        self._descending = descending
+        return self
+
+    def limit(self, limit: int) -> "BlockQuery":
+        """Set maximum number of results to return."""
+        if limit <= 0:
+            raise ValueError("Limit must be a positive integer")
+        self._limit = limit
+        return self
+
+    def after(self, cursor: Optional[str]) -> "BlockQuery":
+        """
+        Resume after the row identified by `cursor` (keyset pagination).
+
+        Args:
+            cursor: A value previously returned by next_cursor(), or None for the first page
+
+        Raises:
+            ValueError: If cursor is not a valid format
+        """
+        if cursor:
+            _decode_cursor(cursor)
+        self._cursor = cursor or None
+        return self
+
+    @property
+    def page_size(self) -> Optional[int]:
+        """The configured LIMIT, if any."""
+        return self._limit
+
+    def next_cursor(self, last_block: MemoryBlock) -> str:
+        """Build the cursor that continues after `last_block` under this query's ordering."""
+        field = self._order_field or "id"
+        return self.row_cursor({field: getattr(last_block, field), "id": last_block.id})
+
+    def row_cursor(self, row: Dict[str, Any]) -> str:
+        """Build the cursor that continues after a raw memory_blocks row."""
+        field = self._order_field or "id"
+        return _encode_cursor(row.get(field), row["id"])
+
+    def page(self, rows: List[Dict[str, Any]], blocks: List[MemoryBlock]) -> BlockPage:
+        """
+        Pair hydrated blocks with the SQL rows they were built from.
+
+        A page is full when the SQL query returned `limit` rows, even if some of
+        them could not be hydrated; the cursor then continues after the last row.
+        """
+        next_cursor = None
+        if self._limit and rows and len(rows) == self._limit:
+            next_cursor = self.row_cursor(rows[-1])
+        return BlockPage(blocks, len(rows), next_cursor)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert query to dictionary representation."""
+        result: Dict[str, Any] = {}
+        if self._types:
+            result["types"] = self._types
+            result["case_insensitive"] = self._case_insensitive
+        if self._namespace_id:
+            result["namespace_id"] = self._namespace_id
+        if self._tags:
+            result["tags"] = self._tags
+            result["match_all_tags"] = self._match_all_tags
+        if self._metadata:
+            result["metadata"] = dict(self._metadata)
+        if self._order_field:
+            result["order_by"] = self._order_field
+            result["descending"] = self._descending
+        if self._limit:
+            result["limit"] = self._limit
+        if self._cursor:
+            result["cursor"] = self._cursor
+        return result
+
+    def __str__(self) -> str:
+        """String representation of the query for debugging."""
+        parts = [f"{k}={v}" for k, v in self.to_dict().items()]
+        return f"BlockQuery({', '.join(parts)})"
+
+    def to_sql(self, columns: str = "mb.*") -> Tuple[str, List[Any]]:
+        """
+        Convert the query to a parameterized SQL statement.
+
+        Args:
+            columns: Column list for the SELECT clause (memory_blocks is aliased as mb)
+
+        Returns:
+            Tuple of (sql, params) for cursor.execute()
+        """
+        conditions: List[str] = []
+        params: List[Any] = []
+
+        if self._types:
+            placeholders = ",".join(["%s"] * len(self._types))
+            if self._case_insensitive:
+                conditions.append(f"LOWER(mb.type) IN ({placeholders})")
+                params.extend(t.lower() for t in self._types)
+            else:
+                conditions.append(f"mb.type IN ({placeholders})")
+                params.extend(self._types)
+
+        if self._namespace_id:
+            conditions.append("mb.namespace_id = %s")
+            params.append(self._namespace_id)
+
+        if self._tags:
+            joiner = " AND " if self._match_all_tags else " OR "
+            conditions.append(
+                "(" + joiner.join(["JSON_CONTAINS(mb.tags, %s)"] * len(self._tags)) + ")"
+            )
+            params.extend(json.dumps(tag) for tag in self._tags)
+
+        for key, value in self._metadata.items():
+            predicate, predicate_params = _metadata_predicate(key, value)
+            conditions.append(predicate)
+            params.extend(predicate_params)
+
+        order_field = self._order_field
+        if self._cursor or (self._limit and not order_field):
+            # Keyset pagination and stable LIMIT pages need a total order
+            order_field = order_field or "id"
+
+        if self._cursor:
+            sort_value, last_id = _decode_cursor(self._cursor)
+            op = "<" if self._descending else ">"
+            if order_field == "id":
+                conditions.append(f"mb.id {op} %s")
+                params.append(last_id)
+            else:
+                predicate, predicate_params = _keyset_predicate(
+                    f"mb.{order_field}", op, sort_value, last_id
+                )
+                conditions.append(predicate)
+                params.extend(predicate_params)
+
+        sql = f"SELECT {columns} FROM memory_blocks mb"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        if order_field:
+            direction = "DESC" if self._descending else "ASC"
+            sql += f" ORDER BY mb.{order_field} {direction}"
+            if order_field != "id":
+                sql += f", mb.id {direction}"
+        if self._limit:
+            sql += " LIMIT %s"
+            params.append(self._limit)
+
+        return sql, params
+
+    def matches(self, block: MemoryBlock) -> bool:
+        """Evaluate the filter predicates (not ordering or paging) against a block in memory."""
+        if self._types:
+            if self._case_insensitive:
+                if block.type.lower() not in {t.lower() for t in self._types}:
+                    return False
+            elif block.type not in self._types:
+                return False
+
+        if self._namespace_id and block.namespace_id != self._namespace_id:
+            return False
+
+        if self._tags:
+            check = all if self._match_all_tags else any
+            if not check(tag in block.tags for tag in self._tags):
+                return False
+
+        return all(block.metadata.get(k) == v for k, v in self._metadata.items())
@@ -0,0 +1,528 @@
+"""
+Branch-aware connection pooling for Dolt MySQL connections.
+
+DoltMySQLBase subclasses historically opened a new mysql.connector connection
+for every operation and then ran CALL DOLT_CHECKOUT on it. This module keeps a
+bounded set of connections per (host, port, user, database, kind) and remembers
+which Dolt branch each idle connection is checked out to, so that:
+
+- Borrowing a connection skips TCP + auth when an idle one is available
+- Borrowing for a branch prefers a connection already on that branch, which
+  skips the DOLT_CHECKOUT round trip entirely
+- Borrowing without a branch always runs statements on the default branch: a
+  reused connection left on another branch is checked back out before its first
+  statement, unless the borrower checks out a branch of its own first
+- Idle connections are health-checked cheaply on borrow and evicted after
+  an idle timeout; a connection whose statement failed is pinged on return
+  and discarded if it is dead, so reconnect logic never gets it back
+- The autocommit mode is read once when a connection is created; release only
+  rolls back or restores it when needed, without querying the server
+- Pool metrics are available for sizing via DoltConnectionPool.stats()
+
+Callers keep the existing get/close pattern: DoltMySQLBase._get_connection()
+returns a PooledConnection whose close() hands the connection back to the pool.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Pool key: (host, port, user, database, connection kind)
+PoolKey = Tuple[str, int, str, str, str]
+
+
+class ConnectionPoolExhaustedError(Exception):
+    """
+    Raised when no pooled connection becomes available within the acquire timeout.
+
+    This indicates the pool is undersized for the current concurrency, or that
+    connections are being leaked (borrowed and never closed).
+    """
+
+    def __init__(self, key: PoolKey, max_size: int, timeout: float):
+        self.key = key
+        self.max_size = max_size
+        self.timeout = timeout
+        super().__init__(
+            f"Connection pool for {key[3]}@{key[0]}:{key[1]} ({key[4]}) exhausted: "
+            f"all {max_size} connections in use after waiting {timeout:.1f}s"
+        )
+
+
+@dataclass
+class _PoolEntry:
+    """A raw connection plus the bookkeeping the pool needs about it."""
+
+    raw: Any
+    branch: Optional[str] = None
+    # Autocommit mode the factory created the connection with, and the current
+    # mode as changed by borrowers through PooledConnection.autocommit
+    initial_autocommit: bool = True
+    autocommit: bool = True
+    # Set when a statement failed while borrowed; the connection is pinged on release
+    suspect: bool = False
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class _TrackingCursor:
+    """
+    Cursor wrapper that invalidates the connection's tracked branch when a
+    statement may have switched branches behind the pool's back.
+    """
+
+    def __init__(self, cursor: Any, owner: "PooledConnection"):
+        self._cursor = cursor
+        self._owner = owner
+
+    def execute(self, operation, params=None, *args, **kwargs):
+        normalized = operation.lstrip().lower() if isinstance(operation, str) else ""
+        if "dolt_checkout" in normalized or normalized.startswith("use "):
+            self._owner.branch = None
+        elif self._owner._reset_pending:
+            self._owner._reset_branch()
+        try:
+            return self._cursor.execute(operation, params, *args, **kwargs)
+        except Exception:
+            self._owner._entry.suspect = True
+            raise
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._cursor.close()
+        return False
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class PooledConnection:
+    """
+    Proxy around a pooled mysql.connector connection.
+
+    Behaves like the underlying connection, except that close() returns it to
+    the pool instead of closing the socket, and the Dolt branch it is checked
+    out to is tracked in `branch`.
+
+    A connection borrowed without a branch may still be on the previous borrower's
+    branch; it is then checked out to the pool's default branch before its first
+    statement, unless that statement is itself a checkout or swap_to_branch()
+    claims the connection for the branch it is already on.
+    """
+
+    def __init__(self, pool: "DoltConnectionPool", entry: _PoolEntry, reset_branch: bool = False):
+        self._pool = pool
+        self._entry = entry
+        self._released = False
+        self._cursor_opened = False
+        self._reset_pending = reset_branch
+
+    @property
+    def branch(self) -> Optional[str]:
+        """Dolt branch this connection's statements run on, if known."""
+        if self._reset_pending:
+            return self._pool.default_branch
+        return self._entry.branch
+
+    @branch.setter
+    def branch(self, value: Optional[str]) -> None:
+        self._reset_pending = False
+        self._entry.branch = value
+
+    @property
+    def autocommit(self) -> bool:
+        """Autocommit mode of the connection, tracked without a server round trip."""
+        return self._entry.autocommit
+
+    @autocommit.setter
+    def autocommit(self, value: bool) -> None:
+        try:
+            self._entry.raw.autocommit = value
+        except Exception:
+            self._entry.suspect = True
+            raise
+        self._entry.autocommit = bool(value)
+
+    def cursor(self, *args, **kwargs):
+        self._cursor_opened = True
+        return _TrackingCursor(self._entry.raw.cursor(*args, **kwargs), self)
+
+    def _reset_branch(self) -> None:
+        """Check the connection out to the default branch before a branchless statement."""
+        try:
+            self._pool._checkout_default(self._entry)
+        except Exception:
+            self._entry.suspect = True
+            raise
+        self._reset_pending = False
+
+    def is_connected(self) -> bool:
+        try:
+            connected = bool(self._entry.raw.is_connected())
+        except Exception:
+            connected = False
+        if not connected:
+            self._entry.suspect = True
+        return connected
+
+    def commit(self) -> None:
+        try:
+            self._entry.raw.commit()
+        except Exception:
+            self._entry.suspect = True
+            raise
+
+    def swap_to_branch(self, branch: str) -> bool:
+        """
+        Exchange the underlying connection for an idle one already on `branch`.
+
+        Only possible before any cursor has been opened on this proxy, since
+        existing cursors are bound to the current raw connection.
+
+        Returns:
+            True if the proxy is now backed by a connection on `branch`.
+        """
+        if self._released or self._cursor_opened:
+            return False
+        if self._entry.branch == branch:
+            # Still on the previous borrower's branch, which is the one wanted
+            self._reset_pending = False
+            return True
+        replacement = self._pool._exchange(self._entry, branch)
+        if replacement is None:
+            return False
+        self._entry = replacement
+        self._reset_pending = False
+        return True
+
+    def close(self) -> None:
+        """Return the connection to the pool (idempotent)."""
+        if self._released:
+            return
+        self._released = True
+        self._pool._release(self._entry)
+
+    def __getattr__(self, name):
+        return getattr(self._entry.raw, name)
+
+
+class DoltConnectionPool:
+    """
+    Bounded, branch-aware pool of connections for a single pool key.
+
+    Connections are created lazily by `factory` up to `max_size`. Borrowers
+    block for up to `acquire_timeout` seconds when the pool is exhausted.
+    When `default_branch` is set, branchless borrows never run on another branch.
+    """
+
+    def __init__(
+        self,
+        key: PoolKey,
+        factory: Callable[[], Any],
+        max_size: int = 8,
+        idle_timeout: float = 300.0,
+        validation_interval: float = 1.0,
+        acquire_timeout: float = 10.0,
+        default_branch: Optional[str] = None,
+    ):
+        self.key = key
+        self._factory = factory
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.validation_interval = validation_interval
+        self.acquire_timeout = acquire_timeout
+        self.default_branch = default_branch
+
+        self._idle: List[_PoolEntry] = []
+        self._in_use = 0
+        self._cond = threading.Condition()
+        self._metrics: Dict[str, int] = {
+            "created": 0,
+            "reused": 0,
+            "branch_hits": 0,
+            "branch_swaps": 0,
+            "branch_resets": 0,
+            "health_check_failures": 0,
+            "evicted_idle": 0,
+            "discarded": 0,
+            "waits": 0,
+            "timeouts": 0,
+        }
+
+    # --- Public API ---
+
+    def acquire(self, branch: Optional[str] = None) -> PooledConnection:
+        """
+        Borrow a connection, preferring one already checked out to `branch`.
+
+        Without a `branch`, one on the default branch is preferred; any other reused
+        connection is reset to the default branch before its first statement.
+
+        Raises:
+            ConnectionPoolExhaustedError: If no connection frees up in time.
+        """
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            entry, expired = self._reserve(branch, deadline)
+            # Network calls (close, ping) happen outside the lock
+            for stale in expired:
+                self._close_raw(stale)
+            if entry is None or self._is_healthy(entry):
+                break
+            with self._cond:
+                self._metrics["health_check_failures"] += 1
+                self._in_use -= 1
+                self._cond.notify()
+            self._close_raw(entry)
+
+        # A new connection starts on the database's default branch; a reused one
+        # may have been left on another branch by its previous borrower
+        reset_branch = False
+        if entry is None:
+            # Create outside the lock; connecting is the slow part
+            try:
+                raw = self._factory()
+            except Exception:
+                with self._cond:
+                    self._in_use -= 1
+                    self._cond.notify()
+                raise
+            # Read once here; on mysql.connector this property queries the server
+            autocommit = bool(getattr(raw, "autocommit", True))
+            entry = _PoolEntry(raw=raw, initial_autocommit=autocommit, autocommit=autocommit)
+            with self._cond:
+                self._metrics["created"] += 1
+        else:
+            with self._cond:
+                self._metrics["reused"] += 1
+                if branch is not None and entry.branch == branch:
+                    self._metrics["branch_hits"] += 1
+            if branch is None and self.default_branch is not None:
+                reset_branch = entry.branch != self.default_branch
+
+        entry.last_used = time.monotonic()
+        return PooledConnection(self, entry, reset_branch=reset_branch)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of pool sizing and usage counters."""
+        with self._cond:
+            branches: Dict[str, int] = {}
+            for entry in self._idle:
+                name = entry.branch or "(unknown)"
+                branches[name] = branches.get(name, 0) + 1
+            return {
+                "host": self.key[0],
+                "port": self.key[1],
+                "database": self.key[3],
+                "kind": self.key[4],
+                "max_size": self.max_size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "idle_by_branch": branches,
+                **self._metrics,
+            }
+
+    def close_all(self) -> None:
+        """Close every idle connection. Borrowed connections are closed on return."""
+        with self._cond:
+            idle, self._idle = self._idle, []
+        for entry in idle:
+            self._close_raw(entry)
+
+    # --- Internals (called by PooledConnection) ---
+
+    def _reserve(
+        self, branch: Optional[str], deadline: float
+    ) -> Tuple[Optional[_PoolEntry], List[_PoolEntry]]:
+        """
+        Claim an idle entry (or a slot to create one, returned as None) under the lock.
+
+        Returns the claimed entry, still unvalidated, plus expired idle entries the
+        caller must close once the lock is released.
+        """
+        expired: List[_PoolEntry] = []
+        with self._cond:
+            while True:
+                expired.extend(self._pop_expired_locked())
+                entry = self._pop_idle_locked(branch)
+                if entry is not None:
+                    return entry, expired
+                if self._in_use + len(self._idle) < self.max_size:
+                    self._in_use += 1
+                    return None, expired
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._metrics["timeouts"] += 1
+                    break
+                self._metrics["waits"] += 1
+                self._cond.wait(remaining)
+
+        for stale in expired:
+            self._close_raw(stale)
+        raise ConnectionPoolExhaustedError(self.key, self.max_size, self.acquire_timeout)
+
+    def _release(self, entry: _PoolEntry) -> None:
+        reusable = True
+        try:
+            # A statement failed while borrowed: make sure the connection survived it
+            if entry.suspect and not entry.raw.is_connected():
+                logger.debug("Discarding pooled connection that died while in use")
+                reusable = False
+            else:
+                # Discard any uncommitted transaction, matching close() semantics
+                if not entry.autocommit:
+                    entry.raw.rollback()
+                # Undo a borrower's autocommit change before the next borrow
+                if entry.autocommit != entry.initial_autocommit:
+                    entry.raw.autocommit = entry.initial_autocommit
+                    entry.autocommit = entry.initial_autocommit
+        except Exception as e:
+            logger.debug(f"Discarding pooled connection that failed validation on release: {e}")
+            reusable = False
+        entry.suspect = False
+
+        with self._cond:
+            self._in_use -= 1
+            if reusable:
+                entry.last_used = time.monotonic()
+                self._idle.append(entry)
+            else:
+                self._metrics["discarded"] += 1
+            self._cond.notify()
+
+        if not reusable:
+            self._close_raw(entry)
+
+    def _exchange(self, entry: _PoolEntry, branch: str) -> Optional[_PoolEntry]:
+        """Swap a borrowed entry for an idle one on `branch`, if one is available."""
+        with self._cond:
+            for i in range(len(self._idle) - 1, -1, -1):
+                if self._idle[i].branch == branch:
+                    candidate = self._idle.pop(i)
+                    break
+            else:
+                return None
+
+        if not self._is_healthy(candidate):
+            with self._cond:
+                self._metrics["health_check_failures"] += 1
+            self._close_raw(candidate)
+            return None
+
+        with self._cond:
+            entry.last_used = time.monotonic()
+            self._idle.append(entry)
+            self._metrics["branch_swaps"] += 1
+            self._cond.notify()
+        candidate.last_used = time.monotonic()
+        return candidate
+
+    def _pop_idle_locked(self, branch: Optional[str]) -> Optional[_PoolEntry]:
+        """Take an idle entry (most recently used first), preferring `branch` or the default."""
+        if not self._idle:
+            return None
+        index = len(self._idle) - 1
+        preferred = branch if branch is not None else self.default_branch
+        if preferred is not None:
+            for i in range(len(self._idle) - 1, -1, -1):
+                if self._idle[i].branch == preferred:
+                    index = i
+                    break
+        self._in_use += 1
+        return self._idle.pop(index)
+
+    def _pop_expired_locked(self) -> List[_PoolEntry]:
+        """Remove idle entries past the idle timeout; the caller closes them unlocked."""
+        if self.idle_timeout <= 0:
+            return []
+        cutoff = time.monotonic() - self.idle_timeout
+        expired = [entry for entry in self._idle if entry.last_used < cutoff]
+        if expired:
+            self._idle = [entry for entry in self._idle if entry.last_used >= cutoff]
+            self._metrics["evicted_idle"] += len(expired)
+        return expired
+
+    def _is_healthy(self, entry: _PoolEntry) -> bool:
+        """Ping connections that have been idle longer than the validation interval."""
+        if time.monotonic() - entry.last_used < self.validation_interval:
+            return True
+        try:
+            return bool(entry.raw.is_connected())
+        except Exception:
+            return False
+
+    def _checkout_default(self, entry: _PoolEntry) -> None:
+        """Check a borrowed entry's raw connection out to the default branch."""
+        cursor = entry.raw.cursor()
+        try:
+            cursor.execute("CALL DOLT_CHECKOUT(%s)", (self.default_branch,))
+            cursor.fetchall()
+        finally:
+            cursor.close()
+        entry.branch = self.default_branch
+        with self._cond:
+            self._metrics["branch_resets"] += 1
+
+    @staticmethod
+    def _close_raw(entry: _PoolEntry) -> None:
+        try:
+            entry.raw.close()
+        except Exception:
+            pass
+
+
+# Process-wide registry so readers, writers and link managers sharing a
+# DoltConnectionConfig also share connections.
+_POOLS: Dict[PoolKey, DoltConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(
+    key: PoolKey,
+    factory: Callable[[], Any],
+    max_size: int,
+    idle_timeout: float,
+    default_branch: Optional[str] = None,
+) -> DoltConnectionPool:
+    """Return the shared pool for `key`, creating it on first use."""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = DoltConnectionPool(
+                key,
+                factory,
+                max_size=max_size,
+                idle_timeout=idle_timeout,
+                default_branch=default_branch,
+            )
+            _POOLS[key] = pool
+            logger.info(
+                f"Created Dolt connection pool for {key[3]}@{key[0]}:{key[1]} "
+                f"({key[4]}, max_size={max_size})"
+            )
+        return pool
+
+
+def get_all_pool_stats() -> List[Dict[str, Any]]:
+    """Return stats for every pool in this process."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+    return [pool.stats() for pool in pools]
+
+
+def close_all_pools() -> None:
+    """Close idle connections in every pool and forget the pools."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close_all()
@@ -14,16 +14,25 @@ Environment Variables (used by DoltConnectionConfig):
 - MYSQL_USER / DB_USER: Database user (default: root)
 - MYSQL_PASSWORD / DB_PASSWORD: Database password (default: empty)
 - MYSQL_DATABASE / DB_NAME: Database name (default: memory_dolt)
+- DOLT_POOL_SIZE: Max pooled connections per database and connection kind (default: 0, pooling off)
+- DOLT_POOL_IDLE_TIMEOUT: Seconds before idle pooled connections are closed (default: 300)
 """
 
 import logging
 import os
+import threading
 from dataclasses import dataclass, field
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 import mysql.connector
 from mysql.connector import Error, OperationalError, InterfaceError, DatabaseError
 
+from infra_core.memory_system.connection_pool import (
+    DoltConnectionPool,
+    PooledConnection,
+    get_pool,
+)
+
 # Setup standard Python logger
 logger = logging.getLogger(__name__)
 
@@ -82,6 +91,8 @@ class DoltConnectionConfig:
     - MYSQL_USER / DB_USER -> user
     - MYSQL_PASSWORD / DB_PASSWORD -> password
     - MYSQL_DATABASE / DB_NAME -> database
+    - DOLT_POOL_SIZE -> pool_size (0 disables pooling)
+    - DOLT_POOL_IDLE_TIMEOUT -> pool_idle_timeout
     """
 
     host: str = field(
@@ -99,11 +110,16 @@ class DoltConnectionConfig:
     database: str = field(
         default_factory=lambda: os.getenv("MYSQL_DATABASE") or os.getenv("DB_NAME", "memory_dolt")
     )
+    pool_size: int = field(default_factory=lambda: int(os.getenv("DOLT_POOL_SIZE", "0")))
+    pool_idle_timeout: float = field(
+        default_factory=lambda: float(os.getenv("DOLT_POOL_IDLE_TIMEOUT", "300"))
+    )
 
     def __post_init__(self):
         """Log connection configuration for debugging."""
         logger.info(
-            f"DoltConnectionConfig: host={self.host}, port={self.port}, user={self.user}, database={self.database}"
+            f"DoltConnectionConfig: host={self.host}, port={self.port}, user={self.user}, "
+            f"database={self.database}, pool_size={self.pool_size}"
         )
 
 
@@ -113,13 +129,26 @@ class DoltMySQLBase:
 
     Provides common functionality for connecting to Dolt SQL server via MySQL connector,
     including persistent connection support and configurable branch write protection.
+
+    When config.pool_size > 0, _get_connection() borrows from a shared, branch-aware
+    connection pool and close() returns the connection to it. Subclasses customize
+    connection settings by overriding _create_connection(); _connection_kind keeps
+    connections with different settings (e.g. autocommit) in separate pools.
+
+    A persistent connection is shared by every thread using the instance (e.g. tools
+    run concurrently against one session's memory bank), so operations hold
+    _persistent_lock while they use it; per-operation connections need no lock.
     """
 
+    _connection_kind = "default"
+
     def __init__(self, config: DoltConnectionConfig):
         self.config = config
         self._persistent_connection = None
         self._current_branch = None
         self._use_persistent = False
+        # Serializes use of the persistent connection (re-entrant: active_branch, reconnection)
+        self._persistent_lock = threading.RLock()
 
     def _is_branch_protected(self, branch: str) -> bool:
         """
@@ -172,8 +201,43 @@ class DoltMySQLBase:
 
         self._check_branch_protection(operation, effective_branch)
 
+    def _get_pool(self) -> Optional[DoltConnectionPool]:
+        """Return the shared pool for this config and connection kind, or None if pooling is off."""
+        if self.config.pool_size <= 0:
+            return None
+        key = (
+            self.config.host,
+            self.config.port,
+            self.config.user,
+            self.config.database,
+            self._connection_kind,
+        )
+        return get_pool(
+            key,
+            self._create_connection,
+            max_size=self.config.pool_size,
+            idle_timeout=self.config.pool_idle_timeout,
+            default_branch=DEFAULT_PROTECTED_BRANCH,
+        )
+
+    def pool_stats(self) -> Optional[Dict[str, Any]]:
+        """Return connection pool metrics for this instance's pool, or None if pooling is off."""
+        pool = self._get_pool()
+        return pool.stats() if pool else None
+
     def _get_connection(self):
-        """Get a new MySQL connection to the Dolt SQL server.
+        """Get a MySQL connection to the Dolt SQL server.
+
+        Borrows from the connection pool when pooling is enabled, otherwise opens a
+        new connection. Either way, callers release it with connection.close().
+        """
+        pool = self._get_pool()
+        if pool is not None:
+            return pool.acquire()
+        return self._create_connection()
+
+    def _create_connection(self):
+        """Open a new MySQL connection to the Dolt SQL server.
 
         This base implementation uses autocommit=True. Subclasses can override
         this method to use different connection settings.
@@ -196,7 +260,15 @@ class DoltMySQLBase:
             raise Exception(f"Failed to connect to Dolt SQL server: {e}")
 
     def _ensure_branch(self, connection: mysql.connector.MySQLConnection, branch: str) -> None:
-        """Ensure we're on the specified branch."""
+        """Ensure we're on the specified branch.
+
+        Pooled connections remember their checked-out branch, so the checkout is
+        skipped when the connection (or an idle one it can be swapped for) is
+        already on the target branch.
+        """
+        if isinstance(connection, PooledConnection):
+            if connection.branch == branch or connection.swap_to_branch(branch):
+                return
         try:
             cursor = connection.cursor(dictionary=True)
             cursor.execute("CALL DOLT_CHECKOUT(%s)", (branch,))
@@ -205,6 +277,8 @@ class DoltMySQLBase:
             cursor.close()
         except Error as e:
             raise Exception(f"Failed to checkout branch '{branch}': {e}")
+        if isinstance(connection, PooledConnection):
+            connection.branch = branch
 
     def _verify_current_branch(self, connection: mysql.connector.MySQLConnection) -> str:
         """
@@ -261,6 +335,62 @@ class DoltMySQLBase:
             logger.debug(f"Connection health check failed: {e}")
             return False
 
+    def _acquire_connection(self) -> Tuple[Any, bool]:
+        """
+        Get the connection for one operation.
+
+        Returns the persistent connection, held exclusively until _release_connection(),
+        when persistent mode is active; otherwise a new per-operation connection.
+
+        Returns:
+            Tuple of (connection, connection_is_persistent)
+        """
+        if self._use_persistent and self._persistent_connection:
+            self._persistent_lock.acquire()
+            # Re-check: another thread may have closed it while we waited
+            if self._use_persistent and self._persistent_connection:
+                return self._persistent_connection, True
+            self._persistent_lock.release()
+        return self._get_operation_connection(), False
+
+    def _get_operation_connection(self):
+        """
+        Get a per-operation connection on the branch this instance works on.
+
+        Pooled connections come back on the default branch; if a persistent branch
+        is set (persistent mode, connection unavailable), it is checked out so the
+        operation does not silently run against the default branch instead.
+        """
+        connection = self._get_connection()
+        if self._current_branch:
+            try:
+                self._ensure_branch(connection, self._current_branch)
+            except Exception:
+                connection.close()
+                raise
+        return connection
+
+    def _release_connection(self, connection, connection_is_persistent: bool) -> None:
+        """Release a connection from _acquire_connection() (per-operation ones are closed)."""
+        if connection_is_persistent:
+            self._persistent_lock.release()
+        else:
+            connection.close()
+
+    def _acquire_healthy_connection(self) -> Tuple[Any, bool]:
+        """_acquire_connection(), falling back to a new connection if the persistent one is down."""
+        connection, connection_is_persistent = self._acquire_connection()
+        # FIX: Check connection health before use to prevent "MySQL Connection not available" errors
+        if connection_is_persistent and not self._is_connection_healthy(connection):
+            logger.warning(
+                "Persistent connection unhealthy, creating new connection for this operation"
+            )
+            # Don't reset persistent connection state - let retry logic handle reconnection
+            # Just use a new connection for this specific operation
+            self._release_connection(connection, connection_is_persistent)
+            connection, connection_is_persistent = self._get_operation_connection(), False
+        return connection, connection_is_persistent
+
     def use_persistent_connection(self, branch: str = DEFAULT_PROTECTED_BRANCH) -> None:
         """
         Enable persistent connection mode and checkout the specified branch.
@@ -271,54 +401,57 @@ class DoltMySQLBase:
         Args:
             branch: Branch to checkout and maintain for all subsequent operations
         """
-        if self._persistent_connection:
-            logger.warning("Persistent connection already active, closing previous connection")
-            self.close_persistent_connection()
-
-        try:
-            # Create persistent connection
-            self._persistent_connection = self._get_connection()
-
-            # Checkout the specified branch
-            self._ensure_branch(self._persistent_connection, branch)
+        with self._persistent_lock:
+            if self._persistent_connection:
+                logger.warning("Persistent connection already active, closing previous connection")
+                self.close_persistent_connection()
 
-            # Verify the actual branch state according to Dolt session behavior
-            actual_branch = self._verify_current_branch(self._persistent_connection)
-            self._current_branch = actual_branch
-            self._use_persistent = True
+            try:
+                # Create persistent connection
+                self._persistent_connection = self._get_connection()
 
-            logger.info(
-                f"Persistent connection established on branch '{actual_branch}' (requested: '{branch}')"
-            )
+                # Checkout the specified branch
+                self._ensure_branch(self._persistent_connection, branch)
 
-        except Exception as e:
-            # Cleanup on failure
-            if self._persistent_connection:
-                try:
-                    self._persistent_connection.close()
-                except Exception:
-                    pass
-            self._persistent_connection = None
-            self._current_branch = None
-            self._use_persistent = False
-            raise Exception(f"Failed to establish persistent connection: {e}")
+                # Verify the actual branch state according to Dolt session behavior
+                actual_branch = self._verify_current_branch(self._persistent_connection)
+                self._current_branch = actual_branch
+                self._use_persistent = True
 
-    def close_persistent_connection(self) -> None:
-        """
-        Close the persistent connection and return to per-operation connection mode.
-        """
-        if self._persistent_connection:
-            try:
-                self._persistent_connection.close()
                 logger.info(
-                    f"Closed persistent connection (was on branch '{self._current_branch}')"
+                    f"Persistent connection established on branch '{actual_branch}' "
+                    f"(requested: '{branch}')"
                 )
+
             except Exception as e:
-                logger.warning(f"Error closing persistent connection: {e}")
-            finally:
+                # Cleanup on failure
+                if self._persistent_connection:
+                    try:
+                        self._persistent_connection.close()
+                    except Exception:
+                        pass
                 self._persistent_connection = None
                 self._current_branch = None
                 self._use_persistent = False
+                raise Exception(f"Failed to establish persistent connection: {e}")
+
+    def close_persistent_connection(self) -> None:
+        """
+        Close the persistent connection and return to per-operation connection mode.
+        """
+        with self._persistent_lock:
+            if self._persistent_connection:
+                try:
+                    self._persistent_connection.close()
+                    logger.info(
+                        f"Closed persistent connection (was on branch '{self._current_branch}')"
+                    )
+                except Exception as e:
+                    logger.warning(f"Error closing persistent connection: {e}")
+                finally:
+                    self._persistent_connection = None
+                    self._current_branch = None
+                    self._use_persistent = False
 
     def _ensure_branch_and_check_protection(
         self, connection: mysql.connector.MySQLConnection, operation: str, target_branch: str
@@ -411,54 +544,57 @@ class DoltMySQLBase:
                 logger.error(f"❌ Regular connection validation failed: {e}")
                 return False
 
-        logger.warning("🔄 Attempting to reconnect persistent connection...")
+        with self._persistent_lock:
+            logger.warning("🔄 Attempting to reconnect persistent connection...")
 
-        try:
-            # Close the old connection if it exists
-            if self._persistent_connection:
-                try:
-                    self._persistent_connection.close()
-                except Exception:
-                    pass  # Ignore errors when closing broken connection
+            try:
+                # Close the old connection if it exists
+                if self._persistent_connection:
+                    try:
+                        self._persistent_connection.close()
+                    except Exception:
+                        pass  # Ignore errors when closing broken connection
 
-            # Create new persistent connection
-            self._persistent_connection = self._get_connection()
+                # Create new persistent connection
+                self._persistent_connection = self._get_connection()
 
-            # Restore the branch state if we had one
-            if self._current_branch:
-                self._ensure_branch(self._persistent_connection, self._current_branch)
+                # Restore the branch state if we had one
+                if self._current_branch:
+                    self._ensure_branch(self._persistent_connection, self._current_branch)
 
-                # Verify the branch was restored correctly
-                actual_branch = self._verify_current_branch(self._persistent_connection)
-                if actual_branch != self._current_branch:
-                    logger.error(
-                        f"Branch mismatch after reconnection: expected '{self._current_branch}', got '{actual_branch}'"
-                    )
-                    raise BranchConsistencyError(self._current_branch, actual_branch)
+                    # Verify the branch was restored correctly
+                    actual_branch = self._verify_current_branch(self._persistent_connection)
+                    if actual_branch != self._current_branch:
+                        logger.error(
+                            f"Branch mismatch after reconnection: expected "
+                            f"'{self._current_branch}', got '{actual_branch}'"
+                        )
+                        raise BranchConsistencyError(self._current_branch, actual_branch)
 
-            logger.info(
-                f"✅ Persistent connection reconnected successfully on branch '{self._current_branch}'"
-            )
-            return True
+                logger.info(
+                    f"✅ Persistent connection reconnected successfully on branch "
+                    f"'{self._current_branch}'"
+                )
+                return True
 
-        except DatabaseError as e:
-            logger.error(f"❌ Database error during reconnection: {e}")
-            # Reset persistent connection state on failure
-            self._persistent_connection = None
-            self._current_branch = None
-            self._use_persistent = False
-            return False
-        except BranchConsistencyError:
-            # Let branch consistency errors bubble up to enforce strict branch consistency
-            raise
-        except Exception as e:
-            # Log unexpected non-database errors separately for troubleshooting
-            logger.error(f"❌ Unexpected error during reconnection: {type(e).__name__}: {e}")
-            # Reset persistent connection state on failure
-            self._persistent_connection = None
-            self._current_branch = None
-            self._use_persistent = False
-            return False
+            except DatabaseError as e:
+                logger.error(f"❌ Database error during reconnection: {e}")
+                # Reset persistent connection state on failure
+                self._persistent_connection = None
+                self._current_branch = None
+                self._use_persistent = False
+                return False
+            except BranchConsistencyError:
+                # Let branch consistency errors bubble up to enforce strict branch consistency
+                raise
+            except Exception as e:
+                # Log unexpected non-database errors separately for troubleshooting
+                logger.error(f"❌ Unexpected error during reconnection: {type(e).__name__}: {e}")
+                # Reset persistent connection state on failure
+                self._persistent_connection = None
+                self._current_branch = None
+                self._use_persistent = False
+                return False
 
     def _execute_with_retry(self, operation_func, query: str, params: tuple = None):
         """
@@ -517,22 +653,7 @@ class DoltMySQLBase:
     def _execute_query_impl(self, query: str, params: tuple = None) -> List[Dict[str, Any]]:
         """Implementation of query execution (without retry logic)."""
         # Use persistent connection if available, otherwise create new one
-        if self._use_persistent and self._persistent_connection:
-            # FIX: Check connection health before use to prevent "MySQL Connection not available" errors
-            if not self._is_connection_healthy(self._persistent_connection):
-                logger.warning(
-                    "Persistent connection unhealthy, creating new connection for this operation"
-                )
-                # Don't reset persistent connection state - let retry logic handle reconnection
-                # Just use a new connection for this specific operation
-                connection = self._get_connection()
-                connection_is_persistent = False
-            else:
-                connection = self._persistent_connection
-                connection_is_persistent = True
-        else:
-            connection = self._get_connection()
-            connection_is_persistent = False
+        connection, connection_is_persistent = self._acquire_healthy_connection()
 
         try:
             cursor = connection.cursor(dictionary=True)
@@ -546,9 +667,7 @@ class DoltMySQLBase:
             # OperationalError("MySQL Connection not available") properly
             raise e
         finally:
-            # Only close if it's not a persistent connection
-            if not connection_is_persistent:
-                connection.close()
+            self._release_connection(connection, connection_is_persistent)
 
     def _execute_update(self, query: str, params: tuple = None) -> int:
         """Execute an update/insert/delete query and return affected rows."""
@@ -557,22 +676,7 @@ class DoltMySQLBase:
     def _execute_update_impl(self, query: str, params: tuple = None) -> int:
         """Implementation of update execution (without retry logic)."""
         # Use persistent connection if available, otherwise create new one
-        if self._use_persistent and self._persistent_connection:
-            # FIX: Check connection health before use to prevent "MySQL Connection not available" errors
-            if not self._is_connection_healthy(self._persistent_connection):
-                logger.warning(
-                    "Persistent connection unhealthy, creating new connection for this operation"
-                )
-                # Don't reset persistent connection state - let retry logic handle reconnection
-                # Just use a new connection for this specific operation
-                connection = self._get_connection()
-                connection_is_persistent = False
-            else:
-                connection = self._persistent_connection
-                connection_is_persistent = True
-        else:
-            connection = self._get_connection()
-            connection_is_persistent = False
+        connection, connection_is_persistent = self._acquire_healthy_connection()
 
         try:
             cursor = connection.cursor()
@@ -586,9 +690,39 @@ class DoltMySQLBase:
             # FIX: Don't wrap - preserve original error type for proper detection
             raise e
         finally:
-            # Only close if it's not a persistent connection
-            if not connection_is_persistent:
-                connection.close()
+            self._release_connection(connection, connection_is_persistent)
+
+    def _execute_updates_in_transaction(self, statements: List[tuple]) -> int:
+        """
+        Execute several update statements atomically on one connection.
+
+        Unlike _execute_update, failed statements are not retried: the whole
+        transaction is rolled back and the error is raised to the caller.
+
+        Args:
+            statements: List of (query, params) tuples, executed in order
+
+        Returns:
+            Total number of affected rows
+        """
+        connection, connection_is_persistent = self._acquire_connection()
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute("START TRANSACTION")
+                affected_rows = 0
+                for query, params in statements:
+                    cursor.execute(query, params or ())
+                    affected_rows += max(cursor.rowcount, 0)
+                connection.commit()
+                return affected_rows
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+        finally:
+            self._release_connection(connection, connection_is_persistent)
 
     @property
     def active_branch(self) -> str:
@@ -607,12 +741,7 @@ class DoltMySQLBase:
 
         # Otherwise query the database using Dolt's native active_branch() function
         try:
-            if self._use_persistent and self._persistent_connection:
-                connection = self._persistent_connection
-                connection_is_persistent = True
-            else:
-                connection = self._get_connection()
-                connection_is_persistent = False
+            connection, connection_is_persistent = self._acquire_connection()
 
             try:
                 cursor = connection.cursor(dictionary=True)
@@ -626,8 +755,7 @@ class DoltMySQLBase:
                     return DEFAULT_PROTECTED_BRANCH  # Fallback to default if query fails
 
             finally:
-                if not connection_is_persistent:
-                    connection.close()
+                self._release_connection(connection, connection_is_persistent)
 
         except Exception as e:
             logger.warning(f"Failed to get active branch: {e}")
@@ -17,6 +17,7 @@ Environment Variables (used by DoltConnectionConfig):
 - MYSQL_DATABASE / DB_NAME: Database name (default: memory_dolt)
 """
 
+import hashlib
 import logging
 import sys
 from pathlib import Path
@@ -40,6 +41,7 @@ try:
     from infra_core.memory_system.schemas.memory_block import MemoryBlock
     from infra_core.memory_system.schemas.common import BlockProperty
     from infra_core.memory_system.dolt_mysql_base import DoltMySQLBase
+    from infra_core.memory_system.block_query import BlockPage, BlockQuery
 except ImportError as e:
     # Add more context to the error message
     raise ImportError(
@@ -53,6 +55,25 @@ logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
+# Columns selected whenever memory_blocks rows are hydrated into MemoryBlock objects
+MEMORY_BLOCK_COLUMNS = """id, namespace_id, type, schema_version, text, state, visibility, block_version,
+            parent_id, has_children, tags, source_file, source_uri, confidence,
+            created_by, created_at, updated_at, embedding"""
+
+# Columns selected whenever block_properties rows are parsed into BlockProperty objects
+BLOCK_PROPERTY_COLUMNS = """block_id, property_name, property_value_text, property_value_number,
+                   property_value_json, property_type, is_computed, created_at, updated_at"""
+
+# Maximum number of block IDs bound into a single IN (...) clause
+PROPERTY_BATCH_SIZE = 500
+
+
+def _table_as_of(table: str, as_of: Optional[str]) -> Tuple[str, List[str]]:
+    """Return a FROM target reading `table` at revision `as_of` (working set if None)."""
+    if as_of:
+        return f"{table} AS OF %s", [as_of]
+    return table, []
+
 
 class DoltMySQLReader(DoltMySQLBase):
     """Dolt reader that connects to remote Dolt SQL server via MySQL connector.
@@ -63,7 +84,9 @@ class DoltMySQLReader(DoltMySQLBase):
     Uses autocommit=True connections optimized for read operations.
     """
 
-    def _get_connection(self):
+    _connection_kind = "read"
+
+    def _create_connection(self):
         """Get a new MySQL connection optimized for reading with autocommit=True."""
         try:
             conn = mysql.connector.connect(
@@ -82,68 +105,129 @@ class DoltMySQLReader(DoltMySQLBase):
         except mysql.connector.Error as e:
             raise Exception(f"Failed to connect to Dolt SQL server: {e}")
 
-    def read_memory_blocks(self, branch: str = "main") -> List[MemoryBlock]:
-        """Read all memory blocks from Dolt SQL server, returning MemoryBlock objects."""
+    @staticmethod
+    def _parse_property_row(row: Dict[str, Any]) -> BlockProperty:
+        """Convert a raw block_properties row into a BlockProperty object."""
+        # Parse JSON field if it's a string
+        if row.get("property_value_json") and isinstance(row["property_value_json"], str):
+            row["property_value_json"] = json.loads(row["property_value_json"])
+        return BlockProperty.model_validate(row)
+
+    def _group_property_rows(self, rows: List[Dict[str, Any]]) -> Dict[str, List[BlockProperty]]:
+        """Group raw block_properties rows by block_id, skipping rows that fail to parse."""
+        properties_by_block: Dict[str, List[BlockProperty]] = {}
+        for row in rows:
+            try:
+                property_obj = self._parse_property_row(row)
+            except Exception as e:
+                logger.error(
+                    f"Failed to parse property for block {row.get('block_id', 'unknown')}: {e}"
+                )
+                continue
+            properties_by_block.setdefault(property_obj.block_id, []).append(property_obj)
+        return properties_by_block
+
+    def _fetch_properties_for_blocks(
+        self, cursor, block_ids: List[str], as_of: Optional[str] = None
+    ) -> Dict[str, List[BlockProperty]]:
+        """
+        Fetch properties for the given blocks on an already checked-out cursor.
+
+        IDs are bound in chunks of PROPERTY_BATCH_SIZE so large reads stay within
+        the server's placeholder limits while still costing O(n / chunk) queries.
+        With `as_of`, properties are read at that revision instead of the working set.
+        """
+        table, table_params = _table_as_of("block_properties", as_of)
+        properties_by_block: Dict[str, List[BlockProperty]] = {}
+        for start in range(0, len(block_ids), PROPERTY_BATCH_SIZE):
+            chunk = block_ids[start : start + PROPERTY_BATCH_SIZE]
+            placeholders = ",".join(["%s"] * len(chunk))
+            cursor.execute(
+                f"SELECT {BLOCK_PROPERTY_COLUMNS} FROM {table} "
+                f"WHERE block_id IN ({placeholders})",
+                table_params + chunk,
+            )
+            for block_id, props in self._group_property_rows(cursor.fetchall()).items():
+                properties_by_block.setdefault(block_id, []).extend(props)
+        return properties_by_block
+
+    @staticmethod
+    def _row_to_memory_block(
+        row: Dict[str, Any], properties: Optional[List[BlockProperty]]
+    ) -> MemoryBlock:
+        """
+        Build a MemoryBlock from a memory_blocks row and its already-loaded properties.
+
+        Raises:
+            Exception: If JSON parsing or MemoryBlock validation fails.
+        """
+        # Parse JSON fields
+        if row.get("tags") and isinstance(row["tags"], str):
+            row["tags"] = json.loads(row["tags"])
+        if row.get("confidence") and isinstance(row["confidence"], str):
+            row["confidence"] = json.loads(row["confidence"])
+        if row.get("embedding") and isinstance(row["embedding"], str):
+            row["embedding"] = json.loads(row["embedding"])
+
+        # Compose metadata from properties
         try:
-            connection = self._get_connection()
-            self._ensure_branch(connection, branch)
+            from infra_core.memory_system.property_mapper import PropertyMapper
 
-            query = """
-            SELECT id, namespace_id, type, schema_version, text, state, visibility, block_version,
-            parent_id, has_children, tags, source_file, source_uri, confidence, 
-            created_by, created_at, updated_at, embedding
-        FROM memory_blocks 
-            """
+            row["metadata"] = PropertyMapper.compose_metadata(properties) if properties else {}
+        except Exception as e:
+            logger.warning(f"Failed to compose metadata for block {row.get('id')}: {e}")
+            row["metadata"] = {}
 
-            cursor = connection.cursor(dictionary=True)
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            cursor.close()
-            connection.close()
+        # Remove None values and create MemoryBlock
+        cleaned_row = {k: v for k, v in row.items() if v is not None}
+        return MemoryBlock.model_validate(cleaned_row)
 
-            # Convert to MemoryBlock objects
-            memory_blocks = []
-            for row in rows:
-                try:
-                    # Parse JSON fields
-                    if row.get("tags") and isinstance(row["tags"], str):
-                        row["tags"] = json.loads(row["tags"])
-                    if row.get("confidence") and isinstance(row["confidence"], str):
-                        row["confidence"] = json.loads(row["confidence"])
-                    if row.get("embedding") and isinstance(row["embedding"], str):
-                        row["embedding"] = json.loads(row["embedding"])
-
-                    # Get properties and compose metadata
-                    try:
-                        from infra_core.memory_system.property_mapper import PropertyMapper
-
-                        properties = self.read_block_properties(row["id"], branch)
-                        if properties:
-                            # Convert dict properties to BlockProperty objects if needed
-                            if properties and isinstance(properties[0], dict):
-                                from infra_core.memory_system.schemas.common import BlockProperty
-
-                                properties = [
-                                    BlockProperty.model_validate(prop) for prop in properties
-                                ]
-                            metadata_dict = PropertyMapper.compose_metadata(properties)
-                        else:
-                            metadata_dict = {}
-                        row["metadata"] = metadata_dict
-                    except Exception as e:
-                        logger.warning(f"Failed to compose metadata for block {row['id']}: {e}")
-                        row["metadata"] = {}
+    def _hydrate_memory_blocks(
+        self,
+        rows: List[Dict[str, Any]],
+        properties_by_block: Dict[str, List[BlockProperty]],
+    ) -> List[MemoryBlock]:
+        """Join memory_blocks rows with grouped properties in a single pass."""
+        memory_blocks = []
+        for row in rows:
+            try:
+                memory_blocks.append(
+                    self._row_to_memory_block(row, properties_by_block.get(row.get("id")))
+                )
+            except Exception as e:
+                logger.error(f"Failed to parse memory block {row.get('id', 'unknown')}: {e}")
+                continue
+        return memory_blocks
 
-                    # Remove None values and create MemoryBlock
-                    cleaned_row = {k: v for k, v in row.items() if v is not None}
-                    memory_block = MemoryBlock.model_validate(cleaned_row)
-                    memory_blocks.append(memory_block)
+    def read_memory_blocks(
+        self, branch: str = "main", as_of: Optional[str] = None
+    ) -> List[MemoryBlock]:
+        """
+        Read all memory blocks from Dolt SQL server, returning MemoryBlock objects.
 
-                except Exception as e:
-                    logger.error(f"Failed to parse memory block {row.get('id', 'unknown')}: {e}")
-                    continue
+        Uses a single connection and two set-based queries (one over memory_blocks,
+        one over block_properties) joined in Python, instead of one properties
+        query per block. With `as_of` (e.g. a commit hash) the blocks are read at
+        that revision instead of from the branch's working set.
+        """
+        try:
+            connection = self._get_connection()
+            try:
+                self._ensure_branch(connection, branch)
+                cursor = connection.cursor(dictionary=True)
+
+                table, params = _table_as_of("block_properties", as_of)
+                cursor.execute(f"SELECT {BLOCK_PROPERTY_COLUMNS} FROM {table}", params or None)
+                properties_by_block = self._group_property_rows(cursor.fetchall())
+
+                table, params = _table_as_of("memory_blocks", as_of)
+                cursor.execute(f"SELECT {MEMORY_BLOCK_COLUMNS} FROM {table}", params or None)
+                rows = cursor.fetchall()
+                cursor.close()
+            finally:
+                connection.close()
 
-            return memory_blocks
+            return self._hydrate_memory_blocks(rows, properties_by_block)
 
         except Exception as e:
             logger.error(f"Failed to read memory blocks: {e}")
@@ -155,14 +239,12 @@ class DoltMySQLReader(DoltMySQLBase):
             connection = self._get_connection()
             self._ensure_branch(connection, branch)
 
-            query = """
-            SELECT id, namespace_id, type, schema_version, text, state, visibility, block_version,
-            parent_id, has_children, tags, source_file, source_uri, confidence, 
-            created_by, created_at, updated_at, embedding
-        FROM memory_blocks
+            query = f"""
+            SELECT {MEMORY_BLOCK_COLUMNS}
+            FROM memory_blocks
             WHERE id = %s
-        LIMIT 1
-        """
+            LIMIT 1
+            """
 
             cursor = connection.cursor(dictionary=True)
             cursor.execute(query, (block_id,))
@@ -174,37 +256,8 @@ class DoltMySQLReader(DoltMySQLBase):
                 return None
 
             try:
-                # Parse JSON fields
-                if row.get("tags") and isinstance(row["tags"], str):
-                    row["tags"] = json.loads(row["tags"])
-                if row.get("confidence") and isinstance(row["confidence"], str):
-                    row["confidence"] = json.loads(row["confidence"])
-                if row.get("embedding") and isinstance(row["embedding"], str):
-                    row["embedding"] = json.loads(row["embedding"])
-
-                # Get properties and compose metadata
-                try:
-                    from infra_core.memory_system.property_mapper import PropertyMapper
-
-                    properties = self.read_block_properties(block_id, branch)
-                    if properties:
-                        # Convert dict properties to BlockProperty objects if needed
-                        if properties and isinstance(properties[0], dict):
-                            from infra_core.memory_system.schemas.common import BlockProperty
-
-                            properties = [BlockProperty.model_validate(prop) for prop in properties]
-                        metadata_dict = PropertyMapper.compose_metadata(properties)
-                    else:
-                        metadata_dict = {}
-                    row["metadata"] = metadata_dict
-                except Exception as e:
-                    logger.warning(f"Failed to compose metadata for block {block_id}: {e}")
-                    row["metadata"] = {}
-
-                # Remove None values and create MemoryBlock
-                cleaned_row = {k: v for k, v in row.items() if v is not None}
-                return MemoryBlock.model_validate(cleaned_row)
-
+                properties = self.read_block_properties(block_id, branch)
+                return self._row_to_memory_block(row, properties)
             except Exception as e:
                 logger.error(f"Failed to parse memory block {block_id}: {e}")
                 return None
@@ -213,15 +266,66 @@ class DoltMySQLReader(DoltMySQLBase):
             logger.error(f"Failed to read memory block {block_id}: {e}")
             return None
 
+    def read_memory_blocks_by_ids(
+        self, block_ids: List[str], branch: str = "main", as_of: Optional[str] = None
+    ) -> List[MemoryBlock]:
+        """
+        Read specific memory blocks by ID, returning MemoryBlock objects.
+
+        IDs are bound in chunks of PROPERTY_BATCH_SIZE and properties are loaded
+        in batches on the same connection, so the cost scales with the number of
+        requested blocks rather than the size of the branch. Missing IDs are
+        simply absent from the result; order follows the first occurrence of
+        each ID in `block_ids`. With `as_of` the blocks are read at that revision
+        instead of from the branch's working set.
+        """
+        # Deduplicate while preserving caller order
+        unique_ids = list(dict.fromkeys(block_id for block_id in block_ids if block_id))
+        if not unique_ids:
+            return []
+
+        try:
+            connection = self._get_connection()
+            try:
+                self._ensure_branch(connection, branch)
+                cursor = connection.cursor(dictionary=True)
+
+                table, table_params = _table_as_of("memory_blocks", as_of)
+                rows = []
+                for start in range(0, len(unique_ids), PROPERTY_BATCH_SIZE):
+                    chunk = unique_ids[start : start + PROPERTY_BATCH_SIZE]
+                    placeholders = ",".join(["%s"] * len(chunk))
+                    cursor.execute(
+                        f"SELECT {MEMORY_BLOCK_COLUMNS} FROM {table} "
+                        f"WHERE id IN ({placeholders})",
+                        table_params + chunk,
+                    )
+                    rows.extend(cursor.fetchall())
+
+                found_ids = [row["id"] for row in rows if row.get("id")]
+                properties_by_block = self._fetch_properties_for_blocks(
+                    cursor, found_ids, as_of=as_of
+                )
+                cursor.close()
+            finally:
+                connection.close()
+
+            position = {block_id: i for i, block_id in enumerate(unique_ids)}
+            rows.sort(key=lambda row: position.get(row.get("id"), len(position)))
+            return self._hydrate_memory_blocks(rows, properties_by_block)
+
+        except Exception as e:
+            logger.error(f"Failed to read memory blocks by IDs: {e}")
+            return []
+
     def read_block_properties(self, block_id: str, branch: str = "main") -> List[BlockProperty]:
         """Read block properties for a specific block, returning BlockProperty objects."""
         try:
             connection = self._get_connection()
             self._ensure_branch(connection, branch)
 
-            query = """
-            SELECT block_id, property_name, property_value_text, property_value_number,
-                   property_value_json, property_type, is_computed, created_at, updated_at
+            query = f"""
+            SELECT {BLOCK_PROPERTY_COLUMNS}
             FROM block_properties
             WHERE block_id = %s
             """
@@ -232,25 +336,7 @@ class DoltMySQLReader(DoltMySQLBase):
             cursor.close()
             connection.close()
 
-            # Convert to BlockProperty objects
-            properties = []
-            for row in rows:
-                try:
-                    from infra_core.memory_system.schemas.common import BlockProperty
-
-                    # Parse JSON field if it's a string
-                    if row.get("property_value_json") and isinstance(
-                        row["property_value_json"], str
-                    ):
-                        row["property_value_json"] = json.loads(row["property_value_json"])
-
-                    property_obj = BlockProperty.model_validate(row)
-                    properties.append(property_obj)
-                except Exception as e:
-                    logger.error(f"Failed to parse property for block {block_id}: {e}")
-                    continue
-
-            return properties
+            return self._group_property_rows(rows).get(block_id, [])
 
         except Exception as e:
             logger.error(f"Failed to read properties for block {block_id}: {e}")
@@ -265,44 +351,13 @@ class DoltMySQLReader(DoltMySQLBase):
 
         try:
             connection = self._get_connection()
-            self._ensure_branch(connection, branch)
-
-            placeholders = ",".join(["%s"] * len(block_ids))
-            query = f"""
-            SELECT block_id, property_name, property_value_text, property_value_number,
-                   property_value_json, property_type, is_computed, created_at, updated_at
-            FROM block_properties
-            WHERE block_id IN ({placeholders})
-            """
-
-            cursor = connection.cursor(dictionary=True)
-            cursor.execute(query, block_ids)
-            rows = cursor.fetchall()
-            cursor.close()
-            connection.close()
-
-            # Group by block_id and convert to BlockProperty objects
-            properties_by_block = {}
-            for row in rows:
-                try:
-                    from infra_core.memory_system.schemas.common import BlockProperty
-
-                    # Parse JSON field if it's a string
-                    if row.get("property_value_json") and isinstance(
-                        row["property_value_json"], str
-                    ):
-                        row["property_value_json"] = json.loads(row["property_value_json"])
-
-                    property_obj = BlockProperty.model_validate(row)
-                    block_id = row["block_id"]
-                    if block_id not in properties_by_block:
-                        properties_by_block[block_id] = []
-                    properties_by_block[block_id].append(property_obj)
-                except Exception as e:
-                    logger.error(
-                        f"Failed to parse property for block {row.get('block_id', 'unknown')}: {e}"
-                    )
-                    continue
+            try:
+                self._ensure_branch(connection, branch)
+                cursor = connection.cursor(dictionary=True)
+                properties_by_block = self._fetch_properties_for_blocks(cursor, list(block_ids))
+                cursor.close()
+            finally:
+                connection.close()
 
             return properties_by_block
 
@@ -340,60 +395,73 @@ class DoltMySQLReader(DoltMySQLBase):
                 where_clause = " OR ".join(tag_conditions)
 
             query = f"""
-            SELECT id, namespace_id, type, schema_version, text, state, visibility, block_version,
-            parent_id, has_children, tags, source_file, source_uri, confidence, 
-            created_by, created_at, updated_at, embedding
-        FROM memory_blocks 
-        WHERE {where_clause}
-        """
+            SELECT {MEMORY_BLOCK_COLUMNS}
+            FROM memory_blocks
+            WHERE {where_clause}
+            """
 
-            cursor = connection.cursor(dictionary=True)
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            cursor.close()
-            connection.close()
+            try:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+
+                # Load properties for all matched blocks in batched queries
+                block_ids = [row["id"] for row in rows if row.get("id")]
+                properties_by_block = self._fetch_properties_for_blocks(cursor, block_ids)
+                cursor.close()
+            finally:
+                connection.close()
 
-            # Convert to MemoryBlock objects (similar to read_memory_blocks)
-            memory_blocks = []
-            for row in rows:
-                try:
-                    # Parse JSON fields
-                    if row.get("tags") and isinstance(row["tags"], str):
-                        row["tags"] = json.loads(row["tags"])
-                    if row.get("confidence") and isinstance(row["confidence"], str):
-                        row["confidence"] = json.loads(row["confidence"])
-                    if row.get("embedding") and isinstance(row["embedding"], str):
-                        row["embedding"] = json.loads(row["embedding"])
-
-                    # Get properties and compose metadata
-                    try:
-                        from infra_core.memory_system.property_mapper import PropertyMapper
-
-                        properties = self.read_block_properties(row["id"], branch)
-                        if properties:
-                            metadata_dict = PropertyMapper.compose_metadata(properties)
-                        else:
-                            metadata_dict = {}
-                        row["metadata"] = metadata_dict
-                    except Exception as e:
-                        logger.warning(f"Failed to compose metadata for block {row['id']}: {e}")
-                        row["metadata"] = {}
+            return self._hydrate_memory_blocks(rows, properties_by_block)
 
-                    # Remove None values and create MemoryBlock
-                    cleaned_row = {k: v for k, v in row.items() if v is not None}
-                    memory_block = MemoryBlock.model_validate(cleaned_row)
-                    memory_blocks.append(memory_block)
+        except Exception as e:
+            logger.error(f"Failed to read memory blocks by tags: {e}")
+            return []
 
-                except Exception as e:
-                    logger.error(f"Failed to parse memory block {row.get('id', 'unknown')}: {e}")
-                    continue
+    def query_memory_blocks(self, query: BlockQuery, branch: str = "main") -> List[MemoryBlock]:
+        """
+        Read memory blocks matching a BlockQuery, returning MemoryBlock objects.
 
-            return memory_blocks
+        Type, namespace, tag and metadata predicates as well as ORDER BY, LIMIT
+        and keyset pagination are evaluated by the server in a single query;
+        properties are then loaded only for the matched blocks.
 
+        Returns an empty list on error; use query_memory_block_page() to page
+        through results or to see database errors.
+        """
+        try:
+            return self.query_memory_block_page(query, branch=branch).blocks
         except Exception as e:
-            logger.error(f"Failed to read memory blocks by tags: {e}")
+            logger.error(f"Failed to query memory blocks ({query}): {e}")
             return []
 
+    def query_memory_block_page(self, query: BlockQuery, branch: str = "main") -> BlockPage:
+        """
+        Read one page of memory blocks matching a BlockQuery.
+
+        Returns:
+            BlockPage whose row_count and next_cursor describe the SQL page, so
+            rows that fail to hydrate do not end pagination early
+
+        Raises:
+            Exception: Database errors are propagated rather than returned as an empty page
+        """
+        sql, params = query.to_sql(MEMORY_BLOCK_COLUMNS)
+        connection = self._get_connection()
+        try:
+            self._ensure_branch(connection, branch)
+            cursor = connection.cursor(dictionary=True)
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+
+            block_ids = [row["id"] for row in rows if row.get("id")]
+            properties_by_block = self._fetch_properties_for_blocks(cursor, block_ids)
+            cursor.close()
+        finally:
+            connection.close()
+
+        return query.page(rows, self._hydrate_memory_blocks(rows, properties_by_block))
+
     def read_block_proofs(self, block_id: str, branch: str = "main") -> List[Dict[str, Any]]:
         """
         Read block operation proofs for a specific block from block_proofs table.
@@ -471,6 +539,129 @@ class DoltMySQLReader(DoltMySQLBase):
             logger.error(f"Unexpected error reading schema version for {node_type}: {e}")
             return None
 
+    def read_working_set_hash(self, branch: str = "main") -> Optional[str]:
+        """
+        Read the hash of a branch's working set (uncommitted data included).
+
+        The hash changes whenever any table on the branch changes, so it can be
+        used as a version stamp for caching data read from that branch.
+
+        Returns:
+            The working set hash, or None if it could not be determined
+        """
+        try:
+            connection = self._get_connection()
+            try:
+                self._ensure_branch(connection, branch)
+                cursor = connection.cursor(dictionary=True)
+                # With no argument DOLT_HASHOF_DB hashes the working set of the checked-out branch
+                cursor.execute("SELECT DOLT_HASHOF_DB() AS working_hash")
+                result = cursor.fetchone()
+                cursor.close()
+            finally:
+                connection.close()
+
+            if result and result.get("working_hash"):
+                return str(result["working_hash"])
+            return None
+
+        except Exception as e:
+            logger.error(f"Failed to read working set hash for branch {branch}: {e}")
+            return None
+
+    def read_branch_head(self, branch: str = "main") -> Optional[str]:
+        """
+        Read the commit hash at the head of a branch.
+
+        Unlike read_working_set_hash this is a commit hash, so it can be passed to
+        DOLT_DIFF as a revision.
+
+        Returns:
+            The head commit hash, or None if it could not be determined
+        """
+        try:
+            connection = self._get_connection()
+            try:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute("SELECT DOLT_HASHOF(%s) AS commit_hash", (branch,))
+                result = cursor.fetchone()
+                cursor.close()
+            finally:
+                connection.close()
+
+            if result and result.get("commit_hash"):
+                return str(result["commit_hash"])
+            return None
+
+        except Exception as e:
+            logger.error(f"Failed to read head commit for branch {branch}: {e}")
+            return None
+
+    def read_branches_state_hash(self) -> Optional[str]:
+        """
+        Read a hash of every branch's head commit and dirty flag.
+
+        Changes whenever a branch is created, deleted, committed to or becomes
+        dirty, so it can be used as a version stamp for branch listings.
+
+        Returns:
+            The state hash, or None if it could not be determined
+        """
+        try:
+            connection = self._get_connection()
+            try:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute("SELECT name, hash, dirty FROM dolt_branches ORDER BY name")
+                rows = cursor.fetchall()
+                cursor.close()
+            finally:
+                connection.close()
+
+            state = "\n".join(f"{row['name']}:{row['hash']}:{row['dirty']}" for row in rows)
+            return hashlib.sha1(state.encode("utf-8")).hexdigest()
+
+        except Exception as e:
+            logger.error(f"Failed to read branches state hash: {e}")
+            return None
+
+    def read_link_sources(
+        self, block_ids: List[str], branch: str = "main"
+    ) -> Dict[str, List[str]]:
+        """
+        Read the sources of all block_links pointing at any of the given blocks.
+
+        IDs are bound in chunks of PROPERTY_BATCH_SIZE on one connection. Unlike
+        the other link readers, errors are raised rather than swallowed, so that
+        callers validating dependencies before a delete fail closed.
+
+        Returns:
+            Mapping of target block ID to the IDs of blocks linking to it; blocks
+            without inbound links are absent
+        """
+        unique_ids = list(dict.fromkeys(block_ids))
+        sources: Dict[str, List[str]] = {}
+        if not unique_ids:
+            return sources
+
+        connection = self._get_connection()
+        try:
+            self._ensure_branch(connection, branch)
+            cursor = connection.cursor(dictionary=True)
+            for start in range(0, len(unique_ids), PROPERTY_BATCH_SIZE):
+                chunk = unique_ids[start : start + PROPERTY_BATCH_SIZE]
+                placeholders = ",".join(["%s"] * len(chunk))
+                cursor.execute(
+                    "SELECT DISTINCT to_id, from_id FROM block_links "
+                    f"WHERE to_id IN ({placeholders}) ORDER BY to_id, from_id",
+                    chunk,
+                )
+                for row in cursor.fetchall():
+                    sources.setdefault(row["to_id"], []).append(row["from_id"])
+            cursor.close()
+        finally:
+            connection.close()
+        return sources
+
     def read_forward_links(
         self, block_id: str, relation: Optional[str] = None, branch: str = "main"
     ) -> List[Dict[str, Any]]:
@@ -587,6 +778,114 @@ class DoltMySQLReader(DoltMySQLBase):
             logger.error(f"Unexpected error reading backlinks for {block_id}: {e}")
             return []
 
+    def read_link_graph(
+        self,
+        root_id: str,
+        max_depth: int,
+        relations: Optional[List[str]] = None,
+        include_inbound: bool = False,
+        namespace_id: Optional[str] = None,
+        branch: str = "main",
+    ) -> Dict[str, Any]:
+        """
+        Breadth-first traversal of block_links starting at `root_id`.
+
+        Each BFS level is expanded with one `WHERE from_id IN (...)` query (plus one
+        `WHERE to_id IN (...)` query when include_inbound), all on a single
+        connection, so round trips grow with max_depth rather than with the number
+        of blocks reached. A final query collects the links leaving the deepest
+        level, so every link between discovered blocks is returned.
+
+        Args:
+            root_id: The block to start from (depth 0)
+            max_depth: Number of link hops to follow
+            relations: Only follow these relation types (None = all)
+            include_inbound: Also follow links pointing at the frontier
+            namespace_id: Only step onto blocks in this namespace (None = any)
+            branch: The Dolt branch to read from
+
+        Returns:
+            {"depths": {block_id: depth}, "links": [{"from_id", "to_id", "relation",
+            "priority"}, ...]} where links are those between discovered blocks.
+
+        Raises:
+            Exception: If a query fails, so callers never mistake a failed traversal
+                for a block without links.
+        """
+        depths: Dict[str, int] = {root_id: 0}
+        links: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+
+        connection = self._get_connection()
+        try:
+            self._ensure_branch(connection, branch)
+            cursor = connection.cursor(dictionary=True)
+
+            frontier = [root_id]
+            for depth in range(1, max_depth + 1):
+                next_frontier = []
+                for row in self._read_frontier_links(
+                    cursor, frontier, relations, include_inbound, namespace_id
+                ):
+                    links[(row["from_id"], row["to_id"], row["relation"])] = row
+                    for neighbor_id in (row["to_id"], row["from_id"]):
+                        if neighbor_id not in depths:
+                            depths[neighbor_id] = depth
+                            next_frontier.append(neighbor_id)
+                frontier = next_frontier
+                if not frontier:
+                    break
+            else:
+                # Links from the deepest level back into the discovered graph
+                for row in self._read_frontier_links(
+                    cursor, frontier, relations, include_inbound, namespace_id
+                ):
+                    if row["from_id"] in depths and row["to_id"] in depths:
+                        links[(row["from_id"], row["to_id"], row["relation"])] = row
+
+            cursor.close()
+        finally:
+            connection.close()
+
+        logger.info(
+            f"Traversed {len(depths)} blocks and {len(links)} links from {root_id} "
+            f"(max_depth={max_depth})"
+        )
+        return {"depths": depths, "links": list(links.values())}
+
+    def _read_frontier_links(
+        self,
+        cursor,
+        block_ids: List[str],
+        relations: Optional[List[str]],
+        include_inbound: bool,
+        namespace_id: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        """Read the links leaving (and optionally entering) a BFS frontier, in ID chunks."""
+        directions = [("from_id", "to_id")]
+        if include_inbound:
+            directions.append(("to_id", "from_id"))
+
+        rows: List[Dict[str, Any]] = []
+        for frontier_column, neighbor_column in directions:
+            for start in range(0, len(block_ids), PROPERTY_BATCH_SIZE):
+                chunk = block_ids[start : start + PROPERTY_BATCH_SIZE]
+                query = "SELECT bl.from_id, bl.to_id, bl.relation, bl.priority FROM block_links bl"
+                params: List[Any] = []
+                if namespace_id:
+                    query += (
+                        f" JOIN memory_blocks mb ON mb.id = bl.{neighbor_column}"
+                        " AND mb.namespace_id = %s"
+                    )
+                    params.append(namespace_id)
+                query += f" WHERE bl.{frontier_column} IN ({','.join(['%s'] * len(chunk))})"
+                params.extend(chunk)
+                if relations:
+                    query += f" AND bl.relation IN ({','.join(['%s'] * len(relations))})"
+                    params.extend(relations)
+                cursor.execute(query, tuple(params))
+                rows.extend(cursor.fetchall())
+        return rows
+
     def read_work_items_core_view(self, limit: int = 5, branch: str = "main") -> list:
         """
         Read work items from the core view with limit.
@@ -613,14 +912,13 @@ class DoltMySQLReader(DoltMySQLBase):
             Tuple of (branches_list, current_branch) where:
             - branches_list: List of dictionaries containing branch information
             - current_branch: Name of the currently active branch
+
+        Raises:
+            Exception: If the branches cannot be read (an empty list would look like a
+                valid, cacheable answer)
         """
         # Use persistent connection if available, otherwise create new one
-        if self._use_persistent and self._persistent_connection:
-            connection = self._persistent_connection
-            connection_is_persistent = True
-        else:
-            connection = self._get_connection()
-            connection_is_persistent = False
+        connection, connection_is_persistent = self._acquire_connection()
 
         try:
             cursor = connection.cursor(dictionary=True)
@@ -671,13 +969,10 @@ class DoltMySQLReader(DoltMySQLBase):
             return branches_list, current_branch
 
         except Exception as e:
-            error_msg = f"Failed to list branches: {e}"
-            logger.error(error_msg, exc_info=True)
-            return [], "unknown"
+            logger.error(f"Failed to list branches: {e}", exc_info=True)
+            raise
         finally:
-            # Only close if it's not a persistent connection
-            if not connection_is_persistent:
-                connection.close()
+            self._release_connection(connection, connection_is_persistent)
 
     def get_diff_summary(self, from_revision: str, to_revision: str) -> List[dict]:
         """
@@ -691,12 +986,7 @@ class DoltMySQLReader(DoltMySQLBase):
             A list of dictionaries, where each dictionary represents a changed table.
         """
         # Use persistent connection if available, otherwise create a new one
-        if self._use_persistent and self._persistent_connection:
-            connection = self._persistent_connection
-            connection_is_persistent = True
-        else:
-            connection = self._get_connection()
-            connection_is_persistent = False
+        connection, connection_is_persistent = self._acquire_connection()
 
         try:
             cursor = connection.cursor(dictionary=True)
@@ -716,8 +1006,7 @@ class DoltMySQLReader(DoltMySQLBase):
             logger.error(f"Failed to get diff summary: {e}", exc_info=True)
             raise
         finally:
-            if not connection_is_persistent:
-                connection.close()
+            self._release_connection(connection, connection_is_persistent)
 
     def get_diff_details(
         self, from_revision: str, to_revision: str, table_name: str = None
@@ -736,12 +1025,7 @@ class DoltMySQLReader(DoltMySQLBase):
             A list of dictionaries with raw DOLT_DIFF results for all tables or specific table.
         """
         # Use persistent connection if available, otherwise create a new one
-        if self._use_persistent and self._persistent_connection:
-            connection = self._persistent_connection
-            connection_is_persistent = True
-        else:
-            connection = self._get_connection()
-            connection_is_persistent = False
+        connection, connection_is_persistent = self._acquire_connection()
 
         try:
             cursor = connection.cursor(dictionary=True)
@@ -786,8 +1070,63 @@ class DoltMySQLReader(DoltMySQLBase):
             logger.error(f"Failed to get detailed diff: {e}", exc_info=True)
             return []
         finally:
-            if not connection_is_persistent:
-                connection.close()
+            self._release_connection(connection, connection_is_persistent)
+
+    def read_block_changes(self, from_revision: str, to_revision: str) -> Dict[str, List[str]]:
+        """
+        List the memory blocks that changed between two revisions.
+
+        Only the key columns of DOLT_DIFF are selected, so the cost is proportional
+        to the number of changed rows rather than to their size. A block counts as
+        changed when its memory_blocks row or any of its block_properties rows
+        changed.
+
+        Args:
+            from_revision: The starting revision (e.g. the last synced commit hash).
+            to_revision: The ending revision (e.g. a branch name or commit hash).
+
+        Returns:
+            {"upserted": [...], "deleted": [...]} block IDs. Blocks that still exist at
+            to_revision are "upserted" (added or modified); removed ones are "deleted".
+
+        Raises:
+            Exception: If the diff cannot be computed (e.g. from_revision no longer exists),
+                so callers can fall back to a full resync instead of missing changes.
+        """
+        connection = self._get_connection()
+        try:
+            cursor = connection.cursor(dictionary=True)
+            upserted: Dict[str, None] = {}
+            deleted: Dict[str, None] = {}
+
+            cursor.execute(
+                "SELECT from_id, to_id, diff_type FROM DOLT_DIFF(%s, %s, 'memory_blocks')",
+                (from_revision, to_revision),
+            )
+            for row in cursor.fetchall():
+                if row["diff_type"] == "removed":
+                    deleted[row["from_id"]] = None
+                else:
+                    upserted[row["to_id"]] = None
+
+            cursor.execute(
+                "SELECT DISTINCT from_block_id, to_block_id "
+                "FROM DOLT_DIFF(%s, %s, 'block_properties')",
+                (from_revision, to_revision),
+            )
+            for row in cursor.fetchall():
+                block_id = row["to_block_id"] or row["from_block_id"]
+                if block_id and block_id not in deleted:
+                    upserted[block_id] = None
+
+            cursor.close()
+            logger.info(
+                f"Found {len(upserted)} upserted and {len(deleted)} deleted blocks "
+                f"from {from_revision} to {to_revision}"
+            )
+            return {"upserted": list(upserted), "deleted": list(deleted)}
+        finally:
+            connection.close()
 
 
 # Helper function from dolt_writer for safe SQL formatting
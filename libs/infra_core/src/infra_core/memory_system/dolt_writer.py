@@ -15,6 +15,7 @@ properties to the block_properties table instead of JSON metadata column.
 import json
 import logging
 import sys
+from datetime import datetime
 from pathlib import Path
 from typing import Optional, Tuple, List
 import warnings
@@ -55,6 +56,55 @@ logging.basicConfig(
 # Standard tables that store memory block data and should be included in commits/rollbacks
 PERSISTED_TABLES = ["memory_blocks", "block_properties", "block_links", "block_proofs"]
 
+# Maximum number of block IDs bound into a single IN (...) clause or multi-row insert
+WRITE_BATCH_SIZE = 500
+
+# Column lists for multi-row inserts (values built by _memory_block_row / _property_row)
+MEMORY_BLOCK_INSERT_COLUMNS = """id, namespace_id, type, schema_version, text, state, visibility,
+    block_version, parent_id, has_children, tags, source_file, source_uri, confidence,
+    created_by, created_at, updated_at, embedding"""
+PROPERTY_INSERT_COLUMNS = """block_id, property_name, property_value_text, property_value_number,
+    property_value_json, property_type, is_computed, created_at, updated_at"""
+
+
+def _memory_block_row(block: MemoryBlock) -> tuple:
+    """memory_blocks column values for a block, in MEMORY_BLOCK_INSERT_COLUMNS order."""
+    return (
+        block.id,
+        block.namespace_id,
+        block.type,
+        getattr(block, "schema_version", None),
+        block.text,
+        getattr(block, "state", "draft"),
+        getattr(block, "visibility", "internal"),
+        getattr(block, "block_version", 1),
+        getattr(block, "parent_id", None),
+        getattr(block, "has_children", False),
+        json.dumps(block.tags) if block.tags is not None else json.dumps([]),
+        block.source_file,
+        block.source_uri,
+        json.dumps(block.confidence.model_dump()) if block.confidence else None,
+        block.created_by,
+        block.created_at,
+        block.updated_at,
+        json.dumps(block.embedding) if block.embedding else None,
+    )
+
+
+def _property_row(prop) -> tuple:
+    """block_properties column values for a property, in PROPERTY_INSERT_COLUMNS order."""
+    return (
+        prop.block_id,
+        prop.property_name,
+        prop.property_value_text,
+        prop.property_value_number,
+        json.dumps(prop.property_value_json) if prop.property_value_json is not None else None,
+        prop.property_type,
+        prop.is_computed,
+        prop.created_at,
+        prop.updated_at,
+    )
+
 
 class DoltMySQLWriter(DoltMySQLBase):
     """Dolt writer that connects to remote Dolt SQL server via MySQL connector.
@@ -63,7 +113,9 @@ class DoltMySQLWriter(DoltMySQLBase):
     Works with the same DoltConnectionConfig as DoltMySQLReader.
     """
 
-    def _get_connection(self):
+    _connection_kind = "write"
+
+    def _create_connection(self):
         """Get a new MySQL connection to the Dolt SQL server with transaction control."""
         try:
             conn = mysql.connector.connect(
@@ -91,12 +143,7 @@ class DoltMySQLWriter(DoltMySQLBase):
     ) -> Tuple[bool, Optional[str]]:
         """Write a memory block to the Dolt SQL server."""
         # Use persistent connection if available, otherwise create new one
-        if self._use_persistent and self._persistent_connection:
-            connection = self._persistent_connection
-            connection_is_persistent = True
-        else:
-            connection = self._get_connection()
-            connection_is_persistent = False
+        connection, connection_is_persistent = self._acquire_connection()
 
         commit_hash = None
 
@@ -117,26 +164,7 @@ class DoltMySQLWriter(DoltMySQLBase):
             """
 
             # Prepare values, handling JSON serialization
-            values = (
-                block.id,
-                block.namespace_id,
-                block.type,
-                getattr(block, "schema_version", None),
-                block.text,
-                getattr(block, "state", "draft"),
-                getattr(block, "visibility", "internal"),
-                getattr(block, "block_version", 1),
-                getattr(block, "parent_id", None),
-                getattr(block, "has_children", False),
-                json.dumps(block.tags) if block.tags is not None else json.dumps([]),
-                block.source_file,
-                block.source_uri,
-                json.dumps(block.confidence.model_dump()) if block.confidence else None,
-                block.created_by,
-                block.created_at,
-                block.updated_at,
-                json.dumps(block.embedding) if block.embedding else None,
-            )
+            values = _memory_block_row(block)
 
             # 🔍 DEBUG: Log the actual SQL values being passed to the database
             logger.error(
@@ -168,20 +196,7 @@ class DoltMySQLWriter(DoltMySQLBase):
                     """
 
                     for prop in properties:
-                        property_values = (
-                            prop.block_id,
-                            prop.property_name,
-                            prop.property_value_text,
-                            prop.property_value_number,
-                            json.dumps(prop.property_value_json)
-                            if prop.property_value_json is not None
-                            else None,
-                            prop.property_type,
-                            prop.is_computed,
-                            prop.created_at,
-                            prop.updated_at,
-                        )
-                        cursor.execute(property_query, property_values)
+                        cursor.execute(property_query, _property_row(prop))
 
             if auto_commit:
                 # Use Dolt SQL functions to add and commit
@@ -212,9 +227,267 @@ class DoltMySQLWriter(DoltMySQLBase):
             logger.error(f"Failed to write block {block.id}: {e}", exc_info=True)
             return False, None
         finally:
-            # Only close if it's not a persistent connection
-            if not connection_is_persistent:
-                connection.close()
+            self._release_connection(connection, connection_is_persistent)
+
+    def write_memory_block_changes(
+        self,
+        previous: MemoryBlock,
+        block: MemoryBlock,
+        branch: str = DEFAULT_PROTECTED_BRANCH,
+        preserve_nulls: bool = False,
+    ) -> bool:
+        """
+        Write only what changed between the stored and the new version of a block.
+
+        Changed memory_blocks columns are set with one UPDATE, and block_properties
+        rows are deleted or re-inserted only for metadata properties whose value
+        changed, so the Dolt working set (and the next commit) only holds real
+        changes. Nothing is written if no column or property differs. The
+        transaction is committed to the working set only, like write_memory_blocks.
+
+        Args:
+            previous: The block as currently stored
+            block: The new version of the block (same ID)
+            branch: The Dolt branch to write to
+            preserve_nulls: Passed to PropertyMapper.decompose_metadata
+
+        Returns:
+            True if the changes were written (or there were none), False on error
+        """
+        columns = [column.strip() for column in MEMORY_BLOCK_INSERT_COLUMNS.split(",")]
+        changed_columns = {
+            column: value
+            for column, old_value, value in zip(
+                columns, _memory_block_row(previous), _memory_block_row(block)
+            )
+            if column != "id" and old_value != value
+        }
+
+        def _properties(source: MemoryBlock) -> dict:
+            properties = PropertyMapper.decompose_metadata(
+                block_id=block.id,
+                metadata_dict=source.metadata or {},
+                preserve_nulls=preserve_nulls,
+            )
+            return {prop.property_name: prop for prop in properties}
+
+        def _value(prop) -> tuple:
+            # Everything but the timestamps, which are regenerated on each decompose
+            return _property_row(prop)[2:7]
+
+        old_properties = _properties(previous)
+        new_properties = _properties(block)
+        upserted = [
+            prop
+            for name, prop in new_properties.items()
+            if name not in old_properties or _value(old_properties[name]) != _value(prop)
+        ]
+        removed_names = [name for name in old_properties if name not in new_properties]
+        # Changed properties are deleted and re-inserted along with the new ones
+        stale_names = removed_names + [
+            prop.property_name for prop in upserted if prop.property_name in old_properties
+        ]
+
+        if not changed_columns and not upserted and not stale_names:
+            logger.info(f"Block {block.id} is unchanged in Dolt; nothing to write")
+            return True
+
+        connection, connection_is_persistent = self._acquire_connection()
+
+        try:
+            # Safely ensure branch and check protection (prevents bypass attacks)
+            self._ensure_branch_and_check_protection(
+                connection, "write_memory_block_changes", branch
+            )
+            cursor = connection.cursor(dictionary=True)
+            cursor.execute("START TRANSACTION")
+
+            if changed_columns:
+                assignments = ", ".join(f"{column} = %s" for column in changed_columns)
+                cursor.execute(
+                    f"UPDATE memory_blocks SET {assignments} WHERE id = %s",
+                    (*changed_columns.values(), block.id),
+                )
+            if stale_names:
+                placeholders = ", ".join(["%s"] * len(stale_names))
+                cursor.execute(
+                    "DELETE FROM block_properties "
+                    f"WHERE block_id = %s AND property_name IN ({placeholders})",
+                    (block.id, *stale_names),
+                )
+            if upserted:
+                property_placeholders = "(" + ", ".join(["%s"] * 9) + ")"
+                cursor.execute(
+                    f"INSERT INTO block_properties ({PROPERTY_INSERT_COLUMNS}) VALUES "
+                    + ", ".join([property_placeholders] * len(upserted)),
+                    [value for prop in upserted for value in _property_row(prop)],
+                )
+
+            connection.commit()
+            cursor.close()
+            logger.info(
+                f"Successfully wrote changes to block {block.id} "
+                f"(columns: {sorted(changed_columns)}, properties upserted: {len(upserted)}, "
+                f"removed: {len(removed_names)})"
+            )
+            return True
+
+        except MainBranchProtectionError:
+            # Let branch protection errors propagate to caller for specific handling
+            raise
+        except Exception as e:
+            connection.rollback()
+            logger.error(f"Failed to write changes to block {block.id}: {e}", exc_info=True)
+            return False
+        finally:
+            self._release_connection(connection, connection_is_persistent)
+
+    def write_memory_blocks(
+        self,
+        blocks: List[MemoryBlock],
+        branch: str = DEFAULT_PROTECTED_BRANCH,
+        preserve_nulls: bool = False,
+    ) -> bool:
+        """
+        Write many memory blocks and their properties in one transaction.
+
+        Blocks go in with multi-row REPLACE INTO statements and properties with
+        multi-row INSERTs (after clearing any existing properties of the blocks),
+        WRITE_BATCH_SIZE rows per statement. The transaction is committed to the
+        working set only; staging and Dolt commits are left to the caller.
+
+        Args:
+            blocks: The MemoryBlocks to write
+            branch: The Dolt branch to write to
+            preserve_nulls: Passed to PropertyMapper.decompose_metadata
+
+        Returns:
+            True if every block was written, False if the transaction was rolled back
+        """
+        if not blocks:
+            return True
+
+        connection, connection_is_persistent = self._acquire_connection()
+
+        try:
+            # Safely ensure branch and check protection (prevents bypass attacks)
+            self._ensure_branch_and_check_protection(connection, "write_memory_blocks", branch)
+            cursor = connection.cursor(dictionary=True)
+            cursor.execute("START TRANSACTION")
+
+            block_placeholders = "(" + ", ".join(["%s"] * 18) + ")"
+            property_placeholders = "(" + ", ".join(["%s"] * 9) + ")"
+            for start in range(0, len(blocks), WRITE_BATCH_SIZE):
+                chunk = blocks[start : start + WRITE_BATCH_SIZE]
+                cursor.execute(
+                    f"REPLACE INTO memory_blocks ({MEMORY_BLOCK_INSERT_COLUMNS}) VALUES "
+                    + ", ".join([block_placeholders] * len(chunk)),
+                    [value for block in chunk for value in _memory_block_row(block)],
+                )
+                id_placeholders = ", ".join(["%s"] * len(chunk))
+                cursor.execute(
+                    f"DELETE FROM block_properties WHERE block_id IN ({id_placeholders})",
+                    [block.id for block in chunk],
+                )
+
+            property_rows = [
+                _property_row(prop)
+                for block in blocks
+                if block.metadata
+                for prop in PropertyMapper.decompose_metadata(
+                    block_id=block.id, metadata_dict=block.metadata, preserve_nulls=preserve_nulls
+                )
+            ]
+            for start in range(0, len(property_rows), WRITE_BATCH_SIZE):
+                chunk = property_rows[start : start + WRITE_BATCH_SIZE]
+                cursor.execute(
+                    f"INSERT INTO block_properties ({PROPERTY_INSERT_COLUMNS}) VALUES "
+                    + ", ".join([property_placeholders] * len(chunk)),
+                    [value for row in chunk for value in row],
+                )
+
+            connection.commit()
+            cursor.close()
+            logger.info(
+                f"Successfully wrote {len(blocks)} blocks and {len(property_rows)} properties "
+                "via MySQL connection"
+            )
+            return True
+
+        except MainBranchProtectionError:
+            # Let branch protection errors propagate to caller for specific handling
+            raise
+        except Exception as e:
+            connection.rollback()
+            logger.error(f"Failed to write {len(blocks)} blocks: {e}", exc_info=True)
+            return False
+        finally:
+            self._release_connection(connection, connection_is_persistent)
+
+    def update_blocks_namespace(
+        self, block_ids: List[str], namespace_id: str, branch: str = DEFAULT_PROTECTED_BRANCH
+    ) -> Tuple[bool, int]:
+        """
+        Move many memory blocks to a namespace in one transaction.
+
+        Only memory_blocks rows change: namespace_id is set, block_version is
+        incremented and updated_at refreshed with one UPDATE per WRITE_BATCH_SIZE
+        IDs; properties are left alone. The transaction is committed to the working
+        set only; staging and Dolt commits are left to the caller.
+
+        Args:
+            block_ids: IDs of the blocks to move
+            namespace_id: The namespace to move them to
+            branch: The Dolt branch to write to
+
+        Returns:
+            Tuple of (success, number of memory_blocks rows updated)
+        """
+        unique_ids = list(dict.fromkeys(block_ids))
+        if not unique_ids:
+            return True, 0
+
+        connection, connection_is_persistent = self._acquire_connection()
+
+        try:
+            # Safely ensure branch and check protection (prevents bypass attacks)
+            self._ensure_branch_and_check_protection(connection, "update_blocks_namespace", branch)
+            cursor = connection.cursor(dictionary=True)
+            cursor.execute("START TRANSACTION")
+
+            updated_at = datetime.now()
+            updated_count = 0
+            for start in range(0, len(unique_ids), WRITE_BATCH_SIZE):
+                chunk = unique_ids[start : start + WRITE_BATCH_SIZE]
+                placeholders = ", ".join(["%s"] * len(chunk))
+                cursor.execute(
+                    "UPDATE memory_blocks SET namespace_id = %s, "
+                    "block_version = COALESCE(block_version, 0) + 1, updated_at = %s "
+                    f"WHERE id IN ({placeholders})",
+                    (namespace_id, updated_at, *chunk),
+                )
+                updated_count += max(cursor.rowcount, 0)
+
+            connection.commit()
+            cursor.close()
+            logger.info(
+                f"Successfully moved {updated_count} blocks to namespace '{namespace_id}' "
+                "via MySQL connection"
+            )
+            return True, updated_count
+
+        except MainBranchProtectionError:
+            # Let branch protection errors propagate to caller for specific handling
+            raise
+        except Exception as e:
+            connection.rollback()
+            logger.error(
+                f"Failed to move {len(unique_ids)} blocks to namespace '{namespace_id}': {e}",
+                exc_info=True,
+            )
+            return False, 0
+        finally:
+            self._release_connection(connection, connection_is_persistent)
 
     def delete_memory_block(
         self, block_id: str, branch: str = DEFAULT_PROTECTED_BRANCH, auto_commit: bool = False
@@ -222,12 +495,7 @@ class DoltMySQLWriter(DoltMySQLBase):
         """Delete a memory block from the Dolt SQL server."""
         # CRITICAL FIX: Use persistent connection if available to ensure deletion and staging
         # happen in the same database session for auto_commit=False scenarios
-        if self._use_persistent and self._persistent_connection:
-            connection = self._persistent_connection
-            connection_is_persistent = True
-        else:
-            connection = self._get_connection()
-            connection_is_persistent = False
+        connection, connection_is_persistent = self._acquire_connection()
         commit_hash = None
 
         try:
@@ -277,9 +545,108 @@ class DoltMySQLWriter(DoltMySQLBase):
             logger.error(f"Failed to delete block {block_id}: {e}", exc_info=True)
             return False, None
         finally:
-            # Only close if it's not a persistent connection
-            if not connection_is_persistent:
-                connection.close()
+            self._release_connection(connection, connection_is_persistent)
+
+    def delete_memory_blocks(
+        self, block_ids: List[str], branch: str = DEFAULT_PROTECTED_BRANCH
+    ) -> Tuple[bool, int]:
+        """
+        Delete many memory blocks, their properties and their links in one transaction.
+
+        Statements are set-based (IN lists of up to WRITE_BATCH_SIZE IDs): children of
+        deleted blocks get parent_id cleared, surviving parents of deleted children get
+        has_children recomputed from their remaining 'contains' links. The deletion is
+        committed to the working set and staged, but not committed to Dolt.
+
+        Args:
+            block_ids: IDs of the blocks to delete
+            branch: The Dolt branch to delete on
+
+        Returns:
+            Tuple of (success, number of memory_blocks rows deleted)
+
+        Raises:
+            MainBranchProtectionError: If the branch is protected
+        """
+        unique_ids = list(dict.fromkeys(block_ids))
+        if not unique_ids:
+            return True, 0
+
+        connection, connection_is_persistent = self._acquire_connection()
+
+        chunks = [
+            unique_ids[start : start + WRITE_BATCH_SIZE]
+            for start in range(0, len(unique_ids), WRITE_BATCH_SIZE)
+        ]
+        deleted_ids = set(unique_ids)
+
+        try:
+            # Safely ensure branch and check protection (prevents bypass attacks)
+            self._ensure_branch_and_check_protection(connection, "delete_memory_blocks", branch)
+            cursor = connection.cursor(dictionary=True)
+            cursor.execute("START TRANSACTION")
+
+            # Parents that keep existing but lose a child
+            parent_ids = set()
+            for chunk in chunks:
+                placeholders = ", ".join(["%s"] * len(chunk))
+                cursor.execute(
+                    "SELECT DISTINCT from_id FROM block_links "
+                    f"WHERE relation = %s AND to_id IN ({placeholders})",
+                    ("contains", *chunk),
+                )
+                parent_ids.update(row["from_id"] for row in cursor.fetchall())
+            parent_ids = sorted(parent_ids - deleted_ids)
+
+            deleted_count = 0
+            for chunk in chunks:
+                placeholders = ", ".join(["%s"] * len(chunk))
+                cursor.execute(
+                    "UPDATE memory_blocks SET parent_id = NULL "
+                    f"WHERE parent_id IN ({placeholders})",
+                    chunk,
+                )
+                cursor.execute(
+                    f"DELETE FROM block_links WHERE from_id IN ({placeholders}) "
+                    f"OR to_id IN ({placeholders})",
+                    (*chunk, *chunk),
+                )
+                cursor.execute(
+                    f"DELETE FROM block_properties WHERE block_id IN ({placeholders})", chunk
+                )
+                cursor.execute(f"DELETE FROM memory_blocks WHERE id IN ({placeholders})", chunk)
+                deleted_count += max(cursor.rowcount, 0)
+
+            for start in range(0, len(parent_ids), WRITE_BATCH_SIZE):
+                chunk = parent_ids[start : start + WRITE_BATCH_SIZE]
+                placeholders = ", ".join(["%s"] * len(chunk))
+                cursor.execute(
+                    "UPDATE memory_blocks SET has_children = EXISTS ("
+                    "SELECT 1 FROM block_links WHERE block_links.from_id = memory_blocks.id "
+                    f"AND block_links.relation = %s) WHERE id IN ({placeholders})",
+                    ("contains", *chunk),
+                )
+
+            # Commit the MySQL transaction so the deletion reaches the working set
+            connection.commit()
+            cursor.close()
+
+            stage_success, stage_msg = self.add_to_staging(tables=PERSISTED_TABLES)
+            if not stage_success:
+                logger.error(f"Failed to stage deletion of {deleted_count} blocks: {stage_msg}")
+
+            logger.info(f"Successfully deleted {deleted_count} blocks via MySQL connection")
+            return True, deleted_count
+
+        except MainBranchProtectionError:
+            # Let branch protection errors propagate to caller for specific handling
+            raise
+        except Exception as e:
+            connection.rollback()
+            logger.error(f"Failed to delete {len(unique_ids)} blocks: {e}", exc_info=True)
+            return False, 0
+        finally:
+            self._release_connection(connection, connection_is_persistent)
 
     def commit_changes(
         self, commit_msg: str, tables: List[str] = None, branch: str = None
@@ -292,12 +659,7 @@ class DoltMySQLWriter(DoltMySQLBase):
             branch: Optional explicit branch to commit on (default: current active branch)
         """
         # Use persistent connection if available, otherwise create new one
-        if self._use_persistent and self._persistent_connection:
-            connection = self._persistent_connection
-            connection_is_persistent = True
-        else:
-            connection = self._get_connection()
-            connection_is_persistent = False
+        connection, connection_is_persistent = self._acquire_connection()
 
         commit_hash = None
 
@@ -340,30 +702,28 @@ class DoltMySQLWriter(DoltMySQLBase):
             logger.error(f"Failed to commit changes: {e}", exc_info=True)
             return False, None
         finally:
-            # Only close if it's not a persistent connection
-            if not connection_is_persistent:
-                connection.close()
+            self._release_connection(connection, connection_is_persistent)
 
     def add_to_staging(self, tables: List[str] = None) -> Tuple[bool, Optional[str]]:
         """
         Add working changes to the staging area for the current session.
         This is a critical step before committing.
         """
-        if self._use_persistent and self._persistent_connection:
-            connection = self._persistent_connection
-            connection_is_persistent = True
+        connection, connection_is_persistent = self._acquire_connection()
+        if connection_is_persistent:
             # For persistent connections, we can check protection immediately since branch is already set
             current_branch = self._current_branch or self.active_branch
-            self._check_branch_protection("add_to_staging", current_branch)
         else:
             logger.warning(
                 "add_to_staging called without a persistent connection. Branch context may be lost."
             )
-            connection = self._get_connection()
-            connection_is_persistent = False
             # For non-persistent connections, check protection after we know the current branch
             current_branch = self.active_branch
+        try:
             self._check_branch_protection("add_to_staging", current_branch)
+        except Exception:
+            self._release_connection(connection, connection_is_persistent)
+            raise
 
         try:
             cursor = connection.cursor(dictionary=True)
@@ -401,8 +761,7 @@ class DoltMySQLWriter(DoltMySQLBase):
             logger.error(f"Failed to stage changes: {e}", exc_info=True)
             return False, str(e)
         finally:
-            if not connection_is_persistent:
-                connection.close()
+            self._release_connection(connection, connection_is_persistent)
 
     def reset(self, hard: bool = False, tables: List[str] = None) -> Tuple[bool, Optional[str]]:
         """
@@ -416,12 +775,7 @@ class DoltMySQLWriter(DoltMySQLBase):
             Tuple of (success: bool, message: Optional[str])
         """
         # Use persistent connection if available, otherwise create new one
-        if self._use_persistent and self._persistent_connection:
-            connection = self._persistent_connection
-            connection_is_persistent = True
-        else:
-            connection = self._get_connection()
-            connection_is_persistent = False
+        connection, connection_is_persistent = self._acquire_connection()
 
         try:
             cursor = connection.cursor(dictionary=True)
@@ -462,8 +816,7 @@ class DoltMySQLWriter(DoltMySQLBase):
             logger.error(error_msg, exc_info=True)
             return False, error_msg
         finally:
-            if not connection_is_persistent:
-                connection.close()
+            self._release_connection(connection, connection_is_persistent)
 
     def discard_changes(self, tables: List[str] = None) -> bool:
         """
@@ -497,12 +850,7 @@ class DoltMySQLWriter(DoltMySQLBase):
             A list of dictionaries, where each dictionary represents a changed table.
         """
         # Use persistent connection if available, otherwise create a new one
-        if self._use_persistent and self._persistent_connection:
-            connection = self._persistent_connection
-            connection_is_persistent = True
-        else:
-            connection = self._get_connection()
-            connection_is_persistent = False
+        connection, connection_is_persistent = self._acquire_connection()
 
         try:
             cursor = connection.cursor(dictionary=True)
@@ -523,8 +871,7 @@ class DoltMySQLWriter(DoltMySQLBase):
             # Optionally re-raise or handle as appropriate
             raise
         finally:
-            if not connection_is_persistent:
-                connection.close()
+            self._release_connection(connection, connection_is_persistent)
 
     def push_to_remote(
         self,
@@ -546,12 +893,7 @@ class DoltMySQLWriter(DoltMySQLBase):
             Tuple of (success: bool, message: Optional[str])
         """
         # Use persistent connection if available, otherwise create new one
-        if self._use_persistent and self._persistent_connection:
-            connection = self._persistent_connection
-            connection_is_persistent = True
-        else:
-            connection = self._get_connection()
-            connection_is_persistent = False
+        connection, connection_is_persistent = self._acquire_connection()
 
         try:
             # Safely ensure branch and check protection (prevents bypass attacks)
@@ -608,9 +950,7 @@ class DoltMySQLWriter(DoltMySQLBase):
             logger.error(error_msg, exc_info=True)
             return False, error_msg
         finally:
-            # Only close if it's not a persistent connection
-            if not connection_is_persistent:
-                connection.close()
+            self._release_connection(connection, connection_is_persistent)
 
     def pull_from_remote(
         self,
@@ -894,12 +1234,7 @@ class DoltMySQLWriter(DoltMySQLBase):
             True if proof was stored successfully, False otherwise
         """
         # Use persistent connection if available, otherwise create new one
-        if self._use_persistent and self._persistent_connection:
-            connection = self._persistent_connection
-            connection_is_persistent = True
-        else:
-            connection = self._get_connection()
-            connection_is_persistent = False
+        connection, connection_is_persistent = self._acquire_connection()
 
         try:
             # Safely ensure branch and check protection (prevents bypass attacks)
@@ -941,9 +1276,73 @@ class DoltMySQLWriter(DoltMySQLBase):
             logger.error(f"Failed to store block proof for {block_id}: {e}", exc_info=True)
             return False
         finally:
-            # Only close if it's not a persistent connection
-            if not connection_is_persistent:
-                connection.close()
+            self._release_connection(connection, connection_is_persistent)
+
+    def write_block_proofs(
+        self,
+        block_ids: List[str],
+        operation: str,
+        commit_hash: str,
+        branch: str = DEFAULT_PROTECTED_BRANCH,
+    ) -> bool:
+        """
+        Write the same operation proof for many blocks with multi-row inserts.
+
+        Args:
+            block_ids: The IDs of the blocks
+            operation: The operation type ('create', 'update', 'delete')
+            commit_hash: The Dolt commit hash for this operation
+            branch: The Dolt branch to write to
+
+        Returns:
+            True if all proofs were stored successfully, False otherwise
+        """
+        if not block_ids:
+            return True
+
+        # Use persistent connection if available, otherwise create new one
+        connection, connection_is_persistent = self._acquire_connection()
+
+        try:
+            # Safely ensure branch and check protection (prevents bypass attacks)
+            self._ensure_branch_and_check_protection(connection, "write_block_proofs", branch)
+            cursor = connection.cursor(dictionary=True)
+
+            for start in range(0, len(block_ids), WRITE_BATCH_SIZE):
+                chunk = block_ids[start : start + WRITE_BATCH_SIZE]
+                values = ", ".join(["(%s, %s, %s, NOW())"] * len(chunk))
+                params = [
+                    value for block_id in chunk for value in (block_id, commit_hash, operation)
+                ]
+                cursor.execute(
+                    "INSERT INTO block_proofs (block_id, commit_hash, operation, timestamp) "
+                    f"VALUES {values}",
+                    params,
+                )
+
+            # Commit the MySQL transaction to persist the write
+            connection.commit()
+
+            stage_success, stage_msg = self.add_to_staging(tables=["block_proofs"])
+            if not stage_success:
+                logger.warning(
+                    f"Block proofs written but failed to stage: {stage_msg}. "
+                    f"Changes remain in working directory for {len(block_ids)} blocks"
+                )
+
+            cursor.close()
+            logger.info(
+                f"Stored {len(block_ids)} block proofs: {operation} operation "
+                f"with commit {commit_hash}"
+            )
+            return True
+
+        except Exception as e:
+            connection.rollback()
+            logger.error(f"Failed to store block proofs for {len(block_ids)} blocks: {e}")
+            return False
+        finally:
+            self._release_connection(connection, connection_is_persistent)
 
     def merge_branch(
         self,
@@ -0,0 +1,231 @@
+"""
+Persistent content-hash cache for text embeddings.
+
+Embedding requests are the slowest and only paid step of indexing a
+MemoryBlock. The vector for a given text never changes for a fixed model, so
+this module stores embeddings in a local SQLite file keyed by
+(model, dimensions, sha256(text)) and lets the embedder skip texts it has
+already seen - e.g. when a block's metadata changes but its text does not, or
+when the whole index is rebuilt.
+
+Entries are evicted least-recently-used once the cache grows past max_entries.
+The entry count is read once at open and tracked in memory afterwards, so
+writes do not scan the table. Vectors are stored as float32 blobs.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 100_000
+IN_MEMORY_PATH = ":memory:"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    dimensions INTEGER NOT NULL,
+    text_hash TEXT NOT NULL,
+    embedding BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (model, dimensions, text_hash)
+);
+CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings (last_used);
+"""
+
+# SQLite's default limit on bound parameters is 999; keep lookups well below it
+_LOOKUP_CHUNK_SIZE = 500
+
+
+def text_hash(text: str) -> str:
+    """Return the cache key component for `text`."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Thread-safe SQLite-backed embedding cache with LRU eviction.
+
+    A max_entries of 0 disables the cache: lookups always miss and nothing is stored.
+    """
+
+    def __init__(self, path: str = IN_MEMORY_PATH, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, int] = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+        if path != IN_MEMORY_PATH:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+        self._connection.commit()
+        (self._size,) = self._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        logger.info(f"Embedding cache ready at {path} (max_entries={max_entries})")
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.max_entries > 0
+
+    def get_many(
+        self, model: str, dimensions: Optional[int], texts: Sequence[str]
+    ) -> List[Optional[List[float]]]:
+        """
+        Look up embeddings for `texts`.
+
+        Returns:
+            A list aligned with `texts` holding the cached vector or None for a miss.
+        """
+        if not self.enabled or not texts:
+            return [None] * len(texts)
+
+        hashes = [text_hash(text) for text in texts]
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            unique = list(dict.fromkeys(hashes))
+            for start in range(0, len(unique), _LOOKUP_CHUNK_SIZE):
+                chunk = unique[start : start + _LOOKUP_CHUNK_SIZE]
+                placeholders = ",".join("?" for _ in chunk)
+                rows = self._connection.execute(
+                    f"SELECT text_hash, embedding FROM embeddings "
+                    f"WHERE model = ? AND dimensions = ? AND text_hash IN ({placeholders})",
+                    (model, dimensions or 0, *chunk),
+                ).fetchall()
+                for row_hash, blob in rows:
+                    found[row_hash] = array("f", blob).tolist()
+
+            if found:
+                now = time.time()
+                self._connection.executemany(
+                    "UPDATE embeddings SET last_used = ? "
+                    "WHERE model = ? AND dimensions = ? AND text_hash = ?",
+                    [(now, model, dimensions or 0, h) for h in found],
+                )
+                self._connection.commit()
+
+            results = [found.get(h) for h in hashes]
+            hits = sum(1 for result in results if result is not None)
+            self._metrics["hits"] += hits
+            self._metrics["misses"] += len(results) - hits
+        return results
+
+    def put_many(
+        self,
+        model: str,
+        dimensions: Optional[int],
+        texts: Sequence[str],
+        embeddings: Sequence[Sequence[float]],
+    ) -> None:
+        """Store embeddings for `texts`, evicting the least recently used entries if full."""
+        if not self.enabled or not texts:
+            return
+        now = time.time()
+        rows = [
+            (model, dimensions or 0, text_hash(text), array("f", embedding).tobytes(), now, now)
+            for text, embedding in zip(texts, embeddings)
+        ]
+        with self._lock:
+            new_hashes = set(row[2] for row in rows) - self._existing_hashes_locked(
+                model, dimensions, [row[2] for row in rows]
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings "
+                "(model, dimensions, text_hash, embedding, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._size += len(new_hashes)
+            self._metrics["writes"] += len(rows)
+            if self._size > self.max_entries:
+                self._evict_locked(self.max_entries)
+            self._connection.commit()
+
+    def _existing_hashes_locked(
+        self, model: str, dimensions: Optional[int], hashes: Sequence[str]
+    ) -> Set[str]:
+        """Return which of `hashes` are already stored (primary-key lookups only)."""
+        existing: Set[str] = set()
+        unique = list(dict.fromkeys(hashes))
+        for start in range(0, len(unique), _LOOKUP_CHUNK_SIZE):
+            chunk = unique[start : start + _LOOKUP_CHUNK_SIZE]
+            placeholders = ",".join("?" for _ in chunk)
+            rows = self._connection.execute(
+                f"SELECT text_hash FROM embeddings "
+                f"WHERE model = ? AND dimensions = ? AND text_hash IN ({placeholders})",
+                (model, dimensions or 0, *chunk),
+            ).fetchall()
+            existing.update(row_hash for (row_hash,) in rows)
+        return existing
+
+    def get(self, model: str, dimensions: Optional[int], text: str) -> Optional[List[float]]:
+        """Look up a single embedding."""
+        return self.get_many(model, dimensions, [text])[0]
+
+    def put(
+        self, model: str, dimensions: Optional[int], text: str, embedding: Sequence[float]
+    ) -> None:
+        """Store a single embedding."""
+        self.put_many(model, dimensions, [text], [embedding])
+
+    def evict(self, max_entries: Optional[int] = None) -> int:
+        """
+        Drop least recently used entries until at most `max_entries` remain.
+
+        Args:
+            max_entries: Target size (defaults to the cache's max_entries)
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            removed = self._evict_locked(self.max_entries if max_entries is None else max_entries)
+            self._connection.commit()
+        return removed
+
+    def _evict_locked(self, max_entries: int) -> int:
+        overflow = self._size - max(max_entries, 0)
+        if overflow <= 0:
+            return 0
+        removed = self._connection.execute(
+            "DELETE FROM embeddings WHERE rowid IN "
+            "(SELECT rowid FROM embeddings ORDER BY last_used ASC LIMIT ?)",
+            (overflow,),
+        ).rowcount
+        self._size -= removed
+        self._metrics["evictions"] += removed
+        logger.debug(f"Evicted {removed} embeddings from cache")
+        return removed
+
+    def clear(self) -> None:
+        """Remove every cached embedding."""
+        with self._lock:
+            self._connection.execute("DELETE FROM embeddings")
+            self._connection.commit()
+            self._size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache size and hit/miss/write/eviction counters."""
+        with self._lock:
+            (size,) = self._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+            lookups = self._metrics["hits"] + self._metrics["misses"]
+            return {
+                "path": self.path,
+                "size": size,
+                "max_entries": self.max_entries,
+                "hit_rate": (self._metrics["hits"] / lookups) if lookups else 0.0,
+                **self._metrics,
+            }
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._connection.close()
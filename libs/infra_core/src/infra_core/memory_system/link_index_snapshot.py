@@ -0,0 +1,147 @@
+"""
+Materialized in-memory snapshot of a branch's block_links table.
+
+SQLLinkManager (with enable_link_index=True) keeps one LinkIndexSnapshot per Dolt
+branch. A snapshot is bulk-loaded once, updated in place by the manager's own
+writes, and caught up with changes made elsewhere (merges, pulls, other writers,
+committed or not) whenever the branch's working-set hash moves:
+1. Working-set changes applied since the snapshot's commit are undone
+2. The DOLT_DIFF between the snapshot's commit and the branch head is applied
+3. The DOLT_DIFF between the head and the working set is applied, remembering
+   the committed value of every link it touches so step 1 can undo it later
+Link reads are then answered from the LinkIndex adjacency maps instead of SQL.
+"""
+
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .link_manager import Direction, LinkIndex
+from .schemas.common import BlockLink
+
+LinkKey = Tuple[str, str, str]
+
+
+class LinkIndexSnapshot:
+    """
+    All links of one branch, held as BlockLinks plus a LinkIndex over their keys.
+
+    Not thread-safe on its own; SQLLinkManager serializes access with a lock.
+    """
+
+    def __init__(
+        self, branch: str, commit_hash: Optional[str] = None, working_hash: Optional[str] = None
+    ):
+        self.branch = branch
+        self.commit_hash = commit_hash
+        self.working_hash = working_hash
+        self.checked_at = time.monotonic()
+        self.index = LinkIndex()
+        self.links: Dict[LinkKey, BlockLink] = {}
+        # Values at commit_hash of links changed since (None: the link did not exist)
+        self._committed: Dict[LinkKey, Optional[BlockLink]] = {}
+
+    def __len__(self) -> int:
+        return len(self.links)
+
+    def upsert(self, link: BlockLink) -> None:
+        """Add a link or replace the stored values of an existing one."""
+        key = (link.from_id, link.to_id, link.relation)
+        if key not in self.links:
+            self.index.add_link(*key)
+        self.links[key] = link
+
+    def remove(self, from_id: str, to_id: str, relation: str) -> bool:
+        """Remove a link. Returns False if it was not in the snapshot."""
+        if self.links.pop((from_id, to_id, relation), None) is None:
+            return False
+        self.index.remove_link(from_id, to_id, relation)
+        return True
+
+    def remove_block(self, block_id: str) -> int:
+        """Remove every link from or to a block. Returns the number removed."""
+        keys = self.index.links_of(block_id, Direction.BOTH)
+        for key in keys:
+            self.remove(*key)
+        return len(keys)
+
+    def track(self, key: LinkKey) -> None:
+        """Remember the committed value of a link before it is changed in place."""
+        if key not in self._committed:
+            self._committed[key] = self.links.get(key)
+
+    def track_working_diff(self, rows: Iterable[Dict[str, Any]], to_link) -> None:
+        """
+        Record committed values from DOLT_DIFF(commit_hash, 'WORKING', 'block_links')
+        rows whose changes the snapshot already holds (e.g. it was loaded from the
+        working set).
+        """
+        for row in rows:
+            if row["diff_type"] == "added":
+                key = (row["to_from_id"], row["to_to_id"], row["to_relation"])
+                self._committed.setdefault(key, None)
+            else:
+                key = (row["from_from_id"], row["from_to_id"], row["from_relation"])
+                old_row = {k[len("from_") :]: v for k, v in row.items() if k.startswith("from_")}
+                self._committed.setdefault(key, to_link(old_row))
+
+    def reset_to_commit(self) -> None:
+        """Undo every tracked change, leaving exactly the links at commit_hash."""
+        for key, link in self._committed.items():
+            if link is None:
+                self.remove(*key)
+            else:
+                self.upsert(link)
+        self._committed.clear()
+
+    def apply_diff(self, rows: Iterable[Dict[str, Any]], to_link, track: bool = False) -> int:
+        """
+        Apply DOLT_DIFF(..., 'block_links') rows to the snapshot.
+
+        Args:
+            rows: Diff rows with diff_type plus from_*/to_* columns
+            to_link: Callable building a BlockLink from a block_links-shaped row
+            track: Remember committed values so reset_to_commit() can undo the rows
+                (for diffs against the working set)
+
+        Returns:
+            Number of rows applied
+        """
+        applied = 0
+        for row in rows:
+            if row["diff_type"] in ("removed", "modified"):
+                key = (row["from_from_id"], row["from_to_id"], row["from_relation"])
+                if track:
+                    self.track(key)
+                self.remove(*key)
+            if row["diff_type"] in ("added", "modified"):
+                new_row = {k[len("to_") :]: v for k, v in row.items() if k.startswith("to_")}
+                link = to_link(new_row)
+                if track:
+                    self.track((link.from_id, link.to_id, link.relation))
+                self.upsert(link)
+            applied += 1
+        return applied
+
+    def select(
+        self,
+        block_id: str,
+        relation: Optional[str] = None,
+        direction: Direction = Direction.OUTBOUND,
+        depth: int = 1,
+    ) -> List[BlockLink]:
+        """
+        Links touching a block, or with depth > 1 the links among every block
+        reachable within depth hops (mirrors SQLLinkManager.links_from/links_to).
+        """
+        if depth > 1:
+            block_ids = {block_id}
+            block_ids |= self.index.get_connected_blocks(block_id, relation, direction, depth)
+            keys = {
+                key
+                for member in block_ids
+                for key in self.index.links_of(member, Direction.OUTBOUND)
+                if key[1] in block_ids
+            }
+        else:
+            keys = self.index.links_of(block_id, direction)
+        return [self.links[key] for key in keys if relation in (None, key[2])]
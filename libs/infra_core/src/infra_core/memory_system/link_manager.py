@@ -7,7 +7,7 @@ referential integrity enforcement, cycle detection, and efficient querying.
 
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Dict, List, Optional, Set, Tuple, Any, Iterator, Union, get_args
+from typing import Callable, Dict, List, Optional, Set, Tuple, Any, Iterator, Union, get_args
 
 from .schemas.common import BlockLink, RelationType
 from .relation_registry import CANONICAL_DEPENDENCY_RELATION
@@ -109,7 +109,10 @@ class LinkIndex:
     """
     In-memory index for link operations with incremental in_degree tracking.
 
-    Optimizes graph traversal and ready_tasks queries for performance.
+    Optimizes graph traversal and ready_tasks queries for performance: besides the
+    in-degree counts, a per-relation zero in-degree frontier (blocks with outbound
+    links and no inbound links of the relation) is kept current by add_link and
+    remove_link, so get_ready_tasks never scans the adjacency lists.
     """
 
     def __init__(self):
@@ -126,9 +129,13 @@ class LinkIndex:
         # This is a performance optimization for ready_tasks
         self._in_degree = collections.defaultdict(lambda: collections.defaultdict(int))
 
+        # Zero in-degree frontier (relation -> source blocks with no inbound links
+        # of the relation), built on first use of a relation
+        self._ready: Dict[str, Set[str]] = {}
+
     def add_link(self, from_id: str, to_id: str, relation: RelationType) -> None:
         """
-        Add a link to the index.
+        Add a link to the index. Adding a link that is already indexed is a no-op.
 
         Args:
             from_id: Source block ID
@@ -138,6 +145,11 @@ class LinkIndex:
         # Get the relation as a string for consistent indexing
         relation_str = relation if isinstance(relation, str) else relation
 
+        if (to_id, relation_str) in self._outbound.get(from_id, ()):
+            return
+        new_source = from_id not in self._outbound
+        ready = self._frontier(relation_str)
+
         # Add to outbound adjacency list
         self._outbound[from_id].add((to_id, relation_str))
 
@@ -147,6 +159,14 @@ class LinkIndex:
         # Increment in-degree count for this relation type
         self._in_degree[relation_str][to_id] += 1
 
+        # Maintain the frontiers: the target is now blocked for this relation, and a
+        # block that just became a source is ready wherever nothing points at it
+        ready.discard(to_id)
+        if new_source:
+            for rel, frontier in self._ready.items():
+                if from_id not in self._in_degree.get(rel, {}):
+                    frontier.add(from_id)
+
     def remove_link(self, from_id: str, to_id: str, relation: RelationType) -> None:
         """
         Remove a link from the index.
@@ -159,37 +179,87 @@ class LinkIndex:
         # Get the relation as a string for consistent indexing
         relation_str = relation if isinstance(relation, str) else relation
 
-        # Remove from outbound adjacency list if exists
-        if from_id in self._outbound and (to_id, relation_str) in self._outbound[from_id]:
-            self._outbound[from_id].remove((to_id, relation_str))
-            # Clean up empty sets
-            if not self._outbound[from_id]:
-                del self._outbound[from_id]
-
-        # Remove from inbound adjacency list if exists
-        if to_id in self._inbound and (from_id, relation_str) in self._inbound[to_id]:
-            self._inbound[to_id].remove((from_id, relation_str))
-            # Clean up empty sets
-            if not self._inbound[to_id]:
-                del self._inbound[to_id]
-
-            # Decrement in-degree count
-            self._in_degree[relation_str][to_id] -= 1
-            # Clean up zero counts
-            if self._in_degree[relation_str][to_id] == 0:
-                del self._in_degree[relation_str][to_id]
-            if not self._in_degree[relation_str]:
-                del self._in_degree[relation_str]
+        if (to_id, relation_str) not in self._outbound.get(from_id, ()):
+            return
+
+        # Remove from outbound adjacency list
+        self._outbound[from_id].remove((to_id, relation_str))
+        # Clean up empty sets; a block without outbound links leaves every frontier
+        if not self._outbound[from_id]:
+            del self._outbound[from_id]
+            for frontier in self._ready.values():
+                frontier.discard(from_id)
+
+        # Remove from inbound adjacency list
+        self._inbound[to_id].remove((from_id, relation_str))
+        # Clean up empty sets
+        if not self._inbound[to_id]:
+            del self._inbound[to_id]
+
+        # Decrement in-degree count
+        self._in_degree[relation_str][to_id] -= 1
+        # Clean up zero counts
+        if self._in_degree[relation_str][to_id] == 0:
+            del self._in_degree[relation_str][to_id]
+            # A target without remaining blockers is ready again if it is a source
+            if to_id in self._outbound:
+                self._frontier(relation_str).add(to_id)
+        if not self._in_degree[relation_str]:
+            del self._in_degree[relation_str]
+
+    def _frontier(self, relation_str: str) -> Set[str]:
+        """Get the zero in-degree frontier of a relation, building it on first use."""
+        frontier = self._ready.get(relation_str)
+        if frontier is None:
+            blocked = self._in_degree.get(relation_str, {})
+            frontier = {block_id for block_id in self._outbound if block_id not in blocked}
+            self._ready[relation_str] = frontier
+        return frontier
+
+    def in_degree(self, block_id: str, relation: Union[str, RelationType]) -> int:
+        """Number of inbound links of the specified relation pointing at block_id."""
+        return self._in_degree.get(relation, {}).get(block_id, 0)
+
+    def links_of(
+        self, block_id: str, direction: Direction = Direction.BOTH
+    ) -> Set[Tuple[str, str, str]]:
+        """
+        Get the (from_id, to_id, relation) keys of links touching a block.
+
+        Args:
+            block_id: Block ID
+            direction: OUTBOUND for links from the block, INBOUND for links to it, or BOTH
+
+        Returns:
+            Set of link keys
+        """
+        keys = set()
+        if direction in (Direction.OUTBOUND, Direction.BOTH):
+            for to_id, rel in self._outbound.get(block_id, ()):
+                keys.add((block_id, to_id, rel))
+        if direction in (Direction.INBOUND, Direction.BOTH):
+            for from_id, rel in self._inbound.get(block_id, ()):
+                keys.add((from_id, block_id, rel))
+        return keys
 
     def get_ready_tasks(
-        self, relation: Union[str, RelationType] = CANONICAL_DEPENDENCY_RELATION
+        self,
+        relation: Union[str, RelationType] = CANONICAL_DEPENDENCY_RELATION,
+        include: Optional[Callable[[str], bool]] = None,
+        sort_key: Optional[Callable[[str], Any]] = None,
     ) -> List[str]:
         """
         Get IDs of blocks that have zero inbound links of the specified relation.
 
+        Read directly off the ready frontier, so the cost depends on the number of
+        ready blocks rather than on the size of the graph.
+
         Args:
             relation: Relation type to check (default: CANONICAL_DEPENDENCY_RELATION)
                      Can be a string literal or a RelationType value
+            include: Optional predicate; only block IDs it accepts are returned
+            sort_key: Optional key for ordering the result (ties and the default
+                     order are by block ID)
 
         Returns:
             List of block IDs with no inbound dependencies
@@ -197,21 +267,13 @@ class LinkIndex:
         # Get the relation as a string for consistent indexing
         relation_str = relation if isinstance(relation, str) else relation
 
-        # All block IDs that appear in outbound links with this relation
-        all_blocks = set()
-        for from_id, links in self._outbound.items():
-            all_blocks.add(from_id)
-            for to_id, rel in links:
-                if rel == relation_str:
-                    all_blocks.add(to_id)
-
-        # Return blocks with zero in-degree for this relation
-        # By checking which blocks in all_blocks don't appear in the in_degree map
-        return [
-            block_id
-            for block_id in all_blocks
-            if block_id not in self._in_degree.get(relation_str, {})
-        ]
+        ready = self._frontier(relation_str)
+        if include is not None:
+            ready = [block_id for block_id in ready if include(block_id)]
+        ordered = sorted(ready)
+        if sort_key is not None:
+            ordered.sort(key=sort_key)
+        return ordered
 
     def has_path(self, start_id: str, end_id: str, relation: Union[str, RelationType]) -> bool:
         """
@@ -262,7 +324,7 @@ class LinkIndex:
     def get_connected_blocks(
         self,
         block_id: str,
-        relation: Union[str, RelationType],
+        relation: Optional[Union[str, RelationType]],
         direction: Direction = Direction.OUTBOUND,
         depth: int = 1,
     ) -> Set[str]:
@@ -271,7 +333,7 @@ class LinkIndex:
 
         Args:
             block_id: Starting block ID
-            relation: Relation type to follow
+            relation: Relation type to follow (None follows every relation)
             direction: Direction to traverse (OUTBOUND, INBOUND, or BOTH)
             depth: Maximum traversal depth
 
@@ -298,7 +360,7 @@ class LinkIndex:
             # Process outbound links
             if direction in (Direction.OUTBOUND, Direction.BOTH) and current in self._outbound:
                 for neighbor, rel in self._outbound[current]:
-                    if rel == relation_str and (
+                    if relation_str in (None, rel) and (
                         neighbor not in visited or visited[neighbor] > current_depth + 1
                     ):
                         visited[neighbor] = current_depth + 1
@@ -309,7 +371,7 @@ class LinkIndex:
             # Process inbound links
             if direction in (Direction.INBOUND, Direction.BOTH) and current in self._inbound:
                 for neighbor, rel in self._inbound[current]:
-                    if rel == relation_str and (
+                    if relation_str in (None, rel) and (
                         neighbor not in visited or visited[neighbor] > current_depth + 1
                     ):
                         visited[neighbor] = current_depth + 1
@@ -415,8 +477,9 @@ class LinkQuery:
 
         Args:
             cursor: Pagination cursor, which can be:
-                   - A simple offset integer (e.g., "100")
-                   - An opaque token from a previous query's next_cursor
+                   - A simple offset integer (e.g., "100"), used by InMemoryLinkManager
+                   - An opaque token from a previous query's next_cursor (SQLLinkManager
+                     issues keyset cursors that stay constant-time at any page depth)
 
         Raises:
             ValueError: If cursor is not a valid format
@@ -655,7 +718,8 @@ class LinkManager(ABC):
         Create or update multiple links in a single operation.
 
         Args:
-            links: List of (from_id, to_id, relation, metadata) tuples
+            links: List of (from_id, to_id, relation, metadata[, priority[, created_by]])
+                tuples; priority defaults to 0 and created_by to None
 
         Returns:
             List of created/updated BlockLinks
@@ -1147,7 +1211,8 @@ class InMemoryLinkManager(LinkManager):
         Create or update multiple links in a single operation.
 
         Args:
-            links: List of (from_id, to_id, relation, metadata) tuples
+            links: List of (from_id, to_id, relation, metadata[, priority[, created_by]])
+                tuples; priority defaults to 0 and created_by to None
 
         Returns:
             List of created/updated BlockLinks
@@ -1157,21 +1222,21 @@ class InMemoryLinkManager(LinkManager):
             RuntimeError: If operation fails due to database error
         """
         # Validate all links first
-        for from_id, to_id, relation, _ in links:
+        for from_id, to_id, relation, *_ in links:
             self._validate_uuid(from_id, to_id)
             self._validate_relation(relation)
 
         # Check for cycles
         # First add all links to a temporary index
         temp_index = LinkIndex()
-        for from_id, to_id, relation, _ in links:
+        for from_id, to_id, relation, *_ in links:
             relation_str = relation if isinstance(relation, str) else relation
             temp_index.add_link(from_id, to_id, relation_str)
 
         # Check for cycles in each relation type
-        for relation_type in set(rel for _, _, rel, _ in links):
+        for relation_type in set(link[2] for link in links):
             relation_str = relation_type if isinstance(relation_type, str) else relation_type
-            for from_id, _, _, _ in links:
+            for from_id, *_ in links:
                 if temp_index.has_path(from_id, from_id, relation_str):
                     raise LinkError(
                         LinkErrorType.CYCLE_DETECTED,
@@ -1180,10 +1245,17 @@ class InMemoryLinkManager(LinkManager):
 
         # No cycles, proceed with the upsert
         results = []
-        for from_id, to_id, relation, metadata in links:
+        for from_id, to_id, relation, metadata, *extra in links:
+            priority = extra[0] if len(extra) > 0 else 0
+            created_by = extra[1] if len(extra) > 1 else None
             try:
                 link = self.create_link(
-                    from_id=from_id, to_id=to_id, relation=relation, link_metadata=metadata
+                    from_id=from_id,
+                    to_id=to_id,
+                    relation=relation,
+                    priority=priority,
+                    link_metadata=metadata,
+                    created_by=created_by,
                 )
                 results.append(link)
             except LinkError as e:
@@ -1191,6 +1263,7 @@ class InMemoryLinkManager(LinkManager):
                     # Link already exists, update it
                     link_key = (from_id, to_id, relation if isinstance(relation, str) else relation)
                     link = self._links[link_key]
+                    link.priority = priority
                     if metadata is not None:
                         link.link_metadata = metadata
                     results.append(link)
@@ -1,20 +1,25 @@
+import json
 import os
 import logging
+import time
 import chromadb
 from llama_index.core import StorageContext, VectorStoreIndex, load_index_from_storage
-from llama_index.core.schema import NodeWithScore  # Added import for return type
+from llama_index.core.schema import MetadataMode, NodeWithScore
 from llama_index.vector_stores.chroma import ChromaVectorStore
 from llama_index.core.graph_stores.simple import SimpleGraphStore
+from llama_index.core.vector_stores.utils import node_to_metadata_dict
 
 # Temporarily disabled due to HuggingFace dependency conflicts
 # from llama_index.embeddings.huggingface import HuggingFaceEmbedding
 from llama_index.embeddings.openai import OpenAIEmbedding
 from llama_index.core.settings import Settings
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 # Local schema import (assuming it will exist)
 from .schemas.memory_block import MemoryBlock
-from .llamaindex_adapters import memory_block_to_node  # Added import for node conversion
+from .embedding_cache import DEFAULT_MAX_ENTRIES as DEFAULT_EMBEDDING_CACHE_ENTRIES
+from .embedding_cache import EmbeddingCache
+from .llamaindex_adapters import CachedEmbedding, memory_block_to_node
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -24,6 +29,14 @@ DEFAULT_CHROMA_PATH = "./storage/chroma"
 DEFAULT_COLLECTION_NAME = "cogni_memory_poc"
 DEFAULT_GRAPH_STORE_FILENAME = "graph_store.json"
 IN_MEMORY_PATH = ":memory:"  # Define a constant for clarity
+DEFAULT_EMBED_BATCH_SIZE = 64  # Blocks embedded per request in add_blocks
+DEFAULT_EMBEDDING_CACHE_FILENAME = "embedding_cache.sqlite"
+
+
+def to_chroma_where(filters: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert flat exact-match filters into a Chroma `where` clause (AND of $eq)."""
+    clauses = [{key: {"$eq": value}} for key, value in filters.items()]
+    return clauses[0] if len(clauses) == 1 else {"$and": clauses}
 
 
 class LlamaMemory:
@@ -37,6 +50,8 @@ class LlamaMemory:
         self,
         chroma_path: str = DEFAULT_CHROMA_PATH,
         collection_name: str = DEFAULT_COLLECTION_NAME,
+        embedding_cache_path: Optional[str] = None,
+        embedding_cache_max_entries: Optional[int] = None,
     ):
         """
         Initializes the LlamaMemory system.
@@ -44,6 +59,10 @@ class LlamaMemory:
         Args:
             chroma_path: Path to the directory for ChromaDB persistent storage.
             collection_name: Name of the collection within ChromaDB.
+            embedding_cache_path: SQLite file for cached embeddings (defaults to
+                EMBEDDING_CACHE_PATH, else a file inside chroma_path; in-memory for ":memory:").
+            embedding_cache_max_entries: Maximum cached embeddings (defaults to
+                EMBEDDING_CACHE_MAX_ENTRIES or 100000). 0 disables the cache.
         """
         self.chroma_path = chroma_path
         self.collection_name = collection_name
@@ -52,6 +71,7 @@ class LlamaMemory:
         self.client = None
         self.vector_store = None
         self.graph_store = None
+        self.embedding_cache = None
         self._is_in_memory = self.chroma_path == IN_MEMORY_PATH
 
         # Using OpenAI embeddings with custom dimensions to match ChromaDB collection
@@ -59,6 +79,13 @@ class LlamaMemory:
         try:
             # Initialize OpenAI embedding model with 384 dimensions to match ChromaDB
             embed_model = OpenAIEmbedding(model="text-embedding-3-small", dimensions=384)
+
+            # Serve previously embedded texts from the local content-hash cache
+            self.embedding_cache = self._create_embedding_cache(
+                embedding_cache_path, embedding_cache_max_entries
+            )
+            if self.embedding_cache:
+                embed_model = CachedEmbedding(embed_model, self.embedding_cache, dimensions=384)
             Settings.embed_model = embed_model
 
             # CRITICAL: Explicitly disable LLM in Settings to prevent OpenAI initialization
@@ -169,6 +196,33 @@ class LlamaMemory:
             self.client = None
             self.graph_store = None
 
+    def _create_embedding_cache(
+        self, path: Optional[str], max_entries: Optional[int]
+    ) -> Optional[EmbeddingCache]:
+        """Open the embedding cache, or return None if it is disabled or unavailable."""
+        if max_entries is None:
+            max_entries = int(
+                os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", str(DEFAULT_EMBEDDING_CACHE_ENTRIES))
+            )
+        if max_entries <= 0:
+            logging.info("Embedding cache disabled")
+            return None
+        if path is None:
+            path = os.getenv("EMBEDDING_CACHE_PATH") or (
+                IN_MEMORY_PATH
+                if self._is_in_memory
+                else os.path.join(self.chroma_path, DEFAULT_EMBEDDING_CACHE_FILENAME)
+            )
+        try:
+            return EmbeddingCache(path, max_entries=max_entries)
+        except Exception as e:
+            logging.warning(f"Embedding cache unavailable at {path}, embedding without it: {e}")
+            return None
+
+    def embedding_cache_stats(self) -> Dict[str, Any]:
+        """Return embedding cache size and hit-rate counters (empty if the cache is disabled)."""
+        return self.embedding_cache.stats() if self.embedding_cache else {}
+
     def is_ready(self) -> bool:
         """Check if the memory system is fully initialized and ready."""
         return bool(self.index and self.query_engine and self.vector_store and self.client)
@@ -208,7 +262,118 @@ class LlamaMemory:
             logging.error(f"Failed to insert node for block ID {block.id}: {e}", exc_info=True)
             return  # Stop if vector insert fails
 
-        # Add graph relationships to graph store
+        # Add graph relationships to graph store, persisting if it changed
+        if self._add_graph_triplets(node):
+            self._persist_graph_store()
+
+    def add_blocks(
+        self,
+        blocks: List[MemoryBlock],
+        batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+        replace_existing: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Indexes many MemoryBlocks at once.
+
+        Nodes are embedded with one embedding request per batch and inserted per
+        batch; the index and graph store are persisted once at the end instead of
+        once per block. A failing batch is logged and skipped so the remaining
+        batches are still indexed.
+
+        Args:
+            blocks: The MemoryBlocks to index.
+            batch_size: Number of blocks embedded and inserted per batch.
+            replace_existing: Delete any nodes already indexed under the same IDs
+                before inserting (use when re-indexing modified blocks).
+
+        Returns:
+            Metrics dict with counts (total, indexed, batches, failed_ids), timings in
+            seconds (embed_seconds, insert_seconds, persist_seconds, elapsed_seconds)
+            and throughput (blocks_per_second), plus embedding_cache stats when the
+            embedding cache is enabled.
+        """
+        metrics: Dict[str, Any] = {
+            "total": len(blocks),
+            "indexed": 0,
+            "batches": 0,
+            "failed_ids": [],
+            "embed_seconds": 0.0,
+            "insert_seconds": 0.0,
+            "persist_seconds": 0.0,
+            "elapsed_seconds": 0.0,
+            "blocks_per_second": 0.0,
+        }
+        if not self.is_ready():
+            logging.error("LlamaMemory is not ready. Cannot add blocks.")
+            metrics["failed_ids"] = [block.id for block in blocks]
+            return metrics
+        if not blocks:
+            return metrics
+
+        batch_size = max(1, batch_size)
+        started = time.perf_counter()
+        graph_changed = False
+
+        for offset in range(0, len(blocks), batch_size):
+            batch = blocks[offset : offset + batch_size]
+            metrics["batches"] += 1
+            try:
+                nodes = [memory_block_to_node(block) for block in batch]
+
+                # One embedding request for the whole batch
+                embed_started = time.perf_counter()
+                embeddings = Settings.embed_model.get_text_embedding_batch(
+                    [node.get_content(metadata_mode=MetadataMode.EMBED) for node in nodes]
+                )
+                for node, embedding in zip(nodes, embeddings):
+                    node.embedding = embedding
+                metrics["embed_seconds"] += time.perf_counter() - embed_started
+
+                # Pre-embedded nodes are inserted without further embedding calls
+                insert_started = time.perf_counter()
+                if replace_existing:
+                    self.index.delete_nodes([node.id_ for node in nodes])
+                self.index.insert_nodes(nodes)
+                metrics["insert_seconds"] += time.perf_counter() - insert_started
+            except Exception as e:
+                logging.error(
+                    f"Failed to index batch of {len(batch)} blocks starting at {offset}: {e}",
+                    exc_info=True,
+                )
+                metrics["failed_ids"].extend(block.id for block in batch)
+                continue
+
+            metrics["indexed"] += len(nodes)
+            for node in nodes:
+                graph_changed = self._add_graph_triplets(node) or graph_changed
+            logging.info(f"Indexed {metrics['indexed']}/{len(blocks)} blocks")
+
+        # Persist once for the whole run
+        persist_started = time.perf_counter()
+        if metrics["indexed"] and not self._is_in_memory:
+            try:
+                self.index.storage_context.persist(persist_dir=self.chroma_path)
+            except Exception as e:
+                logging.error(f"Failed to persist index after bulk insert: {e}", exc_info=True)
+        if graph_changed:
+            self._persist_graph_store()
+        metrics["persist_seconds"] = time.perf_counter() - persist_started
+
+        metrics["elapsed_seconds"] = time.perf_counter() - started
+        if metrics["elapsed_seconds"] > 0:
+            metrics["blocks_per_second"] = metrics["indexed"] / metrics["elapsed_seconds"]
+        if self.embedding_cache:
+            metrics["embedding_cache"] = self.embedding_cache_stats()
+        logging.info(
+            f"Bulk indexed {metrics['indexed']}/{metrics['total']} blocks in "
+            f"{metrics['batches']} batches ({metrics['elapsed_seconds']:.2f}s, "
+            f"{metrics['blocks_per_second']:.1f} blocks/s, embed {metrics['embed_seconds']:.2f}s, "
+            f"insert {metrics['insert_seconds']:.2f}s)"
+        )
+        return metrics
+
+    def _add_graph_triplets(self, node) -> bool:
+        """Upserts the node's relationships into the graph store. Returns True if any were added."""
         graph_changed = False
         if hasattr(node, "relationships") and node.relationships:
             for relationship_type, related_nodes in node.relationships.items():
@@ -222,11 +387,8 @@ class LlamaMemory:
                             f"Added graph triplet: {node.id_} -[{relationship_type.name}]-> {related_node.node_id}"
                         )
                     except Exception as e:
-                        logging.warning(f"Failed to add graph triplet for block {block.id}: {e}")
-
-        # Persist graph store if it changed
-        if graph_changed:
-            self._persist_graph_store()
+                        logging.warning(f"Failed to add graph triplet for block {node.id_}: {e}")
+        return graph_changed
 
     def update_block(self, block: MemoryBlock):
         """
@@ -283,13 +445,67 @@ class LlamaMemory:
         except Exception as e:
             logging.error(f"Failed to update node for block ID {block.id}: {e}", exc_info=True)
 
-    def query_vector_store(self, query_text: str, top_k: int = 5) -> List[NodeWithScore]:
+    def update_block_metadata(self, block: MemoryBlock) -> None:
+        """
+        Rewrites a block's stored node without re-embedding it.
+
+        For edits that leave the embedded text unchanged (status, priority, metadata
+        fields outside the title): the stored vector is reused and the Chroma entry
+        is replaced with the new node's metadata and document, exactly as an insert
+        would write them.
+
+        Args:
+            block: The updated MemoryBlock; its embedded text must match the stored one.
+
+        Raises:
+            KeyError: If the block is not in the index.
+            Exception: If the Chroma entry cannot be read or replaced.
+        """
+        if not self.is_ready():
+            logging.error("LlamaMemory is not ready. Cannot update block metadata.")
+            raise RuntimeError("LlamaMemory is not ready")
+
+        logging.info(f"Updating metadata of block (ID: {block.id}) without re-embedding.")
+        try:
+            collection = self.vector_store._collection
+            stored = collection.get(ids=[block.id], include=["embeddings"])
+            if not stored["ids"]:
+                raise KeyError(block.id)
+
+            node = memory_block_to_node(block)
+            metadata = node_to_metadata_dict(
+                node, remove_text=True, flat_metadata=self.vector_store.flat_metadata
+            )
+            metadata = {key: "" if value is None else value for key, value in metadata.items()}
+
+            # Chroma merges metadata on update, so replace the entry to drop stale keys
+            collection.delete(ids=[block.id])
+            collection.add(
+                ids=[block.id],
+                embeddings=[list(stored["embeddings"][0])],
+                metadatas=[metadata],
+                documents=[node.get_content(metadata_mode=MetadataMode.NONE)],
+            )
+            logging.info(f"Successfully updated metadata for block ID: {block.id}")
+        except KeyError:
+            logging.warning(f"Block {block.id} not found in LlamaIndex.")
+            raise
+        except Exception as e:
+            logging.error(f"Failed to update metadata for block {block.id}: {e}", exc_info=True)
+            raise
+
+    def query_vector_store(
+        self, query_text: str, top_k: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[NodeWithScore]:
         """
         Performs semantic search against the indexed MemoryBlocks.
 
         Args:
             query_text: The text query to search for similar content.
             top_k: Maximum number of results to return.
+            filters: Optional exact-match filters on node metadata (see
+                llamaindex_adapters.build_vector_filters), combined with AND and
+                applied inside the Chroma query so top_k counts only matching nodes.
 
         Returns:
             List of NodeWithScore objects containing the retrieved nodes and their similarity scores.
@@ -298,11 +514,16 @@ class LlamaMemory:
             logging.error("LlamaMemory is not ready. Cannot query vector store.")
             return []
 
-        logging.info(f'Performing vector store query: "{query_text}" (top_k={top_k})')
+        logging.info(
+            f'Performing vector store query: "{query_text}" (top_k={top_k}, filters={filters})'
+        )
 
         try:
-            # Create retriever from the index
-            retriever = self.index.as_retriever(similarity_top_k=top_k)
+            # Create retriever from the index, pushing metadata filters into the Chroma query
+            retriever_kwargs: Dict[str, Any] = {"similarity_top_k": top_k}
+            if filters:
+                retriever_kwargs["vector_store_kwargs"] = {"where": to_chroma_where(filters)}
+            retriever = self.index.as_retriever(**retriever_kwargs)
 
             # Retrieve nodes based on query
             nodes_with_scores = retriever.retrieve(query_text)
@@ -416,32 +637,9 @@ class LlamaMemory:
             if not self._is_in_memory:
                 self.index.storage_context.persist(persist_dir=self.chroma_path)
 
-            # Also handle graph relationships if needed
-            graph_changed = False
-            try:
-                # Remove all relationships where this node is the subject
-                triplets = self.graph_store.get_triplets_by_subj(block_id)
-                for triplet in triplets:
-                    self.graph_store.delete_triplet(subj=block_id, rel=triplet.rel, obj=triplet.obj)
-                    graph_changed = True
-
-                # Remove all relationships where this node is the object
-                triplets = self.graph_store.get_triplets_by_obj(block_id)
-                for triplet in triplets:
-                    self.graph_store.delete_triplet(
-                        subj=triplet.subj, rel=triplet.rel, obj=block_id
-                    )
-                    graph_changed = True
-
-                # Persist graph changes if any were made
-                if graph_changed:
-                    self._persist_graph_store()
-
-            except Exception as graph_e:
-                logging.warning(
-                    f"Error cleaning up graph relationships for block {block_id}: {graph_e}"
-                )
-                # Continue with deletion even if graph cleanup fails
+            # Also handle graph relationships if needed, persisting graph changes if any were made
+            if self._remove_graph_triplets(block_id):
+                self._persist_graph_store()
 
             logging.info(f"Successfully deleted block {block_id} from LlamaIndex.")
 
@@ -453,6 +651,108 @@ class LlamaMemory:
             logging.error(f"Failed to delete block {block_id} from LlamaIndex: {e}", exc_info=True)
             raise
 
+    def delete_blocks(self, block_ids: List[str]) -> None:
+        """
+        Deletes many memory blocks from the LlamaIndex index with a single persist.
+
+        IDs that are not in the index are ignored.
+
+        Args:
+            block_ids: The IDs of the blocks to delete.
+
+        Raises:
+            Exception: If there is an error during deletion.
+        """
+        if not self.is_ready():
+            logging.error("LlamaMemory is not ready. Cannot delete blocks.")
+            raise RuntimeError("LlamaMemory is not ready")
+        if not block_ids:
+            return
+
+        logging.info(f"Deleting {len(block_ids)} blocks from LlamaIndex.")
+        try:
+            self.index.delete_nodes(list(block_ids))
+            if not self._is_in_memory:
+                self.index.storage_context.persist(persist_dir=self.chroma_path)
+
+            graph_changed = False
+            for block_id in block_ids:
+                graph_changed = self._remove_graph_triplets(block_id) or graph_changed
+            if graph_changed:
+                self._persist_graph_store()
+
+            logging.info(f"Successfully deleted {len(block_ids)} blocks from LlamaIndex.")
+        except Exception as e:
+            logging.error(f"Failed to delete blocks from LlamaIndex: {e}", exc_info=True)
+            raise
+
+    def update_namespace(self, block_ids: List[str], namespace_id: str) -> None:
+        """
+        Moves indexed blocks to another namespace without re-embedding them.
+
+        namespace_id is a filter-only field (it is not part of the embedded text), so
+        only the stored Chroma metadata is patched: the top-level field used by
+        `where` filters and the copy inside the serialized node content. IDs that
+        are not in the index are ignored.
+
+        Args:
+            block_ids: The IDs of the blocks to move.
+            namespace_id: The namespace to move them to.
+
+        Raises:
+            Exception: If the metadata cannot be read or updated.
+        """
+        if not self.is_ready():
+            logging.error("LlamaMemory is not ready. Cannot update namespaces.")
+            raise RuntimeError("LlamaMemory is not ready")
+        if not block_ids:
+            return
+
+        logging.info(f"Moving {len(block_ids)} blocks to namespace '{namespace_id}' in LlamaIndex.")
+        try:
+            collection = self.vector_store._collection
+            stored = collection.get(ids=list(block_ids), include=["metadatas"])
+            if not stored["ids"]:
+                return
+
+            metadatas = []
+            for metadata in stored["metadatas"]:
+                metadata = dict(metadata or {})
+                metadata["namespace_id"] = namespace_id
+                if metadata.get("_node_content"):
+                    node_content = json.loads(metadata["_node_content"])
+                    node_content.setdefault("metadata", {})["namespace_id"] = namespace_id
+                    metadata["_node_content"] = json.dumps(node_content)
+                metadatas.append(metadata)
+
+            # Chroma persists metadata updates itself; the docstore is unchanged
+            collection.update(ids=stored["ids"], metadatas=metadatas)
+            logging.info(f"Successfully moved {len(stored['ids'])} blocks to '{namespace_id}'.")
+        except Exception as e:
+            logging.error(f"Failed to update namespaces in LlamaIndex: {e}", exc_info=True)
+            raise
+
+    def _remove_graph_triplets(self, block_id: str) -> bool:
+        """Removes every graph triplet involving the block. Returns True if any were removed."""
+        graph_changed = False
+        try:
+            # Remove all relationships where this node is the subject
+            triplets = self.graph_store.get_triplets_by_subj(block_id)
+            for triplet in triplets:
+                self.graph_store.delete_triplet(subj=block_id, rel=triplet.rel, obj=triplet.obj)
+                graph_changed = True
+
+            # Remove all relationships where this node is the object
+            triplets = self.graph_store.get_triplets_by_obj(block_id)
+            for triplet in triplets:
+                self.graph_store.delete_triplet(subj=triplet.subj, rel=triplet.rel, obj=block_id)
+                graph_changed = True
+
+        except Exception as graph_e:
+            logging.warning(f"Error cleaning up graph relationships for block {block_id}: {graph_e}")
+            # Continue with deletion even if graph cleanup fails
+        return graph_changed
+
 
 if __name__ == "__main__":
     print("Attempting to initialize LlamaMemory...")
@@ -1,9 +1,13 @@
+from infra_core.memory_system.embedding_cache import EmbeddingCache
 from infra_core.memory_system.schemas.memory_block import MemoryBlock
-from llama_index.core.schema import TextNode, NodeRelationship
-from typing import Dict, Any
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.schema import MetadataMode, TextNode, NodeRelationship
+from pydantic import PrivateAttr
+from typing import Dict, Any, List, Optional
 import json  # For serializing complex metadata
 import logging
 from datetime import datetime  # Import datetime
+from enum import Enum
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -24,6 +28,82 @@ RELATION_TO_NODE_RELATIONSHIP = {
     "mentions": NodeRelationship.NEXT,
 }
 
+# Prefixes for the flat, filterable node metadata fields. Chroma `where` clauses can
+# only match scalar values, so each tag becomes its own boolean field and scalar
+# block metadata is copied out of metadata_json.
+TAG_FIELD_PREFIX = "tag:"
+METADATA_FIELD_PREFIX = "meta:"
+
+# Node metadata kept out of the embedded text: it changes on edits without changing
+# what the block is about (timestamps, scores, the raw metadata dump)
+EMBED_EXCLUDED_METADATA_KEYS = frozenset(
+    {
+        "metadata_json",
+        "created_at",
+        "updated_at",
+        "schema_version",
+        "confidence_human",
+        "confidence_ai",
+    }
+)
+
+# MemoryBlock fields that memory_block_to_node reads; edits to any other field
+# (block_version, state, parent_id, ...) leave the indexed node unchanged
+INDEXED_BLOCK_FIELDS = frozenset(
+    {
+        "type",
+        "namespace_id",
+        "text",
+        "metadata",
+        "tags",
+        "source_file",
+        "source_uri",
+        "created_by",
+        "confidence",
+        "created_at",
+        "schema_version",
+    }
+)
+
+
+def _filterable_value(value: Any) -> Optional[Any]:
+    """Return `value` as a Chroma-compatible scalar, or None if it cannot be filtered on."""
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    return None
+
+
+def build_vector_filters(
+    type_filter: Optional[str] = None,
+    namespace_id: Optional[str] = None,
+    tag_filters: Optional[List[str]] = None,
+    metadata_filters: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Translate block-level filters into exact-match filters on node metadata.
+
+    The keys mirror the fields written by memory_block_to_node; all filters are
+    combined with AND. Metadata filters on non-scalar values (lists, dicts, None)
+    cannot be expressed against the vector store and are left out, so callers
+    should still post-filter on those.
+
+    Returns:
+        A flat {metadata_key: value} dict, empty if nothing can be pushed down.
+    """
+    filters: Dict[str, Any] = {}
+    if type_filter:
+        filters["type"] = type_filter
+    if namespace_id:
+        filters["namespace_id"] = namespace_id
+    for tag in tag_filters or []:
+        filters[f"{TAG_FIELD_PREFIX}{tag}"] = True
+    for key, value in (metadata_filters or {}).items():
+        scalar = _filterable_value(value)
+        if scalar is not None:
+            filters[f"{METADATA_FIELD_PREFIX}{key}"] = scalar
+    return filters
+
 
 # Helper function to convert datetime objects in nested structures
 def convert_datetimes_to_isoformat(obj: Any) -> Any:
@@ -51,6 +131,7 @@ def memory_block_to_node(block: MemoryBlock) -> TextNode:
     # --- Map MemoryBlock fields to metadata ---
     # Simple fields
     metadata["type"] = block.type
+    metadata["namespace_id"] = block.namespace_id
 
     # Directly promote 'title' from block.metadata
     # This makes it top-level accessible in the LlamaIndex Node's metadata
@@ -83,6 +164,14 @@ def memory_block_to_node(block: MemoryBlock) -> TextNode:
             # Fallback to repr if deep conversion and serialization still fail
             metadata["metadata_json"] = repr(block.metadata)
 
+    # Flat filterable fields (see build_vector_filters)
+    for tag in block.tags or []:
+        metadata[f"{TAG_FIELD_PREFIX}{tag}"] = True
+    for key, value in (block.metadata or {}).items():
+        scalar = _filterable_value(value)
+        if scalar is not None:
+            metadata[f"{METADATA_FIELD_PREFIX}{key}"] = scalar
+
     # Flatten confidence scores
     if block.confidence:
         if block.confidence.human is not None:
@@ -116,11 +205,27 @@ def memory_block_to_node(block: MemoryBlock) -> TextNode:
     metadata["enriched_title"] = title
     metadata["enriched_tags"] = tags_str
 
+    # Filter-only fields must not change the embedded text
+    filter_only_keys = [
+        key
+        for key in metadata
+        if key == "namespace_id"
+        or key.startswith(TAG_FIELD_PREFIX)
+        or key.startswith(METADATA_FIELD_PREFIX)
+    ]
+    # Neither should bookkeeping fields, so metadata-only edits embed the same text
+    # and can be served from the embedding cache
+    embed_excluded_keys = filter_only_keys + [
+        key for key in metadata if key in EMBED_EXCLUDED_METADATA_KEYS
+    ]
+
     # --- Create the TextNode ---
     node = TextNode(
         text=enriched_text,  # Use the enriched text
         id_=block.id,  # Map MemoryBlock.id to TextNode.id_
         metadata=metadata,  # Assign the populated metadata
+        excluded_embed_metadata_keys=embed_excluded_keys,
+        excluded_llm_metadata_keys=filter_only_keys,
     )
 
     # Note: Links are now managed through LinkManager and block_links table,
@@ -129,4 +234,81 @@ def memory_block_to_node(block: MemoryBlock) -> TextNode:
     return node
 
 
+def embedding_text(block: MemoryBlock) -> str:
+    """Return the exact text memory_block_to_node sends to the embedding model."""
+    return memory_block_to_node(block).get_content(metadata_mode=MetadataMode.EMBED)
+
+
+class CachedEmbedding(BaseEmbedding):
+    """Embedding model wrapper that consults an EmbeddingCache before calling the model.
+
+    Only texts missing from the cache are sent to the wrapped model (in one batch);
+    their vectors are then stored for next time. The cache is only an optimization:
+    if it cannot be read or written, embedding proceeds without it.
+    """
+
+    _inner: BaseEmbedding = PrivateAttr()
+    _cache: EmbeddingCache = PrivateAttr()
+    _dimensions: Optional[int] = PrivateAttr()
+
+    def __init__(
+        self, inner: BaseEmbedding, cache: EmbeddingCache, dimensions: Optional[int] = None
+    ):
+        super().__init__(model_name=inner.model_name, embed_batch_size=inner.embed_batch_size)
+        self._inner = inner
+        self._cache = cache
+        self._dimensions = dimensions
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "CachedEmbedding"
+
+    @property
+    def cache(self) -> EmbeddingCache:
+        return self._cache
+
+    def _embed_with_cache(
+        self, texts: List[str], cache_model: str, embed_misses
+    ) -> List[List[float]]:
+        try:
+            embeddings = self._cache.get_many(cache_model, self._dimensions, texts)
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed, embedding without cache: {e}")
+            embeddings = [None] * len(texts)
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            computed = embed_misses([texts[i] for i in missing])
+            for i, embedding in zip(missing, computed):
+                embeddings[i] = embedding
+            try:
+                self._cache.put_many(
+                    cache_model, self._dimensions, [texts[i] for i in missing], computed
+                )
+            except Exception as e:
+                logger.warning(f"Failed to store {len(missing)} embeddings in cache: {e}")
+        return embeddings
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return self._embed_with_cache(
+            texts, self.model_name, self._inner.get_text_embedding_batch
+        )
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._get_text_embeddings([text])[0]
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        # Query and document embeddings may differ per model, so cache them separately
+        return self._embed_with_cache(
+            [query],
+            f"{self.model_name}:query",
+            lambda queries: [self._inner.get_query_embedding(q) for q in queries],
+        )[0]
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return self._get_query_embedding(query)
+
+    async def _aget_text_embedding(self, text: str) -> List[float]:
+        return self._get_text_embedding(text)
+
+
 # Future tasks might add more conversion functions here, e.g., node_to_memory_block
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+"""Migration 0002: Indexes backing SQL-side block filtering (BlockQuery).
+
+Block listing now pushes type/namespace/metadata predicates into SQL. This
+migration adds the indexes those queries rely on:
+1. memory_blocks (namespace_id, type, created_at) for namespace + type listings
+   ordered by creation time
+2. block_properties (property_name, property_value_text) so metadata filters
+   such as status='in_progress' can be resolved from the index
+
+This migration is idempotent and can be safely re-run.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+# (table, index name, column list)
+BLOCK_QUERY_INDEXES = [
+    (
+        "memory_blocks",
+        "idx_memory_blocks_namespace_type_created",
+        "namespace_id, type, created_at",
+    ),
+    (
+        "block_properties",
+        "idx_block_properties_name_text",
+        "property_name, property_value_text(255)",
+    ),
+]
+
+
+def apply(runner):
+    """
+    Apply the block query index migration.
+
+    Args:
+        runner: MigrationRunner instance with database connection
+    """
+    logger.info("Starting block query index migration")
+
+    for table, index_name, columns in BLOCK_QUERY_INDEXES:
+        _ensure_index(runner, table, index_name, columns)
+
+    logger.info("Block query index migration completed successfully")
+
+
+def _ensure_index(runner, table: str, index_name: str, columns: str):
+    """Create an index on `table` unless one with the same name already exists."""
+    existing = runner._execute_query(f"SHOW INDEX FROM {table}")
+    if any(row.get("Key_name") == index_name for row in existing):
+        logger.info(f"Index {index_name} already exists on {table}, skipping creation")
+        return
+
+    try:
+        runner._execute_update(f"CREATE INDEX {index_name} ON {table} ({columns})")
+        logger.info(f"Created index {index_name} on {table} ({columns})")
+    except Exception as e:
+        logger.error(f"Failed to create index {index_name} on {table}: {e}")
+        raise
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+"""Migration 0003: Composite indexes backing keyset pagination of block_links.
+
+SQLLinkManager pages links in (priority, created_at, from_id, to_id, relation)
+order and resumes from the last row's key instead of an OFFSET. This migration
+adds the indexes that let each page be read as a single range scan:
+1. block_links (from_id, priority, created_at, to_id, relation) for links_from
+2. block_links (to_id, priority, created_at, from_id, relation) for links_to
+3. block_links (priority, created_at, from_id, to_id, relation) for get_all_links
+
+This migration is idempotent and can be safely re-run.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+# (table, index name, column list)
+BLOCK_LINK_KEYSET_INDEXES = [
+    (
+        "block_links",
+        "idx_block_links_from_keyset",
+        "from_id, priority, created_at, to_id, relation",
+    ),
+    (
+        "block_links",
+        "idx_block_links_to_keyset",
+        "to_id, priority, created_at, from_id, relation",
+    ),
+    (
+        "block_links",
+        "idx_block_links_keyset",
+        "priority, created_at, from_id, to_id, relation",
+    ),
+]
+
+
+def apply(runner):
+    """
+    Apply the block link keyset index migration.
+
+    Args:
+        runner: MigrationRunner instance with database connection
+    """
+    logger.info("Starting block link keyset index migration")
+
+    for table, index_name, columns in BLOCK_LINK_KEYSET_INDEXES:
+        _ensure_index(runner, table, index_name, columns)
+
+    logger.info("Block link keyset index migration completed successfully")
+
+
+def _ensure_index(runner, table: str, index_name: str, columns: str):
+    """Create an index on `table` unless one with the same name already exists."""
+    existing = runner._execute_query(f"SHOW INDEX FROM {table}")
+    if any(row.get("Key_name") == index_name for row in existing):
+        logger.info(f"Index {index_name} already exists on {table}, skipping creation")
+        return
+
+    try:
+        runner._execute_update(f"CREATE INDEX {index_name} ON {table} ({columns})")
+        logger.info(f"Created index {index_name} on {table} ({columns})")
+    except Exception as e:
+        logger.error(f"Failed to create index {index_name} on {table}: {e}")
+        raise
@@ -10,6 +10,10 @@ from typing import Dict, List, Optional, Any, cast
 
 from .link_manager import LinkManager, LinkQuery, BlockLink, InMemoryLinkManager
 from .relation_registry import PMRelationType, CoreRelationType
+from .sql_link_manager import SQLLinkManager
+
+# Priority order mapping (P0 = highest priority = 0, P5 = lowest priority = 5)
+PRIORITY_ORDER = {"P0": 0, "P1": 1, "P2": 2, "P3": 3, "P4": 4, "P5": 5}
 
 
 class ExecutableLinkManager:
@@ -137,20 +141,57 @@ class ExecutableLinkManager:
         result = self._link_manager.links_from(task_id, query)
         return result.links
 
-    def get_ready_tasks(self, task_ids: Optional[List[str]] = None) -> List[str]:
+    def get_ready_tasks(
+        self,
+        task_ids: Optional[List[str]] = None,
+        statuses: Optional[List[str]] = None,
+        namespace_id: Optional[str] = None,
+        block_store=None,
+    ) -> List[str]:
         """
         Get IDs of tasks that have no blockers.
 
+        With a block_store the ready tasks can be narrowed to given statuses and a
+        namespace, and are ordered by metadata priority (P0 first) instead of by ID.
+
         Args:
             task_ids: Optional list of task IDs to check.
                      If None, all tasks in the system are checked.
+            statuses: Optional task statuses (metadata["status"]) to keep
+            namespace_id: Optional namespace the tasks must belong to
+            block_store: Store providing get_memory_blocks_by_ids (e.g. a
+                StructuredMemoryBank); required for status/namespace filtering
 
         Returns:
             List of task IDs with no blockers
+
+        Raises:
+            ValueError: If statuses or namespace_id is given without a block_store
         """
-        # If we're using the in-memory implementation, we can use the optimized method
+        if (statuses is not None or namespace_id is not None) and block_store is None:
+            raise ValueError("Filtering ready tasks by status or namespace needs a block_store")
+
+        ready_tasks = self._unblocked_task_ids(task_ids)
+        if block_store is None:
+            return ready_tasks
+        return _rank_ready_tasks(ready_tasks, block_store, statuses, namespace_id)
+
+    def _unblocked_task_ids(self, task_ids: Optional[List[str]] = None) -> List[str]:
+        """Get IDs of tasks with no inbound BLOCKS links."""
+        # If we're using the in-memory implementation, read the index's ready frontier
         if hasattr(self._link_manager, "_index"):
-            return self._link_manager._index.get_ready_tasks(PMRelationType.BLOCKS.value)
+            index = self._link_manager._index
+            if task_ids is None:
+                return index.get_ready_tasks(PMRelationType.BLOCKS.value)
+            return [
+                task_id
+                for task_id in task_ids
+                if index.in_degree(task_id, PMRelationType.BLOCKS.value) == 0
+            ]
+
+        # SQLLinkManager answers from its link index, or with one query per ID chunk
+        if isinstance(self._link_manager, SQLLinkManager):
+            return self._link_manager.get_ready_tasks(PMRelationType.BLOCKS.value, task_ids)
 
         # Otherwise, we need to query each task
         if task_ids is None:
@@ -403,8 +444,10 @@ class ExecutableLinkManager:
         Raises:
             ValueError: If a dependency cycle is detected
         """
-        # Use the BLOCKS relation for dependency sorting
-        return self._link_manager.topo_sort(task_ids, PMRelationType.BLOCKS.value)
+        # BLOCKS links point from the blocker to the blocked task, while topo_sort puts
+        # link targets first, so reverse its order to get blockers ahead of their tasks
+        sequence = self._link_manager.topo_sort(task_ids, PMRelationType.BLOCKS.value)
+        return list(reversed(sequence))
 
     def sync_parent_reference(self, block_id: str, block_store=None) -> bool:
         """
@@ -433,3 +476,31 @@ class ExecutableLinkManager:
         #     return True
 
         return False
+
+
+def _rank_ready_tasks(
+    task_ids: List[str],
+    block_store,
+    statuses: Optional[List[str]] = None,
+    namespace_id: Optional[str] = None,
+) -> List[str]:
+    """
+    Filter ready task IDs by status and namespace and order them by priority.
+
+    Tasks are fetched in one batch; IDs the store does not return are dropped.
+    Priority P0 sorts first, missing or unknown priorities sort as P5, and ties
+    keep ID order.
+    """
+    if not task_ids:
+        return []
+
+    ranked = []
+    for block in block_store.get_memory_blocks_by_ids(task_ids):
+        metadata = block.metadata or {}
+        if statuses is not None and metadata.get("status") not in statuses:
+            continue
+        if namespace_id is not None and block.namespace_id != namespace_id:
+            continue
+        priority_rank = PRIORITY_ORDER.get(metadata.get("priority", "P5"), 5)
+        ranked.append((priority_rank, block.id))
+    return [block_id for _, block_id in sorted(ranked)]
@@ -224,6 +224,19 @@ def is_parent_relation(relation: str) -> bool:
     return relation in parent_relations
 
 
+def is_acyclic_relation(relation: str) -> bool:
+    """
+    Check if a relation must never form a cycle (dependency or hierarchy relations).
+
+    Args:
+        relation: The relation string to check
+
+    Returns:
+        True if links of this relation have to stay acyclic
+    """
+    return relation in ACYCLIC_RELATIONS
+
+
 # Reference to canonical dependency relation
 CANONICAL_DEPENDENCY_RELATION = PMRelationType.IS_BLOCKED_BY.value
 
@@ -234,3 +247,17 @@ RELATION_ALIASES = {
     # Hierarchy aliases
     PMRelationType.SUBTASK_OF.value: CoreRelationType.CHILD_OF.value,
 }
+
+# Relations whose links must form a DAG: a cycle makes dependency order or hierarchy undefined
+ACYCLIC_RELATIONS = frozenset(
+    {
+        PMRelationType.DEPENDS_ON.value,
+        PMRelationType.BLOCKS.value,
+        PMRelationType.IS_BLOCKED_BY.value,
+        PMRelationType.SUBTASK_OF.value,
+        CoreRelationType.CHILD_OF.value,
+        CoreRelationType.PARENT_OF.value,
+        CoreRelationType.CONTAINS.value,
+        CoreRelationType.PART_OF.value,
+    }
+)
@@ -261,16 +261,36 @@ def generate_schema_file(output_path: Path) -> None:
     schema_statements.append(
         "\nCREATE INDEX idx_memory_blocks_namespace ON memory_blocks (namespace_id);"
     )
+    schema_statements.append(
+        "\nCREATE INDEX idx_memory_blocks_namespace_type_created "
+        "ON memory_blocks (namespace_id, type, created_at);"
+    )
 
     # Generate schema for BlockLink
     schema_statements.append("\n" + generate_table_schema(BlockLink, "block_links"))
     schema_statements.append("\nCREATE INDEX idx_block_links_to_id ON block_links (to_id);")
+    schema_statements.append(
+        "\nCREATE INDEX idx_block_links_from_keyset "
+        "ON block_links (from_id, priority, created_at, to_id, relation);"
+    )
+    schema_statements.append(
+        "\nCREATE INDEX idx_block_links_to_keyset "
+        "ON block_links (to_id, priority, created_at, from_id, relation);"
+    )
+    schema_statements.append(
+        "\nCREATE INDEX idx_block_links_keyset "
+        "ON block_links (priority, created_at, from_id, to_id, relation);"
+    )
 
     # Generate schema for NodeSchemaRecord
     schema_statements.append("\n" + generate_table_schema(NodeSchemaRecord, "node_schemas"))
 
     # Generate schema for BlockProperty
     schema_statements.append("\n" + generate_table_schema(BlockProperty, "block_properties"))
+    schema_statements.append(
+        "\nCREATE INDEX idx_block_properties_name_text "
+        "ON block_properties (property_name, property_value_text(255));"
+    )
 
     # Generate schema for block_proofs (infrastructure table)
     schema_statements.append("\n" + generate_block_proofs_table())
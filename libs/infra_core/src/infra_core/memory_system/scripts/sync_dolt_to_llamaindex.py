@@ -3,13 +3,18 @@
 Script to sync MemoryBlocks from a Dolt database into LlamaIndex.
 This script retrieves MemoryBlocks from Dolt and indexes them into LlamaIndex's
 vector and graph stores using the LlamaMemory system.
+
+With --incremental, only blocks changed since the last recorded sync (found via
+DOLT_DIFF) are re-embedded or deleted.
 """
 
 import argparse
+import json
 import logging
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
-import time
+from typing import Any, Dict
 
 # --- Path setup --- #
 # Add project root to Python path for imports
@@ -18,8 +23,13 @@ project_root = script_path.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 # --- Import local modules --- #
-from infra_core.memory_system.dolt_reader import read_memory_blocks  # noqa: E402
-from infra_core.memory_system.llama_memory import LlamaMemory, DEFAULT_CHROMA_PATH  # noqa: E402
+from infra_core.memory_system.dolt_mysql_base import DoltConnectionConfig  # noqa: E402
+from infra_core.memory_system.dolt_reader import DoltMySQLReader  # noqa: E402
+from infra_core.memory_system.llama_memory import (  # noqa: E402
+    DEFAULT_CHROMA_PATH,
+    DEFAULT_EMBED_BATCH_SIZE,
+    LlamaMemory,
+)
 
 # --- Configure logging --- #
 logging.basicConfig(
@@ -27,24 +37,81 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Last-synced Dolt commit per branch, stored inside the LlamaIndex storage directory
+SYNC_STATE_FILENAME = "dolt_sync_state.json"
+
+
+def load_sync_state(llama_storage_path: str) -> Dict[str, Any]:
+    """Load the last-synced Dolt commit per branch stored next to the Chroma collection."""
+    state_path = Path(llama_storage_path) / SYNC_STATE_FILENAME
+    if not state_path.exists():
+        return {}
+    try:
+        return json.loads(state_path.read_text())
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable sync state at {state_path}: {e}")
+        return {}
+
+
+def save_sync_state(llama_storage_path: str, branch: str, commit_hash: str) -> None:
+    """Record `commit_hash` as the last commit of `branch` synced into LlamaIndex."""
+    state = load_sync_state(llama_storage_path)
+    state[branch] = {
+        "commit_hash": commit_hash,
+        "synced_at": datetime.now(timezone.utc).isoformat(),
+    }
+    state_path = Path(llama_storage_path) / SYNC_STATE_FILENAME
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    state_path.write_text(json.dumps(state, indent=2))
+
+
+def _report_indexing(metrics: Dict[str, Any]) -> bool:
+    """Log add_blocks metrics. Returns False if any block failed to index."""
+    logger.info(
+        f"Indexing completed in {metrics['elapsed_seconds']:.2f} seconds "
+        f"({metrics['indexed']}/{metrics['total']} blocks, "
+        f"{metrics['blocks_per_second']:.1f} blocks/s)"
+    )
+    if metrics["failed_ids"]:
+        logger.error(
+            f"Failed to index {len(metrics['failed_ids'])} blocks: {metrics['failed_ids']}"
+        )
+        return False
+    return True
+
 
 def sync_dolt_to_llamaindex(
-    dolt_db_path: str, llama_storage_path: str = DEFAULT_CHROMA_PATH, branch: str = "main"
+    dolt_db_path: str,
+    llama_storage_path: str = DEFAULT_CHROMA_PATH,
+    branch: str = "main",
+    batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+    incremental: bool = False,
 ) -> bool:
     """
     Syncs MemoryBlocks from a Dolt DB to LlamaIndex.
 
+    Blocks are read from the Dolt SQL server AS OF the branch's head commit, and after
+    a successful sync that commit is recorded next to the Chroma collection, so the
+    index never holds uncommitted working-set edits under a recorded hash. In
+    incremental mode only the blocks that DOLT_DIFF reports as added, modified or
+    deleted since that commit are re-embedded or removed; without a recorded commit
+    (or if the diff fails) a full sync is performed instead.
+
     Args:
-        dolt_db_path: Path to the Dolt database
+        dolt_db_path: Path to the Dolt database (only used for logging; data is read
+            through the configured Dolt SQL server)
         llama_storage_path: Path for LlamaIndex/ChromaDB storage
         branch: Dolt branch to read from
+        batch_size: Number of blocks embedded and inserted per batch
+        incremental: Only sync the changes since the last recorded sync
 
     Returns:
         bool: True if sync was successful, False otherwise
     """
     success = True
     logger.info(
-        f"Starting sync from Dolt DB at {dolt_db_path} (branch: {branch}) to LlamaIndex at {llama_storage_path}"
+        f"Starting {'incremental' if incremental else 'full'} sync from Dolt DB at {dolt_db_path} "
+        f"(branch: {branch}) to LlamaIndex at {llama_storage_path}"
     )
 
     try:
@@ -56,52 +123,83 @@ def sync_dolt_to_llamaindex(
             logger.error("Failed to initialize LlamaMemory properly")
             return False
 
-        # 2. Read MemoryBlocks from Dolt
-        logger.info(f"Reading MemoryBlocks from Dolt DB at {dolt_db_path}...")
-        memory_blocks = read_memory_blocks(dolt_db_path, branch=branch)
-        logger.info(f"Retrieved {len(memory_blocks)} MemoryBlocks from Dolt")
+        # Pin the commit being synced before reading any data
+        reader = DoltMySQLReader(DoltConnectionConfig())
+        head_commit = reader.read_branch_head(branch)
+        last_commit = load_sync_state(llama_storage_path).get(branch, {}).get("commit_hash")
 
-        if not memory_blocks:
-            logger.warning("No memory blocks found in Dolt DB. Nothing to sync.")
-            return True
+        changes = None
+        if incremental and head_commit and last_commit:
+            if head_commit == last_commit:
+                logger.info(f"LlamaIndex is already up to date with {branch}@{head_commit}")
+                return True
+            try:
+                changes = reader.read_block_changes(last_commit, head_commit)
+            except Exception as e:
+                logger.warning(
+                    f"Could not diff {last_commit}..{head_commit}, falling back to full sync: {e}"
+                )
+        elif incremental:
+            logger.info("No previous sync recorded for this branch, performing full sync")
 
-        # 3. Sync each block to LlamaIndex
-        logger.info("Starting to index MemoryBlocks to LlamaIndex...")
-        start_time = time.time()
+        if changes is not None:
+            # 2a. Incremental: re-embed changed blocks and drop deleted ones
+            logger.info(
+                f"Syncing {len(changes['upserted'])} changed and {len(changes['deleted'])} "
+                f"deleted blocks since {last_commit}"
+            )
+            if changes["deleted"]:
+                llama_memory.delete_blocks(changes["deleted"])
+            if changes["upserted"]:
+                changed_blocks = reader.read_memory_blocks_by_ids(
+                    changes["upserted"], branch=branch, as_of=head_commit
+                )
+                metrics = llama_memory.add_blocks(
+                    changed_blocks, batch_size=batch_size, replace_existing=True
+                )
+                success = _report_indexing(metrics)
+        else:
+            # 2b. Full: read every MemoryBlock from Dolt at the pinned commit
+            logger.info(f"Reading MemoryBlocks from {branch}@{head_commit or 'WORKING'}...")
+            memory_blocks = reader.read_memory_blocks(branch=branch, as_of=head_commit)
+            logger.info(f"Retrieved {len(memory_blocks)} MemoryBlocks from Dolt")
 
-        for i, block in enumerate(memory_blocks):
-            try:
-                logger.debug(
-                    f"Processing block {i + 1}/{len(memory_blocks)}: ID={block.id}, Type={block.type}"
+            if not memory_blocks:
+                logger.warning("No memory blocks found in Dolt DB. Nothing to sync.")
+            else:
+                # 3. Index all blocks in batches (one embedding request and insert per batch)
+                logger.info("Starting to index MemoryBlocks to LlamaIndex...")
+                metrics = llama_memory.add_blocks(
+                    memory_blocks, batch_size=batch_size, replace_existing=True
                 )
-                llama_memory.add_block(block)
-                if (i + 1) % 10 == 0:
-                    logger.info(f"Progress: {i + 1}/{len(memory_blocks)} blocks processed")
-            except Exception as e:
-                logger.error(f"Error indexing block {block.id}: {e}")
-                success = False
-
-        elapsed_time = time.time() - start_time
-        logger.info(f"Indexing completed in {elapsed_time:.2f} seconds")
-
-        # 4. Verify indexing
-        if success:
-            logger.info("All blocks processed. Performing verification query...")
-            if memory_blocks:
-                # Try a simple query to verify indexing worked
-                sample_block = memory_blocks[0]
-                if sample_block.tags:
-                    query_text = f"type:{sample_block.type} tag:{sample_block.tags[0]}"
-                else:
-                    query_text = f"type:{sample_block.type}"
-
-                results = llama_memory.query_vector_store(query_text, top_k=1)
-                if results and len(results) > 0:
-                    logger.info("Verification query returned results. Indexing appears successful.")
-                else:
-                    logger.warning(
-                        "Verification query returned no results. Indexing may not be working correctly."
-                    )
+                success = _report_indexing(metrics)
+
+                # 4. Verify indexing
+                if success:
+                    logger.info("All blocks processed. Performing verification query...")
+                    # Try a simple query to verify indexing worked
+                    sample_block = memory_blocks[0]
+                    if sample_block.tags:
+                        query_text = f"type:{sample_block.type} tag:{sample_block.tags[0]}"
+                    else:
+                        query_text = f"type:{sample_block.type}"
+
+                    results = llama_memory.query_vector_store(query_text, top_k=1)
+                    if results and len(results) > 0:
+                        logger.info(
+                            "Verification query returned results. Indexing appears successful."
+                        )
+                    else:
+                        logger.warning(
+                            "Verification query returned no results. Indexing may not be working correctly."
+                        )
+
+        # 5. Record the synced commit so the next incremental run starts from here
+        if success and head_commit:
+            save_sync_state(llama_storage_path, branch, head_commit)
+            logger.info(f"Recorded {branch}@{head_commit} as last synced commit")
+        elif success:
+            logger.warning("Could not determine head commit; incremental sync state not updated")
 
         return success
 
@@ -131,6 +229,19 @@ def parse_args():
         "--branch", type=str, default="main", help="Dolt branch to read from (default: main)"
     )
 
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_EMBED_BATCH_SIZE,
+        help=f"Blocks embedded per request (default: {DEFAULT_EMBED_BATCH_SIZE})",
+    )
+
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-embed blocks changed since the last sync (uses DOLT_DIFF)",
+    )
+
     return parser.parse_args()
 
 
@@ -140,7 +251,11 @@ if __name__ == "__main__":
     logger.info("Starting Dolt to LlamaIndex sync...")
 
     result = sync_dolt_to_llamaindex(
-        dolt_db_path=args.dolt_path, llama_storage_path=args.llamaindex_path, branch=args.branch
+        dolt_db_path=args.dolt_path,
+        llama_storage_path=args.llamaindex_path,
+        branch=args.branch,
+        batch_size=args.batch_size,
+        incremental=args.incremental,
     )
 
     if result:
@@ -5,19 +5,202 @@ This module provides a SQL-backed LinkManager that persists links to the block_l
 and includes hooks for maintaining parent/child hierarchy columns when 'contains' relations change.
 """
 
+import base64
 import logging
+import threading
+import time
 import uuid
+from collections import defaultdict, deque
 from datetime import datetime
 from typing import Dict, List, Optional, Set, Tuple, Any, Union, get_args
 import json
 
-from .link_manager import LinkManager, LinkError, LinkErrorType, LinkQuery, LinkQueryResult
+from .link_manager import (
+    Direction,
+    LinkManager,
+    LinkError,
+    LinkErrorType,
+    LinkQuery,
+    LinkQueryResult,
+)
 from .schemas.common import BlockLink, RelationType
 from .dolt_mysql_base import DoltMySQLBase, DoltConnectionConfig
+from .link_index_snapshot import LinkIndexSnapshot
+from .relation_registry import CANONICAL_DEPENDENCY_RELATION, is_acyclic_relation
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Largest ID list bound into a single IN (...) clause
+ID_FILTER_LIMIT = 500
+
+# Links written per multi-row INSERT in bulk_upsert
+UPSERT_CHUNK_SIZE = 500
+
+# Seconds between checks of a branch head for commits the link index has not seen
+LINK_INDEX_POLL_INTERVAL = 5.0
+
+# Total order of link listings; keyset cursors encode these columns of the last row
+# (backed by the idx_block_links_*keyset indexes, see migration 0003)
+LINK_SORT_COLUMNS = ("priority", "created_at", "from_id", "to_id", "relation")
+
+# NULL priority / created_at sort as 0 / the epoch, in SQL and in the link snapshot alike,
+# so a keyset predicate never compares against NULL and stops paging early
+LINK_NULL_CREATED_AT = "1970-01-01 00:00:00"
+LINK_SORT_EXPRESSIONS = (
+    "COALESCE(priority, 0)",
+    f"COALESCE(created_at, '{LINK_NULL_CREATED_AT}')",
+    "from_id",
+    "to_id",
+    "relation",
+)
+
+LINK_COLUMNS = "from_id, to_id, relation, priority, link_metadata, created_by, created_at"
+
+
+def _encode_link_cursor(link: BlockLink) -> str:
+    """Encode a link's sort key as an opaque cursor (unpadded base64url)."""
+    payload = base64.urlsafe_b64encode(json.dumps(list(_link_sort_key(link))).encode("utf-8"))
+    return payload.decode("ascii").rstrip("=")
+
+
+def _decode_link_cursor(cursor: str) -> List[Any]:
+    """Decode a cursor produced by _encode_link_cursor (NULL sort values normalized)."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception:
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}")
+    if not isinstance(key, list) or len(key) != len(LINK_SORT_COLUMNS):
+        raise ValueError(f"Invalid pagination cursor: {cursor!r}")
+    key[0] = key[0] or 0
+    key[1] = key[1] or LINK_NULL_CREATED_AT
+    return key
+
+
+def _keyset_predicate(values: List[Any]) -> Tuple[str, List[Any]]:
+    """
+    Build the WHERE predicate selecting rows after `values` in descending LINK_SORT_COLUMNS order.
+
+    Expanded as (a < ?) OR (a = ? AND b < ?) OR ... over LINK_SORT_EXPRESSIONS, so
+    rows with a NULL priority or created_at are compared like the link snapshot
+    compares them instead of never matching.
+    """
+    disjuncts = []
+    params: List[Any] = []
+    for i, column in enumerate(LINK_SORT_EXPRESSIONS):
+        terms = [f"{prefix} = %s" for prefix in LINK_SORT_EXPRESSIONS[:i]] + [f"{column} < %s"]
+        disjuncts.append("(" + " AND ".join(terms) + ")")
+        params.extend(values[: i + 1])
+    return "(" + " OR ".join(disjuncts) + ")", params
+
+
+def _link_sort_key(link: BlockLink) -> Tuple[Any, ...]:
+    """LINK_SORT_EXPRESSIONS values of a link, comparable with a decoded cursor."""
+    created_at = link.created_at.isoformat(sep=" ") if link.created_at else LINK_NULL_CREATED_AT
+    return (link.priority or 0, created_at, link.from_id, link.to_id, link.relation)
+
+
+def _page_links(links: List[BlockLink], query_dict: Dict[str, Any]) -> LinkQueryResult:
+    """
+    Page in-memory links exactly like SQLLinkManager._query_link_page pages rows:
+    relation filter, LINK_SORT_COLUMNS descending, keyset cursor, limit.
+    """
+    relation = query_dict.get("relation")
+    limit = query_dict.get("limit", 100)
+    cursor = query_dict.get("cursor")
+
+    if relation:
+        links = [link for link in links if link.relation == relation]
+    if cursor:
+        after = tuple(_decode_link_cursor(cursor))
+        links = [link for link in links if _link_sort_key(link) < after]
+    links = sorted(links, key=_link_sort_key, reverse=True)
+
+    next_cursor = None
+    if len(links) > limit:
+        links = links[:limit]
+        next_cursor = _encode_link_cursor(links[-1])
+    return LinkQueryResult(links=links, next_cursor=next_cursor)
+
+
+def _path_exists(adjacency: Dict[str, Set[str]], source: str, target: str) -> bool:
+    """Return True if `target` is reachable from `source` (iterative DFS)."""
+    if source == target:
+        return True
+    seen = {source}
+    stack = [source]
+    while stack:
+        for neighbor in adjacency.get(stack.pop(), ()):
+            if neighbor == target:
+                return True
+            if neighbor not in seen:
+                seen.add(neighbor)
+                stack.append(neighbor)
+    return False
+
+
+def _reaches_cycle(
+    adjacency: Dict[str, Set[str]], start_id: str, path: Optional[Set[str]] = None
+) -> bool:
+    """
+    Return True if a cycle is reachable from `start_id` (iterative three-colour DFS).
+
+    Blocks in `path` are treated as already on the current DFS path.
+    """
+    on_path = set(path or ()) | {start_id}
+    finished: Set[str] = set()
+    stack = [(start_id, iter(adjacency.get(start_id, ())))]
+    while stack:
+        node, neighbors = stack[-1]
+        for neighbor in neighbors:
+            if neighbor in on_path:
+                return True
+            if neighbor not in finished:
+                on_path.add(neighbor)
+                stack.append((neighbor, iter(adjacency.get(neighbor, ()))))
+                break
+        else:
+            stack.pop()
+            on_path.discard(node)
+            finished.add(node)
+    return False
+
+
+def _kahn_order(block_ids: List[str], adjacency: Dict[str, Set[str]]) -> List[str]:
+    """
+    Order `block_ids` so that for every edge from_id -> to_id, to_id comes first.
+
+    Uses Kahn's algorithm over the edges between the given blocks; ties keep the
+    input order.
+
+    Raises:
+        ValueError: If the edges between the given blocks contain a cycle
+    """
+    nodes = list(dict.fromkeys(block_ids))
+    subset = set(nodes)
+    dependents: Dict[str, List[str]] = defaultdict(list)
+    in_degree = dict.fromkeys(nodes, 0)
+    for from_id in nodes:
+        for to_id in adjacency.get(from_id, ()):
+            if to_id in subset:
+                dependents[to_id].append(from_id)
+                in_degree[from_id] += 1
+
+    queue = deque(node for node in nodes if in_degree[node] == 0)
+    result = []
+    while queue:
+        current = queue.popleft()
+        result.append(current)
+        for dependent in dependents.get(current, ()):
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                queue.append(dependent)
+
+    if len(result) != len(nodes):
+        raise ValueError("Cycle detected in graph, cannot perform topological sort")
+    return result
+
 
 class SQLLinkManager(LinkManager, DoltMySQLBase):
     """
@@ -27,12 +210,21 @@ class SQLLinkManager(LinkManager, DoltMySQLBase):
     for maintaining parent/child hierarchy columns.
     """
 
-    def __init__(self, config: DoltConnectionConfig):
+    def __init__(
+        self,
+        config: DoltConnectionConfig,
+        enable_link_index: bool = False,
+        link_index_poll_interval: float = LINK_INDEX_POLL_INTERVAL,
+    ):
         """
         Initialize the SQL LinkManager.
 
         Args:
             config: DoltConnectionConfig for MySQL connection
+            enable_link_index: Answer link reads from an in-memory LinkIndexSnapshot
+                per branch instead of SQL
+            link_index_poll_interval: Seconds between checks of the branch's working set
+                for changes made outside this manager (merges, pulls, other writers)
         """
         # Initialize both parent classes
         LinkManager.__init__(self)
@@ -42,6 +234,12 @@ class SQLLinkManager(LinkManager, DoltMySQLBase):
         self._uuid_module = uuid
         self._datetime = datetime
 
+        # Per-branch link snapshots, only used when enable_link_index is set
+        self._link_index_enabled = enable_link_index
+        self._link_index_poll_interval = link_index_poll_interval
+        self._link_snapshots: Dict[str, LinkIndexSnapshot] = {}
+        self._link_snapshot_lock = threading.RLock()
+
     def _validate_uuid(self, *ids: str) -> None:
         """Validate that all provided IDs are valid UUIDs."""
         for id_str in ids:
@@ -94,6 +292,175 @@ class SQLLinkManager(LinkManager, DoltMySQLBase):
             )
             return None
 
+    def _row_to_link(self, row: Dict[str, Any]) -> BlockLink:
+        """Build a BlockLink from a block_links row."""
+        return BlockLink(
+            from_id=row["from_id"],
+            to_id=row["to_id"],
+            relation=row["relation"],
+            priority=row.get("priority", 0),
+            link_metadata=self._parse_json_metadata(row.get("link_metadata")),
+            created_by=row.get("created_by"),
+            # A NULL created_at reads as the epoch, where it also sorts (LINK_NULL_CREATED_AT)
+            created_at=self._parse_datetime(row.get("created_at"))
+            or datetime.fromisoformat(LINK_NULL_CREATED_AT),
+        )
+
+    def _read_head_commit(self, branch: str) -> Optional[str]:
+        """Commit hash at the head of a branch, or None if it cannot be read."""
+        result = self._execute_query("SELECT DOLT_HASHOF(%s) AS commit_hash", (branch,))
+        if result and result[0].get("commit_hash"):
+            return str(result[0]["commit_hash"])
+        return None
+
+    def _read_working_hash(self) -> Optional[str]:
+        """Hash of the active branch's working set (uncommitted writes included), or None."""
+        result = self._execute_query("SELECT DOLT_HASHOF_DB() AS working_hash")
+        if result and result[0].get("working_hash"):
+            return str(result[0]["working_hash"])
+        return None
+
+    def _read_working_link_diff(self, commit_hash: str) -> List[Dict[str, Any]]:
+        """DOLT_DIFF rows of block_links between a commit and the working set."""
+        return (
+            self._execute_query(
+                "SELECT * FROM DOLT_DIFF(%s, 'WORKING', 'block_links')", (commit_hash,)
+            )
+            or []
+        )
+
+    def _load_link_snapshot(self, branch: str) -> LinkIndexSnapshot:
+        """Bulk-load every link of the active branch's working set into a new snapshot."""
+        start = time.perf_counter()
+        working_hash = self._read_working_hash()
+        snapshot = LinkIndexSnapshot(branch, self._read_head_commit(branch), working_hash)
+        for row in self._execute_query(f"SELECT {LINK_COLUMNS} FROM block_links") or []:
+            snapshot.upsert(self._row_to_link(row))
+        if snapshot.commit_hash:
+            # Uncommitted link changes are already loaded; remember how to undo them
+            snapshot.track_working_diff(
+                self._read_working_link_diff(snapshot.commit_hash), self._row_to_link
+            )
+        self._link_snapshots[branch] = snapshot
+        logger.info(
+            f"Loaded link index for {branch}@{snapshot.commit_hash}: {len(snapshot)} links "
+            f"in {time.perf_counter() - start:.3f}s"
+        )
+        return snapshot
+
+    def refresh_link_index(self, branch: Optional[str] = None) -> None:
+        """
+        Catch the branch's link snapshot up with changes it has not seen.
+
+        Nothing is read beyond the working-set hash while it is unchanged. Otherwise
+        the snapshot is reset to its commit, the DOLT_DIFF of block_links up to the
+        branch head is applied, and then the uncommitted diff from the head to the
+        working set, so other writers' uncommitted links are visible too. If a diff
+        cannot be computed the snapshot is dropped and reloaded on the next read.
+        Call after merges or pulls to skip the poll interval.
+
+        The working-set hash and diff can only be read for the branch this manager
+        has checked out, so other branches are left alone; their snapshots catch up
+        on the next poll once they are active again.
+        """
+        if not self._link_index_enabled:
+            return
+        active_branch = self.active_branch
+        branch = branch or active_branch
+        if branch != active_branch:
+            logger.debug(
+                f"Not refreshing the {branch} link index while {active_branch} is checked out"
+            )
+            return
+        with self._link_snapshot_lock:
+            snapshot = self._link_snapshots.get(branch)
+            if snapshot is None:
+                return  # Loaded on the next read
+
+            working_hash = self._read_working_hash()
+            snapshot.checked_at = time.monotonic()
+            if working_hash and working_hash == snapshot.working_hash:
+                return
+            head_commit = self._read_head_commit(branch)
+            if not head_commit:
+                return
+            try:
+                snapshot.reset_to_commit()
+                if head_commit != snapshot.commit_hash:
+                    rows = self._execute_query(
+                        "SELECT * FROM DOLT_DIFF(%s, %s, 'block_links')",
+                        (snapshot.commit_hash, head_commit),
+                    )
+                    applied = snapshot.apply_diff(rows or [], self._row_to_link)
+                    logger.info(
+                        f"Applied {applied} link changes {snapshot.commit_hash}..{head_commit} "
+                        f"to the {branch} link index"
+                    )
+                    snapshot.commit_hash = head_commit
+                snapshot.apply_diff(
+                    self._read_working_link_diff(head_commit), self._row_to_link, track=True
+                )
+                snapshot.working_hash = working_hash
+            except Exception as e:
+                logger.warning(f"Could not diff links for {branch}, reloading link index: {e}")
+                self._link_snapshots.pop(branch, None)
+
+    def invalidate_link_index(self, branch: Optional[str] = None) -> None:
+        """Drop the link snapshot of one branch (or of every branch if None)."""
+        with self._link_snapshot_lock:
+            if branch is None:
+                self._link_snapshots.clear()
+            else:
+                self._link_snapshots.pop(branch, None)
+
+    def _link_snapshot(self) -> Optional[LinkIndexSnapshot]:
+        """
+        The active branch's link snapshot, loaded or refreshed as needed.
+
+        Returns None when the index is disabled or cannot be loaded, in which case
+        callers fall back to SQL.
+        """
+        if not self._link_index_enabled:
+            return None
+        try:
+            branch = self.active_branch
+            with self._link_snapshot_lock:
+                snapshot = self._link_snapshots.get(branch)
+                if snapshot is None:
+                    return self._load_link_snapshot(branch)
+                if time.monotonic() - snapshot.checked_at >= self._link_index_poll_interval:
+                    self.refresh_link_index(branch)
+                    snapshot = self._link_snapshots.get(branch)
+                return snapshot or self._load_link_snapshot(branch)
+        except Exception as e:
+            logger.error(f"Link index unavailable, falling back to SQL: {e}")
+            return None
+
+    def _record_link_writes(
+        self, branch: str, upserted: List[BlockLink] = (), removed: List[Tuple] = ()
+    ) -> None:
+        """Apply this manager's own writes to an already loaded snapshot (undoable on refresh)."""
+        if not self._link_index_enabled:
+            return
+        with self._link_snapshot_lock:
+            snapshot = self._link_snapshots.get(branch)
+            if snapshot is None:
+                return
+            for key in removed:
+                snapshot.track(tuple(key))
+                snapshot.remove(*key)
+            for link in upserted:
+                # Updates keep the stored created_at like the UPDATE statements do;
+                # inserts store it at the seconds precision written to the table
+                key = (link.from_id, link.to_id, link.relation)
+                snapshot.track(key)
+                existing = snapshot.links.get(key)
+                if existing:
+                    created_at = existing.created_at
+                else:
+                    created_at = link.created_at.replace(microsecond=0)
+                snapshot.upsert(link.model_copy(update={"created_at": created_at}))
+
     def _sync_parent_child_columns(
         self, from_id: str, to_id: str, relation: str, operation: str
     ) -> None:
@@ -190,6 +557,8 @@ class SQLLinkManager(LinkManager, DoltMySQLBase):
         Create or update a single link with parent/child synchronization.
 
         This is the main method with hooks for 'contains' relation processing.
+        New links of dependency/hierarchy relations are rejected if they would
+        close a cycle.
 
         Args:
             from_id: Source block ID
@@ -204,8 +573,24 @@ class SQLLinkManager(LinkManager, DoltMySQLBase):
 
         Raises:
             MainBranchProtectionError: If attempting to write to protected branch
-            LinkError: If validation fails or database operation fails
+            LinkError: If validation fails, the link would create a cycle,
+                or database operation fails
         """
+        return self._upsert_link(
+            from_id, to_id, relation, priority, link_metadata, created_by, check_cycle=True
+        )
+
+    def _upsert_link(
+        self,
+        from_id: str,
+        to_id: str,
+        relation: RelationType,
+        priority: int = 0,
+        link_metadata: Optional[Dict[str, Any]] = None,
+        created_by: Optional[str] = None,
+        check_cycle: bool = True,
+    ) -> BlockLink:
+        """Upsert a link; check_cycle=False is for callers that already checked the batch."""
         # Branch protection: prevent link writes to protected branches
         current_branch = self.active_branch
         self._check_branch_protection("upsert_link", current_branch)
@@ -236,6 +621,18 @@ class SQLLinkManager(LinkManager, DoltMySQLBase):
         if result and len(result) > 0:
             link_exists = result[0]["link_count"] > 0
 
+        # A new edge closes a cycle if its target already reaches its source
+        if (
+            check_cycle
+            and not link_exists
+            and is_acyclic_relation(relation_str)
+            and self._path_exists_in_db(to_id, from_id, relation_str)
+        ):
+            raise LinkError(
+                LinkErrorType.CYCLE_DETECTED,
+                f"Creating link would introduce a cycle: {from_id} -> {to_id} ({relation_str})",
+            )
+
         # Prepare timestamp and metadata
         now = self._datetime.now()
         timestamp_str = now.isoformat(sep=" ", timespec="seconds")
@@ -287,8 +684,7 @@ class SQLLinkManager(LinkManager, DoltMySQLBase):
         # Call hook for parent/child synchronization
         self._sync_parent_child_columns(from_id, to_id, relation_str, operation)
 
-        # Return the BlockLink object
-        return BlockLink(
+        link = BlockLink(
             from_id=from_id,
             to_id=to_id,
             relation=relation_str,
@@ -297,6 +693,8 @@ class SQLLinkManager(LinkManager, DoltMySQLBase):
             created_by=created_by,
             created_at=now,
         )
+        self._record_link_writes(current_branch, upserted=[link])
+        return link
 
     def create_link(
         self,
@@ -359,6 +757,7 @@ class SQLLinkManager(LinkManager, DoltMySQLBase):
         AND relation = %s
         """
         self._execute_update(delete_query, (from_id, to_id, relation_str))
+        self._record_link_writes(current_branch, removed=[(from_id, to_id, relation_str)])
 
         # Call hook for parent/child synchronization
         self._sync_parent_child_columns(from_id, to_id, relation_str, "delete")
@@ -369,13 +768,46 @@ class SQLLinkManager(LinkManager, DoltMySQLBase):
         """
         Get links originating from a block.
 
+        With query.depth(n) > 1, returns the links among all blocks reachable within
+        n hops in the query's direction (outbound by default).
+
         Args:
             block_id: ID of the source block
             query: Optional query parameters
 
         Returns:
-            LinkQueryResult containing matching links
+            LinkQueryResult containing matching links, with an opaque next_cursor
+            when more pages are available
+
+        Raises:
+            ValueError: If block_id or the cursor is invalid
+        """
+        return self._links_around(block_id, query, Direction.OUTBOUND)
+
+    def links_to(self, block_id: str, query: Optional[LinkQuery] = None) -> LinkQueryResult:
+        """
+        Get links pointing to a block.
+
+        With query.depth(n) > 1, returns the links among all blocks reachable within
+        n hops in the query's direction (inbound by default).
+
+        Args:
+            block_id: ID of the target block
+            query: Optional query parameters
+
+        Returns:
+            LinkQueryResult containing matching links, with an opaque next_cursor
+            when more pages are available
+
+        Raises:
+            ValueError: If block_id or the cursor is invalid
         """
+        return self._links_around(block_id, query, Direction.INBOUND)
+
+    def _links_around(
+        self, block_id: str, query: Optional[LinkQuery], default_direction: Direction
+    ) -> LinkQueryResult:
+        """Shared implementation of links_from/links_to."""
         # Validate ID
         self._validate_uuid(block_id)
 
@@ -385,153 +817,509 @@ class SQLLinkManager(LinkManager, DoltMySQLBase):
 
         query_dict = query.to_dict()
         relation = query_dict.get("relation")
-        limit = query_dict.get("limit", 100)
+        depth = query_dict.get("depth", 1)
+        direction = Direction.from_string(query_dict.get("direction", default_direction.value))
+
+        snapshot = self._link_snapshot()
+        if snapshot is not None:
+            with self._link_snapshot_lock:
+                links = snapshot.select(block_id, relation, direction, depth)
+            return _page_links(links, query_dict)
+
+        where_clauses: List[str] = []
+        params: List[Any] = []
+        if depth > 1:
+            # Links among every block reachable within `depth` hops
+            block_ids = [block_id, *self._connected_block_ids(block_id, relation, direction, depth)]
+            if len(block_ids) > ID_FILTER_LIMIT:
+                return _page_links(self._links_among(block_ids, relation), query_dict)
+            placeholders = ", ".join(["%s"] * len(block_ids))
+            where_clauses.append(f"from_id IN ({placeholders}) AND to_id IN ({placeholders})")
+            params.extend(block_ids + block_ids)
+        elif direction == Direction.OUTBOUND:
+            where_clauses.append("from_id = %s")
+            params.append(block_id)
+        elif direction == Direction.INBOUND:
+            where_clauses.append("to_id = %s")
+            params.append(block_id)
+        else:
+            where_clauses.append("(from_id = %s OR to_id = %s)")
+            params.extend([block_id, block_id])
+
+        return self._query_link_page(where_clauses, params, query_dict)
 
-        # Build SQL query
-        where_clauses = ["from_id = %s"]
-        params = [block_id]
+    def _links_among(self, block_ids: List[str], relation: Optional[str]) -> List[BlockLink]:
+        """
+        Load every link whose endpoints are both in `block_ids`.
+
+        Used when the set is too large for a single pair of IN (...) lists: links
+        are fetched by from_id in chunks of ID_FILTER_LIMIT IDs and the to_id
+        side is filtered in memory.
+        """
+        members = set(block_ids)
+        links: List[BlockLink] = []
+        for start in range(0, len(block_ids), ID_FILTER_LIMIT):
+            chunk = block_ids[start : start + ID_FILTER_LIMIT]
+            sql_query = (
+                f"SELECT {LINK_COLUMNS} FROM block_links "
+                f"WHERE from_id IN ({', '.join(['%s'] * len(chunk))})"
+            )
+            params: List[Any] = list(chunk)
+            if relation:
+                sql_query += " AND relation = %s"
+                params.append(relation)
+            for row in self._execute_query(sql_query, tuple(params)) or []:
+                if row["to_id"] in members:
+                    links.append(self._row_to_link(row))
+        return links
+
+    def _connected_block_ids(
+        self, block_id: str, relation: Optional[str], direction: Direction, depth: int
+    ) -> Set[str]:
+        """
+        Collect the blocks reachable from `block_id` within `depth` hops.
+
+        Each BFS level is one query over the whole frontier (in chunks of
+        ID_FILTER_LIMIT IDs), so the number of queries grows with depth rather
+        than with the number of blocks reached.
+        """
+        columns = []
+        if direction in (Direction.OUTBOUND, Direction.BOTH):
+            columns.append(("from_id", "to_id"))
+        if direction in (Direction.INBOUND, Direction.BOTH):
+            columns.append(("to_id", "from_id"))
+
+        visited = {block_id}
+        frontier = [block_id]
+        for _ in range(depth):
+            next_frontier = []
+            for frontier_column, neighbor_column in columns:
+                for start in range(0, len(frontier), ID_FILTER_LIMIT):
+                    chunk = frontier[start : start + ID_FILTER_LIMIT]
+                    sql_query = (
+                        f"SELECT {neighbor_column} AS neighbor_id FROM block_links "
+                        f"WHERE {frontier_column} IN ({', '.join(['%s'] * len(chunk))})"
+                    )
+                    params: List[Any] = list(chunk)
+                    if relation:
+                        sql_query += " AND relation = %s"
+                        params.append(relation)
+                    for row in self._execute_query(sql_query, tuple(params)) or []:
+                        neighbor_id = row["neighbor_id"]
+                        if neighbor_id not in visited:
+                            visited.add(neighbor_id)
+                            next_frontier.append(neighbor_id)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+
+        visited.discard(block_id)
+        return visited
+
+    def _query_link_page(
+        self, where_clauses: List[str], params: List[Any], query_dict: Dict[str, Any]
+    ) -> LinkQueryResult:
+        """
+        Fetch one page of links in LINK_SORT_COLUMNS order (descending).
+
+        Pages continue from an opaque keyset cursor instead of an OFFSET, so every
+        page costs the same regardless of how deep into the result it is. One
+        extra row is fetched to tell whether another page exists.
+        """
+        relation = query_dict.get("relation")
+        limit = query_dict.get("limit", 100)
+        cursor = query_dict.get("cursor")
 
+        where_clauses = list(where_clauses)
+        params = list(params)
         if relation:
             where_clauses.append("relation = %s")
             params.append(relation)
+        if cursor:
+            predicate, predicate_params = _keyset_predicate(_decode_link_cursor(cursor))
+            where_clauses.append(predicate)
+            params.extend(predicate_params)
 
+        where_clause = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+        order_clause = ", ".join(f"{column} DESC" for column in LINK_SORT_EXPRESSIONS)
         sql_query = f"""
-        SELECT to_id, relation, priority, link_metadata, created_by, created_at
-        FROM block_links 
-        WHERE {" AND ".join(where_clauses)}
-        ORDER BY priority DESC, created_at DESC
+        SELECT {LINK_COLUMNS}
+        FROM block_links
+        {where_clause}
+        ORDER BY {order_clause}
         LIMIT %s
         """
+        params.append(limit + 1)
 
-        params.append(limit)
+        result = self._execute_query(sql_query, tuple(params))
+        links = [self._row_to_link(row) for row in result or []]
 
-        result = self._execute_query(sql_query, params)
-
-        links = []
-        if result and len(result) > 0:
-            for row in result:
-                # For links FROM this block
-                link = BlockLink(
-                    from_id=block_id,
-                    to_id=row["to_id"],
-                    relation=row["relation"],
-                    priority=row.get("priority", 0),
-                    link_metadata=self._parse_json_metadata(row.get("link_metadata")),
-                    created_by=row.get("created_by"),
-                    created_at=self._parse_datetime(row.get("created_at")),
-                )
-                links.append(link)
+        next_cursor = None
+        if len(links) > limit:
+            links = links[:limit]
+            next_cursor = _encode_link_cursor(links[-1])
 
-        # TODO: Implement pagination with cursor
-        return LinkQueryResult(links=links, next_cursor=None)
+        return LinkQueryResult(links=links, next_cursor=next_cursor)
 
-    def links_to(self, block_id: str, query: Optional[LinkQuery] = None) -> LinkQueryResult:
+    def _load_adjacency(
+        self, relation: str, from_ids: Optional[List[str]] = None
+    ) -> Dict[str, Set[str]]:
         """
-        Get links pointing to a block.
+        Load a snapshot of the relation's edges as a from_id -> {to_id} adjacency map.
 
         Args:
-            block_id: ID of the target block
-            query: Optional query parameters
+            relation: Relation whose edges are loaded
+            from_ids: Only load edges leaving these blocks; None loads every edge
+                of the relation
 
         Returns:
-            LinkQueryResult containing matching links
+            Adjacency map of the loaded edges
         """
-        # Validate ID
-        self._validate_uuid(block_id)
+        query = "SELECT from_id, to_id FROM block_links WHERE relation = %s"
+        params: List[str] = [relation]
+        if from_ids is not None:
+            unique_ids = list(dict.fromkeys(from_ids))
+            query += f" AND from_id IN ({', '.join(['%s'] * len(unique_ids))})"
+            params.extend(unique_ids)
+
+        adjacency: Dict[str, Set[str]] = defaultdict(set)
+        for row in self._execute_query(query, tuple(params)) or []:
+            adjacency[row["from_id"]].add(row["to_id"])
+        return adjacency
+
+    def _path_exists_in_db(self, source_id: str, target_id: str, relation: str) -> bool:
+        """
+        Check whether `target_id` is reachable from `source_id` along `relation` links.
 
-        # Default query if none provided
-        if query is None:
-            query = LinkQuery()
+        Uses a recursive CTE so only the subgraph reachable from `source_id` is
+        walked; UNION (not UNION ALL) drops revisited nodes, so existing cycles
+        cannot make the recursion diverge.
+        """
+        query = """
+        WITH RECURSIVE reachable (id) AS (
+            SELECT %s
+            UNION
+            SELECT bl.to_id
+            FROM block_links bl
+            JOIN reachable r ON bl.from_id = r.id
+            WHERE bl.relation = %s
+        )
+        SELECT 1 AS found FROM reachable WHERE id = %s LIMIT 1
+        """
+        result = self._execute_query(query, (source_id, relation, target_id))
+        return bool(result)
 
-        query_dict = query.to_dict()
-        relation = query_dict.get("relation")
-        limit = query_dict.get("limit", 100)
+    def has_path(self, start_id: str, end_id: str, relation: RelationType) -> bool:
+        """
+        Check whether end_id is reachable from start_id along links of a relation.
 
-        # Build SQL query
-        where_clauses = ["to_id = %s"]
-        params = [block_id]
+        Answered from the link index when enabled, otherwise with a recursive CTE.
+        """
+        self._validate_uuid(start_id, end_id)
+        relation_str = self._validate_relation(relation)
 
-        if relation:
-            where_clauses.append("relation = %s")
-            params.append(relation)
+        snapshot = self._link_snapshot()
+        if snapshot is not None:
+            with self._link_snapshot_lock:
+                return snapshot.index.has_path(start_id, end_id, relation_str)
+        return self._path_exists_in_db(start_id, end_id, relation_str)
 
-        sql_query = f"""
-        SELECT from_id, to_id, relation, priority, link_metadata, created_by, created_at
-        FROM block_links 
-        WHERE {" AND ".join(where_clauses)}
-        ORDER BY priority DESC, created_at DESC
-        LIMIT %s
+    def get_connected_blocks(
+        self,
+        block_id: str,
+        relation: Optional[RelationType] = None,
+        direction: Direction = Direction.OUTBOUND,
+        depth: int = 1,
+    ) -> Set[str]:
         """
+        Get the blocks reachable from block_id within depth hops.
 
-        params.append(limit)
+        Args:
+            block_id: Starting block ID
+            relation: Relation to follow (None follows every relation)
+            direction: Direction to traverse (OUTBOUND, INBOUND, or BOTH)
+            depth: Maximum traversal depth
 
-        result = self._execute_query(sql_query, params)
+        Returns:
+            Set of connected block IDs (excluding the starting block)
+        """
+        self._validate_uuid(block_id)
+        relation_str = self._validate_relation(relation) if relation else None
 
-        links = []
-        if result and len(result) > 0:
-            for row in result:
-                # For links pointing TO this block, the from_id is what we get from DB
-                link = BlockLink(
-                    from_id=row["from_id"],
-                    to_id=row["to_id"],  # This should be the block_id we queried for
-                    relation=row["relation"],
-                    priority=row.get("priority", 0),
-                    link_metadata=self._parse_json_metadata(row.get("link_metadata")),
-                    created_by=row.get("created_by"),
-                    created_at=self._parse_datetime(row.get("created_at")),
+        snapshot = self._link_snapshot()
+        if snapshot is not None:
+            with self._link_snapshot_lock:
+                return snapshot.index.get_connected_blocks(
+                    block_id, relation_str, direction, depth
                 )
-                links.append(link)
+        return self._connected_block_ids(block_id, relation_str, direction, depth)
+
+    def get_ready_tasks(
+        self,
+        relation: RelationType = CANONICAL_DEPENDENCY_RELATION,
+        block_ids: Optional[List[str]] = None,
+    ) -> List[str]:
+        """
+        Get blocks with no inbound links of the given relation.
 
-        # TODO: Implement pagination with cursor
-        return LinkQueryResult(links=links, next_cursor=None)
+        Args:
+            relation: Dependency relation (edges point from prerequisite to dependent)
+            block_ids: Blocks to check; None checks every block with outbound links
+                (of any relation), like LinkIndex.get_ready_tasks
+
+        Returns:
+            IDs of the blocks with zero in-degree for the relation
+        """
+        relation_str = self._validate_relation(relation)
+
+        snapshot = self._link_snapshot()
+        if snapshot is not None:
+            with self._link_snapshot_lock:
+                if block_ids is None:
+                    return snapshot.index.get_ready_tasks(relation_str)
+                return [b for b in block_ids if snapshot.index.in_degree(b, relation_str) == 0]
+
+        if block_ids is None:
+            query = """
+            SELECT DISTINCT from_id AS block_id FROM block_links
+            WHERE from_id NOT IN (SELECT to_id FROM block_links WHERE relation = %s)
+            ORDER BY block_id
+            """
+            result = self._execute_query(query, (relation_str,))
+            return [row["block_id"] for row in result or []]
+
+        blocked: Set[str] = set()
+        unique_ids = list(dict.fromkeys(block_ids))
+        for start in range(0, len(unique_ids), ID_FILTER_LIMIT):
+            chunk = unique_ids[start : start + ID_FILTER_LIMIT]
+            query = (
+                "SELECT DISTINCT to_id FROM block_links WHERE relation = %s "
+                f"AND to_id IN ({', '.join(['%s'] * len(chunk))})"
+            )
+            result = self._execute_query(query, (relation_str, *chunk))
+            blocked.update(row["to_id"] for row in result or [])
+        return [block_id for block_id in block_ids if block_id not in blocked]
 
     def has_cycle(
         self, start_id: str, relation: RelationType, visited: Optional[Set[str]] = None
     ) -> bool:
         """
-        Check if there's a cycle starting from the given block for the specified relation.
+        Check if there's a cycle reachable from the given block for the specified relation.
 
-        This is a simplified implementation for now. For production, consider more sophisticated
-        cycle detection algorithms.
+        Loads the relation's edges in a single query and walks them with an
+        iterative DFS, so deep graphs cannot hit the recursion limit.
+
+        Args:
+            start_id: Starting block ID for cycle detection
+            relation: Relation type to check for cycles
+            visited: Blocks already on the current path (they count as part of a cycle)
+
+        Returns:
+            True if a cycle is detected, False otherwise
         """
-        # For now, return False to allow link creation
-        # TODO: Implement proper cycle detection with SQL queries
-        return False
+        self._validate_uuid(start_id)
+        relation_str = self._validate_relation(relation)
+
+        if visited and start_id in visited:
+            return True
+
+        adjacency = self._load_adjacency(relation_str)
+        return _reaches_cycle(adjacency, start_id, path=visited)
 
     def topo_sort(self, block_ids: List[str], relation: RelationType) -> List[str]:
         """
         Perform topological sort on the given blocks for the specified relation.
 
-        This is a placeholder implementation.
+        The relation's edges are loaded in one query (restricted to the given blocks
+        when there are few of them) and ordered with Kahn's algorithm; blocks
+        without an ordering constraint keep their input order.
+
+        Args:
+            block_ids: List of block IDs to sort
+            relation: Relation type to use for sorting
+
+        Returns:
+            Topologically sorted list of block IDs in dependency order
+            (e.g., for is_blocked_by, if A is_blocked_by B, then B comes before A)
+
+        Raises:
+            ValueError: If a cycle is detected
+        """
+        for block_id in block_ids:
+            self._validate_uuid(block_id)
+        relation_str = self._validate_relation(relation)
+
+        if not block_ids:
+            return []
+
+        # Past ID_FILTER_LIMIT blocks, one scan of the relation beats a huge IN (...) list
+        from_ids = block_ids if len(block_ids) <= ID_FILTER_LIMIT else None
+        adjacency = self._load_adjacency(relation_str, from_ids=from_ids)
+        return _kahn_order(block_ids, adjacency)
+
+    def _check_bulk_cycles(self, links: List[Tuple[str, str, str]]) -> None:
+        """
+        Reject a batch of links if adding them would create a cycle.
+
+        Each acyclic relation in the batch is loaded once as an adjacency snapshot;
+        the new edges are then added one by one, checking that the target does not
+        already reach the source.
+
+        Raises:
+            LinkError: If any new link would introduce a cycle
         """
-        # For now, return blocks in original order
-        # TODO: Implement proper topological sort with SQL queries
-        return block_ids
+        new_edges: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        for from_id, to_id, relation_str in links:
+            if is_acyclic_relation(relation_str):
+                new_edges[relation_str].append((from_id, to_id))
+
+        for relation_str, edges in new_edges.items():
+            adjacency = self._load_adjacency(relation_str)
+            for from_id, to_id in edges:
+                if to_id in adjacency.get(from_id, ()):
+                    continue  # Existing link, will only be updated
+                if _path_exists(adjacency, to_id, from_id):
+                    raise LinkError(
+                        LinkErrorType.CYCLE_DETECTED,
+                        f"Creating links would introduce a cycle with relation: {relation_str} "
+                        f"({from_id} -> {to_id})",
+                    )
+                adjacency[from_id].add(to_id)
 
     def bulk_upsert(
         self, links: List[Tuple[str, str, RelationType, Optional[Dict[str, Any]]]]
     ) -> List[BlockLink]:
         """
-        Create or update multiple links in a single operation.
+        Create or update multiple links in a single transaction.
+
+        Links are written with one multi-row INSERT ... ON DUPLICATE KEY UPDATE per
+        UPSERT_CHUNK_SIZE links, followed by batched parent_id/has_children updates
+        for 'contains' links. Either every link is written or none is.
 
         Args:
-            links: List of (from_id, to_id, relation, metadata) tuples
+            links: List of (from_id, to_id, relation, metadata[, priority[, created_by]])
+                tuples; priority defaults to 0 and created_by to None
 
         Returns:
-            List of created/updated BlockLinks
+            List of created/updated BlockLinks, in input order
+
+        Raises:
+            ValueError: If an ID, relation or priority is invalid (nothing is written)
+            LinkError: If a link is self-referential or the links would introduce
+                a cycle (nothing is written)
         """
         # Branch protection: prevent bulk link operations on protected branches
         current_branch = self.active_branch
         self._check_branch_protection("bulk_upsert", current_branch)
 
-        results = []
-        for from_id, to_id, relation, metadata in links:
-            link = self.upsert_link(
-                from_id=from_id, to_id=to_id, relation=relation, link_metadata=metadata
+        # Validate everything and check the whole batch for cycles before writing
+        specs = []
+        for from_id, to_id, relation, metadata, *extra in links:
+            priority = extra[0] if len(extra) > 0 else 0
+            created_by = extra[1] if len(extra) > 1 else None
+            self._validate_uuid(from_id, to_id)
+            relation_str = self._validate_relation(relation)
+            if priority < 0:
+                raise ValueError("Priority must be non-negative")
+            if from_id == to_id:
+                raise LinkError(
+                    LinkErrorType.CYCLE_DETECTED, f"Self-referential link not allowed: {from_id}"
+                )
+            specs.append((from_id, to_id, relation_str, priority, metadata, created_by))
+        if not specs:
+            return []
+        self._check_bulk_cycles([spec[:3] for spec in specs])
+
+        now = self._datetime.now()
+        timestamp_str = now.isoformat(sep=" ", timespec="seconds")
+
+        # A link listed twice is written once, with its last values
+        rows = {}
+        for from_id, to_id, relation_str, priority, metadata, created_by in specs:
+            metadata_json = None if metadata is None else json.dumps(metadata)
+            rows[(from_id, to_id, relation_str)] = (priority, metadata_json, created_by)
+
+        statements = []
+        row_items = list(rows.items())
+        for start in range(0, len(row_items), UPSERT_CHUNK_SIZE):
+            chunk = row_items[start : start + UPSERT_CHUNK_SIZE]
+            values_sql = ", ".join(["(%s, %s, %s, %s, %s, %s, %s)"] * len(chunk))
+            params = []
+            for key, values in chunk:
+                params.extend((*key, *values, timestamp_str))
+            statements.append(
+                (
+                    f"INSERT INTO block_links ({LINK_COLUMNS}) VALUES {values_sql} "
+                    "ON DUPLICATE KEY UPDATE priority = VALUES(priority), "
+                    "link_metadata = VALUES(link_metadata), created_by = VALUES(created_by)",
+                    tuple(params),
+                )
+            )
+
+        # 'contains' links make from_id the parent of to_id (the last parent listed wins)
+        parent_of = {
+            to_id: from_id for from_id, to_id, relation_str in rows if relation_str == "contains"
+        }
+        statements.extend(self._parent_child_statements(parent_of))
+
+        self._execute_updates_in_transaction(statements)
+        logger.info(
+            f"Bulk upserted {len(rows)} links ({len(parent_of)} parent relationships) "
+            f"in {len(statements)} statements"
+        )
+
+        results = [
+            BlockLink(
+                from_id=from_id,
+                to_id=to_id,
+                relation=relation_str,
+                priority=priority,
+                link_metadata=metadata,
+                created_by=created_by,
+                created_at=now,
             )
-            results.append(link)
+            for from_id, to_id, relation_str, priority, metadata, created_by in specs
+        ]
+        self._record_link_writes(current_branch, upserted=results)
         return results
 
+    def _parent_child_statements(self, parent_of: Dict[str, str]) -> List[Tuple[str, tuple]]:
+        """
+        Build batched updates setting parent_id on children and has_children on parents.
+
+        Args:
+            parent_of: Mapping of child block ID to parent block ID
+
+        Returns:
+            List of (query, params) tuples
+        """
+        statements = []
+        children = list(parent_of)
+        for start in range(0, len(children), ID_FILTER_LIMIT):
+            chunk = children[start : start + ID_FILTER_LIMIT]
+            cases = " ".join(["WHEN %s THEN %s"] * len(chunk))
+            placeholders = ", ".join(["%s"] * len(chunk))
+            params = [value for child_id in chunk for value in (child_id, parent_of[child_id])]
+            statements.append(
+                (
+                    f"UPDATE memory_blocks SET parent_id = CASE id {cases} END "
+                    f"WHERE id IN ({placeholders})",
+                    tuple(params + chunk),
+                )
+            )
+
+        parents = list(dict.fromkeys(parent_of.values()))
+        for start in range(0, len(parents), ID_FILTER_LIMIT):
+            chunk = parents[start : start + ID_FILTER_LIMIT]
+            placeholders = ", ".join(["%s"] * len(chunk))
+            statements.append(
+                (
+                    f"UPDATE memory_blocks SET has_children = %s WHERE id IN ({placeholders})",
+                    (1, *chunk),
+                )
+            )
+        return statements
+
     def delete_links_for_block(self, block_id: str) -> int:
         """
         Delete all links involving a block (as source or target).
@@ -577,6 +1365,10 @@ class SQLLinkManager(LinkManager, DoltMySQLBase):
         WHERE from_id = %s OR to_id = %s
         """
         self._execute_update(delete_query, (block_id, block_id))
+        self._record_link_writes(
+            current_branch,
+            removed=[(row["from_id"], row["to_id"], row["relation"]) for row in links_to_process],
+        )
 
         return len(links_to_process)
 
@@ -588,66 +1380,21 @@ class SQLLinkManager(LinkManager, DoltMySQLBase):
             query: Optional query parameters for filtering
 
         Returns:
-            LinkQueryResult containing all matching links
+            LinkQueryResult containing all matching links, with an opaque
+            next_cursor when more pages are available
+
+        Raises:
+            ValueError: If the cursor is invalid
         """
         # Default query if none provided
         if query is None:
             query = LinkQuery()
 
         query_dict = query.to_dict()
-        relation = query_dict.get("relation")
-        limit = query_dict.get("limit", 100)
-        cursor = query_dict.get("cursor")
+        snapshot = self._link_snapshot()
+        if snapshot is not None:
+            with self._link_snapshot_lock:
+                links = list(snapshot.links.values())
+            return _page_links(links, query_dict)
 
-        # Build SQL query
-        where_clauses = []
-        params = []
-
-        if relation:
-            where_clauses.append("relation = %s")
-            params.append(relation)
-
-        where_clause = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
-
-        # Handle cursor-based pagination
-        offset = 0
-        if cursor:
-            try:
-                offset = int(cursor)
-            except (ValueError, TypeError):
-                # Invalid cursor, ignore it
-                offset = 0
-
-        sql_query = f"""
-        SELECT from_id, to_id, relation, priority, link_metadata, created_by, created_at
-        FROM block_links 
-        {where_clause}
-        ORDER BY priority DESC, created_at DESC
-        LIMIT %s OFFSET %s
-        """
-
-        params.extend([limit, offset])
-
-        result = self._execute_query(sql_query, params)
-
-        links = []
-        if result and len(result) > 0:
-            for row in result:
-                link = BlockLink(
-                    from_id=row["from_id"],
-                    to_id=row["to_id"],
-                    relation=row["relation"],
-                    priority=row.get("priority", 0),
-                    link_metadata=self._parse_json_metadata(row.get("link_metadata")),
-                    created_by=row.get("created_by"),
-                    created_at=self._parse_datetime(row.get("created_at")),
-                )
-                links.append(link)
-
-        # Determine next cursor for pagination
-        next_cursor = None
-        if len(links) == limit:
-            # If we got exactly the limit, there might be more
-            next_cursor = str(offset + limit)
-
-        return LinkQueryResult(links=links, next_cursor=next_cursor)
+        return self._query_link_page([], [], query_dict)
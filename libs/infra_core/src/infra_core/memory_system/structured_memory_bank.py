@@ -7,10 +7,12 @@ and the LlamaIndex (ChromaDB) indexing/retrieval system.
 Uses secure MySQL connections to Dolt SQL servers with parameterized queries.
 """
 
+import functools
 import logging
+import os
 import sys
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from pydantic import ValidationError
 
 from infra_core.memory_system.dolt_mysql_base import DoltConnectionConfig, MainBranchProtectionError
@@ -22,6 +24,13 @@ from infra_core.memory_system.dolt_writer import (
     PERSISTED_TABLES,
 )
 from infra_core.memory_system.llama_memory import LlamaMemory
+from infra_core.memory_system.llamaindex_adapters import (
+    INDEXED_BLOCK_FIELDS,
+    build_vector_filters,
+    embedding_text,
+)
+from infra_core.memory_system.block_query import BlockPage, BlockQuery
+from infra_core.memory_system.block_cache import BlockCache
 from infra_core.memory_system.schemas.memory_block import MemoryBlock
 from infra_core.memory_system.schemas.common import BlockLink
 from infra_core.memory_system.tools.helpers.namespace_validation import (
@@ -105,6 +114,24 @@ class InconsistentStateError(Exception):
         return base_msg
 
 
+def _invalidates_block_cache(method):
+    """
+    Decorator for write paths: drop the written block from the read-through cache
+    once the write has finished, whether it succeeded or not.
+
+    The wrapped method's first argument must be a MemoryBlock or a block ID.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, block_or_id, *args, **kwargs):
+        try:
+            return method(self, block_or_id, *args, **kwargs)
+        finally:
+            self.invalidate_block_cache(block_id=getattr(block_or_id, "id", block_or_id))
+
+    return wrapper
+
+
 class StructuredMemoryBank:
     """
     Manages MemoryBlocks using Dolt for persistence and LlamaIndex for indexing.
@@ -119,6 +146,9 @@ class StructuredMemoryBank:
         dolt_connection_config: DoltConnectionConfig,
         branch: str = "main",
         auto_commit: bool = False,
+        block_cache_size: Optional[int] = None,
+        block_cache_ttl: Optional[float] = None,
+        llama_memory: Optional[LlamaMemory] = None,
     ):
         """
         Initializes the StructuredMemoryBank.
@@ -130,6 +160,12 @@ class StructuredMemoryBank:
             branch: Default branch to use for operations (default: "main").
             auto_commit: Whether to automatically commit changes after successful operations (default: False).
                         When False, changes remain in working set until explicit commit via MCP tools.
+            block_cache_size: Maximum number of blocks kept in the read-through block cache
+                        (default: MEMORY_BLOCK_CACHE_SIZE env var or 1024; 0 disables caching).
+            block_cache_ttl: Seconds a cached block stays valid
+                        (default: MEMORY_BLOCK_CACHE_TTL env var or 300).
+            llama_memory: Existing LlamaMemory to share instead of opening chroma_path again,
+                        e.g. between banks pinned to different branches (default: None).
         """
         # Normalize branch name to lowercase for consistency
         self.branch = branch.lower().strip()
@@ -157,11 +193,25 @@ class StructuredMemoryBank:
         )
 
         # Initialize LlamaIndex
-        self.llama_memory = LlamaMemory(chroma_path=chroma_path, collection_name=chroma_collection)
+        if llama_memory is None:
+            llama_memory = LlamaMemory(chroma_path=chroma_path, collection_name=chroma_collection)
+        self.llama_memory = llama_memory
 
         # Flag to track data consistency state
         self._is_consistent = True
 
+        # Set by hosts that pool one bank per branch (the MCP server): callable(branch=...,
+        # namespace_id=...) that re-pins the caller's session and returns its (branch, namespace).
+        # Context-switching tools use it instead of checking out this shared bank.
+        self.session_context_switcher: Optional[Callable[..., Tuple[str, str]]] = None
+
+        # Read-through cache of hydrated blocks keyed by (branch, working-set hash, block_id)
+        if block_cache_size is None:
+            block_cache_size = int(os.getenv("MEMORY_BLOCK_CACHE_SIZE", "1024"))
+        if block_cache_ttl is None:
+            block_cache_ttl = float(os.getenv("MEMORY_BLOCK_CACHE_TTL", "300"))
+        self._block_cache = BlockCache(max_size=block_cache_size, ttl=block_cache_ttl)
+
         if not self.llama_memory.is_ready():
             raise RuntimeError("Failed to initialize LlamaMemory backend.")
 
@@ -240,6 +290,29 @@ class StructuredMemoryBank:
             logger.error(f"Failed to store block proof for {block_id}: {e}", exc_info=True)
             return False
 
+    def _store_block_proofs(self, block_ids: List[str], operation: str, commit_hash: str) -> bool:
+        """
+        Store the same operation proof for many blocks in one multi-row insert.
+
+        Args:
+            block_ids: The IDs of the blocks
+            operation: The operation type ('create', 'update', 'delete')
+            commit_hash: The Dolt commit hash for this operation
+
+        Returns:
+            True if the proofs were stored successfully, False otherwise
+        """
+        try:
+            return self.dolt_writer.write_block_proofs(
+                block_ids=block_ids,
+                operation=operation,
+                commit_hash=commit_hash,
+                branch=self.branch,
+            )
+        except Exception as e:
+            logger.error(f"Failed to store block proofs for {len(block_ids)} blocks: {e}")
+            return False
+
     def get_latest_schema_version(self, node_type: str) -> Optional[int]:
         """
         Gets the latest schema version for a given node type by querying the node_schemas table.
@@ -269,26 +342,20 @@ class StructuredMemoryBank:
             logger.warning(f"Error fetching schema version for {node_type}: {e}")
             return None
 
-    def create_memory_block(self, block: MemoryBlock) -> tuple[bool, Optional[str]]:
+    def _prepare_new_block(
+        self, block: MemoryBlock, namespace_errors: Optional[Dict[str, Optional[str]]] = None
+    ) -> Tuple[MemoryBlock, Optional[str]]:
         """
-        Creates a new MemoryBlock, persisting to Dolt and indexing in LlamaIndex with atomic guarantees.
-        If either operation fails, both are rolled back to ensure consistency between storage systems.
+        Fill in the schema version and validate a block before it is created.
 
         Args:
-            block: The MemoryBlock object to create.
+            block: The MemoryBlock about to be created.
+            namespace_errors: Optional per-call memo of namespace check results, so a
+                batch validates each namespace only once.
 
         Returns:
-            Tuple of (success: bool, error_message: Optional[str])
-            - success: True if creation was successful (both Dolt write and LlamaIndex add), False otherwise
-            - error_message: Specific error details if creation failed, None if successful
+            Tuple of (re-validated block, error message or None if the block is valid)
         """
-        logger.info(f"Attempting to create memory block: {block.id}")
-
-        if not self.llama_memory.is_ready():
-            error_msg = "LlamaMemory backend is not ready. Cannot create block."
-            logger.error(error_msg)
-            return False, error_msg
-
         # Query node_schemas for latest version and set block.schema_version if not already set
         if block.schema_version is None:
             try:
@@ -322,20 +389,52 @@ class StructuredMemoryBank:
             simple_errors = [
                 f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in ve.errors()
             ]
-            return False, f"Block validation failed: {'; '.join(simple_errors)}"
+            return block, f"Block validation failed: {'; '.join(simple_errors)}"
 
         # Validate namespace exists
-        try:
-            validate_namespace_exists(block.namespace_id, self, raise_error=True)
-        except KeyError as e:
-            error_msg = f"Namespace validation failed: {str(e)}"
-            logger.error(error_msg)
-            return False, error_msg
-        except Exception as e:
-            error_msg = f"Namespace validation error: {str(e)}"
+        if namespace_errors is not None and block.namespace_id in namespace_errors:
+            namespace_error = namespace_errors[block.namespace_id]
+        else:
+            namespace_error = None
+            try:
+                validate_namespace_exists(block.namespace_id, self, raise_error=True)
+            except KeyError as e:
+                namespace_error = f"Namespace validation failed: {str(e)}"
+            except Exception as e:
+                namespace_error = f"Namespace validation error: {str(e)}"
+            if namespace_errors is not None:
+                namespace_errors[block.namespace_id] = namespace_error
+        if namespace_error:
+            logger.error(namespace_error)
+            return block, namespace_error
+        # --- END VALIDATION PHASE ---
+
+        return block, None
+
+    @_invalidates_block_cache
+    def create_memory_block(self, block: MemoryBlock) -> tuple[bool, Optional[str]]:
+        """
+        Creates a new MemoryBlock, persisting to Dolt and indexing in LlamaIndex with atomic guarantees.
+        If either operation fails, both are rolled back to ensure consistency between storage systems.
+
+        Args:
+            block: The MemoryBlock object to create.
+
+        Returns:
+            Tuple of (success: bool, error_message: Optional[str])
+            - success: True if creation was successful (both Dolt write and LlamaIndex add), False otherwise
+            - error_message: Specific error details if creation failed, None if successful
+        """
+        logger.info(f"Attempting to create memory block: {block.id}")
+
+        if not self.llama_memory.is_ready():
+            error_msg = "LlamaMemory backend is not ready. Cannot create block."
             logger.error(error_msg)
             return False, error_msg
-        # --- END VALIDATION PHASE ---
+
+        block, validation_error = self._prepare_new_block(block)
+        if validation_error:
+            return False, validation_error
 
         # --- ATOMIC PERSISTENCE PHASE ---
         # Tables to track for commit/rollback
@@ -482,6 +581,144 @@ class StructuredMemoryBank:
             return False, error_msg
         # --- END ATOMIC PERSISTENCE PHASE ---
 
+    def create_memory_blocks(
+        self, blocks: List[MemoryBlock], stop_on_first_error: bool = False
+    ) -> Dict[str, Optional[str]]:
+        """
+        Creates many MemoryBlocks with one Dolt transaction and one bulk index insert.
+
+        Every block is validated first (schema version, model validation, each distinct
+        namespace checked once). The valid blocks are then written with multi-row
+        inserts in a single transaction, embedded and indexed in batches through
+        LlamaMemory.add_blocks with one persist, and their proofs are written in bulk.
+        Persistence is all-or-nothing for the valid blocks: if the write, indexing or
+        commit fails, the indexed nodes are removed, the Dolt changes are discarded
+        and every valid block is reported as failed.
+
+        Args:
+            blocks: The MemoryBlocks to create.
+            stop_on_first_error: Stop validating at the first invalid block; blocks
+                after it are neither created nor reported.
+
+        Returns:
+            Mapping of block ID to None if the block was created, or an error message.
+        """
+        logger.info(f"Attempting to create {len(blocks)} memory blocks")
+        if not self.llama_memory.is_ready():
+            error_msg = "LlamaMemory backend is not ready. Cannot create blocks."
+            logger.error(error_msg)
+            return {block.id: error_msg for block in blocks}
+
+        # --- VALIDATION PHASE ---
+        errors: Dict[str, Optional[str]] = {}
+        valid_blocks: List[MemoryBlock] = []
+        namespace_errors: Dict[str, Optional[str]] = {}
+        for block in blocks:
+            block, validation_error = self._prepare_new_block(block, namespace_errors)
+            errors[block.id] = validation_error
+            if validation_error is None:
+                valid_blocks.append(block)
+            elif stop_on_first_error:
+                break
+        if not valid_blocks:
+            return errors
+        valid_ids = [block.id for block in valid_blocks]
+
+        # --- ATOMIC PERSISTENCE PHASE ---
+        tables = PERSISTED_TABLES
+        indexed_ids: List[str] = []
+        try:
+            try:
+                if not self.dolt_writer.write_memory_blocks(valid_blocks, branch=self.branch):
+                    raise RuntimeError(f"Failed to write {len(valid_blocks)} blocks to Dolt")
+            except MainBranchProtectionError as protection_e:
+                logger.error(f"Branch protection error: {protection_e}")
+                errors.update({block_id: str(protection_e) for block_id in valid_ids})
+                return errors
+
+            metrics = self.llama_memory.add_blocks(valid_blocks)
+            failed_ids = set(metrics.get("failed_ids", []))
+            indexed_ids = [block_id for block_id in valid_ids if block_id not in failed_ids]
+            if failed_ids:
+                raise RuntimeError(f"Search indexing failed for {len(failed_ids)} blocks")
+
+            if self.auto_commit:
+                commit_success, commit_hash = self.dolt_writer.commit_changes(
+                    commit_msg=f"Create {len(valid_blocks)} memory blocks", tables=tables
+                )
+                if not commit_success:
+                    raise RuntimeError("Failed to commit created blocks to database")
+            else:
+                # Auto-commit disabled - changes remain uncommitted
+                commit_hash = "STAGED"
+
+            self._store_block_proofs(valid_ids, "create", commit_hash)
+            logger.info(f"Successfully created and indexed {len(valid_blocks)} memory blocks")
+            return errors
+
+        except Exception as e:
+            error_msg = f"Bulk creation failed: {str(e)}"
+            logger.error(
+                f"Atomic persistence of {len(valid_blocks)} blocks failed: {e}", exc_info=True
+            )
+            if indexed_ids:
+                try:
+                    self.llama_memory.delete_blocks(indexed_ids)
+                except Exception as llama_e:
+                    logger.error(f"Failed to remove indexed blocks after failure: {llama_e}")
+            try:
+                self.dolt_writer.discard_changes(tables)
+                logger.info(f"Rolled back Dolt changes for {len(valid_blocks)} blocks")
+            except Exception as rollback_e:
+                logger.critical(
+                    f"Failed to rollback Dolt changes: {rollback_e}. "
+                    "Database may be in an inconsistent state!"
+                )
+                self._mark_inconsistent(
+                    f"Bulk create failed and Dolt rollback failed for {len(valid_blocks)} blocks"
+                )
+            errors.update({block_id: error_msg for block_id in valid_ids})
+            return errors
+        finally:
+            for block_id in valid_ids:
+                self.invalidate_block_cache(block_id=block_id)
+        # --- END ATOMIC PERSISTENCE PHASE ---
+
+    def _block_cache_state_hash(self, branch: str) -> Optional[str]:
+        """
+        Return the branch's working-set hash for cache keys, or None to bypass the cache.
+
+        Keying on the hash means any change to the branch (including writes made
+        by other processes) moves lookups to fresh entries.
+        """
+        if not self._block_cache.enabled:
+            return None
+        try:
+            state_hash = self.dolt_reader.read_working_set_hash(branch)
+        except Exception as e:
+            logger.debug(f"Could not read working set hash for branch '{branch}': {e}")
+            return None
+        return state_hash if isinstance(state_hash, str) and state_hash else None
+
+    def invalidate_block_cache(
+        self, block_id: Optional[str] = None, branch: Optional[str] = None
+    ) -> int:
+        """
+        Drop entries from the read-through block cache.
+
+        Args:
+            block_id: Only drop this block (on every branch unless branch is given).
+            branch: Only drop entries read from this branch.
+
+        Returns:
+            Number of cache entries removed. With no arguments the whole cache is cleared.
+        """
+        return self._block_cache.invalidate(block_id=block_id, branch=branch)
+
+    def block_cache_stats(self) -> Dict[str, Any]:
+        """Return size and hit/miss/eviction counters for the read-through block cache."""
+        return self._block_cache.stats()
+
     def get_memory_block(self, block_id: str) -> Optional[MemoryBlock]:
         """
         Retrieves a MemoryBlock from Dolt by its ID.
@@ -494,9 +731,18 @@ class StructuredMemoryBank:
         """
         logger.info(f"Attempting to get memory block: {block_id}")
         try:
+            state_hash = self._block_cache_state_hash(self.branch)
+            if state_hash:
+                cached = self._block_cache.get(self.branch, state_hash, block_id)
+                if cached is not None:
+                    logger.debug(f"Block cache hit for {block_id}")
+                    return cached
+
             block = self.dolt_reader.read_memory_block(block_id, branch=self.branch)
             if block:
                 logger.info(f"Successfully retrieved block {block_id}")
+                if state_hash:
+                    self._block_cache.put(self.branch, state_hash, block)
             else:
                 logger.info(f"Block {block_id} not found in Dolt.")
             return block
@@ -504,11 +750,59 @@ class StructuredMemoryBank:
             logger.error(f"Error retrieving block {block_id}: {e}", exc_info=True)
             return None
 
+    def get_memory_blocks_by_ids(
+        self, block_ids: List[str], branch: Optional[str] = None
+    ) -> List[MemoryBlock]:
+        """
+        Retrieves specific MemoryBlocks from Dolt in batched queries.
+
+        Args:
+            block_ids: IDs of the blocks to retrieve.
+            branch: The Dolt branch to read from (defaults to the bank's branch).
+
+        Returns:
+            The MemoryBlock objects that were found, in request order. Missing IDs are omitted.
+        """
+        target_branch = branch or self.branch
+        logger.info(f"Getting {len(block_ids)} memory blocks by ID from branch '{target_branch}'")
+        try:
+            state_hash = self._block_cache_state_hash(target_branch)
+            if not state_hash:
+                return self.dolt_reader.read_memory_blocks_by_ids(block_ids, branch=target_branch)
+
+            found: Dict[str, MemoryBlock] = {}
+            for block_id in block_ids:
+                cached = self._block_cache.get(target_branch, state_hash, block_id)
+                if cached is not None:
+                    found[block_id] = cached
+
+            missing = [block_id for block_id in block_ids if block_id not in found]
+            if missing:
+                for block in self.dolt_reader.read_memory_blocks_by_ids(
+                    missing, branch=target_branch
+                ):
+                    self._block_cache.put(target_branch, state_hash, block)
+                    found[block.id] = block
+
+            return [found[block_id] for block_id in dict.fromkeys(block_ids) if block_id in found]
+        except Exception as e:
+            logger.error(
+                f"Error retrieving memory blocks by ID from branch '{target_branch}': {e}",
+                exc_info=True,
+            )
+            return []
+
+    @_invalidates_block_cache
     def update_memory_block(self, block: MemoryBlock) -> bool:
         """
         Updates an existing MemoryBlock, persisting to Dolt and updating in LlamaIndex with atomic guarantees.
         If either operation fails, both are rolled back to ensure consistency between storage systems.
 
+        Writes are diff-aware against the stored block: only changed columns and
+        properties are written to Dolt, the node is re-embedded only when its embedded
+        text changed (otherwise just its metadata is rewritten, or nothing if no indexed
+        field changed), and an update with no changes at all is skipped.
+
         Args:
             block: The MemoryBlock object to update.
 
@@ -548,6 +842,18 @@ class StructuredMemoryBank:
             return False
         # --- END VALIDATION PHASE ---
 
+        # --- CHANGE DETECTION ---
+        # Diff against the stored block; without it, fall back to a full rewrite
+        previous = self.get_memory_block(block.id)
+        changes = None
+        if isinstance(previous, MemoryBlock):
+            changes = diff_memory_blocks(previous, block)
+            if not changes:
+                logger.info(f"No changes to memory block {block.id}; skipping write.")
+                return True
+        else:
+            previous = None
+
         # --- ATOMIC PERSISTENCE PHASE ---
         # Tables to track for commit/rollback
         tables = PERSISTED_TABLES
@@ -557,12 +863,20 @@ class StructuredMemoryBank:
         try:
             # Step 1: Write to Dolt without auto-commit
             try:
-                dolt_write_success, _ = self.dolt_writer.write_memory_block(
-                    block=block,
-                    branch=self.branch,
-                    auto_commit=False,  # Do not auto-commit, we need atomicity control
-                    preserve_nulls=True,  # Preserve None values for update operations
-                )
+                if previous is not None:
+                    dolt_write_success = self.dolt_writer.write_memory_block_changes(
+                        previous,
+                        block,
+                        branch=self.branch,
+                        preserve_nulls=True,  # Preserve None values for update operations
+                    )
+                else:
+                    dolt_write_success, _ = self.dolt_writer.write_memory_block(
+                        block=block,
+                        branch=self.branch,
+                        auto_commit=False,  # Do not auto-commit, we need atomicity control
+                        preserve_nulls=True,  # Preserve None values for update operations
+                    )
 
                 if not dolt_write_success:
                     logger.error(
@@ -582,7 +896,7 @@ class StructuredMemoryBank:
 
             # Step 2: Update block in LlamaIndex
             try:
-                self.llama_memory.update_block(block)
+                self._update_indexed_block(previous, block, changes)
                 llama_success = True
                 logger.info(f"Successfully updated block {block.id} in LlamaIndex.")
             except Exception as llama_e:
@@ -688,6 +1002,31 @@ class StructuredMemoryBank:
             return False
         # --- END ATOMIC PERSISTENCE PHASE ---
 
+    def _update_indexed_block(
+        self,
+        previous: Optional[MemoryBlock],
+        block: MemoryBlock,
+        changes: Optional[Dict[str, Tuple[Any, Any]]],
+    ) -> None:
+        """
+        Bring the LlamaIndex node of an updated block up to date with the least work.
+
+        Nothing is done if no indexed field changed; if the embedded text is unchanged
+        only the node metadata is rewritten (reusing the stored vector); otherwise, or
+        if the metadata rewrite fails, the block is re-embedded.
+        """
+        if changes is not None and not INDEXED_BLOCK_FIELDS.intersection(changes):
+            logger.debug(f"No indexed fields of block {block.id} changed; index left as is.")
+            return
+        if previous is not None and embedding_text(previous) == embedding_text(block):
+            try:
+                self.llama_memory.update_block_metadata(block)
+                return
+            except Exception as e:
+                logger.warning(f"Metadata-only index update failed for block {block.id}: {e}")
+        self.llama_memory.update_block(block)
+
+    @_invalidates_block_cache
     def delete_memory_block(self, block_id: str) -> bool:
         """
         Deletes a MemoryBlock from both Dolt and LlamaIndex with atomic guarantees.
@@ -875,6 +1214,194 @@ class StructuredMemoryBank:
             return False
         # --- END ATOMIC DELETION PHASE ---
 
+    def delete_memory_blocks(self, block_ids: List[str]) -> bool:
+        """
+        Deletes many MemoryBlocks from both Dolt and LlamaIndex as one unit.
+
+        Blocks, their properties and their links are removed with set-based statements
+        in a single Dolt transaction, then the vectors are removed with one index
+        delete. If the index delete fails the Dolt changes are discarded. Callers are
+        expected to have checked that the blocks exist.
+
+        Args:
+            block_ids: The IDs of the blocks to delete.
+
+        Returns:
+            True if every block was deleted from both stores, False otherwise.
+
+        Raises:
+            MainBranchProtectionError: If the memory bank's branch is protected
+        """
+        block_ids = list(dict.fromkeys(block_ids))
+        if not block_ids:
+            return True
+        logger.info(f"Attempting to delete {len(block_ids)} memory blocks")
+
+        if not self.llama_memory.is_ready():
+            logger.error("LlamaMemory backend is not ready. Cannot delete blocks.")
+            return False
+
+        tables = PERSISTED_TABLES
+        try:
+            dolt_success, deleted_count = self.dolt_writer.delete_memory_blocks(
+                block_ids, branch=self.branch
+            )
+            if not dolt_success:
+                logger.error(f"Failed to delete {len(block_ids)} blocks from Dolt.")
+                return False
+            if deleted_count != len(block_ids):
+                logger.warning(
+                    f"Deleted {deleted_count} of {len(block_ids)} blocks from Dolt; "
+                    "the rest were already gone."
+                )
+
+            try:
+                self.llama_memory.delete_blocks(block_ids)
+            except Exception as llama_e:
+                logger.error(
+                    f"Failed to delete {len(block_ids)} blocks from LlamaIndex: {llama_e}",
+                    exc_info=True,
+                )
+                try:
+                    self.dolt_writer.discard_changes(tables)
+                    logger.info("Rolled back Dolt deletions after LlamaIndex delete failure.")
+                except Exception as rollback_e:
+                    logger.critical(
+                        f"Failed to rollback Dolt changes after LlamaIndex delete failure: "
+                        f"{rollback_e}. Database may be in an inconsistent state!"
+                    )
+                    self._mark_inconsistent(
+                        f"LlamaIndex bulk delete failed and Dolt rollback failed for "
+                        f"{len(block_ids)} blocks"
+                    )
+                return False
+
+            if not self.auto_commit:
+                logger.info(
+                    f"Successfully deleted {len(block_ids)} memory blocks "
+                    "(uncommitted - auto_commit=False)"
+                )
+                self._store_block_proofs(block_ids, "delete", "STAGED")
+                return True
+
+            commit_success, commit_hash = self.dolt_writer.commit_changes(
+                commit_msg=f"Delete {len(block_ids)} memory blocks", tables=tables
+            )
+            if not commit_success:
+                logger.error(f"Failed to commit deletion of {len(block_ids)} blocks.")
+                self.dolt_writer.discard_changes(tables)
+                return False
+            self._store_block_proofs(block_ids, "delete", commit_hash)
+            return True
+
+        except MainBranchProtectionError:
+            # Nothing was written; let the caller report the protection error
+            raise
+        except Exception as e:
+            logger.error(
+                f"Failed during bulk deletion of {len(block_ids)} blocks: {e}", exc_info=True
+            )
+            try:
+                self.dolt_writer.discard_changes(tables)
+            except Exception as rollback_e:
+                logger.critical(
+                    f"Failed to rollback Dolt changes after exception: {rollback_e}. "
+                    "Database may be in an inconsistent state!"
+                )
+                self._mark_inconsistent(
+                    f"Exception during bulk delete and Dolt rollback failed for "
+                    f"{len(block_ids)} blocks"
+                )
+            return False
+        finally:
+            for block_id in block_ids:
+                self.invalidate_block_cache(block_id=block_id)
+
+    def update_blocks_namespace(self, block_ids: List[str], namespace_id: str) -> bool:
+        """
+        Moves many MemoryBlocks to a namespace in both Dolt and LlamaIndex as one unit.
+
+        Dolt gets one set-based UPDATE of memory_blocks (properties are untouched) and
+        LlamaIndex only has the namespace metadata patched, without re-embedding. If
+        the index update fails the Dolt changes are discarded. Unlike the single-block
+        methods this never commits or writes proofs: the changes are staged so the
+        caller can commit the whole batch once. Callers are expected to have checked
+        that the blocks and the namespace exist.
+
+        Args:
+            block_ids: The IDs of the blocks to move.
+            namespace_id: The namespace to move them to.
+
+        Returns:
+            True if every block was moved in both stores, False otherwise.
+        """
+        block_ids = list(dict.fromkeys(block_ids))
+        if not block_ids:
+            return True
+        logger.info(f"Attempting to move {len(block_ids)} memory blocks to '{namespace_id}'")
+
+        if not self.llama_memory.is_ready():
+            logger.error("LlamaMemory backend is not ready. Cannot update namespaces.")
+            return False
+
+        tables = PERSISTED_TABLES
+        try:
+            dolt_success, updated_count = self.dolt_writer.update_blocks_namespace(
+                block_ids, namespace_id, branch=self.branch
+            )
+            if not dolt_success:
+                logger.error(f"Failed to move {len(block_ids)} blocks in Dolt.")
+                return False
+            if updated_count != len(block_ids):
+                logger.warning(f"Moved {updated_count} of {len(block_ids)} blocks in Dolt.")
+
+            try:
+                self.llama_memory.update_namespace(block_ids, namespace_id)
+            except Exception as llama_e:
+                logger.error(
+                    f"Failed to move {len(block_ids)} blocks in LlamaIndex: {llama_e}",
+                    exc_info=True,
+                )
+                try:
+                    self.dolt_writer.discard_changes(tables)
+                    logger.info("Rolled back Dolt namespace changes after LlamaIndex failure.")
+                except Exception as rollback_e:
+                    logger.critical(
+                        f"Failed to rollback Dolt changes after LlamaIndex namespace failure: "
+                        f"{rollback_e}. Database may be in an inconsistent state!"
+                    )
+                    self._mark_inconsistent(
+                        f"LlamaIndex namespace update failed and Dolt rollback failed for "
+                        f"{len(block_ids)} blocks"
+                    )
+                return False
+
+            stage_success, stage_msg = self.dolt_writer.add_to_staging(tables)
+            if not stage_success:
+                logger.error(f"Failed to stage namespace changes: {stage_msg}")
+            return True
+
+        except Exception as e:
+            logger.error(
+                f"Failed during bulk namespace update of {len(block_ids)} blocks: {e}",
+                exc_info=True,
+            )
+            try:
+                self.dolt_writer.discard_changes(tables)
+            except Exception as rollback_e:
+                logger.critical(
+                    f"Failed to rollback Dolt changes after exception: {rollback_e}. "
+                    "Database may be in an inconsistent state!"
+                )
+                self._mark_inconsistent(
+                    f"Exception during bulk namespace update and Dolt rollback failed for "
+                    f"{len(block_ids)} blocks"
+                )
+            return False
+        finally:
+            for block_id in block_ids:
+                self.invalidate_block_cache(block_id=block_id)
+
     def query_semantic(self, query_text: str, top_k: int = 5) -> List[MemoryBlock]:
         """
         Performs a semantic search using LlamaIndex and retrieves full blocks from Dolt.
@@ -886,50 +1413,86 @@ class StructuredMemoryBank:
         Returns:
             A list of relevant MemoryBlock objects, potentially fewer than top_k if retrieval fails for some IDs.
         """
+        return [block for block, _ in self.query_semantic_with_scores(query_text, top_k=top_k)]
+
+    def query_semantic_with_scores(
+        self,
+        query_text: str,
+        top_k: int = 5,
+        type_filter: Optional[str] = None,
+        namespace_id: Optional[str] = None,
+        tag_filters: Optional[List[str]] = None,
+        metadata_filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Tuple[MemoryBlock, Optional[float]]]:
+        """
+        Performs a semantic search and returns each hydrated block with its relevance score.
+
+        Filters are applied inside the vector store query, so top_k counts only
+        matching blocks. All hits are loaded from Dolt in a single batched read;
+        results keep the LlamaIndex ranking order.
+
+        Args:
+            query_text: The text query for semantic search.
+            top_k: The maximum number of results to return.
+            type_filter: Only return blocks of this type.
+            namespace_id: Only return blocks in this namespace.
+            tag_filters: Only return blocks carrying all of these tags.
+            metadata_filters: Only return blocks whose metadata equals these values.
+                Non-scalar values cannot be pushed into the vector store and are ignored here.
+
+        Returns:
+            A list of (MemoryBlock, score) tuples, best match first. Hits that are
+            indexed in LlamaIndex but missing from Dolt are dropped.
+        """
         logger.info(f"Performing semantic query: '{query_text}' (top_k={top_k})")
         if not self.llama_memory.is_ready():
             logger.error("LlamaMemory backend is not ready. Cannot perform semantic query.")
             return []
 
-        retrieved_blocks: List[MemoryBlock] = []
         try:
-            # 1. Query LlamaIndex vector store
-            nodes_with_scores = self.llama_memory.query_vector_store(query_text, top_k=top_k)
+            # 1. Query LlamaIndex vector store (filters become a Chroma `where` clause)
+            vector_filters = build_vector_filters(
+                type_filter=type_filter,
+                namespace_id=namespace_id,
+                tag_filters=tag_filters,
+                metadata_filters=metadata_filters,
+            )
+            nodes_with_scores = self.llama_memory.query_vector_store(
+                query_text, top_k=top_k, filters=vector_filters or None
+            )
 
             if not nodes_with_scores:
                 logger.info("Semantic query returned no results from LlamaIndex.")
                 return []
 
-            # 2. Extract block IDs and retrieve full blocks from Dolt
-            block_ids = [node.node.id_ for node in nodes_with_scores if node.node and node.node.id_]
+            # 2. Extract block IDs (keeping the best score for each) in ranking order
+            scores: Dict[str, Optional[float]] = {}
+            for node in nodes_with_scores:
+                if node.node and node.node.id_ and node.node.id_ not in scores:
+                    scores[node.node.id_] = node.score
+            block_ids = list(scores)
             logger.info(
                 f"LlamaIndex query returned {len(block_ids)} potential block IDs: {block_ids}"
             )
 
-            # Consider adding a cache here later if performance becomes an issue
+            # 3. Retrieve all full blocks from Dolt in one batch (served from cache where possible)
+            found = {
+                block.id: block
+                for block in self.get_memory_blocks_by_ids(block_ids, branch=self.branch)
+            }
+            results: List[Tuple[MemoryBlock, Optional[float]]] = []
             for block_id in block_ids:
-                try:
-                    # 3. Retrieve full block from Dolt using existing method
-                    block = self.get_memory_block(block_id)
-                    if block:
-                        # TODO: Consider adding relevance score from LlamaIndex to the returned block
-                        # (Requires modifying MemoryBlock schema or returning a different structure)
-                        retrieved_blocks.append(block)
-                    else:
-                        logger.warning(
-                            f"Could not retrieve block with ID {block_id} from Dolt, though it was found in LlamaIndex."
-                        )
-                except Exception as e_get:
-                    logger.error(
-                        f"Error retrieving block {block_id} from Dolt during semantic query: {e_get}",
-                        exc_info=True,
+                if block_id in found:
+                    results.append((found[block_id], scores[block_id]))
+                else:
+                    logger.warning(
+                        f"Could not retrieve block with ID {block_id} from Dolt, though it was found in LlamaIndex."
                     )
-                    # Continue to try retrieving other blocks
 
             logger.info(
-                f"Semantic query processing complete. Retrieved {len(retrieved_blocks)} full blocks from Dolt."
+                f"Semantic query processing complete. Retrieved {len(results)} full blocks from Dolt."
             )
-            return retrieved_blocks
+            return results
 
         except Exception as e:
             logger.error(f"Error during semantic query execution: {e}", exc_info=True)
@@ -978,6 +1541,50 @@ class StructuredMemoryBank:
             )
             return []  # Return empty list on error
 
+    def query_memory_blocks(
+        self, query: BlockQuery, branch: Optional[str] = None
+    ) -> List[MemoryBlock]:
+        """
+        Retrieves MemoryBlocks matching a BlockQuery, with filtering done in SQL.
+
+        Args:
+            query: The BlockQuery describing filters, ordering and paging.
+            branch: The Dolt branch to read from (defaults to the bank's branch).
+
+        Returns:
+            A list of matching MemoryBlock objects.
+        """
+        target_branch = branch or self.branch
+        logger.info(f"Querying memory blocks on branch '{target_branch}': {query}")
+        try:
+            return self.dolt_reader.query_memory_blocks(query, branch=target_branch)
+        except Exception as e:
+            logger.error(
+                f"Error querying memory blocks on branch '{target_branch}': {e}", exc_info=True
+            )
+            return []
+
+    def query_memory_block_page(
+        self, query: BlockQuery, branch: Optional[str] = None
+    ) -> BlockPage:
+        """
+        Retrieves one page of MemoryBlocks matching a BlockQuery.
+
+        Unlike query_memory_blocks(), database errors are raised rather than
+        returned as an empty list, and the page's next_cursor follows the last
+        SQL row even when some rows could not be turned into MemoryBlocks.
+
+        Args:
+            query: The BlockQuery describing filters, ordering and paging.
+            branch: The Dolt branch to read from (defaults to the bank's branch).
+
+        Returns:
+            The BlockPage for the query.
+        """
+        target_branch = branch or self.branch
+        logger.info(f"Querying memory block page on branch '{target_branch}': {query}")
+        return self.dolt_reader.query_memory_block_page(query, branch=target_branch)
+
     # TODO: Implement MySQL-based link management
     def get_forward_links(self, block_id: str, relation: Optional[str] = None) -> List[BlockLink]:
         """
@@ -1065,6 +1672,22 @@ class StructuredMemoryBank:
             logger.error(f"Error retrieving backlinks for {block_id}: {e}", exc_info=True)
             return []
 
+    def get_link_sources(self, block_ids: List[str]) -> Dict[str, List[str]]:
+        """
+        Finds, in one batched query, the blocks that link TO any of the given blocks.
+
+        Args:
+            block_ids: The IDs of the target blocks
+
+        Returns:
+            Mapping of target block ID to the IDs of the blocks linking to it
+
+        Raises:
+            Exception: If the links cannot be read (so dependency checks fail closed)
+        """
+        logger.debug(f"Getting link sources for {len(block_ids)} blocks")
+        return self.dolt_reader.read_link_sources(block_ids, branch=self.branch)
+
     def get_block_proofs(self, block_id: str) -> List[Dict[str, Any]]:
         """
         Retrieves block operation proofs (create/update/delete) for a specific block.
@@ -11,9 +11,11 @@ from pydantic import BaseModel, Field
 import logging
 
 from ...schemas.common import BlockIdType
-from ...schemas.memory_block import ConfidenceScore
+from ...schemas.memory_block import ConfidenceScore, MemoryBlock
+from ...structured_memory_bank import StructuredMemoryBank
 from ..base.cogni_tool import CogniTool
 from ..memory_core.create_memory_block_tool import (
+    build_memory_block,
     create_memory_block,
     CreateMemoryBlockInput as CoreCreateMemoryBlockInput,
 )
@@ -123,62 +125,48 @@ class BulkCreateBlocksOutput(BaseModel):
     )
 
 
-def bulk_create_blocks(input_data: BulkCreateBlocksInput, memory_bank) -> BulkCreateBlocksOutput:
-    """
-    Create multiple memory blocks with independent success tracking.
-
-    Each block creation is independent - if one fails, others can still succeed.
-    This allows for partial success scenarios which are common in bulk operations.
-
-    Transaction Semantics:
-    - Each block creation uses the existing create_memory_block() function
-    - Individual blocks are committed independently (current implementation)
-    - TODO: Future enhancement could wrap in single transaction for atomicity
+def _core_input(
+    block_spec: BlockSpec, input_data: BulkCreateBlocksInput
+) -> CoreCreateMemoryBlockInput:
+    """Build the single-block create input for a spec, adding system metadata fields."""
+    # Prepare metadata with system fields
+    final_metadata = block_spec.metadata.copy()
+
+    # Add system metadata fields with defaults (addresses FIELD-DEFAULT-102)
+    final_metadata["x_agent_id"] = block_spec.x_agent_id or input_data.default_x_agent_id
+    final_metadata["x_tool_id"] = block_spec.x_tool_id or input_data.default_x_tool_id
+
+    if block_spec.x_parent_block_id:
+        final_metadata["x_parent_block_id"] = block_spec.x_parent_block_id
+    if block_spec.x_session_id or input_data.default_x_session_id:
+        final_metadata["x_session_id"] = block_spec.x_session_id or input_data.default_x_session_id
+
+    return CoreCreateMemoryBlockInput(
+        type=block_spec.type,
+        text=block_spec.text,
+        state=block_spec.state,
+        visibility=block_spec.visibility,
+        tags=block_spec.tags,
+        metadata=final_metadata,
+        source_file=block_spec.source_file,
+        confidence=block_spec.confidence,
+        created_by=block_spec.created_by,
+    )
 
-    Args:
-        input_data: Input data containing list of block specifications
-        memory_bank: StructuredMemoryBank instance for persistence
-
-    Returns:
-        BulkCreateBlocksOutput containing overall status and individual results
-    """
-    logger.info(f"Starting bulk creation of {len(input_data.blocks)} blocks")
 
+def _create_blocks_one_by_one(
+    input_data: BulkCreateBlocksInput, memory_bank
+) -> List[BlockResult]:
+    """Create each block through the single-block create_memory_block path."""
     results = []
-    successful_count = 0
-    failed_count = 0
 
     for i, block_spec in enumerate(input_data.blocks):
         if logger.isEnabledFor(logging.DEBUG):  # Gate debug logging (addresses LOGGING-101)
             logger.debug(f"Processing block {i + 1}/{len(input_data.blocks)}: {block_spec.type}")
 
         try:
-            # Prepare metadata with system fields
-            final_metadata = block_spec.metadata.copy()
-
-            # Add system metadata fields with defaults (addresses FIELD-DEFAULT-102)
-            final_metadata["x_agent_id"] = block_spec.x_agent_id or input_data.default_x_agent_id
-            final_metadata["x_tool_id"] = block_spec.x_tool_id or input_data.default_x_tool_id
-
-            if block_spec.x_parent_block_id:
-                final_metadata["x_parent_block_id"] = block_spec.x_parent_block_id
-            if block_spec.x_session_id or input_data.default_x_session_id:
-                final_metadata["x_session_id"] = (
-                    block_spec.x_session_id or input_data.default_x_session_id
-                )
-
             # Create core input from block spec
-            core_input = CoreCreateMemoryBlockInput(
-                type=block_spec.type,
-                text=block_spec.text,
-                state=block_spec.state,
-                visibility=block_spec.visibility,
-                tags=block_spec.tags,
-                metadata=final_metadata,
-                source_file=block_spec.source_file,
-                confidence=block_spec.confidence,
-                created_by=block_spec.created_by,
-            )
+            core_input = _core_input(block_spec, input_data)
 
             # Attempt to create the block
             core_result = create_memory_block(core_input, memory_bank)
@@ -195,11 +183,9 @@ def bulk_create_blocks(input_data: BulkCreateBlocksInput, memory_bank) -> BulkCr
             results.append(block_result)
 
             if core_result.success:
-                successful_count += 1
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.debug(f"Successfully created block {i + 1}: {core_result.id}")
             else:
-                failed_count += 1
                 logger.warning(f"Failed to create block {i + 1}: {core_result.error}")
 
                 # Stop on first error if requested
@@ -221,13 +207,112 @@ def bulk_create_blocks(input_data: BulkCreateBlocksInput, memory_bank) -> BulkCr
             )
 
             results.append(block_result)
-            failed_count += 1
 
             # Stop on first error if requested
             if input_data.stop_on_first_error:
                 logger.info("Stopping bulk operation on unexpected error as requested")
                 break
 
+    return results
+
+
+def _create_blocks_in_bulk(
+    input_data: BulkCreateBlocksInput, memory_bank: StructuredMemoryBank
+) -> List[BlockResult]:
+    """
+    Validate every spec up front, then create the valid blocks in one batch.
+
+    Specs are checked in order with the same rules as the single-block path (schema
+    versions looked up once per type); the resulting blocks are persisted together
+    by StructuredMemoryBank.create_memory_blocks. Results keep input order and end
+    at the first failure when stop_on_first_error is set.
+    """
+    now = datetime.now()
+    schema_versions: Dict[str, Optional[int]] = {}
+    results: List[Optional[BlockResult]] = []
+    pending: Dict[int, MemoryBlock] = {}
+
+    for i, block_spec in enumerate(input_data.blocks):
+        try:
+            block, error = build_memory_block(
+                _core_input(block_spec, input_data), memory_bank, now, schema_versions
+            )
+        except Exception as e:
+            block, error = None, f"Unexpected error processing block {i + 1}: {str(e)}"
+            logger.error(error, exc_info=True)
+
+        if block is not None:
+            pending[len(results)] = block
+            results.append(None)
+            continue
+
+        logger.warning(f"Failed to create block {i + 1}: {error}")
+        results.append(
+            BlockResult(success=False, error=error, block_type=block_spec.type, timestamp=now)
+        )
+        if input_data.stop_on_first_error:
+            logger.info("Stopping bulk operation on first error as requested")
+            break
+
+    if pending:
+        logger.info(f"Creating {len(pending)} validated blocks in one batch")
+        errors = memory_bank.create_memory_blocks(
+            list(pending.values()), stop_on_first_error=input_data.stop_on_first_error
+        )
+        for index, block in pending.items():
+            if block.id not in errors:
+                continue  # Not reached: the bank stopped at an earlier invalid block
+            error = errors[block.id]
+            results[index] = BlockResult(
+                success=error is None,
+                id=block.id if error is None else None,
+                error=error,
+                block_type=block.type,
+                timestamp=block.created_at if error is None else now,
+            )
+
+    ordered: List[BlockResult] = []
+    for result in results:
+        if result is None:
+            break
+        ordered.append(result)
+        if input_data.stop_on_first_error and not result.success:
+            break
+    return ordered
+
+
+def bulk_create_blocks(input_data: BulkCreateBlocksInput, memory_bank) -> BulkCreateBlocksOutput:
+    """
+    Create multiple memory blocks with independent success tracking.
+
+    Each block creation is independent - if one fails, others can still succeed.
+    This allows for partial success scenarios which are common in bulk operations.
+
+    Transaction Semantics:
+    - With a StructuredMemoryBank, every spec is validated first and the valid
+      blocks are created together: one Dolt transaction with multi-row inserts,
+      batched embedding with a single index persist, and proofs written in bulk.
+      Persistence of the valid blocks is all-or-nothing; if it fails, each of
+      them is reported as failed
+    - Any other memory bank goes through create_memory_block() block by block,
+      each block committed independently
+
+    Args:
+        input_data: Input data containing list of block specifications
+        memory_bank: StructuredMemoryBank instance for persistence
+
+    Returns:
+        BulkCreateBlocksOutput containing overall status and individual results
+    """
+    logger.info(f"Starting bulk creation of {len(input_data.blocks)} blocks")
+
+    if isinstance(memory_bank, StructuredMemoryBank):
+        results = _create_blocks_in_bulk(input_data, memory_bank)
+    else:
+        results = _create_blocks_one_by_one(input_data, memory_bank)
+    successful_count = sum(1 for result in results if result.success)
+    failed_count = len(results) - successful_count
+
     # Clear success semantics (addresses CONSISTENCY-002)
     overall_success = failed_count == 0  # True only if ALL blocks succeeded
     partial_success = successful_count > 0  # True if ANY blocks succeeded
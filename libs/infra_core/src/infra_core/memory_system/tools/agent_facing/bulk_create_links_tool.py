@@ -13,7 +13,7 @@ import logging
 from ...schemas.common import BlockIdType, RelationType
 from ..base.cogni_tool import CogniTool
 from ..helpers.block_validation import ensure_blocks_exist
-from ...link_manager import LinkError
+from ...link_manager import LinkError, LinkManager
 from ...relation_registry import get_inverse_relation, is_valid_relation
 
 # Setup logging
@@ -145,6 +145,70 @@ def _get_active_branch(memory_bank) -> Optional[str]:
         return None
 
 
+def _spec_links(link_spec: LinkSpec) -> List[tuple]:
+    """Expand a spec into bulk_upsert tuples: the link itself plus its inverse if bidirectional."""
+    links = [
+        (
+            link_spec.from_id,
+            link_spec.to_id,
+            link_spec.relation,
+            link_spec.metadata,
+            link_spec.priority,
+            link_spec.created_by,
+        )
+    ]
+    if link_spec.bidirectional:
+        inverse_relation = get_inverse_relation(link_spec.relation)
+        if inverse_relation and inverse_relation != link_spec.relation:
+            links.append(
+                (
+                    link_spec.to_id,
+                    link_spec.from_id,
+                    inverse_relation,
+                    link_spec.metadata,
+                    link_spec.priority,
+                    link_spec.created_by,
+                )
+            )
+    return links
+
+
+def _bulk_upsert_specs(
+    link_manager: LinkManager, specs: List[LinkSpec]
+) -> Optional[List[LinkResult]]:
+    """
+    Write every spec with a single bulk_upsert call.
+
+    Returns:
+        Per-spec results, or None if the batch was rejected so the caller can fall
+        back to per-link upserts that report each failing spec individually
+
+    Raises:
+        Exception: Errors other than a rejected batch (e.g. a lost connection), where
+            retrying link by link could repeat writes that already happened
+    """
+    spec_links = [_spec_links(link_spec) for link_spec in specs]
+    try:
+        link_manager.bulk_upsert([link for links in spec_links for link in links])
+    except (LinkError, ValueError) as e:
+        logger.warning(f"Bulk link upsert rejected, retrying link by link: {e}")
+        return None
+
+    now = datetime.now()
+    return [
+        LinkResult(
+            success=True,
+            from_id=link_spec.from_id,
+            to_id=link_spec.to_id,
+            relation=link_spec.relation,
+            bidirectional=link_spec.bidirectional,
+            links_created=len(links),
+            timestamp=now,
+        )
+        for link_spec, links in zip(specs, spec_links)
+    ]
+
+
 def bulk_create_links(input_data: BulkCreateLinksInput, memory_bank) -> BulkCreateLinksOutput:
     """
     Create multiple memory block links with independent success tracking.
@@ -153,9 +217,12 @@ def bulk_create_links(input_data: BulkCreateLinksInput, memory_bank) -> BulkCrea
     This allows for partial success scenarios which are common in bulk operations.
 
     Transaction Semantics:
-    - When stop_on_first_error=True, uses transaction wrapper for atomicity
-    - When stop_on_first_error=False, allows partial success (current behavior)
-    - Future enhancement: Full transaction support for all scenarios
+    - All specs are first written with one LinkManager.bulk_upsert call, which
+      SQLLinkManager runs as a single transaction
+    - If that batch is rejected (e.g. one link would create a cycle), nothing is
+      written and the specs are retried one by one so each failure is reported;
+      stop_on_first_error applies to this per-link pass
+    - Any other batch error (e.g. a lost connection) fails every spec without a retry
 
     Args:
         input_data: Input data containing list of link specifications
@@ -267,10 +334,39 @@ def bulk_create_links(input_data: BulkCreateLinksInput, memory_bank) -> BulkCrea
                 timestamp=datetime.now(),
             )
 
-    # TODO: Implement transaction wrapper for stop_on_first_error=True (addresses TXN-SEMANTICS-L001)
-    # For now, process links individually as before but with improved error handling
+    # Set-based path: all specs in one bulk_upsert (one transaction for SQLLinkManager).
+    # If the batch is rejected nothing was written, and the per-link loop below
+    # pinpoints the failing specs.
+    per_link_specs = input_data.links
+    if isinstance(link_manager, LinkManager):
+        try:
+            bulk_results = _bulk_upsert_specs(link_manager, input_data.links)
+        except Exception as e:
+            error_msg = f"Bulk link upsert failed: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            bulk_results = [
+                LinkResult(
+                    success=False,
+                    from_id=link_spec.from_id,
+                    to_id=link_spec.to_id,
+                    relation=link_spec.relation,
+                    error=error_msg,
+                    bidirectional=link_spec.bidirectional,
+                    links_created=0,
+                    timestamp=datetime.now(),
+                )
+                for link_spec in input_data.links
+            ]
+        if bulk_results is not None:
+            per_link_specs = []
+            results = bulk_results
+            successful_count = sum(1 for result in results if result.success)
+            failed_count = len(results) - successful_count
+            total_actual_links_created = sum(
+                result.links_created for result in results if result.success
+            )
 
-    for i, link_spec in enumerate(input_data.links):
+    for i, link_spec in enumerate(per_link_specs):
         if (
             logger.isEnabledFor(logging.DEBUG) and i % 100 == 0
         ):  # Reduced debug spam (addresses LOGGING-L104)
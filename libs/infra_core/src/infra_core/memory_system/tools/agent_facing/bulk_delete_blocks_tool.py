@@ -14,10 +14,13 @@ from ...schemas.common import BlockIdType
 from ..base.cogni_tool import CogniTool
 from ..memory_core.delete_memory_block_core import (
     delete_memory_block_core,
+    format_dependency_error,
     DeleteMemoryBlockInput as CoreDeleteMemoryBlockInput,
 )
 from ..memory_core.delete_memory_block_models import DeleteErrorCode
+from ...dolt_mysql_base import MainBranchProtectionError
 from ...dolt_writer import PERSISTED_TABLES
+from ...structured_memory_bank import StructuredMemoryBank
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -113,85 +116,18 @@ class BulkDeleteBlocksOutput(BaseModel):
     )
 
 
-def bulk_delete_blocks(input_data: BulkDeleteBlocksInput, memory_bank) -> BulkDeleteBlocksOutput:
-    """
-    Delete multiple memory blocks with independent success tracking.
-
-    Each block deletion is independent - if one fails, others can still succeed.
-    This allows for partial success scenarios which are common in bulk operations.
-
-    Transaction Semantics:
-    - Each block deletion uses the existing delete_memory_block_core() function
-    - Individual blocks are deleted independently (current implementation)
-    - Each deletion is atomic at the individual block level
-
-    Timing Semantics:
-    - total_processing_time_ms: Total wall-clock time for the entire bulk operation
-      (includes overhead, coordination, and sequential processing time)
-    - Individual processing_time_ms: Time for each block's deletion attempt
-    - Note: total_processing_time_ms is NOT the sum of individual processing times
-      due to bulk operation overhead and sequential coordination costs
-
-    Stop Behavior:
-    - stop_on_first_error=False: Process all blocks, report all results
-    - stop_on_first_error=True: Stop on first failure, remaining blocks are skipped
-    - skipped_block_ids: Contains IDs of blocks not processed due to early termination
-
-    Dependency Validation Precedence:
-    - Per-block validate_dependencies (if specified) overrides default_validate_dependencies
-    - If block spec doesn't specify, uses default_validate_dependencies from input
-
-    Args:
-        input_data: Input data containing list of block specifications to delete
-        memory_bank: StructuredMemoryBank instance for persistence
+def _validate_dependencies(delete_spec: DeleteSpec, input_data: BulkDeleteBlocksInput) -> bool:
+    """Per-block validate_dependencies if specified, otherwise the input default."""
+    if delete_spec.validate_dependencies is not None:
+        return delete_spec.validate_dependencies
+    return input_data.default_validate_dependencies
 
-    Returns:
-        BulkDeleteBlocksOutput containing overall status and individual results
-
-    Examples:
-        >>> # Basic bulk deletion
-        >>> input_data = BulkDeleteBlocksInput(
-        ...     blocks=[
-        ...         DeleteSpec(block_id="12345678-1234-1234-1234-123456789001"),
-        ...         DeleteSpec(block_id="12345678-1234-1234-1234-123456789002")
-        ...     ]
-        ... )
-        >>> result = bulk_delete_blocks(input_data, memory_bank)
-        >>> # result.success = True if ALL deletions succeeded
-        >>> # result.partial_success = True if ANY deletions succeeded
-        >>> # result.skipped_block_ids = [] (no blocks skipped)
-
-        >>> # Partial success scenario with dependency validation
-        >>> input_data = BulkDeleteBlocksInput(
-        ...     blocks=[
-        ...         DeleteSpec(block_id="valid-id", validate_dependencies=True),
-        ...         DeleteSpec(block_id="has-deps-id", validate_dependencies=False)
-        ...     ],
-        ...     stop_on_first_error=False
-        ... )
-        >>> result = bulk_delete_blocks(input_data, memory_bank)
-        >>> # First may fail due to dependencies, second force-deletes
-        >>> # result.partial_success = True if at least one succeeded
-
-        >>> # Early termination scenario with skipped blocks
-        >>> input_data = BulkDeleteBlocksInput(
-        ...     blocks=[
-        ...         DeleteSpec(block_id="nonexistent-id"),
-        ...         DeleteSpec(block_id="valid-id-1"),
-        ...         DeleteSpec(block_id="valid-id-2")
-        ...     ],
-        ...     stop_on_first_error=True
-        ... )
-        >>> result = bulk_delete_blocks(input_data, memory_bank)
-        >>> # First block fails (not found), remaining blocks are skipped
-        >>> # result.skipped_block_ids = ["valid-id-1", "valid-id-2"]
-    """
-    start_time = datetime.now()
-    logger.info(f"Starting bulk deletion of {len(input_data.blocks)} blocks")
 
+def _delete_blocks_one_by_one(
+    input_data: BulkDeleteBlocksInput, memory_bank
+) -> List[DeleteResult]:
+    """Delete each block through delete_memory_block_core, in input order."""
     results = []
-    successful_count = 0
-    failed_count = 0
 
     for i, delete_spec in enumerate(input_data.blocks):
         if logger.isEnabledFor(logging.DEBUG):  # Gate debug logging
@@ -201,11 +137,7 @@ def bulk_delete_blocks(input_data: BulkDeleteBlocksInput, memory_bank) -> BulkDe
 
         try:
             # Determine validation setting (spec override or default)
-            validate_deps = (
-                delete_spec.validate_dependencies
-                if delete_spec.validate_dependencies is not None
-                else input_data.default_validate_dependencies
-            )
+            validate_deps = _validate_dependencies(delete_spec, input_data)
 
             # Create core input for deletion
             core_input = CoreDeleteMemoryBlockInput(
@@ -235,11 +167,9 @@ def bulk_delete_blocks(input_data: BulkDeleteBlocksInput, memory_bank) -> BulkDe
             results.append(delete_result)
 
             if core_result.success:
-                successful_count += 1
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.debug(f"Successfully deleted block {i + 1}: {delete_spec.block_id}")
             else:
-                failed_count += 1
                 logger.warning(f"Failed to delete block {i + 1}: {core_result.error}")
 
                 # Stop on first error if requested
@@ -264,13 +194,196 @@ def bulk_delete_blocks(input_data: BulkDeleteBlocksInput, memory_bank) -> BulkDe
             )
 
             results.append(delete_result)
-            failed_count += 1
 
             # Stop on first error if requested
             if input_data.stop_on_first_error:
                 logger.info("Stopping bulk operation on unexpected error as requested")
                 break
 
+    return results
+
+
+def _delete_blocks_in_bulk(
+    input_data: BulkDeleteBlocksInput, memory_bank: StructuredMemoryBank
+) -> List[DeleteResult]:
+    """
+    Validate every spec up front and delete the accepted blocks in one batch.
+
+    Existence is checked with one batched block read and dependencies with one
+    link query; the accepted blocks are then removed by a single
+    StructuredMemoryBank.delete_memory_blocks call. Results keep input order and
+    stop after the first rejected spec when stop_on_first_error is set. Every
+    result carries the processing time of the whole batch.
+    """
+    start_time = datetime.now()
+    specs = input_data.blocks
+    existing = {
+        block.id: block
+        for block in memory_bank.get_memory_blocks_by_ids([spec.block_id for spec in specs])
+    }
+
+    dependency_error = None
+    link_sources: Dict[str, List[str]] = {}
+    validate_ids = [spec.block_id for spec in specs if _validate_dependencies(spec, input_data)]
+    if validate_ids:
+        try:
+            link_sources = memory_bank.get_link_sources(validate_ids)
+        except Exception as e:
+            logger.error(f"Error checking block dependencies: {e}", exc_info=True)
+            dependency_error = f"Failed to check dependencies: {str(e)}"
+
+    results: List[DeleteResult] = []
+    accepted: List[DeleteResult] = []
+    accepted_ids = set()
+    for delete_spec in specs:
+        block_id = delete_spec.block_id
+        block = existing.get(block_id)
+        # Links from blocks accepted earlier in the batch go away with them,
+        # as they did when each deletion removed its links before the next check
+        dependents = [
+            source_id
+            for source_id in link_sources.get(block_id, [])
+            if source_id not in accepted_ids
+        ]
+        error, error_code = None, None
+        if block is None or block_id in accepted_ids:
+            error_code = DeleteErrorCode.BLOCK_NOT_FOUND
+            error = f"Memory block with ID '{block_id}' not found"
+        elif _validate_dependencies(delete_spec, input_data) and (dependency_error or dependents):
+            error_code = DeleteErrorCode.DEPENDENCIES_EXIST
+            error = dependency_error or format_dependency_error(block_id, dependents)
+
+        result = DeleteResult(
+            success=error is None,
+            block_id=block_id,
+            error=error,
+            error_code=error_code,
+            deleted_block_type=block.type if error is None else None,
+            deleted_block_version=(block.block_version or 0) if error is None else None,
+            timestamp=start_time,
+        )
+        results.append(result)
+        if error is None:
+            accepted.append(result)
+            accepted_ids.add(block_id)
+        else:
+            logger.warning(f"Failed to delete block {len(results)}: {error}")
+            if input_data.stop_on_first_error:
+                logger.info("Stopping bulk operation on first error as requested")
+                break
+
+    if accepted:
+        logger.info(f"Deleting {len(accepted)} validated blocks in one batch")
+        protection_error = None
+        try:
+            deleted = memory_bank.delete_memory_blocks([result.block_id for result in accepted])
+        except MainBranchProtectionError as e:
+            logger.error(f"Bulk delete blocked by branch protection: {e}")
+            deleted, protection_error = False, str(e)
+        if not deleted:
+            for result in accepted:
+                result.success = False
+                result.error = (
+                    protection_error or f"Failed to delete memory block {result.block_id}"
+                )
+                result.error_code = DeleteErrorCode.DELETION_FAILED
+                result.deleted_block_type = None
+                result.deleted_block_version = None
+
+    processing_time = (datetime.now() - start_time).total_seconds() * 1000
+    for result in results:
+        result.processing_time_ms = processing_time
+    return results
+
+
+def bulk_delete_blocks(input_data: BulkDeleteBlocksInput, memory_bank) -> BulkDeleteBlocksOutput:
+    """
+    Delete multiple memory blocks with independent success tracking.
+
+    Each block deletion is independent - if one fails, others can still succeed.
+    This allows for partial success scenarios which are common in bulk operations.
+
+    Transaction Semantics:
+    - With a StructuredMemoryBank, all specs are validated first (one batched block
+      read, one dependency query over block_links) and the accepted blocks are
+      deleted together: blocks, properties and links in one Dolt transaction and
+      one LlamaIndex delete. If that batch fails, every accepted block fails
+    - Any other memory bank goes through delete_memory_block_core() block by block,
+      each deletion atomic at the individual block level
+    - Proofs for the committed deletions are written in one multi-row insert
+
+    Timing Semantics:
+    - total_processing_time_ms: Total wall-clock time for the entire bulk operation
+      (includes overhead, coordination, and sequential processing time)
+    - Individual processing_time_ms: Time for each block's deletion attempt (the
+      whole batch's time on the batched path)
+    - Note: total_processing_time_ms is NOT the sum of individual processing times
+      due to bulk operation overhead and sequential coordination costs
+
+    Stop Behavior:
+    - stop_on_first_error=False: Process all blocks, report all results
+    - stop_on_first_error=True: Stop on first failure, remaining blocks are skipped
+    - skipped_block_ids: Contains IDs of blocks not processed due to early termination
+
+    Dependency Validation Precedence:
+    - Per-block validate_dependencies (if specified) overrides default_validate_dependencies
+    - If block spec doesn't specify, uses default_validate_dependencies from input
+
+    Args:
+        input_data: Input data containing list of block specifications to delete
+        memory_bank: StructuredMemoryBank instance for persistence
+
+    Returns:
+        BulkDeleteBlocksOutput containing overall status and individual results
+
+    Examples:
+        >>> # Basic bulk deletion
+        >>> input_data = BulkDeleteBlocksInput(
+        ...     blocks=[
+        ...         DeleteSpec(block_id="12345678-1234-1234-1234-123456789001"),
+        ...         DeleteSpec(block_id="12345678-1234-1234-1234-123456789002")
+        ...     ]
+        ... )
+        >>> result = bulk_delete_blocks(input_data, memory_bank)
+        >>> # result.success = True if ALL deletions succeeded
+        >>> # result.partial_success = True if ANY deletions succeeded
+        >>> # result.skipped_block_ids = [] (no blocks skipped)
+
+        >>> # Partial success scenario with dependency validation
+        >>> input_data = BulkDeleteBlocksInput(
+        ...     blocks=[
+        ...         DeleteSpec(block_id="valid-id", validate_dependencies=True),
+        ...         DeleteSpec(block_id="has-deps-id", validate_dependencies=False)
+        ...     ],
+        ...     stop_on_first_error=False
+        ... )
+        >>> result = bulk_delete_blocks(input_data, memory_bank)
+        >>> # First may fail due to dependencies, second force-deletes
+        >>> # result.partial_success = True if at least one succeeded
+
+        >>> # Early termination scenario with skipped blocks
+        >>> input_data = BulkDeleteBlocksInput(
+        ...     blocks=[
+        ...         DeleteSpec(block_id="nonexistent-id"),
+        ...         DeleteSpec(block_id="valid-id-1"),
+        ...         DeleteSpec(block_id="valid-id-2")
+        ...     ],
+        ...     stop_on_first_error=True
+        ... )
+        >>> result = bulk_delete_blocks(input_data, memory_bank)
+        >>> # First block fails (not found), remaining blocks are skipped
+        >>> # result.skipped_block_ids = ["valid-id-1", "valid-id-2"]
+    """
+    start_time = datetime.now()
+    logger.info(f"Starting bulk deletion of {len(input_data.blocks)} blocks")
+
+    if isinstance(memory_bank, StructuredMemoryBank):
+        results = _delete_blocks_in_bulk(input_data, memory_bank)
+    else:
+        results = _delete_blocks_one_by_one(input_data, memory_bank)
+    successful_count = sum(1 for result in results if result.success)
+    failed_count = len(results) - successful_count
+
     # Clear success semantics (same pattern as bulk_create_blocks)
     overall_success = failed_count == 0  # True only if ALL blocks succeeded
     partial_success = successful_count > 0  # True if ANY blocks succeeded
@@ -359,10 +472,12 @@ def bulk_delete_blocks(input_data: BulkDeleteBlocksInput, memory_bank) -> BulkDe
 
             if commit_success:
                 logger.info(f"Successfully committed bulk deletion changes: {commit_hash}")
-                # Store block proof for successful deletions
-                for result in results:
-                    if result.success:
-                        memory_bank._store_block_proof(result.block_id, "delete", commit_hash)
+                # Store block proofs for successful deletions in one multi-row insert
+                memory_bank._store_block_proofs(
+                    [result.block_id for result in results if result.success],
+                    "delete",
+                    commit_hash,
+                )
             else:
                 # Commit failed - all "successful" deletions are now failures
                 logger.error(f"DEBUG: Commit failed! success={commit_success}, hash={commit_hash}")
@@ -5,7 +5,7 @@ This tool provides efficient bulk namespace updates with independent success tra
 allowing partial success scenarios where some blocks succeed and others fail.
 """
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime
 from pydantic import BaseModel, Field
 import logging
@@ -18,6 +18,7 @@ from ..memory_core.update_memory_block_core import (
     UpdateErrorCode,
 )
 from ...dolt_writer import PERSISTED_TABLES
+from ...structured_memory_bank import StructuredMemoryBank
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -105,96 +106,17 @@ class BulkUpdateNamespaceOutput(BaseModel):
     )
 
 
-def bulk_update_namespace(
+def _update_namespaces_one_by_one(
     input_data: BulkUpdateNamespaceInput, memory_bank
-) -> BulkUpdateNamespaceOutput:
+) -> Tuple[List[BlockUpdateResult], int]:
     """
-    Update namespace of multiple memory blocks with independent success tracking.
-
-    Each block update is independent - if one fails, others can still succeed.
-    This allows for partial success scenarios which are common in bulk operations.
-
-    Transaction Semantics:
-    - Individual updates are staged independently
-    - Bulk commit at the end for atomicity
-    - Rollback on commit failure
-
-    Args:
-        input_data: Input data containing list of block IDs and target namespace
-        memory_bank: StructuredMemoryBank instance for persistence
+    Move each block through update_memory_block_core() in turn.
 
-    Returns:
-        BulkUpdateNamespaceOutput containing overall status and individual results
+    Returns the results and the number of specs processed before stopping.
     """
-    start_time = datetime.now()
-    logger.info(
-        f"Starting bulk namespace update of {len(input_data.blocks)} blocks to namespace '{input_data.target_namespace_id}'"
-    )
-
     results = []
-    successful_count = 0
-    failed_count = 0
     processed_blocks = 0
-    namespace_validated = False
-
-    # --- VALIDATION PHASE: Validate target namespace exists ---
-    try:
-        # Check if target namespace exists
-        from ...tools.agent_facing.dolt_namespace_tool import (
-            list_namespaces_tool,
-            ListNamespacesInput,
-        )
 
-        namespace_result = list_namespaces_tool(ListNamespacesInput(), memory_bank)
-
-        if namespace_result.success:
-            existing_namespaces = [ns.id for ns in namespace_result.namespaces]
-            if input_data.target_namespace_id not in existing_namespaces:
-                logger.error(f"Target namespace '{input_data.target_namespace_id}' does not exist")
-                # Create failed results for all blocks
-                for block_spec in input_data.blocks:
-                    results.append(
-                        BlockUpdateResult(
-                            success=False,
-                            block_id=block_spec.block_id,
-                            error=f"Target namespace '{input_data.target_namespace_id}' does not exist",
-                            error_code=UpdateErrorCode.VALIDATION_ERROR,
-                            previous_namespace=None,
-                            new_namespace=None,
-                            block_version=None,
-                            timestamp=datetime.now(),
-                            processing_time_ms=0,
-                        )
-                    )
-                failed_count = len(input_data.blocks)
-
-                return BulkUpdateNamespaceOutput(
-                    success=False,
-                    partial_success=False,
-                    total_blocks=len(input_data.blocks),
-                    successful_blocks=0,
-                    failed_blocks=failed_count,
-                    results=results,
-                    skipped_block_ids=[],
-                    error_summary={"VALIDATION_ERROR": failed_count},
-                    target_namespace_id=input_data.target_namespace_id,
-                    namespace_validated=False,
-                    active_branch=memory_bank.branch,
-                    timestamp=datetime.now(),
-                    total_processing_time_ms=(datetime.now() - start_time).total_seconds() * 1000,
-                )
-            else:
-                namespace_validated = True
-                logger.info(
-                    f"Target namespace '{input_data.target_namespace_id}' validated successfully"
-                )
-        else:
-            logger.warning("Could not validate namespace - proceeding with updates")
-
-    except Exception as e:
-        logger.warning(f"Namespace validation failed: {e} - proceeding with updates")
-
-    # --- UPDATE PHASE: Process each block ---
     for i, block_spec in enumerate(input_data.blocks):
         block_start_time = datetime.now()
 
@@ -223,7 +145,6 @@ def bulk_update_namespace(
                             * 1000,
                         )
                     )
-                    failed_count += 1
 
                     if input_data.stop_on_first_error:
                         logger.info(f"Stopping on first error at block {i + 1}")
@@ -256,7 +177,6 @@ def bulk_update_namespace(
                         * 1000,
                     )
                 )
-                successful_count += 1
                 processed_blocks += 1
                 continue
 
@@ -290,13 +210,11 @@ def bulk_update_namespace(
             results.append(block_result)
 
             if core_result.success:
-                successful_count += 1
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.debug(
                         f"Successfully updated block {i + 1} namespace: {block_spec.block_id}"
                     )
             else:
-                failed_count += 1
                 logger.warning(f"Failed to update block {i + 1} namespace: {core_result.error}")
 
                 if input_data.stop_on_first_error:
@@ -320,7 +238,6 @@ def bulk_update_namespace(
                     processing_time_ms=(datetime.now() - block_start_time).total_seconds() * 1000,
                 )
             )
-            failed_count += 1
 
             if input_data.stop_on_first_error:
                 logger.info(f"Stopping on first error at block {i + 1}")
@@ -329,6 +246,198 @@ def bulk_update_namespace(
 
         processed_blocks += 1
 
+    return results, processed_blocks
+
+
+def _update_namespaces_in_bulk(
+    input_data: BulkUpdateNamespaceInput, memory_bank: StructuredMemoryBank
+) -> Tuple[List[BlockUpdateResult], int]:
+    """
+    Read every block once and move the ones outside the target namespace together.
+
+    The blocks are fetched with one batched read and moved by a single
+    StructuredMemoryBank.update_blocks_namespace call (one UPDATE in Dolt, a
+    metadata-only patch in LlamaIndex). Results keep input order and stop after
+    the first missing block when stop_on_first_error is set. Every result carries
+    the processing time of the whole batch.
+
+    Returns the results and the number of specs processed before stopping.
+    """
+    start_time = datetime.now()
+    target_namespace = input_data.target_namespace_id
+    existing = {
+        block.id: block
+        for block in memory_bank.get_memory_blocks_by_ids(
+            [spec.block_id for spec in input_data.blocks]
+        )
+    }
+
+    results: List[BlockUpdateResult] = []
+    moved: List[BlockUpdateResult] = []
+    moved_ids = set()
+    processed_blocks = 0
+    for block_spec in input_data.blocks:
+        processed_blocks += 1
+        block_id = block_spec.block_id
+        block = existing.get(block_id)
+
+        if block is None:
+            if not block_spec.validate_exists:
+                logger.warning(f"Block {block_id} not found - skipping")
+                continue
+            logger.warning(f"Failed to update block {processed_blocks} namespace: not found")
+            results.append(
+                BlockUpdateResult(
+                    success=False,
+                    block_id=block_id,
+                    error=f"Block {block_id} not found",
+                    error_code=UpdateErrorCode.BLOCK_NOT_FOUND,
+                    timestamp=start_time,
+                    processing_time_ms=0,
+                )
+            )
+            if input_data.stop_on_first_error:
+                logger.info(f"Stopping on first error at block {processed_blocks}")
+                break
+            continue
+
+        current_version = block.block_version or 0
+        if block_id in moved_ids:
+            # Repeated ID: the earlier spec already moves it
+            previous_namespace, block_version = target_namespace, current_version + 1
+        else:
+            previous_namespace, block_version = block.namespace_id, current_version
+        result = BlockUpdateResult(
+            success=True,
+            block_id=block_id,
+            previous_namespace=previous_namespace,
+            new_namespace=target_namespace,
+            block_version=block_version,
+            timestamp=start_time,
+            processing_time_ms=0,
+        )
+        results.append(result)
+        if previous_namespace != target_namespace:
+            result.block_version = current_version + 1
+            moved.append(result)
+            moved_ids.add(block_id)
+
+    if moved:
+        logger.info(f"Moving {len(moved)} blocks to '{target_namespace}' in one batch")
+        moved_block_ids = [result.block_id for result in moved]
+        if not memory_bank.update_blocks_namespace(moved_block_ids, target_namespace):
+            for result in results:
+                if result.block_id in moved_ids:
+                    result.success = False
+                    result.error = f"Failed to update namespace of block {result.block_id}"
+                    result.error_code = UpdateErrorCode.PERSISTENCE_FAILURE
+                    result.new_namespace = None
+                    result.block_version = None
+
+    processing_time = (datetime.now() - start_time).total_seconds() * 1000
+    for result in results:
+        result.processing_time_ms = processing_time
+    return results, processed_blocks
+
+
+def bulk_update_namespace(
+    input_data: BulkUpdateNamespaceInput, memory_bank
+) -> BulkUpdateNamespaceOutput:
+    """
+    Update namespace of multiple memory blocks with independent success tracking.
+
+    Each block update is independent - if one fails, others can still succeed.
+    This allows for partial success scenarios which are common in bulk operations.
+
+    Transaction Semantics:
+    - With a StructuredMemoryBank, the blocks are read in one batch and moved
+      together: one set-based UPDATE of memory_blocks and a metadata-only patch in
+      LlamaIndex (no re-embedding). If that batch fails, every moved block fails
+    - Any other memory bank goes through update_memory_block_core() block by block,
+      each update staged independently
+    - Bulk commit at the end for atomicity, with proofs written in one insert
+    - Rollback on commit failure
+
+    Args:
+        input_data: Input data containing list of block IDs and target namespace
+        memory_bank: StructuredMemoryBank instance for persistence
+
+    Returns:
+        BulkUpdateNamespaceOutput containing overall status and individual results
+    """
+    start_time = datetime.now()
+    logger.info(
+        f"Starting bulk namespace update of {len(input_data.blocks)} blocks to namespace '{input_data.target_namespace_id}'"
+    )
+
+    results = []
+    namespace_validated = False
+
+    # --- VALIDATION PHASE: Validate target namespace exists ---
+    try:
+        # Check if target namespace exists
+        from ...tools.agent_facing.dolt_namespace_tool import (
+            list_namespaces_tool,
+            ListNamespacesInput,
+        )
+
+        namespace_result = list_namespaces_tool(ListNamespacesInput(), memory_bank)
+
+        if namespace_result.success:
+            existing_namespaces = [ns.id for ns in namespace_result.namespaces]
+            if input_data.target_namespace_id not in existing_namespaces:
+                logger.error(f"Target namespace '{input_data.target_namespace_id}' does not exist")
+                # Create failed results for all blocks
+                for block_spec in input_data.blocks:
+                    results.append(
+                        BlockUpdateResult(
+                            success=False,
+                            block_id=block_spec.block_id,
+                            error=f"Target namespace '{input_data.target_namespace_id}' does not exist",
+                            error_code=UpdateErrorCode.VALIDATION_ERROR,
+                            previous_namespace=None,
+                            new_namespace=None,
+                            block_version=None,
+                            timestamp=datetime.now(),
+                            processing_time_ms=0,
+                        )
+                    )
+                failed_count = len(input_data.blocks)
+
+                return BulkUpdateNamespaceOutput(
+                    success=False,
+                    partial_success=False,
+                    total_blocks=len(input_data.blocks),
+                    successful_blocks=0,
+                    failed_blocks=failed_count,
+                    results=results,
+                    skipped_block_ids=[],
+                    error_summary={"VALIDATION_ERROR": failed_count},
+                    target_namespace_id=input_data.target_namespace_id,
+                    namespace_validated=False,
+                    active_branch=memory_bank.branch,
+                    timestamp=datetime.now(),
+                    total_processing_time_ms=(datetime.now() - start_time).total_seconds() * 1000,
+                )
+            else:
+                namespace_validated = True
+                logger.info(
+                    f"Target namespace '{input_data.target_namespace_id}' validated successfully"
+                )
+        else:
+            logger.warning("Could not validate namespace - proceeding with updates")
+
+    except Exception as e:
+        logger.warning(f"Namespace validation failed: {e} - proceeding with updates")
+
+    # --- UPDATE PHASE: Move the blocks ---
+    if isinstance(memory_bank, StructuredMemoryBank):
+        results, processed_blocks = _update_namespaces_in_bulk(input_data, memory_bank)
+    else:
+        results, processed_blocks = _update_namespaces_one_by_one(input_data, memory_bank)
+    successful_count = sum(1 for result in results if result.success)
+    failed_count = len(results) - successful_count
+
     # Collect IDs of blocks that were not processed
     skipped_block_ids = [spec.block_id for spec in input_data.blocks[processed_blocks:]]
 
@@ -354,10 +463,12 @@ def bulk_update_namespace(
 
             if commit_success:
                 logger.info(f"Successfully committed bulk namespace updates: {commit_hash}")
-                # Store block proof for successful updates
-                for result in results:
-                    if result.success:
-                        memory_bank._store_block_proof(result.block_id, "update", commit_hash)
+                # Store block proofs for successful updates in one multi-row insert
+                memory_bank._store_block_proofs(
+                    [result.block_id for result in results if result.success],
+                    "update",
+                    commit_hash,
+                )
             else:
                 # Commit failed - all "successful" updates are now failures
                 logger.error(
@@ -16,6 +16,7 @@ from typing import List, Optional, Dict, Any, Callable, Literal
 from functools import wraps
 from pydantic import BaseModel, Field, validator
 
+from infra_core.memory_system.sql_link_manager import SQLLinkManager
 from infra_core.memory_system.structured_memory_bank import StructuredMemoryBank
 from infra_core.memory_system.tools.base.cogni_tool import CogniTool
 
@@ -46,6 +47,20 @@ class BaseDoltOutput(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now, description="Timestamp of operation")
 
 
+def _sync_link_index(memory_bank, branch: str, reload: bool = False) -> None:
+    """Bring the link manager's in-memory link index up to date after a pull, merge or reset."""
+    link_manager = getattr(memory_bank, "link_manager", None)
+    if not isinstance(link_manager, SQLLinkManager):
+        return
+    try:
+        if reload:
+            link_manager.invalidate_link_index(branch)
+        else:
+            link_manager.refresh_link_index(branch)
+    except Exception as e:
+        logger.warning(f"Could not refresh link index for {branch}: {e}")
+
+
 def dolt_tool(operation_name: str):
     """
     Decorator to handle common Dolt tool patterns:
@@ -823,6 +838,9 @@ def dolt_pull_tool(input_data: DoltPullInput, memory_bank: StructuredMemoryBank)
 
         if success:
             logger.info(f"Pull operation succeeded: {message}")
+            # Pulled changes replace branch data; drop blocks cached from it
+            memory_bank.invalidate_block_cache(branch=memory_bank.dolt_writer.active_branch)
+            _sync_link_index(memory_bank, memory_bank.dolt_writer.active_branch)
 
             return DoltPullOutput(
                 success=True,
@@ -1036,6 +1054,9 @@ def dolt_reset_tool(
         )
 
         if success:
+            memory_bank.invalidate_block_cache(branch=memory_bank.dolt_writer.active_branch)
+            # A reset discards working changes that no commit diff would report
+            _sync_link_index(memory_bank, memory_bank.dolt_writer.active_branch, reload=True)
             return DoltResetOutput(
                 success=True,
                 message=message,
@@ -1082,9 +1103,18 @@ def dolt_checkout_tool(
         force = input_data.force
         logger.info(f"Checking out Dolt branch: {branch_name} (force={force})")
 
+        # Pooled banks are shared by every client on their branch: re-pin this
+        # client's session to the target branch instead of moving the bank
+        if memory_bank.session_context_switcher is not None:
+            active_branch, _ = memory_bank.session_context_switcher(branch=branch_name)
+            message = f"Successfully switched session to branch '{active_branch}'"
+            logger.info(message)
+            return DoltCheckoutOutput(success=True, message=message, active_branch=active_branch)
+
         # Use memory bank's coordinated persistent connection method
         # This ensures both reader and writer are on the same branch
         memory_bank.use_persistent_connections(branch=branch_name)
+        memory_bank.invalidate_block_cache(branch=branch_name)
 
         # 🔧 CRITICAL FIX: Also update link_manager branch context
         # This ensures link operations stay synchronized with memory_bank operations
@@ -1473,6 +1503,8 @@ def dolt_merge_tool(
 
         if success:
             logger.info(f"Merge operation succeeded: {message}")
+            memory_bank.invalidate_block_cache(branch=current_branch)
+            _sync_link_index(memory_bank, current_branch)
 
             # Parse merge result information from message
             fast_forward = "(fast-forward)" in message
@@ -1,27 +1,20 @@
 """
 GetProjectGraphTool: Hierarchical project data retrieval tool.
 
-⚠️ **DEPRECATED - DO NOT USE** ⚠️
-This tool is broken and incorrectly reports zero links for projects that have many links.
-The link traversal logic is fundamentally flawed and needs a complete rewrite.
-
-TODO: Complete rewrite with proper link traversal or remove entirely
-TODO: Replace with NetworkX backend graph implementation
-
 This tool solves the multiple-query problem by fetching a project (or any block)
 with its complete linked hierarchy in one shot, returning nested JSON structure
 with children, parents, and dependency relations.
 
 Key capabilities:
-- Uses link table joins to fetch children/parent/dependency relations recursively
+- Expands the block_links graph one BFS level per query (see
+  DoltMySQLReader.read_link_graph), so cost grows with depth, not node count
+- Hydrates every discovered block in a single batched read at the end
 - Includes minimal metadata for each node (title, status, priority) for LLM summarization
 - Optional server-side LLM summary generation
 - Configurable depth limit and cycle protection
-
-TODO replace with NetworkX backend graph implementaion
 """
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Set, Tuple
 from datetime import datetime
 from pydantic import BaseModel, Field
 import logging
@@ -98,42 +91,32 @@ class GetProjectGraphOutput(BaseModel):
     )
 
 
-def get_project_graph_core(
-    input_data: GetProjectGraphInput, memory_bank: StructuredMemoryBank
-) -> GetProjectGraphOutput:
-    """
-    ⚠️ **DEPRECATED - BROKEN IMPLEMENTATION** ⚠️
+# Relations where from_id is the child of to_id, and the reverse
+CHILD_TO_PARENT_RELATIONS = {"child_of", "subtask_of", "part_of", "belongs_to_epic"}
+PARENT_TO_CHILD_RELATIONS = {"parent_of", "contains", "epic_contains"}
 
-    This implementation is fundamentally flawed and incorrectly reports zero links
-    for projects that have many links. DO NOT USE.
+# Relations where from_id depends on to_id, and the reverse
+DEPENDENT_TO_DEPENDENCY_RELATIONS = {"depends_on", "is_blocked_by", "requires"}
+DEPENDENCY_TO_DEPENDENT_RELATIONS = {"blocks", "provides"}
 
-    Returns an error immediately to prevent incorrect results.
-    """
-    logger.error("❌ GetProjectGraph tool is deprecated and broken - refusing to execute")
-
-    return GetProjectGraphOutput(
-        success=False,
-        total_nodes=0,
-        max_depth_reached=0,
-        cycles_detected=[],
-        active_branch=memory_bank.branch,
-        message="Tool is deprecated and broken",
-        error="GetProjectGraph tool is deprecated due to broken link traversal logic. Use GetLinkedBlocks or direct link queries instead.",
-        timestamp=datetime.now(),
-    )
+
+def _shallow(node: GraphNode) -> GraphNode:
+    """Copy of a node without its relationship lists, for dependency references."""
+    return node.model_copy(update={"children": [], "dependencies": [], "dependents": []})
 
 
-# COMMENTED OUT - BROKEN IMPLEMENTATION
-"""
 def get_project_graph_core(
     input_data: GetProjectGraphInput, memory_bank: StructuredMemoryBank
 ) -> GetProjectGraphOutput:
-    \"\"\"
+    """
     Core implementation for retrieving project graphs with hierarchical relationships.
 
     Builds a complete project graph by traversing block relationships through
     the block_links table, respecting depth limits and relationship filters.
-    \"\"\"
+    Children are nested under the shallower node of each hierarchy link, so the
+    tree stays finite even if the stored links contain cycles; dependencies and
+    dependents are listed as shallow node references.
+    """
     logger.info(
         f"🔍 Building project graph for {input_data.root_block_id}, "
         f"max_depth={input_data.max_depth}, "
@@ -142,116 +125,25 @@ def get_project_graph_core(
     )
 
     try:
-        # Initialize tracking structures
-        graph_nodes: Dict[str, GraphNode] = {}
-        visited: Set[str] = set()
-        cycles_detected: List[str] = []
-        max_depth_reached = 0
-
-        # BFS traversal queue: (block_id, depth, parent_id, relationship_type)
-        traversal_queue: Deque[Tuple[str, int, Optional[str], Optional[str]]] = deque()
-        traversal_queue.append((input_data.root_block_id, 0, None, None))
-
-        # Block cache to avoid repeated database calls
-        block_cache: Dict[str, MemoryBlock] = {}
-
-        # BFS traversal to discover all connected blocks
-        while traversal_queue:
-            current_id, depth, parent_id, rel_type = traversal_queue.popleft()
-
-            # Update max depth tracking
-            max_depth_reached = max(max_depth_reached, depth)
-
-            # Skip if already visited (cycle detection)
-            if current_id in visited:
-                if current_id not in cycles_detected:
-                    cycles_detected.append(current_id)
-                    logger.debug(f"Cycle detected at block {current_id}, depth {depth}")
-                continue
-
-            visited.add(current_id)
-
-            # Fetch block data if not cached
-            if current_id not in block_cache:
-                block_result = memory_bank.get_memory_block(current_id)
-                if not block_result:
-                    logger.warning(f"Block {current_id} not found, skipping")
-                    continue
-                block_cache[current_id] = block_result
-
-            block = block_cache[current_id]
+        # 1. Discover blocks and links, one query per BFS level
+        traversal = memory_bank.dolt_reader.read_link_graph(
+            root_id=input_data.root_block_id,
+            max_depth=input_data.max_depth,
+            relations=input_data.relation_filters,
+            include_inbound=input_data.include_reverse_dependencies,
+            namespace_id=input_data.namespace_scope,
+            branch=memory_bank.branch,
+        )
+        depths: Dict[str, int] = traversal["depths"]
 
-            # Apply namespace scope filter if specified
-            if input_data.namespace_scope and block.namespace_id != input_data.namespace_scope:
-                logger.debug(
-                    f"Skipping block {current_id} - outside namespace scope {input_data.namespace_scope}"
-                )
-                continue
+        # 2. Hydrate all discovered blocks in one batched read
+        blocks = memory_bank.get_memory_blocks_by_ids(list(depths), branch=memory_bank.branch)
+        blocks_by_id = {block.id: block for block in blocks}
 
-            # Create graph node
-            node = GraphNode(
-                block_id=current_id,
-                title=block.metadata.get(
-                    "title", block.text[:50] + "..." if len(block.text) > 50 else block.text
-                ),
-                type=block.type,
-                status=block.metadata.get("status"),
-                priority=block.metadata.get("priority"),
-                namespace_id=block.namespace_id,
-                depth=depth,
-                relationship_type=rel_type,
-            )
-            graph_nodes[current_id] = node
-
-            # If we haven't reached max depth, find children and dependencies
-            if depth < input_data.max_depth:
-                # Get outgoing links using dolt_reader
-                forward_links = memory_bank.dolt_reader.read_forward_links(
-                    block_id=current_id,
-                    relation=None,  # We'll filter by relation_filters later if needed
-                    branch=memory_bank.branch,
-                )
-
-                # Process outgoing links (children and dependencies)
-                for link in forward_links:
-                    # Apply relation filter if specified
-                    if (
-                        input_data.relation_filters
-                        and link["relation"] not in input_data.relation_filters
-                    ):
-                        continue
-
-                    target_id = link["to_block_id"]
-                    relation = link["relation"]
-
-                    # Add to traversal queue
-                    traversal_queue.append((target_id, depth + 1, current_id, relation))
-
-                # Process incoming links if reverse dependencies requested
-                if input_data.include_reverse_dependencies:
-                    backlinks = memory_bank.dolt_reader.read_backlinks(
-                        block_id=current_id,
-                        relation=None,  # We'll filter by relation_filters later if needed
-                        branch=memory_bank.branch,
-                    )
-                    
-                    for link in backlinks:
-                        # Apply relation filter if specified
-                        if (
-                            input_data.relation_filters
-                            and link["relation"] not in input_data.relation_filters
-                        ):
-                            continue
-
-                        source_id = link["from_block_id"]
-                        relation = f"reverse_{link['relation']}"
-
-                        # Add to traversal queue
-                        traversal_queue.append((source_id, depth + 1, current_id, relation))
-
-        # Build the hierarchical structure
-        root_node = graph_nodes.get(input_data.root_block_id)
-        if not root_node:
+        root_block = blocks_by_id.get(input_data.root_block_id)
+        if not root_block or (
+            input_data.namespace_scope and root_block.namespace_id != input_data.namespace_scope
+        ):
             return GetProjectGraphOutput(
                 success=False,
                 total_nodes=0,
@@ -262,47 +154,60 @@ def get_project_graph_core(
                 timestamp=datetime.now(),
             )
 
-        # Build proper parent-child hierarchy from all discovered nodes
-        if len(graph_nodes) > 1:
-            # Get all links between our discovered nodes for hierarchy building
-            for node_id in graph_nodes.keys():
-                # Get forward links for this node
-                forward_links = memory_bank.dolt_reader.read_forward_links(
-                    block_id=node_id,
-                    relation=None,
-                    branch=memory_bank.branch,
-                )
-
-                # Process links between discovered nodes only
-                for link in forward_links:
-                    source_id = link["from_block_id"]
-                    target_id = link["to_block_id"]
-                    relation = link["relation"]
-
-                    source_node = graph_nodes.get(source_id)
-                    target_node = graph_nodes.get(target_id)
-
-                    # Only process links between nodes we've discovered
-                    if not source_node or not target_node:
-                        continue
-
-                    # Handle parent-child relationships
-                    parent_child_relations = ["child_of", "subtask_of", "epic_of", "part_of"]
-                    dependency_relations = ["depends_on", "blocks", "requires"]
-
-                    if relation in parent_child_relations:
-                        # source is child of target
-                        if source_node not in target_node.children:
-                            target_node.children.append(source_node)
-
-                    # Handle dependencies
-                    elif relation in dependency_relations and input_data.include_dependencies:
-                        # source depends on target
-                        if target_node not in source_node.dependencies:
-                            source_node.dependencies.append(target_node)
-                        if input_data.include_reverse_dependencies:
-                            if source_node not in target_node.dependents:
-                                target_node.dependents.append(source_node)
+        graph_nodes: Dict[str, GraphNode] = {}
+        for block_id, depth in depths.items():
+            block = blocks_by_id.get(block_id)
+            if not block:
+                logger.warning(f"Block {block_id} not found, skipping")
+                continue
+            metadata = block.metadata or {}
+            graph_nodes[block_id] = GraphNode(
+                block_id=block_id,
+                title=metadata.get(
+                    "title", block.text[:50] + "..." if len(block.text) > 50 else block.text
+                ),
+                type=block.type,
+                status=metadata.get("status"),
+                priority=metadata.get("priority"),
+                namespace_id=block.namespace_id,
+                depth=depth,
+            )
+
+        # 3. Wire up relationships between discovered nodes
+        cycles_detected: List[str] = []
+        attached: Set[Tuple[str, str]] = set()
+        for link in traversal["links"]:
+            source_node = graph_nodes.get(link["from_id"])
+            target_node = graph_nodes.get(link["to_id"])
+            if not source_node or not target_node:
+                continue
+            relation = link["relation"]
+
+            if relation in CHILD_TO_PARENT_RELATIONS or relation in PARENT_TO_CHILD_RELATIONS:
+                if relation in CHILD_TO_PARENT_RELATIONS:
+                    parent, child = target_node, source_node
+                else:
+                    parent, child = source_node, target_node
+                if child.depth > parent.depth:
+                    if (parent.block_id, child.block_id) not in attached:
+                        attached.add((parent.block_id, child.block_id))
+                        child.relationship_type = relation
+                        parent.children.append(child)
+                elif child.depth == parent.depth and child.block_id not in cycles_detected:
+                    # Same-level hierarchy links can only come from a cycle; break it here
+                    cycles_detected.append(child.block_id)
+
+            elif input_data.include_dependencies and (
+                relation in DEPENDENT_TO_DEPENDENCY_RELATIONS
+                or relation in DEPENDENCY_TO_DEPENDENT_RELATIONS
+            ):
+                if relation in DEPENDENT_TO_DEPENDENCY_RELATIONS:
+                    dependent, dependency = source_node, target_node
+                else:
+                    dependent, dependency = target_node, source_node
+                dependent.dependencies.append(_shallow(dependency))
+                if input_data.include_reverse_dependencies:
+                    dependency.dependents.append(_shallow(dependent))
 
         # Sort children by priority and depth for consistent ordering
         for node in graph_nodes.values():
@@ -310,6 +215,9 @@ def get_project_graph_core(
             node.dependencies.sort(key=lambda x: (x.priority or "ZZZ", x.title))
             node.dependents.sort(key=lambda x: (x.priority or "ZZZ", x.title))
 
+        root_node = graph_nodes[input_data.root_block_id]
+        max_depth_reached = max(node.depth for node in graph_nodes.values())
+
         # Generate summary if requested
         summary = None
         if input_data.summarize:
@@ -349,7 +257,6 @@ def get_project_graph_core(
             error=error_msg,
             timestamp=datetime.now(),
         )
-"""
 
 
 def _generate_project_summary(root_node: GraphNode, all_nodes: Dict[str, GraphNode]) -> str:
@@ -369,7 +276,7 @@ def _generate_project_summary(root_node: GraphNode, all_nodes: Dict[str, GraphNo
 # Create the tool instance
 get_project_graph_tool = CogniTool(
     name="GetProjectGraph",
-    description="⚠️ DEPRECATED - DO NOT USE - Broken link traversal tool that reports incorrect results",
+    description="Retrieve a block's linked hierarchy (children, dependencies) as a nested graph",
     input_model=GetProjectGraphInput,
     output_model=GetProjectGraphOutput,
     function=get_project_graph_core,
@@ -63,6 +63,9 @@ class GlobalSemanticSearchOutput(BaseModel):
     blocks: List[MemoryBlock] = Field(
         default_factory=list, description="List of matching memory blocks from all namespaces"
     )
+    scores: Dict[str, float] = Field(
+        default_factory=dict, description="Semantic relevance score for each returned block, by ID"
+    )
     total_results: int = Field(0, description="Total number of results returned")
     namespaces_searched: List[str] = Field(
         default_factory=list, description="List of namespaces that contained results"
@@ -97,18 +100,29 @@ def global_semantic_search_core(
         logger.info(f"🔍 Starting global semantic search for: '{input_data.query_text}'")
 
         # Perform semantic search without namespace restrictions
-        # The semantic search naturally queries across all data unless filtered
-        all_blocks = memory_bank.query_semantic(
+        # The semantic search naturally queries across all data unless filtered.
+        # Filters are applied inside the vector store, so top_k hits all match them.
+        results = memory_bank.query_semantic_with_scores(
             query_text=input_data.query_text,
-            top_k=input_data.top_k * 2,  # Get more results to allow for filtering
+            top_k=input_data.top_k,
+            type_filter=input_data.type_filter,
+            namespace_id=input_data.namespace_filter,
+            tag_filters=input_data.tag_filters,
+            metadata_filters=input_data.metadata_filters,
         )
 
         # Ensure all blocks are MemoryBlock objects
-        all_blocks = [b if isinstance(b, MemoryBlock) else MemoryBlock(**b) for b in all_blocks]
+        all_blocks = []
+        block_scores: Dict[str, float] = {}
+        for b, score in results:
+            block = b if isinstance(b, MemoryBlock) else MemoryBlock(**b)
+            all_blocks.append(block)
+            if score is not None:
+                block_scores[block.id] = score
 
         logger.info(f"Raw semantic search returned {len(all_blocks)} results")
 
-        # Apply filters
+        # Re-apply filters (covers metadata values the vector store cannot match)
         filtered_blocks = all_blocks
 
         # Apply type filter if specified
@@ -156,11 +170,14 @@ def global_semantic_search_core(
         namespaces_found = set()
         namespace_counts = {}
         namespace_types = {}
+        namespace_scores: Dict[str, List[float]] = {}
 
         for block in final_blocks:
             ns = block.namespace_id
             namespaces_found.add(ns)
             namespace_counts[ns] = namespace_counts.get(ns, 0) + 1
+            if block.id in block_scores:
+                namespace_scores.setdefault(ns, []).append(block_scores[block.id])
 
             if ns not in namespace_types:
                 namespace_types[ns] = []
@@ -170,8 +187,9 @@ def global_semantic_search_core(
         namespace_stats = []
         if input_data.include_namespace_stats:
             for ns in namespaces_found:
-                # Calculate average score (simplified - would need actual relevance scores)
-                avg_score = 0.8  # Placeholder since we don't have access to semantic scores
+                # Average relevance score of this namespace's results
+                ns_scores = namespace_scores.get(ns, [])
+                avg_score = sum(ns_scores) / len(ns_scores) if ns_scores else 0.0
 
                 # Get top types for this namespace
                 types_in_ns = namespace_types[ns]
@@ -208,6 +226,7 @@ def global_semantic_search_core(
         return GlobalSemanticSearchOutput(
             success=True,
             blocks=final_blocks,
+            scores={b.id: block_scores[b.id] for b in final_blocks if b.id in block_scores},
             total_results=len(final_blocks),
             namespaces_searched=list(namespaces_found),
             namespace_stats=namespace_stats,
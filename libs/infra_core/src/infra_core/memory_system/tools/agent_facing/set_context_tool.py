@@ -77,9 +77,16 @@ def set_context_core(
     try:
         logger.info("🔧 Setting session context")
 
+        # Pooled banks (MCP server) keep the context per client session instead of
+        # in the process environment and the shared bank's connection
+        switch_session_context = memory_bank.session_context_switcher
+
         # Get current context
-        previous_namespace = os.environ.get("DOLT_NAMESPACE")
-        previous_branch = memory_bank.branch
+        if switch_session_context is not None:
+            previous_branch, previous_namespace = switch_session_context()
+        else:
+            previous_namespace = os.environ.get("DOLT_NAMESPACE")
+            previous_branch = memory_bank.branch
 
         current_namespace = previous_namespace
         current_branch = previous_branch
@@ -111,8 +118,11 @@ def set_context_core(
                         timestamp=datetime.now(),
                     )
 
-            # Set the namespace environment variable for this session
-            os.environ["DOLT_NAMESPACE"] = input_data.namespace_id
+            # Set the namespace for this session
+            if switch_session_context is not None:
+                switch_session_context(namespace_id=input_data.namespace_id)
+            else:
+                os.environ["DOLT_NAMESPACE"] = input_data.namespace_id
             current_namespace = input_data.namespace_id
             namespace_changed = True
 
@@ -146,11 +156,15 @@ def set_context_core(
 
             # Switch to the new branch
             try:
-                # Use the memory bank's checkout functionality
-                memory_bank.dolt_writer.checkout_branch(input_data.branch_name)
-
-                # Re-initialize persistent connections with new branch
-                memory_bank.use_persistent_connections(input_data.branch_name)
+                if switch_session_context is not None:
+                    # Opens (or reuses) the pooled session for the new branch
+                    switch_session_context(branch=input_data.branch_name)
+                else:
+                    # Use the memory bank's checkout functionality
+                    memory_bank.dolt_writer.checkout_branch(input_data.branch_name)
+
+                    # Re-initialize persistent connections with new branch
+                    memory_bank.use_persistent_connections(input_data.branch_name)
 
                 current_branch = input_data.branch_name
                 branch_changed = True
@@ -8,7 +8,7 @@ This tool handles the creation of new memory blocks, including:
 - Indexing in LlamaMemory
 """
 
-from typing import Optional, Dict, Any, Literal
+from typing import Optional, Dict, Any, Literal, Tuple
 from datetime import datetime
 from pydantic import BaseModel, Field, ValidationError, field_validator
 import logging
@@ -74,65 +74,60 @@ class CreateMemoryBlockOutput(BaseModel):
     )
 
 
-def create_memory_block(
-    input_data: CreateMemoryBlockInput, memory_bank: StructuredMemoryBank
-) -> CreateMemoryBlockOutput:
+def build_memory_block(
+    input_data: CreateMemoryBlockInput,
+    memory_bank: StructuredMemoryBank,
+    now: datetime,
+    schema_versions: Optional[Dict[str, Optional[int]]] = None,
+) -> Tuple[Optional[MemoryBlock], Optional[str]]:
     """
-    Create a new memory block with validation and persistence.
+    Apply the create checks to one input and build its MemoryBlock without persisting it.
+
+    Fills in the x_timestamp/x_agent_id system metadata, validates the metadata against
+    the type's schema and looks up the latest schema version (cached in schema_versions
+    when given, so bulk callers query each type once).
 
     Args:
-        input_data: Input data for creating the block
-        memory_bank: StructuredMemoryBank instance for persistence
+        input_data: Input data for the block; its metadata is updated in place
+        memory_bank: StructuredMemoryBank used for the schema version lookup
+        now: Timestamp recorded as x_timestamp when missing
+        schema_versions: Optional cache of schema versions by block type
 
     Returns:
-        CreateMemoryBlockOutput containing creation status, ID, error message, and timestamp
+        Tuple of (MemoryBlock ready to persist, None) or (None, error message)
     """
-    # Capture timestamp for potential error reporting
-    now = datetime.now()
-
-    try:
-        # Inject system metadata fields FIRST if they are not already present
-        # Ensure metadata exists and is a dict
-        if not isinstance(input_data.metadata, dict):
-            input_data.metadata = {}
-
-        if "x_timestamp" not in input_data.metadata:
-            input_data.metadata["x_timestamp"] = now  # Use the consistent timestamp
-        if "x_agent_id" not in input_data.metadata:
-            # Fallback to created_by field from input if x_agent_id is missing
-            input_data.metadata["x_agent_id"] = input_data.created_by
-
-        # Metadata validation now returns error string or None
-        metadata_error = validate_metadata(input_data.type, input_data.metadata)
-        if metadata_error:
-            return CreateMemoryBlockOutput(
-                success=False,
-                active_branch=memory_bank.dolt_writer.active_branch,
-                error=metadata_error,  # Use the detailed error from validate_metadata
-                timestamp=now,  # Use consistent timestamp for failed attempt
-            )
-
-        # Get latest schema version for the block type
-        schema_version = memory_bank.get_latest_schema_version(input_data.type)
-        if schema_version is None:
-            # This case should ideally be prevented by the input validator for 'type',
-            # but handle defensively.
-            error_msg = (
-                f"Schema definition missing or lookup failed for registered type: {input_data.type}"
-            )
-            logger.error(error_msg)  # Log this potentially inconsistent state
-            return CreateMemoryBlockOutput(
-                success=False,
-                active_branch=memory_bank.dolt_writer.active_branch,
-                error=error_msg,
-                timestamp=now,  # Use consistent timestamp
-            )
-
-        # Create the memory block
-        logger.error(
-            f"🔍 DEBUG: About to create MemoryBlock with namespace_id='{input_data.namespace_id}'"
+    # Inject system metadata fields FIRST if they are not already present
+    # Ensure metadata exists and is a dict
+    if not isinstance(input_data.metadata, dict):
+        input_data.metadata = {}
+
+    if "x_timestamp" not in input_data.metadata:
+        input_data.metadata["x_timestamp"] = now  # Use the consistent timestamp
+    if "x_agent_id" not in input_data.metadata:
+        # Fallback to created_by field from input if x_agent_id is missing
+        input_data.metadata["x_agent_id"] = input_data.created_by
+
+    # Metadata validation returns error string or None
+    metadata_error = validate_metadata(input_data.type, input_data.metadata)
+    if metadata_error:
+        return None, metadata_error
+
+    # Get latest schema version for the block type
+    if schema_versions is None:
+        schema_versions = {}
+    if input_data.type not in schema_versions:
+        schema_versions[input_data.type] = memory_bank.get_latest_schema_version(input_data.type)
+    schema_version = schema_versions[input_data.type]
+    if schema_version is None:
+        # This case should ideally be prevented by the input validator for 'type',
+        # but handle defensively.
+        error_msg = (
+            f"Schema definition missing or lookup failed for registered type: {input_data.type}"
         )
+        logger.error(error_msg)  # Log this potentially inconsistent state
+        return None, error_msg
 
+    try:
         block = MemoryBlock(
             type=input_data.type,
             text=input_data.text,
@@ -146,10 +141,41 @@ def create_memory_block(
             created_by=input_data.created_by,  # Default is now handled by input model
             schema_version=schema_version,
         )
-
+    except ValidationError as ve:
+        # Catch Pydantic validation errors during MemoryBlock creation
+        error_details = str(ve)
         logger.error(
-            f"🔍 DEBUG: Created MemoryBlock with namespace_id='{block.namespace_id}' (expected: '{input_data.namespace_id}')"
+            f"Pydantic validation error during memory block creation process: {error_details}"
         )
+        return None, f"Input or internal validation failed: {error_details}"
+    return block, None
+
+
+def create_memory_block(
+    input_data: CreateMemoryBlockInput, memory_bank: StructuredMemoryBank
+) -> CreateMemoryBlockOutput:
+    """
+    Create a new memory block with validation and persistence.
+
+    Args:
+        input_data: Input data for creating the block
+        memory_bank: StructuredMemoryBank instance for persistence
+
+    Returns:
+        CreateMemoryBlockOutput containing creation status, ID, error message, and timestamp
+    """
+    # Capture timestamp for potential error reporting
+    now = datetime.now()
+
+    try:
+        block, error = build_memory_block(input_data, memory_bank, now)
+        if block is None:
+            return CreateMemoryBlockOutput(
+                success=False,
+                active_branch=memory_bank.dolt_writer.active_branch,
+                error=error,
+                timestamp=now,  # Use consistent timestamp for failed attempt
+            )
 
         # Persist to Dolt and index in LlamaMemory
         success, error_message = memory_bank.create_memory_block(block)
@@ -171,18 +197,6 @@ def create_memory_block(
                 timestamp=now,
             )
 
-    except ValidationError as ve:
-        # Catch potential Pydantic validation errors during input parsing or MemoryBlock creation
-        error_details = str(ve)
-        logger.error(
-            f"Pydantic validation error during memory block creation process: {error_details}"
-        )
-        return CreateMemoryBlockOutput(
-            success=False,
-            active_branch=memory_bank.dolt_writer.active_branch,
-            error=f"Input or internal validation failed: {error_details}",
-            timestamp=now,
-        )
     except Exception as e:
         # Catch unexpected errors
         logger.exception(
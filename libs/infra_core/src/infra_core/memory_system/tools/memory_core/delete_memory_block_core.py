@@ -10,7 +10,7 @@ This tool handles deleting memory blocks with:
 Follows the refactored 3-layer architecture pattern established by update_memory_block_core.py
 """
 
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 import logging
 
@@ -167,11 +167,7 @@ def _validate_block_dependencies(
                     }
                 },
             )
-            return (
-                f"Cannot delete block {block_id} - it has {len(dependent_blocks)} "
-                f"dependent blocks: {', '.join(dependent_blocks[:5])}"
-                + ("..." if len(dependent_blocks) > 5 else "")
-            )
+            return format_dependency_error(block_id, dependent_blocks)
 
         return None
 
@@ -183,6 +179,15 @@ def _validate_block_dependencies(
         return f"Failed to check dependencies: {str(e)}"
 
 
+def format_dependency_error(block_id: str, dependent_blocks: List[str]) -> str:
+    """Build the DEPENDENCIES_EXIST message listing up to five dependent blocks."""
+    return (
+        f"Cannot delete block {block_id} - it has {len(dependent_blocks)} "
+        f"dependent blocks: {', '.join(dependent_blocks[:5])}"
+        + ("..." if len(dependent_blocks) > 5 else "")
+    )
+
+
 def _create_error_response(
     error_code: DeleteErrorCode,
     error_message: str,
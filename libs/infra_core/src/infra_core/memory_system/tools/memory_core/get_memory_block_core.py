@@ -11,6 +11,7 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 import logging
 
+from infra_core.memory_system.block_query import BlockQuery
 from infra_core.memory_system.schemas.memory_block import MemoryBlock
 
 # Setup logging
@@ -97,10 +98,11 @@ def get_memory_block_core(input_data: GetMemoryBlockInput, memory_bank) -> GetMe
         logger.debug(f"Attempting to retrieve memory blocks with IDs: {input_data.block_ids}")
 
         try:
-            # Get all blocks from the specified branch, then filter by IDs
-            # This leverages the existing tested branch support in get_all_memory_blocks
-            all_blocks = memory_bank.get_all_memory_blocks(branch=current_branch)
-            block_dict = {block.id: block for block in all_blocks}
+            # Fetch only the requested blocks from the specified branch
+            found_blocks = memory_bank.get_memory_blocks_by_ids(
+                input_data.block_ids, branch=current_branch
+            )
+            block_dict = {block.id: block for block in found_blocks}
 
             retrieved_blocks = []
             missing_ids = []
@@ -148,44 +150,20 @@ def get_memory_block_core(input_data: GetMemoryBlockInput, memory_bank) -> GetMe
         )
 
         try:
-            # Get all blocks from the specified branch (following blocks_router.py pattern)
-            all_blocks = memory_bank.get_all_memory_blocks(branch=current_branch)
-
-            # Apply type filter if specified (following blocks_router.py pattern)
+            # Compile the filters into a single SQL query (metadata via block_properties)
+            query = BlockQuery()
             if input_data.type_filter:
-                logger.debug(f"Applying type filter: {input_data.type_filter}")
-                all_blocks = [block for block in all_blocks if block.type == input_data.type_filter]
-
-            # Apply namespace filter if specified (following blocks_router.py pattern)
+                query.type(input_data.type_filter)
             if input_data.namespace_id:
-                logger.debug(f"Applying namespace filter: {input_data.namespace_id}")
-                all_blocks = [
-                    block for block in all_blocks if block.namespace_id == input_data.namespace_id
-                ]
-
-            # Apply tag filters if specified (following query_memory_blocks_tool.py pattern)
+                query.namespace(input_data.namespace_id)
             if input_data.tag_filters:
-                logger.debug(f"Applying tag filters: {input_data.tag_filters}")
-                all_blocks = [
-                    block
-                    for block in all_blocks
-                    if all(tag in block.tags for tag in input_data.tag_filters)
-                ]
-
-            # Apply metadata filters if specified (following query_memory_blocks_tool.py pattern)
+                query.tags(input_data.tag_filters, match_all=True)
             if input_data.metadata_filters:
-                logger.debug(f"Applying metadata filters: {input_data.metadata_filters}")
-                all_blocks = [
-                    block
-                    for block in all_blocks
-                    if all(
-                        block.metadata.get(k) == v for k, v in input_data.metadata_filters.items()
-                    )
-                ]
-
-            # Apply limit if specified
+                query.metadata(input_data.metadata_filters)
             if input_data.limit:
-                all_blocks = all_blocks[: input_data.limit]
+                query.limit(input_data.limit)
+
+            all_blocks = memory_bank.query_memory_blocks(query, branch=current_branch)
 
             logger.debug(f"Successfully filtered blocks. Found {len(all_blocks)} matching blocks.")
             return GetMemoryBlockOutput(
@@ -44,6 +44,9 @@ class QueryMemoryBlocksOutput(BaseModel):
     blocks: List[MemoryBlock] = Field(
         default_factory=list, description="List of matching memory blocks"
     )
+    scores: Dict[str, float] = Field(
+        default_factory=dict, description="Semantic relevance score for each returned block, by ID"
+    )
     error: Optional[str] = Field(None, description="Error message if query failed")
     timestamp: datetime = Field(default_factory=datetime.now, description="Timestamp of the query")
 
@@ -62,35 +65,50 @@ def query_memory_blocks_core(
         QueryMemoryBlocksOutput containing query status, matching blocks, error message, and timestamp
     """
     try:
-        # Perform semantic search
-        blocks = memory_bank.query_semantic(
-            query_text=input_data.query_text, top_k=input_data.top_k
+        # Perform filtered semantic search (blocks are hydrated in one batch, best match first)
+        results = memory_bank.query_semantic_with_scores(
+            query_text=input_data.query_text,
+            top_k=input_data.top_k,
+            type_filter=input_data.type_filter,
+            namespace_id=input_data.namespace_id,
+            tag_filters=input_data.tag_filters,
+            metadata_filters=input_data.metadata_filters,
         )
 
         # Ensure all blocks are MemoryBlock objects
-        blocks = [b if isinstance(b, MemoryBlock) else MemoryBlock(**b) for b in blocks]
+        results = [(b if isinstance(b, MemoryBlock) else MemoryBlock(**b), s) for b, s in results]
+
+        # The filters below are already applied by the vector store; re-checking them here
+        # also covers metadata values it cannot match (lists, dicts, None)
 
         # Apply type filter if specified
         if input_data.type_filter:
-            blocks = [b for b in blocks if b.type == input_data.type_filter]
+            results = [(b, s) for b, s in results if b.type == input_data.type_filter]
 
         # Apply namespace filter if specified
         if input_data.namespace_id:
-            blocks = [b for b in blocks if b.namespace_id == input_data.namespace_id]
+            results = [(b, s) for b, s in results if b.namespace_id == input_data.namespace_id]
 
         # Apply tag filters if specified
         if input_data.tag_filters:
-            blocks = [b for b in blocks if all(tag in b.tags for tag in input_data.tag_filters)]
+            results = [
+                (b, s) for b, s in results if all(tag in b.tags for tag in input_data.tag_filters)
+            ]
 
         # Apply metadata filters if specified
         if input_data.metadata_filters:
-            blocks = [
-                b
-                for b in blocks
+            results = [
+                (b, s)
+                for b, s in results
                 if all(b.metadata.get(k) == v for k, v in input_data.metadata_filters.items())
             ]
 
-        return QueryMemoryBlocksOutput(success=True, blocks=blocks, timestamp=datetime.now())
+        return QueryMemoryBlocksOutput(
+            success=True,
+            blocks=[b for b, _ in results],
+            scores={b.id: s for b, s in results if s is not None},
+            timestamp=datetime.now(),
+        )
 
     except Exception as e:
         logger.error(f"Error querying memory blocks: {str(e)}")
@@ -179,7 +179,32 @@ def update_memory_block_core(
                     memory_bank,
                 )
 
-        # 9. Persist using memory bank's atomic update
+        # 9. Skip persistence when the update leaves the block's content unchanged
+        if not _has_content_changes(existing_block, updated_block):
+            processing_time = (datetime.now() - start_time).total_seconds() * 1000
+            logger.info(
+                "Update produced no changes; skipping write",
+                extra={"context": {**log_context, "processing_time_ms": processing_time}},
+            )
+            return UpdateMemoryBlockOutput(
+                success=True,
+                id=existing_block.id,
+                active_branch=memory_bank.dolt_writer.active_branch,
+                timestamp=existing_block.updated_at or timestamp,
+                diff_summary=DiffSummary(
+                    fields_updated=[],
+                    text_changed=False,
+                    metadata_changed=False,
+                    tags_changed=False,
+                    links_changed=False,
+                    patch_stats=patch_stats if patch_stats else None,
+                ),
+                previous_version=current_version,
+                new_version=current_version,
+                processing_time_ms=processing_time,
+            )
+
+        # 10. Persist using memory bank's atomic update
         success = memory_bank.update_memory_block(updated_block)
 
         processing_time = (datetime.now() - start_time).total_seconds() * 1000
@@ -349,6 +374,25 @@ def _apply_all_updates(
         }
 
 
+def _has_content_changes(existing_block: MemoryBlock, updated_block: MemoryBlock) -> bool:
+    """
+    Check whether an updated block differs from the stored one in anything but bookkeeping.
+
+    block_version, updated_at and the metadata x_timestamp are always refreshed by an
+    update, so they are excluded from the comparison.
+    """
+    bookkeeping = {"block_version", "updated_at"}
+    old_data = existing_block.model_dump(exclude=bookkeeping)
+    new_data = updated_block.model_dump(exclude=bookkeeping)
+    old_data["metadata"] = {
+        k: v for k, v in (old_data.get("metadata") or {}).items() if k != "x_timestamp"
+    }
+    new_data["metadata"] = {
+        k: v for k, v in (new_data.get("metadata") or {}).items() if k != "x_timestamp"
+    }
+    return old_data != new_data
+
+
 def _create_error_response(
     error_code: UpdateErrorCode,
     error_message: str,
@@ -0,0 +1,75 @@
+"""
+Unit tests for the in-process LRU/TTL MemoryBlock cache.
+"""
+
+import time
+
+from infra_core.memory_system.block_cache import BlockCache
+from infra_core.memory_system.schemas.memory_block import MemoryBlock
+
+
+def _block(block_id: str, text: str = "cached") -> MemoryBlock:
+    return MemoryBlock(id=block_id, type="knowledge", text=text, metadata={"k": "v"})
+
+
+def test_hit_returns_independent_copy():
+    cache = BlockCache(max_size=4)
+    cache.put("main", "h1", _block("a"))
+
+    hit = cache.get("main", "h1", "a")
+    hit.text = "mutated by caller"
+
+    assert cache.get("main", "h1", "a").text == "cached"
+    assert cache.stats()["hits"] == 2
+
+
+def test_key_includes_branch_and_working_set_hash():
+    cache = BlockCache(max_size=4)
+    cache.put("main", "h1", _block("a"))
+
+    assert cache.get("main", "h2", "a") is None
+    assert cache.get("feature", "h1", "a") is None
+    assert cache.stats()["misses"] == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = BlockCache(max_size=2)
+    cache.put("main", "h1", _block("a"))
+    cache.put("main", "h1", _block("b"))
+    cache.get("main", "h1", "a")  # a is now most recently used
+    cache.put("main", "h1", _block("c"))
+
+    assert cache.get("main", "h1", "b") is None
+    assert cache.get("main", "h1", "a") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire_after_ttl():
+    cache = BlockCache(max_size=2, ttl=0.01)
+    cache.put("main", "h1", _block("a"))
+    time.sleep(0.02)
+
+    assert cache.get("main", "h1", "a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_invalidate_by_block_and_branch():
+    cache = BlockCache(max_size=8)
+    for branch in ("main", "feature"):
+        cache.put(branch, "h1", _block("a"))
+        cache.put(branch, "h1", _block("b"))
+
+    assert cache.invalidate(block_id="a") == 2
+    assert cache.invalidate(branch="feature") == 1
+    assert cache.invalidate() == 1
+    assert cache.stats()["size"] == 0
+    assert cache.stats()["invalidations"] == 4
+
+
+def test_zero_size_disables_cache():
+    cache = BlockCache(max_size=0)
+    cache.put("main", "h1", _block("a"))
+
+    assert not cache.enabled
+    assert cache.get("main", "h1", "a") is None
+    assert cache.stats()["size"] == 0
@@ -0,0 +1,208 @@
+"""
+Tests for BlockQuery, the SQL-compiled filter builder used for block listing.
+"""
+
+import datetime
+import sqlite3
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from infra_core.memory_system.block_query import BlockQuery
+from infra_core.memory_system.dolt_mysql_base import DoltConnectionConfig
+from infra_core.memory_system.dolt_reader import DoltMySQLReader
+from infra_core.memory_system.schemas.memory_block import MemoryBlock
+
+
+@pytest.fixture
+def blocks():
+    return [
+        MemoryBlock(
+            id="task-1",
+            type="task",
+            namespace_id="pm",
+            text="Task 1",
+            tags=["urgent", "work"],
+            metadata={"status": "in_progress", "priority": "P1"},
+        ),
+        MemoryBlock(
+            id="task-2",
+            type="task",
+            namespace_id="pm",
+            text="Task 2",
+            tags=["work"],
+            metadata={"status": "done"},
+        ),
+        MemoryBlock(
+            id="doc-1",
+            type="doc",
+            namespace_id="legacy",
+            text="Doc 1",
+            tags=["reference"],
+            metadata={},
+        ),
+    ]
+
+
+class TestToSql:
+    def test_empty_query_selects_everything(self):
+        sql, params = BlockQuery().to_sql()
+
+        assert sql == "SELECT mb.* FROM memory_blocks mb"
+        assert params == []
+
+    def test_type_and_namespace_predicates(self):
+        sql, params = BlockQuery().namespace("pm").types(["task", "bug"]).to_sql()
+
+        assert "mb.type IN (%s,%s)" in sql
+        assert "mb.namespace_id = %s" in sql
+        assert params == ["task", "bug", "pm"]
+
+    def test_case_insensitive_type_lowercases_both_sides(self):
+        sql, params = BlockQuery().type("TASK", case_insensitive=True).to_sql()
+
+        assert "LOWER(mb.type) IN (%s)" in sql
+        assert params == ["task"]
+
+    def test_tags_any_uses_or(self):
+        sql, params = BlockQuery().tags(["a", "b"], match_all=False).to_sql()
+
+        assert "(JSON_CONTAINS(mb.tags, %s) OR JSON_CONTAINS(mb.tags, %s))" in sql
+        assert params == ['"a"', '"b"']
+
+    @pytest.mark.parametrize(
+        "value, column, bound",
+        [
+            ("in_progress", "property_value_text", "in_progress"),
+            (True, "property_value_text", "true"),
+            (3, "property_value_number", 3.0),
+            (["x", "y"], "property_value_json", '["x", "y"]'),
+        ],
+    )
+    def test_metadata_predicate_targets_variant_column(self, value, column, bound):
+        sql, params = BlockQuery().metadata({"status": value}).to_sql()
+
+        assert "EXISTS (SELECT 1 FROM block_properties bp WHERE bp.block_id = mb.id" in sql
+        assert f"bp.{column} = " in sql
+        assert params == ["status", bound]
+
+    def test_none_metadata_matches_missing_property(self):
+        sql, params = BlockQuery().metadata({"assignee": None}).to_sql()
+
+        assert sql.count("NOT EXISTS") == 1
+        assert params == ["assignee"]
+
+    def test_limit_without_order_orders_by_id(self):
+        sql, params = BlockQuery().limit(10).to_sql()
+
+        assert sql.endswith("ORDER BY mb.id ASC LIMIT %s")
+        assert params == [10]
+
+    def test_keyset_pagination_on_created_at(self, blocks):
+        blocks[0].created_at = datetime.datetime(2025, 1, 2, 3, 4, 5)
+        first_page = BlockQuery().order_by("created_at", descending=True).limit(2)
+        cursor = first_page.next_cursor(blocks[0])
+
+        sql, params = (
+            BlockQuery().order_by("created_at", descending=True).limit(2).after(cursor).to_sql()
+        )
+
+        assert (
+            "(mb.created_at < %s OR (mb.created_at = %s AND mb.id < %s) OR mb.created_at IS NULL)"
+            in sql
+        )
+        assert sql.endswith("ORDER BY mb.created_at DESC, mb.id DESC LIMIT %s")
+        assert params == ["2025-01-02T03:04:05", "2025-01-02T03:04:05", "task-1", 2]
+
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_keyset_pages_across_null_sort_values(self, descending):
+        connection = sqlite3.connect(":memory:")
+        connection.execute("CREATE TABLE memory_blocks (id TEXT PRIMARY KEY, updated_at TEXT)")
+        updated = [None, "2025-01-02", None, "2025-01-01", "2025-01-02", None, "2025-01-03"]
+        connection.executemany(
+            "INSERT INTO memory_blocks VALUES (?, ?)",
+            [(f"b{i}", value) for i, value in enumerate(updated)],
+        )
+        columns = "mb.id, mb.updated_at"
+        everything, _ = BlockQuery().order_by("updated_at", descending=descending).to_sql(columns)
+        expected = [row[0] for row in connection.execute(everything)]
+
+        seen, cursor = [], None
+        while True:
+            query = BlockQuery().order_by("updated_at", descending=descending).limit(2)
+            sql, params = query.after(cursor).to_sql(columns)
+            rows = connection.execute(sql.replace("%s", "?"), params).fetchall()
+            seen.extend(row[0] for row in rows)
+            page = query.page([{"id": r[0], "updated_at": r[1]} for r in rows], [])
+            cursor = page.next_cursor
+            if not cursor:
+                break
+
+        assert seen == expected
+        assert len(seen) == len(updated)
+
+    def test_invalid_cursor_and_order_field_rejected(self):
+        with pytest.raises(ValueError):
+            BlockQuery().after("not-a-cursor")
+        with pytest.raises(ValueError):
+            BlockQuery().order_by("text")
+
+
+class TestMatches:
+    def test_matches_mirrors_sql_predicates(self, blocks):
+        query = BlockQuery().namespace("pm").type("task").metadata({"status": "in_progress"})
+
+        assert [b.id for b in blocks if query.matches(b)] == ["task-1"]
+
+    def test_tag_and_case_insensitive_matching(self, blocks):
+        any_tag = BlockQuery().tags(["urgent", "reference"], match_all=False)
+        by_type = BlockQuery().type("DOC", case_insensitive=True)
+
+        assert [b.id for b in blocks if any_tag.matches(b)] == ["task-1", "doc-1"]
+        assert [b.id for b in blocks if by_type.matches(b)] == ["doc-1"]
+
+
+def test_reader_runs_query_and_loads_properties_for_matches_only():
+    reader = DoltMySQLReader(DoltConnectionConfig())
+    cursor = MagicMock()
+    cursor.fetchall.side_effect = [
+        [
+            {
+                "id": "task-1",
+                "type": "task",
+                "namespace_id": "pm",
+                "text": "Task 1",
+                "tags": '["work"]',
+            }
+        ],
+        [
+            {
+                "block_id": "task-1",
+                "property_name": "status",
+                "property_value_text": "in_progress",
+                "property_value_number": None,
+                "property_value_json": None,
+                "property_type": "text",
+                "is_computed": False,
+                "created_at": "2025-01-01T00:00:00",
+                "updated_at": "2025-01-01T00:00:00",
+            }
+        ],
+    ]
+    connection = MagicMock()
+    connection.cursor.return_value = cursor
+
+    query = BlockQuery().namespace("pm").metadata({"status": "in_progress"}).limit(50)
+    with (
+        patch.object(DoltMySQLReader, "_get_connection", return_value=connection),
+        patch.object(DoltMySQLReader, "_ensure_branch"),
+    ):
+        result = reader.query_memory_blocks(query, branch="main")
+
+    assert [b.id for b in result] == ["task-1"]
+    assert result[0].metadata == {"status": "in_progress"}
+    executed = [c.args[0] for c in cursor.execute.call_args_list]
+    assert len(executed) == 2
+    assert "FROM memory_blocks mb WHERE" in executed[0]
+    assert "WHERE block_id IN (%s)" in executed[1]
+    connection.close.assert_called_once()
@@ -0,0 +1,456 @@
+"""
+Unit tests for the branch-aware Dolt connection pool.
+
+Raw connections are simple fakes so the tests can observe checkouts, pings,
+rollbacks and closes without a Dolt SQL server.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from mysql.connector.errors import OperationalError, ProgrammingError
+
+from infra_core.memory_system.connection_pool import (
+    ConnectionPoolExhaustedError,
+    DoltConnectionPool,
+    PooledConnection,
+    close_all_pools,
+    get_all_pool_stats,
+)
+from infra_core.memory_system.dolt_mysql_base import DoltConnectionConfig, DoltMySQLBase
+from infra_core.memory_system.sql_link_manager import SQLLinkManager
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, query, params=None):
+        if not self.conn.healthy:
+            raise OperationalError("Lost connection to MySQL server during query")
+        if "no_such_table" in query:
+            raise ProgrammingError("Table 'no_such_table' doesn't exist")
+        self.conn.executed.append((query, params))
+        if "DOLT_CHECKOUT" in query:
+            self.conn.branch = params[0]
+
+    def fetchall(self):
+        return []
+
+    def fetchone(self):
+        query = self.conn.executed[-1][0] if self.conn.executed else ""
+        if "active_branch()" in query:
+            return {"active_branch": self.conn.branch}
+        return None
+
+    def close(self):
+        pass
+
+
+class FakeRawConnection:
+    def __init__(self, autocommit=True):
+        self.autocommit = autocommit
+        self.executed = []
+        self.branch = None
+        self.closed = False
+        self.healthy = True
+        self.rollbacks = 0
+        self.pings = 0
+
+    def cursor(self, dictionary=False):
+        return FakeCursor(self)
+
+    def is_connected(self):
+        self.pings += 1
+        return self.healthy
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+class AutocommitQueryingConnection(FakeRawConnection):
+    """Like mysql.connector, reading autocommit costs a server round trip."""
+
+    def __init__(self, autocommit=True):
+        self._autocommit = autocommit
+        self.autocommit_reads = 0
+        super().__init__(autocommit)
+
+    @property
+    def autocommit(self):
+        self.autocommit_reads += 1
+        return self._autocommit
+
+    @autocommit.setter
+    def autocommit(self, value):
+        self._autocommit = value
+
+
+class Factory:
+    def __init__(self, autocommit=True, connection_class=FakeRawConnection):
+        self.autocommit = autocommit
+        self.connection_class = connection_class
+        self.created = []
+
+    def __call__(self):
+        conn = self.connection_class(self.autocommit)
+        self.created.append(conn)
+        return conn
+
+
+def _pool(factory=None, **kwargs):
+    key = ("localhost", 3306, "root", "memory_dolt", "test")
+    return DoltConnectionPool(key, factory or Factory(), **kwargs)
+
+
+def _checkouts(raw):
+    return [q for q, _ in raw.executed if "DOLT_CHECKOUT" in q]
+
+
+class TestDoltConnectionPool:
+    def test_close_returns_connection_for_reuse(self):
+        factory = Factory()
+        pool = _pool(factory)
+
+        conn = pool.acquire()
+        conn.close()
+        conn.close()  # idempotent
+        again = pool.acquire()
+
+        assert len(factory.created) == 1
+        assert again._entry.raw is factory.created[0]
+        stats = pool.stats()
+        assert stats["created"] == 1
+        assert stats["reused"] == 1
+        assert stats["in_use"] == 1
+
+    def test_acquire_prefers_connection_on_requested_branch(self):
+        factory = Factory()
+        pool = _pool(factory)
+        a, b = pool.acquire(), pool.acquire()
+        a.branch, b.branch = "feature-x", "main"
+        a.close()
+        b.close()
+
+        conn = pool.acquire(branch="feature-x")
+
+        assert conn.branch == "feature-x"
+        assert pool.stats()["branch_hits"] == 1
+
+    def test_swap_to_branch_exchanges_underlying_connection(self):
+        pool = _pool()
+        on_feature = pool.acquire()
+        on_feature.branch = "feature-x"
+        borrowed = pool.acquire()
+        borrowed.branch = "main"
+        on_feature.close()
+
+        assert borrowed.swap_to_branch("feature-x") is True
+        assert borrowed.branch == "feature-x"
+        assert pool.stats()["idle_by_branch"] == {"main": 1}
+
+    def test_swap_refused_after_cursor_opened(self):
+        pool = _pool()
+        idle = pool.acquire()
+        idle.branch = "feature-x"
+        borrowed = pool.acquire()
+        idle.close()
+
+        borrowed.cursor()
+
+        assert borrowed.swap_to_branch("feature-x") is False
+
+    def test_manual_checkout_invalidates_tracked_branch(self):
+        pool = _pool()
+        conn = pool.acquire()
+        conn.branch = "main"
+
+        cursor = conn.cursor()
+        cursor.execute("CALL DOLT_CHECKOUT(%s)", ("other",))
+
+        assert conn.branch is None
+
+    def test_branchless_borrow_resets_branch_left_by_previous_borrower(self):
+        factory = Factory()
+        pool = _pool(factory, default_branch="main")
+        conn = pool.acquire()
+        conn.cursor().execute("CALL DOLT_CHECKOUT(%s)", ("feature-x",))
+        conn.branch = "feature-x"
+        conn.close()
+
+        again = pool.acquire()
+        assert again.branch == "main"
+        again.cursor().execute("SELECT active_branch()")
+
+        raw = factory.created[0]
+        assert raw.branch == "main"
+        assert raw.executed[-2:] == [
+            ("CALL DOLT_CHECKOUT(%s)", ("main",)),
+            ("SELECT active_branch()", None),
+        ]
+        assert pool.stats()["branch_resets"] == 1
+
+    def test_branchless_borrow_prefers_default_branch_connection(self):
+        pool = _pool(default_branch="main")
+        a, b = pool.acquire(), pool.acquire()
+        a.branch, b.branch = "main", "feature-x"
+        a.close()
+        b.close()
+
+        conn = pool.acquire()
+        conn.cursor().execute("SELECT 1")
+
+        assert conn._entry.raw is a._entry.raw
+        assert pool.stats()["branch_resets"] == 0
+
+    def test_claiming_previous_branch_skips_reset(self):
+        factory = Factory()
+        pool = _pool(factory, default_branch="main")
+        conn = pool.acquire()
+        conn.branch = "feature-x"
+        conn.close()
+
+        again = pool.acquire()
+        assert again.swap_to_branch("feature-x") is True
+        again.cursor().execute("SELECT 1")
+
+        assert _checkouts(factory.created[0]) == []
+        assert again.branch == "feature-x"
+
+    def test_pool_is_bounded_and_times_out(self):
+        pool = _pool(max_size=2, acquire_timeout=0.05)
+        pool.acquire()
+        pool.acquire()
+
+        with pytest.raises(ConnectionPoolExhaustedError):
+            pool.acquire()
+        assert pool.stats()["timeouts"] == 1
+
+    def test_waiting_borrower_gets_released_connection(self):
+        pool = _pool(max_size=1, acquire_timeout=2.0)
+        held = pool.acquire()
+        threading.Timer(0.05, held.close).start()
+
+        conn = pool.acquire()
+
+        assert isinstance(conn, PooledConnection)
+        assert pool.stats()["waits"] >= 1
+
+    def test_idle_connections_are_evicted(self):
+        factory = Factory()
+        pool = _pool(factory, idle_timeout=0.01)
+        pool.acquire().close()
+        time.sleep(0.02)
+
+        pool.acquire()
+
+        assert factory.created[0].closed is True
+        assert len(factory.created) == 2
+        assert pool.stats()["evicted_idle"] == 1
+
+    def test_unhealthy_idle_connection_is_replaced(self):
+        factory = Factory()
+        pool = _pool(factory, validation_interval=0)
+        pool.acquire().close()
+        factory.created[0].healthy = False
+
+        pool.acquire()
+
+        assert factory.created[0].closed is True
+        assert pool.stats()["health_check_failures"] == 1
+
+    def test_recently_used_connection_skips_ping(self):
+        factory = Factory()
+        pool = _pool(factory, validation_interval=60)
+        pool.acquire().close()
+
+        pool.acquire()
+
+        assert factory.created[0].pings == 0
+
+    def test_connection_that_dies_in_use_is_discarded_on_release(self):
+        factory = Factory()
+        pool = _pool(factory, validation_interval=60)
+        conn = pool.acquire()
+        factory.created[0].healthy = False
+
+        with pytest.raises(OperationalError):
+            conn.cursor().execute("SELECT 1")
+        conn.close()
+        again = pool.acquire()
+
+        assert factory.created[0].closed is True
+        assert again._entry.raw is factory.created[1]
+        assert pool.stats()["discarded"] == 1
+
+    def test_failed_statement_on_live_connection_keeps_it(self):
+        factory = Factory()
+        pool = _pool(factory, validation_interval=60)
+        conn = pool.acquire()
+
+        with pytest.raises(ProgrammingError):
+            conn.cursor().execute("SELECT * FROM no_such_table")
+        conn.close()
+        again = pool.acquire()
+
+        assert again._entry.raw is factory.created[0]
+        assert factory.created[0].pings == 1
+        assert pool.stats()["discarded"] == 0
+
+    def test_health_checks_run_outside_the_pool_lock(self):
+        factory = Factory()
+        pool = _pool(factory, validation_interval=0)
+        pool.acquire().close()
+        lock_held = []
+        raw = factory.created[0]
+        raw.is_connected = lambda: lock_held.append(pool._cond._is_owned()) or True
+
+        pool.acquire()
+
+        assert lock_held == [False]
+
+    def test_transactional_connections_roll_back_on_release(self):
+        factory = Factory(autocommit=False)
+        pool = _pool(factory)
+
+        pool.acquire().close()
+
+        assert factory.created[0].rollbacks == 1
+
+    def test_release_does_not_query_autocommit(self):
+        factory = Factory(connection_class=AutocommitQueryingConnection)
+        pool = _pool(factory)
+
+        for _ in range(3):
+            pool.acquire().close()
+
+        raw = factory.created[0]
+        assert raw.autocommit_reads == 1  # once, when the connection was created
+        assert raw.rollbacks == 0
+
+    def test_borrower_autocommit_change_is_undone_on_release(self):
+        factory = Factory(connection_class=AutocommitQueryingConnection)
+        pool = _pool(factory)
+
+        conn = pool.acquire()
+        conn.autocommit = False
+        assert conn.autocommit is False
+        conn.close()
+
+        raw = factory.created[0]
+        assert raw.rollbacks == 1
+        assert raw._autocommit is True
+        assert pool.acquire().autocommit is True
+        assert raw.autocommit_reads == 1
+
+
+class TestDoltMySQLBasePooling:
+    @pytest.fixture(autouse=True)
+    def _reset_pools(self):
+        close_all_pools()
+        yield
+        close_all_pools()
+
+    def _base(self, pool_size):
+        factory = Factory()
+        base = DoltMySQLBase(DoltConnectionConfig(pool_size=pool_size))
+        patcher = patch.object(DoltMySQLBase, "_create_connection", side_effect=factory)
+        patcher.start()
+        return base, factory, patcher
+
+    def test_pooling_disabled_by_default_size(self):
+        base, factory, patcher = self._base(pool_size=0)
+        try:
+            conn = base._get_connection()
+            assert not isinstance(conn, PooledConnection)
+            assert base.pool_stats() is None
+        finally:
+            patcher.stop()
+
+    def test_ensure_branch_skips_checkout_on_reused_connection(self):
+        base, factory, patcher = self._base(pool_size=4)
+        try:
+            conn = base._get_connection()
+            base._ensure_branch(conn, "feature-x")
+            conn.close()
+
+            conn = base._get_connection()
+            base._ensure_branch(conn, "feature-x")
+            conn.close()
+
+            assert len(factory.created) == 1
+            assert len(_checkouts(factory.created[0])) == 1
+            assert base.pool_stats()["reused"] == 1
+            assert get_all_pool_stats()[0]["kind"] == "default"
+        finally:
+            patcher.stop()
+
+    def test_branch_read_does_not_leak_into_branchless_operations(self):
+        base, factory, patcher = self._base(pool_size=4)
+        try:
+            conn = base._get_connection()
+            base._ensure_branch(conn, "feature-x")
+            conn.close()
+
+            assert base.active_branch == "main"
+            assert factory.created[0].branch == "main"
+        finally:
+            patcher.stop()
+
+    def test_link_protection_check_sees_branch_of_the_write(self):
+        base, factory, patcher = self._base(pool_size=4)
+        try:
+            manager = SQLLinkManager(DoltConnectionConfig(pool_size=4))
+            conn = manager._get_connection()
+            manager._ensure_branch(conn, "feature-x")
+            conn.close()
+
+            with patch.object(manager, "_check_branch_protection") as check:
+                manager.delete_link(
+                    "00000000-0000-0000-0000-000000000001",
+                    "00000000-0000-0000-0000-000000000002",
+                    "depends_on",
+                )
+
+            # The link write runs on main, so main is the branch that must be checked
+            check.assert_called_once_with("delete_link", "main")
+            assert all(raw.branch == "main" for raw in factory.created)
+        finally:
+            patcher.stop()
+
+    def test_operation_connection_follows_persistent_branch(self):
+        base, factory, patcher = self._base(pool_size=4)
+        try:
+            # Persistent mode on feature-x, but the persistent connection is unavailable
+            base._use_persistent = True
+            base._current_branch = "feature-x"
+
+            conn, is_persistent = base._acquire_connection()
+
+            assert is_persistent is False
+            assert conn.branch == "feature-x"
+            assert _checkouts(factory.created[0]) == ["CALL DOLT_CHECKOUT(%s)"]
+            base._release_connection(conn, is_persistent)
+        finally:
+            patcher.stop()
+
+    def test_reconnection_gets_a_fresh_connection(self):
+        base, factory, patcher = self._base(pool_size=4)
+        try:
+            conn = base._get_connection()
+            factory.created[0].healthy = False
+            with pytest.raises(OperationalError):
+                conn.cursor().execute("SELECT 1")
+            base._persistent_connection = conn
+            base._use_persistent = True
+
+            assert base._attempt_reconnection() is True
+            assert base._persistent_connection._entry.raw is factory.created[1]
+            assert factory.created[0].closed is True
+        finally:
+            patcher.stop()
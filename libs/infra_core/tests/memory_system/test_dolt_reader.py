@@ -581,3 +581,77 @@ class TestDoltReader:
             }
             assert expected_keys.issubset(set(rows[0].keys()))
         mock_reader.read_work_items_core_view.assert_called_once_with(limit=3)
+
+
+def test_read_block_changes_classifies_diff_rows():
+    """Block and property diffs collapse into upserted/deleted block IDs."""
+    from infra_core.memory_system.dolt_mysql_base import DoltConnectionConfig
+    from infra_core.memory_system.dolt_reader import DoltMySQLReader
+
+    cursor = MagicMock()
+    cursor.fetchall.side_effect = [
+        [
+            {"from_id": None, "to_id": "new-block", "diff_type": "added"},
+            {"from_id": "edited", "to_id": "edited", "diff_type": "modified"},
+            {"from_id": "gone", "to_id": None, "diff_type": "removed"},
+        ],
+        [
+            {"from_block_id": "props-only", "to_block_id": "props-only"},
+            {"from_block_id": "gone", "to_block_id": None},
+            {"from_block_id": None, "to_block_id": "new-block"},
+        ],
+    ]
+    connection = MagicMock()
+    connection.cursor.return_value = cursor
+
+    reader = DoltMySQLReader(DoltConnectionConfig())
+    with patch.object(DoltMySQLReader, "_get_connection", return_value=connection):
+        changes = reader.read_block_changes("commit-1", "main")
+
+    assert changes == {"upserted": ["new-block", "edited", "props-only"], "deleted": ["gone"]}
+    queries = [c.args[0] for c in cursor.execute.call_args_list]
+    assert all("DOLT_DIFF(%s, %s" in q for q in queries)
+    assert cursor.execute.call_args_list[0].args[1] == ("commit-1", "main")
+    connection.close.assert_called_once()
+
+
+def test_read_link_graph_issues_one_query_per_level():
+    """Each BFS level is one IN (...) query on a single connection; the last level closes links."""
+    from infra_core.memory_system.dolt_mysql_base import DoltConnectionConfig
+    from infra_core.memory_system.dolt_reader import DoltMySQLReader
+
+    def link(from_id, to_id, relation="child_of"):
+        return {"from_id": from_id, "to_id": to_id, "relation": relation, "priority": 0}
+
+    cursor = MagicMock()
+    cursor.fetchall.side_effect = [
+        # Level 1: links leaving the root
+        [link("root", "a", "contains"), link("root", "b", "contains")],
+        # Level 2: links leaving a and b (b -> root points back into the graph)
+        [link("a", "c", "contains"), link("b", "root", "depends_on")],
+        # Closing query: links leaving c, only those to discovered blocks are kept
+        [link("c", "a", "depends_on"), link("c", "outside", "contains")],
+    ]
+    connection = MagicMock()
+    connection.cursor.return_value = cursor
+
+    reader = DoltMySQLReader(DoltConnectionConfig())
+    with (
+        patch.object(DoltMySQLReader, "_get_connection", return_value=connection),
+        patch.object(DoltMySQLReader, "_ensure_branch"),
+    ):
+        graph = reader.read_link_graph("root", max_depth=2, relations=["contains", "depends_on"])
+
+    assert graph["depths"] == {"root": 0, "a": 1, "b": 1, "c": 2}
+    assert {(link["from_id"], link["to_id"]) for link in graph["links"]} == {
+        ("root", "a"),
+        ("root", "b"),
+        ("a", "c"),
+        ("b", "root"),
+        ("c", "a"),
+    }
+    assert cursor.execute.call_count == 3
+    level_2_query, level_2_params = cursor.execute.call_args_list[1].args
+    assert "bl.from_id IN (%s,%s)" in level_2_query
+    assert level_2_params == ("a", "b", "contains", "depends_on")
+    connection.close.assert_called_once()
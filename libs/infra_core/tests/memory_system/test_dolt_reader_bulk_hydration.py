@@ -0,0 +1,287 @@
+"""
+Tests and benchmark for the single-pass bulk hydration path in DoltMySQLReader.
+
+The database connection is replaced with an in-memory fake so the tests can
+count round trips and measure hydration throughput without a live Dolt server.
+The benchmark only runs when RUN_BENCHMARKS is set; throughput is logged at INFO
+(use --log-cli-level=INFO to see it).
+"""
+
+import json
+import logging
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from infra_core.memory_system.block_query import BlockQuery
+from infra_core.memory_system.dolt_mysql_base import DoltConnectionConfig
+from infra_core.memory_system.dolt_reader import DoltMySQLReader, PROPERTY_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+def _block_row(i: int) -> dict:
+    return {
+        "id": f"block-{i:06d}",
+        "namespace_id": "legacy",
+        "type": "task",
+        "schema_version": 1,
+        "text": f"Task number {i}",
+        "state": "draft",
+        "visibility": "internal",
+        "block_version": 1,
+        "parent_id": None,
+        "has_children": False,
+        "tags": json.dumps(["bench", f"t{i % 7}"]),
+        "source_file": None,
+        "source_uri": None,
+        "confidence": None,
+        "created_by": "bench",
+        "created_at": "2025-01-01T00:00:00",
+        "updated_at": "2025-01-01T00:00:00",
+        "embedding": None,
+    }
+
+
+def _property_rows(i: int) -> list:
+    block_id = f"block-{i:06d}"
+    return [
+        {
+            "block_id": block_id,
+            "property_name": "status",
+            "property_value_text": "in_progress",
+            "property_value_number": None,
+            "property_value_json": None,
+            "property_type": "text",
+            "is_computed": False,
+            "created_at": "2025-01-01T00:00:00",
+            "updated_at": "2025-01-01T00:00:00",
+        },
+        {
+            "block_id": block_id,
+            "property_name": "priority_score",
+            "property_value_text": None,
+            "property_value_number": float(i % 5),
+            "property_value_json": None,
+            "property_type": "number",
+            "is_computed": False,
+            "created_at": "2025-01-01T00:00:00",
+            "updated_at": "2025-01-01T00:00:00",
+        },
+    ]
+
+
+class FakeCursor:
+    """Cursor that answers memory_blocks / block_properties queries from in-memory rows."""
+
+    def __init__(self, db: "FakeDatabase"):
+        self.db = db
+        self._result = []
+
+    def execute(self, query, params=None):
+        self.db.queries.append(" ".join(query.split()))
+        if "AS OF" in query:
+            self.db.as_of.append(params[0])
+            params = params[1:]
+        if "FROM block_properties" in query:
+            rows = self.db.property_rows
+            if params:
+                wanted = set(params)
+                rows = [r for r in rows if r["block_id"] in wanted]
+        elif "FROM memory_blocks" in query:
+            rows = self.db.block_rows
+            if "LIMIT" in query:
+                rows = rows[: params[-1]]
+            elif params:
+                wanted = set(params)
+                rows = [r for r in rows if r["id"] in wanted]
+        else:
+            rows = []
+        self._result = [dict(r) for r in rows]
+
+    def fetchall(self):
+        return self._result
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, db: "FakeDatabase"):
+        self.db = db
+
+    def cursor(self, dictionary=False):
+        return FakeCursor(self.db)
+
+    def close(self):
+        pass
+
+
+class FakeDatabase:
+    def __init__(self, n_blocks: int):
+        self.block_rows = [_block_row(i) for i in range(n_blocks)]
+        self.property_rows = [p for i in range(n_blocks) for p in _property_rows(i)]
+        self.queries = []
+        self.as_of = []
+        self.connections_opened = 0
+
+    def connect(self):
+        self.connections_opened += 1
+        return FakeConnection(self)
+
+
+@pytest.fixture
+def reader():
+    return DoltMySQLReader(DoltConnectionConfig())
+
+
+def _read_all(reader, db):
+    with patch.object(DoltMySQLReader, "_get_connection", side_effect=db.connect):
+        return reader.read_memory_blocks(branch="main")
+
+
+def test_read_memory_blocks_uses_constant_number_of_queries(reader):
+    """Reading N blocks costs one connection and a fixed number of queries, not N+1."""
+    db = FakeDatabase(250)
+
+    blocks = _read_all(reader, db)
+
+    assert len(blocks) == 250
+    assert db.connections_opened == 1
+    # DOLT_CHECKOUT + one block_properties scan + one memory_blocks scan
+    assert len(db.queries) == 3
+    assert blocks[3].metadata == {"status": "in_progress", "priority_score": 3.0}
+    assert blocks[3].tags == ["bench", "t3"]
+
+
+def test_blocks_without_properties_get_empty_metadata(reader):
+    db = FakeDatabase(3)
+    db.property_rows = [r for r in db.property_rows if r["block_id"] != "block-000001"]
+
+    blocks = {b.id: b for b in _read_all(reader, db)}
+
+    assert blocks["block-000001"].metadata == {}
+    assert blocks["block-000002"].metadata["status"] == "in_progress"
+
+
+def test_invalid_rows_are_skipped_not_fatal(reader):
+    db = FakeDatabase(3)
+    db.block_rows[1]["type"] = "not-a-type"
+
+    blocks = _read_all(reader, db)
+
+    assert [b.id for b in blocks] == ["block-000000", "block-000002"]
+
+
+def test_query_page_cursor_follows_last_sql_row(reader):
+    """A row that fails to hydrate still counts towards the page and advances the cursor."""
+    db = FakeDatabase(5)
+    db.block_rows[2]["type"] = "not-a-type"
+    query = BlockQuery().limit(3)
+
+    with patch.object(DoltMySQLReader, "_get_connection", side_effect=db.connect):
+        page = reader.query_memory_block_page(query, branch="main")
+
+    assert [b.id for b in page.blocks] == ["block-000000", "block-000001"]
+    assert page.row_count == 3
+    assert page.next_cursor == query.row_cursor(db.block_rows[2])
+
+
+def test_query_page_propagates_database_errors(reader):
+    with patch.object(DoltMySQLReader, "_get_connection", side_effect=ConnectionError("down")):
+        with pytest.raises(ConnectionError):
+            reader.query_memory_block_page(BlockQuery(), branch="main")
+        # The list form keeps returning an empty result on error
+        assert reader.query_memory_blocks(BlockQuery(), branch="main") == []
+
+
+def test_batch_read_block_properties_chunks_in_clause(reader):
+    n_blocks = PROPERTY_BATCH_SIZE * 2 + 1
+    db = FakeDatabase(n_blocks)
+    block_ids = [row["id"] for row in db.block_rows]
+
+    with patch.object(DoltMySQLReader, "_get_connection", side_effect=db.connect):
+        properties = reader.batch_read_block_properties(block_ids, branch="main")
+
+    assert len(properties) == n_blocks
+    assert all(len(props) == 2 for props in properties.values())
+    property_queries = [q for q in db.queries if "FROM block_properties" in q]
+    assert len(property_queries) == 3
+
+
+def test_read_memory_blocks_by_ids_only_touches_requested_blocks(reader):
+    db = FakeDatabase(2000)
+    wanted = ["block-001500", "missing-block", "block-000007", "block-001500"]
+
+    with patch.object(DoltMySQLReader, "_get_connection", side_effect=db.connect):
+        blocks = reader.read_memory_blocks_by_ids(wanted, branch="main")
+
+    assert [b.id for b in blocks] == ["block-001500", "block-000007"]
+    assert blocks[1].metadata == {"status": "in_progress", "priority_score": 2.0}
+    assert db.connections_opened == 1
+    # DOLT_CHECKOUT + one memory_blocks lookup + one block_properties lookup
+    assert len(db.queries) == 3
+    assert all("WHERE" in q for q in db.queries[1:])
+
+
+def test_reads_as_of_revision_pin_every_table(reader):
+    """With as_of, both memory_blocks and block_properties are read at that revision."""
+    db = FakeDatabase(4)
+
+    with patch.object(DoltMySQLReader, "_get_connection", side_effect=db.connect):
+        all_blocks = reader.read_memory_blocks(branch="main", as_of="commit-1")
+        some_blocks = reader.read_memory_blocks_by_ids(
+            ["block-000002"], branch="main", as_of="commit-1"
+        )
+
+    assert len(all_blocks) == 4
+    assert [b.id for b in some_blocks] == ["block-000002"]
+    assert some_blocks[0].metadata["status"] == "in_progress"
+    table_queries = [q for q in db.queries if "FROM" in q]
+    assert len(table_queries) == 4
+    assert all("AS OF %s" in q for q in table_queries)
+    assert db.as_of == ["commit-1"] * 4
+
+
+def test_read_memory_blocks_by_ids_chunks_in_clause(reader):
+    n_blocks = PROPERTY_BATCH_SIZE + 1
+    db = FakeDatabase(n_blocks)
+    block_ids = [row["id"] for row in db.block_rows]
+
+    with patch.object(DoltMySQLReader, "_get_connection", side_effect=db.connect):
+        blocks = reader.read_memory_blocks_by_ids(block_ids, branch="main")
+
+    assert len(blocks) == n_blocks
+    assert len([q for q in db.queries if "FROM memory_blocks" in q]) == 2
+    assert len([q for q in db.queries if "FROM block_properties" in q]) == 2
+
+
+def test_read_memory_blocks_by_ids_empty_input_skips_database(reader):
+    db = FakeDatabase(1)
+
+    with patch.object(DoltMySQLReader, "_get_connection", side_effect=db.connect):
+        assert reader.read_memory_blocks_by_ids([], branch="main") == []
+
+    assert db.connections_opened == 0
+
+
+@pytest.mark.skipif(
+    not os.environ.get("RUN_BENCHMARKS"), reason="benchmark; set RUN_BENCHMARKS=1 to run"
+)
+@pytest.mark.parametrize("n_blocks", [100, 1000, 5000])
+def test_bulk_hydration_throughput(reader, n_blocks):
+    """Benchmark: hydration throughput (blocks/second) versus block count."""
+    db = FakeDatabase(n_blocks)
+
+    start = time.perf_counter()
+    blocks = _read_all(reader, db)
+    elapsed = time.perf_counter() - start
+
+    assert len(blocks) == n_blocks
+    assert len(db.queries) == 3
+    logger.info(
+        f"bulk hydration: {n_blocks} blocks in {elapsed:.3f}s "
+        f"({n_blocks / max(elapsed, 1e-9):,.0f} blocks/s)"
+    )
@@ -563,3 +563,224 @@ class TestDoltWriterMergeBranch:
         # Test whitespace-only source branch
         with pytest.raises(ValueError, match="Source branch name cannot be empty"):
             writer.merge_branch("   ")
+
+
+class _SQLiteCursor:
+    """Minimal dictionary cursor over sqlite3 speaking the %s paramstyle."""
+
+    def __init__(self, connection):
+        self._cursor = connection.cursor()
+        self.rowcount = 0
+
+    def execute(self, query, params=()):
+        if query == "START TRANSACTION":
+            return
+        self._cursor.execute(query.replace("%s", "?"), tuple(params))
+        self.rowcount = self._cursor.rowcount
+
+    def fetchall(self):
+        columns = [column[0] for column in self._cursor.description]
+        return [dict(zip(columns, row)) for row in self._cursor.fetchall()]
+
+    def close(self):
+        self._cursor.close()
+
+
+class _SQLiteConnection:
+    def __init__(self):
+        import sqlite3
+
+        self.db = sqlite3.connect(":memory:")
+        self.db.executescript(
+            """
+            CREATE TABLE memory_blocks (id TEXT PRIMARY KEY, namespace_id TEXT, type TEXT,
+                schema_version INT, text TEXT, state TEXT, visibility TEXT, block_version INT,
+                parent_id TEXT, has_children INT, tags TEXT, source_file TEXT, source_uri TEXT,
+                confidence TEXT, created_by TEXT, created_at TEXT, updated_at TEXT,
+                embedding TEXT);
+            CREATE TABLE block_properties (block_id TEXT, property_name TEXT,
+                property_value_text TEXT, property_value_number REAL, property_value_json TEXT,
+                property_type TEXT, is_computed INT, created_at TEXT, updated_at TEXT);
+            CREATE TABLE block_links (from_id TEXT, to_id TEXT, relation TEXT);
+            CREATE TABLE block_proofs (block_id TEXT, commit_hash TEXT, operation TEXT,
+                                       timestamp TEXT);
+            """
+        )
+        self.db.create_function("NOW", 0, lambda: "2025-01-01 00:00:00")
+
+    def cursor(self, dictionary=False):
+        return _SQLiteCursor(self.db)
+
+    def commit(self):
+        self.db.commit()
+
+    def rollback(self):
+        self.db.rollback()
+
+    def close(self):
+        pass
+
+
+class TestDoltWriterBulkWrites:
+    """Unit tests for the set-based write_memory_blocks, delete_memory_blocks and proofs."""
+
+    @pytest.fixture
+    def writer_and_db(self):
+        from infra_core.memory_system.dolt_mysql_base import DoltConnectionConfig
+        from infra_core.memory_system.dolt_writer import DoltMySQLWriter
+
+        connection = _SQLiteConnection()
+        writer = DoltMySQLWriter(DoltConnectionConfig())
+        with (
+            patch.object(writer, "_get_connection", return_value=connection),
+            patch.object(writer, "_ensure_branch_and_check_protection"),
+            patch.object(writer, "add_to_staging", return_value=(True, "staged")) as staging,
+        ):
+            yield writer, connection.db, staging
+
+    def test_delete_memory_blocks_removes_rows_links_and_parent_refs(self, writer_and_db):
+        writer, db, staging = writer_and_db
+        db.executemany(
+            "INSERT INTO memory_blocks (id, parent_id, has_children) VALUES (?, ?, ?)",
+            [
+                ("parent", None, 1),
+                ("other-parent", None, 1),
+                ("child", "parent", 0),
+                ("doomed", "parent", 1),
+                ("grandchild", "doomed", 0),
+                ("orphaned", "other-parent", 0),
+            ],
+        )
+        db.executemany(
+            "INSERT INTO block_links VALUES (?, ?, ?)",
+            [
+                ("parent", "child", "contains"),
+                ("parent", "doomed", "contains"),
+                ("doomed", "grandchild", "contains"),
+                ("other-parent", "orphaned", "contains"),
+                ("child", "orphaned", "depends_on"),
+            ],
+        )
+        db.executemany(
+            "INSERT INTO block_properties (block_id, property_name) VALUES (?, ?)",
+            [("doomed", "status"), ("orphaned", "status"), ("child", "status")],
+        )
+
+        success, deleted = writer.delete_memory_blocks(
+            ["doomed", "orphaned", "doomed"], branch="feat/test"
+        )
+
+        assert (success, deleted) == (True, 2)
+        blocks = {
+            row[0]: row[1:]
+            for row in db.execute("SELECT id, parent_id, has_children FROM memory_blocks")
+        }
+        assert blocks == {
+            "parent": (None, 1),
+            "other-parent": (None, 0),
+            "child": ("parent", 0),
+            "grandchild": (None, 0),
+        }
+        assert db.execute("SELECT * FROM block_links").fetchall() == [
+            ("parent", "child", "contains")
+        ]
+        assert db.execute("SELECT block_id FROM block_properties").fetchall() == [("child",)]
+        staging.assert_called_once()
+
+    def test_delete_memory_blocks_propagates_branch_protection(self, writer_and_db):
+        # The writer's own binding: other tests reload dolt_mysql_base
+        from infra_core.memory_system.dolt_writer import MainBranchProtectionError
+
+        writer, db, staging = writer_and_db
+        db.execute("INSERT INTO memory_blocks (id, parent_id, has_children) VALUES ('a', NULL, 0)")
+
+        with patch.object(
+            writer,
+            "_ensure_branch_and_check_protection",
+            side_effect=MainBranchProtectionError("delete_memory_blocks", "main"),
+        ):
+            with pytest.raises(MainBranchProtectionError):
+                writer.delete_memory_blocks(["a"], branch="main")
+
+        assert db.execute("SELECT id FROM memory_blocks").fetchall() == [("a",)]
+        staging.assert_not_called()
+
+    def test_write_block_proofs_single_insert(self, writer_and_db):
+        writer, db, _ = writer_and_db
+
+        assert writer.write_block_proofs(["a", "b", "c"], "delete", "abc123", branch="feat/x")
+
+        proofs = db.execute("SELECT block_id, commit_hash, operation FROM block_proofs").fetchall()
+        assert proofs == [
+            ("a", "abc123", "delete"),
+            ("b", "abc123", "delete"),
+            ("c", "abc123", "delete"),
+        ]
+
+    def test_write_memory_blocks_replaces_blocks_and_properties(self, writer_and_db):
+        writer, db, _ = writer_and_db
+        blocks = [
+            MemoryBlock(type="knowledge", text=f"Block {i}", metadata={"title": f"T{i}"})
+            for i in range(3)
+        ]
+        db.execute(
+            "INSERT INTO block_properties (block_id, property_name) VALUES (?, ?)",
+            (blocks[0].id, "stale"),
+        )
+
+        assert writer.write_memory_blocks(blocks, branch="feat/x") is True
+        blocks[1].text = "Rewritten"
+        assert writer.write_memory_blocks(blocks[1:2], branch="feat/x") is True
+
+        rows = dict(db.execute("SELECT id, text FROM memory_blocks").fetchall())
+        assert rows == {blocks[0].id: "Block 0", blocks[1].id: "Rewritten", blocks[2].id: "Block 2"}
+        properties = db.execute(
+            "SELECT block_id, property_name, property_value_text FROM block_properties "
+            "ORDER BY property_value_text"
+        ).fetchall()
+        assert properties == [(block.id, "title", f"T{i}") for i, block in enumerate(blocks)]
+
+
+    def test_update_blocks_namespace_touches_only_memory_blocks(self, writer_and_db):
+        writer, db, staging = writer_and_db
+        db.executemany(
+            "INSERT INTO memory_blocks (id, namespace_id, block_version) VALUES (?, ?, ?)",
+            [("a", "old", 1), ("b", "old", None), ("c", "old", 4)],
+        )
+        db.execute("INSERT INTO block_properties (block_id, property_name) VALUES ('a', 'status')")
+
+        success, updated = writer.update_blocks_namespace(["a", "b", "a"], "new", branch="feat/x")
+
+        assert (success, updated) == (True, 2)
+        rows = db.execute("SELECT id, namespace_id, block_version FROM memory_blocks ORDER BY id")
+        assert rows.fetchall() == [("a", "new", 2), ("b", "new", 1), ("c", "old", 4)]
+        assert db.execute("SELECT block_id FROM block_properties").fetchall() == [("a",)]
+        staging.assert_not_called()
+
+    def test_write_memory_block_changes_writes_only_the_diff(self, writer_and_db):
+        writer, db, _ = writer_and_db
+        previous = MemoryBlock(
+            type="knowledge", text="Body", metadata={"title": "T", "status": "open", "owner": "a"}
+        )
+        assert writer.write_memory_blocks([previous], branch="feat/x") is True
+        db.execute("UPDATE block_properties SET created_at = 'original'")
+        block = previous.model_copy(
+            update={"block_version": 2, "metadata": {"title": "T", "status": "done"}}
+        )
+
+        assert writer.write_memory_block_changes(previous, block, branch="feat/x") is True
+        # A second write of the same version has nothing to do
+        with patch.object(writer, "_get_connection") as get_connection:
+            assert writer.write_memory_block_changes(block, block, branch="feat/x") is True
+        get_connection.assert_not_called()
+
+        assert db.execute("SELECT text, block_version FROM memory_blocks").fetchall() == [
+            ("Body", 2)
+        ]
+        properties = db.execute(
+            "SELECT property_name, property_value_text, created_at FROM block_properties "
+            "ORDER BY property_name"
+        ).fetchall()
+        assert properties[0][:2] == ("status", "done")
+        assert properties[1] == ("title", "T", "original")
+        assert len(properties) == 2
@@ -0,0 +1,77 @@
+"""
+Unit tests for the SQLite content-hash embedding cache.
+"""
+
+from infra_core.memory_system.embedding_cache import EmbeddingCache
+
+MODEL = "text-embedding-3-small"
+
+
+def test_roundtrip_and_hit_rate():
+    cache = EmbeddingCache(max_entries=10)
+    cache.put_many(MODEL, 3, ["alpha", "beta"], [[0.5, 0.25, 1.0], [1.0, 2.0, 3.0]])
+
+    results = cache.get_many(MODEL, 3, ["beta", "gamma", "alpha"])
+
+    assert results == [[1.0, 2.0, 3.0], None, [0.5, 0.25, 1.0]]
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["writes"] == 2
+    assert stats["hit_rate"] == 2 / 3
+
+
+def test_key_includes_model_and_dimensions():
+    cache = EmbeddingCache(max_entries=10)
+    cache.put(MODEL, 3, "alpha", [1.0, 2.0, 3.0])
+
+    assert cache.get(MODEL, 3, "alpha") == [1.0, 2.0, 3.0]
+    assert cache.get(MODEL, 1536, "alpha") is None
+    assert cache.get("other-model", 3, "alpha") is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, monkeypatch):
+    clock = iter(range(100))
+    monkeypatch.setattr("infra_core.memory_system.embedding_cache.time.time", lambda: next(clock))
+    cache = EmbeddingCache(str(tmp_path / "cache.sqlite"), max_entries=2)
+    cache.put(MODEL, 1, "a", [1.0])
+    cache.put(MODEL, 1, "b", [2.0])
+    cache.get(MODEL, 1, "a")  # a is now more recently used than b
+    cache.put(MODEL, 1, "c", [3.0])
+
+    assert cache.get(MODEL, 1, "b") is None
+    assert cache.get(MODEL, 1, "a") == [1.0]
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size"] == 2
+
+
+def test_entries_persist_across_instances(tmp_path):
+    path = str(tmp_path / "nested" / "cache.sqlite")
+    first = EmbeddingCache(path)
+    first.put(MODEL, 2, "persisted", [0.5, -0.5])
+    first.close()
+
+    assert EmbeddingCache(path).get(MODEL, 2, "persisted") == [0.5, -0.5]
+
+
+def test_zero_max_entries_disables_cache():
+    cache = EmbeddingCache(max_entries=0)
+    cache.put(MODEL, 1, "a", [1.0])
+
+    assert not cache.enabled
+    assert cache.get(MODEL, 1, "a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_size_is_tracked_without_counting_on_every_put(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    first = EmbeddingCache(path, max_entries=3)
+    first.put_many(MODEL, 1, ["a", "b"], [[1.0], [2.0]])
+    first.put(MODEL, 1, "a", [1.5])  # replacing an entry does not grow the cache
+    first.close()
+
+    cache = EmbeddingCache(path, max_entries=3)
+    cache.put_many(MODEL, 1, ["c", "d"], [[3.0], [4.0]])
+
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size"] == 3
@@ -148,6 +148,39 @@ class TestExecutableLinkManager:
         assert task1_id not in ready_tasks  # task1 is blocked
         assert task2_id not in ready_tasks  # task2 is blocked
 
+    def test_get_ready_tasks_filtered_and_ranked(self, executable_link_manager):
+        """Test status/namespace filtering and priority ordering of ready tasks."""
+        urgent, normal, done, other_ns, blocked = (generate_uuid() for _ in range(5))
+        for task_id in (urgent, normal, done, other_ns):
+            executable_link_manager.add_blocker(blocked, task_id)
+
+        def block(block_id, status, priority=None, namespace_id="legacy"):
+            metadata = {"status": status}
+            if priority:
+                metadata["priority"] = priority
+            return MagicMock(id=block_id, metadata=metadata, namespace_id=namespace_id)
+
+        block_store = MagicMock()
+        block_store.get_memory_blocks_by_ids.return_value = [
+            block(normal, "ready"),
+            block(urgent, "ready", "P0"),
+            block(done, "done", "P0"),
+            block(other_ns, "ready", "P1", namespace_id="other"),
+        ]
+
+        ready_tasks = executable_link_manager.get_ready_tasks(
+            statuses=["ready", "in_progress"], namespace_id="legacy", block_store=block_store
+        )
+
+        assert ready_tasks == [urgent, normal]
+        block_store.get_memory_blocks_by_ids.assert_called_once()
+        assert blocked not in block_store.get_memory_blocks_by_ids.call_args[0][0]
+
+    def test_get_ready_tasks_filters_need_block_store(self, executable_link_manager):
+        """Test status filtering without a block store is rejected."""
+        with pytest.raises(ValueError):
+            executable_link_manager.get_ready_tasks(statuses=["ready"])
+
     def test_set_parent(self, executable_link_manager, link_manager):
         """Test setting a parent-child relationship."""
         child_id = generate_uuid()
@@ -299,6 +332,9 @@ class TestExecutableLinkManager:
         # Test the actual constraint: task3 depends on nothing, task2 depends on task3, task1 depends on task2
         assert task3_idx != task1_idx and task3_idx != task2_idx and task2_idx != task1_idx
 
+        # Blockers come before the tasks they block
+        assert task3_idx < task2_idx < task1_idx
+
         # Either or both of these requirements may be true, depending on how topo_sort is implemented:
         # 1. task3 should be earlier than task2 (if sorting is in dependency order)
         # 2. task2 should be earlier than task1 (if sorting is in dependency order)
@@ -8,6 +8,7 @@ from datetime import datetime
 
 from infra_core.memory_system.link_manager import (
     InMemoryLinkManager,
+    LinkIndex,
     LinkError,
     LinkErrorType,
     BlockLink,
@@ -355,3 +356,40 @@ def test_delete_links_for_block(link_manager, valid_block_ids):
 
     # Other links should still exist
     assert len(link_manager.links_from(valid_block_ids["block4"]).links) == 1
+
+
+def test_link_index_ready_frontier_tracks_add_and_remove(valid_block_ids):
+    """Test the zero in-degree frontier follows link additions and removals."""
+    b1, b2, b3, b4 = (valid_block_ids[f"block{i}"] for i in range(1, 5))
+    index = LinkIndex()
+
+    index.add_link(b1, b2, "depends_on")
+    index.add_link(b2, b3, "depends_on")
+    index.add_link(b4, b1, "mentions")
+    assert index.get_ready_tasks("depends_on") == sorted([b1, b4])
+    assert index.get_ready_tasks("mentions") == sorted([b2, b4])
+
+    # Re-adding an indexed link must not double-count the in-degree
+    index.add_link(b1, b2, "depends_on")
+    index.remove_link(b1, b2, "depends_on")
+    assert b2 in index.get_ready_tasks("depends_on")
+    assert index.in_degree(b2, "depends_on") == 0
+
+    # A block without outbound links leaves every frontier
+    index.remove_link(b4, b1, "mentions")
+    assert index.get_ready_tasks("depends_on") == [b2]
+    assert index.get_ready_tasks("mentions") == [b2]
+
+
+def test_link_index_ready_tasks_filter_and_order(valid_block_ids):
+    """Test include and sort_key are applied to the frontier."""
+    b1, b2, b3, b4 = (valid_block_ids[f"block{i}"] for i in range(1, 5))
+    index = LinkIndex()
+    for source in (b1, b2, b3):
+        index.add_link(source, b4, "depends_on")
+    rank = {b1: 2, b2: 0, b3: 1}
+
+    ready = index.get_ready_tasks("depends_on", include=lambda b: b != b3, sort_key=rank.get)
+
+    assert ready == [b2, b1]
+
@@ -5,6 +5,7 @@ import shutil
 from typing import List
 import gc
 import time
+from unittest.mock import patch
 
 from infra_core.memory_system.llama_memory import LlamaMemory
 from infra_core.memory_system.schemas.memory_block import MemoryBlock
@@ -119,6 +120,34 @@ class TestLlamaMemory:
                         f"Score for irrelevant query should be low, but got {result.score}"
                     )
 
+    def test_add_blocks_batches_and_persists_once(self, llama_memory):
+        """Bulk indexing embeds per batch, persists once and reports throughput."""
+        blocks = [
+            MemoryBlock(
+                id=str(uuid.uuid4()),
+                type="knowledge",
+                text=f"Bulk indexed block number {i} about vector databases.",
+                tags=["bulk"],
+            )
+            for i in range(5)
+        ]
+
+        storage_context = llama_memory.index.storage_context
+        with patch.object(storage_context, "persist", wraps=storage_context.persist) as persist:
+            metrics = llama_memory.add_blocks(blocks, batch_size=2)
+
+        assert metrics["total"] == 5
+        assert metrics["indexed"] == 5
+        assert metrics["batches"] == 3
+        assert metrics["failed_ids"] == []
+        assert metrics["blocks_per_second"] > 0
+        persist.assert_called_once()
+
+        results = llama_memory.query_vector_store(
+            "vector databases", top_k=5, filters={"tag:bulk": True}
+        )
+        assert {r.node.id_ for r in results} == {b.id for b in blocks}
+
     def test_update_block(self, llama_memory, sample_memory_block):
         """Test updating a memory block."""
         # First add the block
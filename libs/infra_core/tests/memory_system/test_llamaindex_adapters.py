@@ -1,9 +1,17 @@
 from infra_core.memory_system.schemas.memory_block import MemoryBlock, ConfidenceScore
 from infra_core.memory_system.schemas.common import BlockLink
-from infra_core.memory_system.llamaindex_adapters import memory_block_to_node
-from llama_index.core.schema import TextNode, NodeRelationship
+from infra_core.memory_system.embedding_cache import EmbeddingCache
+from infra_core.memory_system.llamaindex_adapters import (
+    CachedEmbedding,
+    build_vector_filters,
+    memory_block_to_node,
+)
+from llama_index.core.embeddings.mock_embed_model import MockEmbedding
+from unittest.mock import patch
+from llama_index.core.schema import MetadataMode, TextNode, NodeRelationship
 from datetime import datetime
 import json
+import sqlite3
 import pytest
 
 # TODO: Implement tests for memory_block_to_node conversion
@@ -79,6 +87,13 @@ def test_memory_block_to_node_metadata_and_enrichment():
         "created_by": "agent_x",
         "enriched_title": specific_title,
         "enriched_tags": tags_str,
+        # Flat filterable fields
+        "namespace_id": block.namespace_id,
+        "tag:tag1": True,
+        "tag:test": True,
+        "meta:project": "POC",
+        "meta:status": "pending",
+        "meta:title": specific_title,
     }
     # Compare metadata excluding the dynamic timestamps
     metadata_copy = node.metadata.copy()
@@ -90,6 +105,84 @@ def test_memory_block_to_node_metadata_and_enrichment():
     assert metadata_copy == expected_metadata_static
 
 
+def test_filter_fields_match_vector_filters_and_stay_out_of_embeddings():
+    """Every pushed-down filter targets a field emitted by memory_block_to_node."""
+    block = MemoryBlock(
+        id="filterable",
+        type="task",
+        namespace_id="pm",
+        text="Filterable block.",
+        tags=["urgent", "backend"],
+        metadata={"status": "in_progress", "priority": 1, "assignees": ["a", "b"]},
+    )
+
+    node = memory_block_to_node(block)
+    filters = build_vector_filters(
+        type_filter="task",
+        namespace_id="pm",
+        tag_filters=["urgent"],
+        metadata_filters={"status": "in_progress", "assignees": ["a", "b"]},
+    )
+
+    assert filters == {
+        "type": "task",
+        "namespace_id": "pm",
+        "tag:urgent": True,
+        "meta:status": "in_progress",
+    }
+    assert all(node.metadata[key] == value for key, value in filters.items())
+    assert "meta:assignees" not in node.metadata
+    assert "tag:urgent" not in node.get_content(metadata_mode=MetadataMode.EMBED)
+    assert build_vector_filters() == {}
+
+
+def test_metadata_only_edit_keeps_embedded_text_stable():
+    """Bookkeeping metadata is excluded so metadata edits do not force re-embedding."""
+    block = MemoryBlock(
+        id="stable", type="task", text="Ship it.", metadata={"title": "T", "status": "todo"}
+    )
+    edited = block.model_copy(deep=True)
+    edited.metadata["status"] = "done"
+    edited.updated_at = datetime(2030, 1, 1)
+
+    before = memory_block_to_node(block).get_content(metadata_mode=MetadataMode.EMBED)
+    after = memory_block_to_node(edited).get_content(metadata_mode=MetadataMode.EMBED)
+
+    assert before == after
+
+
+def test_cached_embedding_only_embeds_cache_misses():
+    """Texts already in the cache are not sent to the wrapped model again."""
+    inner = MockEmbedding(embed_dim=4)
+    cached = CachedEmbedding(inner, EmbeddingCache(), dimensions=4)
+
+    with patch.object(
+        MockEmbedding,
+        "get_text_embedding_batch",
+        autospec=True,
+        side_effect=lambda self, texts, **kw: [[0.5] * 4 for _ in texts],
+    ) as embed_batch:
+        first = cached.get_text_embedding_batch(["a", "b"])
+        second = cached.get_text_embedding_batch(["a", "b", "c"])
+
+    assert first == second[:2]
+    assert [c.args[1] for c in embed_batch.call_args_list] == [["a", "b"], ["c"]]
+    assert cached.cache.stats()["hits"] == 2
+
+
+def test_cached_embedding_survives_cache_failures():
+    """A broken cache file falls through to the wrapped model instead of failing."""
+    inner = MockEmbedding(embed_dim=4)
+    cache = EmbeddingCache()
+    cached = CachedEmbedding(inner, cache, dimensions=4)
+
+    with patch.object(cache, "get_many", side_effect=sqlite3.OperationalError("locked")):
+        with patch.object(cache, "put_many", side_effect=sqlite3.OperationalError("readonly")):
+            embeddings = cached.get_text_embedding_batch(["a", "b"])
+
+    assert embeddings == [[0.5] * 4, [0.5] * 4]
+
+
 # Add more tests as needed, e.g., for handling missing optional fields
 
 
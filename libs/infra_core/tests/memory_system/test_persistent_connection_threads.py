@@ -0,0 +1,127 @@
+"""
+Tests that one persistent connection is never used by two threads at once.
+
+Read-only tools run concurrently against a session's memory bank, so the reader's
+persistent connection is shared between threads. The fake connection below records
+how many statements are in flight on it at the same time.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from infra_core.memory_system.dolt_mysql_base import DoltConnectionConfig, DoltMySQLBase
+from infra_core.memory_system.dolt_reader import DoltMySQLReader
+
+
+class SharedCursor:
+    rowcount = 1
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, query, params=None):
+        with self.conn.lock:
+            self.conn.active += 1
+            self.conn.max_active = max(self.conn.max_active, self.conn.active)
+        time.sleep(0.005)  # Widen the window for overlapping statements
+        with self.conn.lock:
+            self.conn.active -= 1
+            self.conn.statements += 1
+
+    def fetchall(self):
+        return []
+
+    def fetchone(self):
+        return {"current_branch": "main", "active_branch": "main"}
+
+    def close(self):
+        pass
+
+
+class SharedRawConnection:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.statements = 0
+
+    def cursor(self, dictionary=False):
+        return SharedCursor(self)
+
+    def is_connected(self):
+        return True
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def reader():
+    raw = SharedRawConnection()
+    reader = DoltMySQLReader(DoltConnectionConfig(pool_size=0))
+    with (
+        patch.object(DoltMySQLReader, "_create_connection", return_value=raw) as create,
+        patch.object(DoltMySQLBase, "_ensure_branch"),
+        patch.object(DoltMySQLBase, "_verify_current_branch", return_value="main"),
+    ):
+        reader.use_persistent_connection("main")
+        yield reader, raw, create
+    reader.close_persistent_connection()
+
+
+def _run_in_threads(target, count=8):
+    errors = []
+
+    def run():
+        try:
+            target()
+        except Exception as e:  # pragma: no cover - surfaced by the assertion below
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def test_concurrent_operations_take_turns_on_persistent_connection(reader):
+    reader, raw, create = reader
+
+    def operations():
+        reader._execute_query("SELECT 1")
+        reader.list_branches()
+        reader.get_diff_summary("HEAD", "WORKING")
+        reader._execute_updates_in_transaction([("UPDATE t SET x = 1", None)])
+
+    _run_in_threads(operations)
+
+    assert create.call_count == 1  # Every operation used the one persistent connection
+    assert raw.statements == 8 * 7  # 6 statements plus the health check before _execute_query
+    assert raw.max_active == 1
+
+
+def test_close_while_waiting_falls_back_to_new_connection(reader):
+    reader, raw, create = reader
+    fresh = SharedRawConnection()
+    create.return_value = fresh
+
+    with reader._persistent_lock:
+        waiter = threading.Thread(target=reader._execute_query, args=("SELECT 1",))
+        waiter.start()
+        time.sleep(0.02)  # Let the waiter block on the persistent connection
+        reader.close_persistent_connection()
+    waiter.join()
+
+    assert raw.statements == 0
+    assert fresh.statements == 1
@@ -251,7 +251,7 @@ class TestSQLLinkManager:
         """INTEGRATION TEST - Validation errors requiring real database."""
         pass
 
-    @pytest.mark.skip("Cycle detection not yet implemented")
+    @pytest.mark.skip(reason="Integration test requiring real database")
     def test_cycle_detection(self, sql_link_manager, sample_blocks):
         """Test cycle detection in link creation."""
         # This test is already skipped for a different reason
@@ -0,0 +1,146 @@
+"""
+Tests for the set-based SQLLinkManager.bulk_upsert path.
+
+Statements are captured instead of executed, so the tests check how many round
+trips a batch costs and what is written, without a live Dolt server.
+"""
+
+import uuid
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from infra_core.memory_system.dolt_mysql_base import DoltConnectionConfig
+from infra_core.memory_system.link_manager import LinkError
+from infra_core.memory_system.sql_link_manager import UPSERT_CHUNK_SIZE, SQLLinkManager
+
+
+def _ids(n):
+    return [str(uuid.UUID(int=i + 1)) for i in range(n)]
+
+
+@pytest.fixture
+def manager():
+    link_manager = SQLLinkManager(DoltConnectionConfig(database="test_db"))
+    with (
+        patch.object(link_manager, "_execute_query", return_value=[]) as query,
+        patch.object(link_manager, "_execute_updates_in_transaction") as transaction,
+        patch.object(link_manager, "_execute_update") as update,
+        patch.object(
+            SQLLinkManager, "active_branch", new_callable=PropertyMock, return_value="feature"
+        ),
+    ):
+        link_manager.query_mock = query
+        link_manager.transaction_mock = transaction
+        link_manager.update_mock = update
+        yield link_manager
+
+
+def _statements(manager):
+    (statements,) = manager.transaction_mock.call_args[0]
+    return statements
+
+
+def test_bulk_upsert_writes_chunks_in_one_transaction(manager):
+    ids = _ids(UPSERT_CHUNK_SIZE * 2 + 2)
+    links = [(ids[0], to_id, "related_to", None) for to_id in ids[1:]]
+
+    results = manager.bulk_upsert(links)
+
+    assert len(results) == len(links)
+    manager.transaction_mock.assert_called_once()
+    manager.update_mock.assert_not_called()
+    # No per-link existence checks; non-acyclic relations need no adjacency either
+    manager.query_mock.assert_not_called()
+    statements = _statements(manager)
+    assert len(statements) == 3
+    assert all("ON DUPLICATE KEY UPDATE" in query for query, _ in statements)
+    assert [len(params) // 7 for _, params in statements] == [500, 500, 1]
+
+
+def test_bulk_upsert_keeps_priority_metadata_and_created_by(manager):
+    a, b, c = _ids(3)
+
+    results = manager.bulk_upsert(
+        [(a, b, "mentions", {"k": 1}, 4, "agent"), (a, c, "mentions", None)]
+    )
+
+    assert [(r.priority, r.link_metadata, r.created_by) for r in results] == [
+        (4, {"k": 1}, "agent"),
+        (0, None, None),
+    ]
+    ((_, params),) = _statements(manager)
+    assert params[:6] == (a, b, "mentions", 4, '{"k": 1}', "agent")
+    assert params[7:13] == (a, c, "mentions", 0, None, None)
+
+
+def test_bulk_upsert_writes_duplicate_links_once_with_last_values(manager):
+    a, b = _ids(2)
+
+    results = manager.bulk_upsert([(a, b, "mentions", None, 1), (a, b, "mentions", None, 2)])
+
+    assert len(results) == 2
+    ((_, params),) = _statements(manager)
+    assert len(params) == 7
+    assert params[3] == 2
+
+
+def test_bulk_upsert_batches_parent_child_columns(manager):
+    parent, other_parent, child1, child2 = _ids(4)
+
+    manager.bulk_upsert(
+        [
+            (parent, child1, "contains", None),
+            (parent, child2, "contains", None),
+            (other_parent, child2, "contains", None),
+        ]
+    )
+
+    statements = _statements(manager)
+    assert len(statements) == 3
+    parent_query, parent_params = statements[1]
+    assert "SET parent_id = CASE id" in parent_query
+    assert parent_params == (child1, parent, child2, other_parent, child1, child2)
+    has_children_query, has_children_params = statements[2]
+    assert "SET has_children" in has_children_query
+    assert has_children_params == (1, parent, other_parent)
+
+
+def test_bulk_upsert_validates_before_writing(manager):
+    a, b = _ids(2)
+
+    with pytest.raises(LinkError):
+        manager.bulk_upsert([(a, b, "mentions", None), (a, a, "mentions", None)])
+    with pytest.raises(ValueError):
+        manager.bulk_upsert([(a, b, "mentions", None, -1)])
+
+    manager.transaction_mock.assert_not_called()
+
+
+def test_execute_updates_in_transaction_rolls_back_on_failure():
+    link_manager = SQLLinkManager(DoltConnectionConfig(database="test_db"))
+    connection = MagicMock()
+    cursor = connection.cursor.return_value
+    cursor.rowcount = 1
+    cursor.execute.side_effect = [None, None, RuntimeError("write failed")]
+
+    with patch.object(link_manager, "_get_connection", return_value=connection):
+        with pytest.raises(RuntimeError):
+            link_manager._execute_updates_in_transaction([("Q1", ()), ("Q2", ())])
+
+    connection.rollback.assert_called_once()
+    connection.commit.assert_not_called()
+    connection.close.assert_called_once()
+
+
+def test_execute_updates_in_transaction_commits_once():
+    link_manager = SQLLinkManager(DoltConnectionConfig(database="test_db"))
+    connection = MagicMock()
+    connection.cursor.return_value.rowcount = 2
+
+    with patch.object(link_manager, "_get_connection", return_value=connection):
+        affected = link_manager._execute_updates_in_transaction([("Q1", (1,)), ("Q2", (2,))])
+
+    assert affected == 4
+    connection.commit.assert_called_once()
+    connection.rollback.assert_not_called()
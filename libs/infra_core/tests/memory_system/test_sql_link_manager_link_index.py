@@ -0,0 +1,321 @@
+"""
+Tests for the in-memory LinkIndexSnapshot behind SQLLinkManager(enable_link_index=True).
+
+block_links lives in an in-memory SQLite table; DOLT_HASHOF, DOLT_HASHOF_DB and
+DOLT_DIFF are answered by the fake, so loading, own-write maintenance and diff polling can be
+checked against the plain SQL read path without a live Dolt server.
+"""
+
+import sqlite3
+import uuid
+from datetime import datetime, timedelta
+from unittest.mock import PropertyMock, patch
+
+import pytest
+
+from infra_core.memory_system.dolt_mysql_base import DoltConnectionConfig
+from infra_core.memory_system.link_manager import Direction, LinkQuery
+from infra_core.memory_system.pm_executable_links import ExecutableLinkManager
+from infra_core.memory_system.sql_link_manager import SQLLinkManager
+
+
+class FakeDolt:
+    """SQLite-backed block_links with settable branch/working-set hashes and DOLT_DIFF rows."""
+
+    def __init__(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute(
+            "CREATE TABLE block_links (to_id TEXT, from_id TEXT, relation TEXT, priority INT, "
+            "link_metadata TEXT, created_by TEXT, created_at TEXT, "
+            "PRIMARY KEY (from_id, to_id, relation))"
+        )
+        self.head = "commit-1"
+        self.working = "working-1"
+        self.diff_rows = []
+        # DOLT_DIFF(head, 'WORKING') rows: uncommitted link changes
+        self.working_diff_rows = []
+        self.queries = []
+
+    def add(self, from_id, to_id, relation="related_to", priority=0, created_at=None):
+        created_at = created_at or datetime(2025, 1, 1)
+        self.connection.execute(
+            "INSERT INTO block_links (from_id, to_id, relation, priority, created_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (from_id, to_id, relation, priority, created_at.isoformat(sep=" ")),
+        )
+
+    def execute_query(self, query, params=None):
+        self.queries.append(query)
+        if "DOLT_HASHOF_DB" in query:
+            return [{"working_hash": self.working}]
+        if "DOLT_HASHOF" in query:
+            return [{"commit_hash": self.head}]
+        if "DOLT_DIFF" in query and "'WORKING'" in query:
+            return self.working_diff_rows
+        if "DOLT_DIFF" in query:
+            if self.diff_rows is None:
+                raise RuntimeError("commit not found")
+            return self.diff_rows
+        rows = self.connection.execute(query.replace("%s", "?"), tuple(params or ())).fetchall()
+        return [dict(row) for row in rows]
+
+    def execute_update(self, query, params=None):
+        cursor = self.connection.execute(query.replace("%s", "?"), tuple(params or ()))
+        return cursor.rowcount
+
+
+def _ids(n):
+    return [str(uuid.UUID(int=i + 1)) for i in range(n)]
+
+
+@pytest.fixture
+def dolt():
+    return FakeDolt()
+
+
+@pytest.fixture
+def make_manager(dolt):
+    patches = [
+        patch.object(
+            SQLLinkManager, "active_branch", new_callable=PropertyMock, return_value="feature"
+        )
+    ]
+    patches[0].start()
+
+    def _make(**kwargs):
+        manager = SQLLinkManager(DoltConnectionConfig(database="test_db"), **kwargs)
+        for name, fake in (
+            ("_execute_query", dolt.execute_query),
+            ("_execute_update", dolt.execute_update),
+        ):
+            p = patch.object(manager, name, side_effect=fake)
+            p.start()
+            patches.append(p)
+        return manager
+
+    yield _make
+    for p in patches:
+        p.stop()
+
+
+def _keys(result):
+    return [(link.from_id, link.to_id, link.relation) for link in result.links]
+
+
+def _added(from_id, to_id, relation="blocks"):
+    return {
+        "diff_type": "added",
+        "from_from_id": None,
+        "from_to_id": None,
+        "from_relation": None,
+        "to_from_id": from_id,
+        "to_to_id": to_id,
+        "to_relation": relation,
+        "to_priority": 0,
+        "to_link_metadata": None,
+        "to_created_by": "other",
+        "to_created_at": "2025-02-01 00:00:00",
+    }
+
+
+def _link_loads(dolt):
+    return [q for q in dolt.queries if q.strip().startswith("SELECT from_id, to_id, relation")]
+
+
+def test_reads_match_sql_and_issue_no_queries_after_load(dolt, make_manager):
+    ids = _ids(12)
+    start = datetime(2025, 1, 1)
+    for i in range(1, 12):
+        dolt.add(ids[i - 1], ids[i], "depends_on", priority=i % 3, created_at=start)
+        dolt.add(ids[0], ids[i], "mentions", priority=i % 2, created_at=start + timedelta(i))
+    sql = make_manager()
+    indexed = make_manager(enable_link_index=True)
+
+    queries = [
+        lambda m: m.links_from(ids[0]),
+        lambda m: m.links_to(ids[5], LinkQuery().relation("depends_on")),
+        lambda m: m.links_from(ids[3], LinkQuery().depth(3).direction(Direction.BOTH)),
+        lambda m: m.get_all_links(LinkQuery().limit(1000)),
+    ]
+    indexed.get_all_links()  # Load the snapshot
+    loaded = indexed._execute_query.call_count
+
+    for run in queries:
+        assert _keys(run(indexed)) == _keys(run(sql))
+    assert indexed.has_path(ids[0], ids[11], "depends_on") is True
+    assert indexed.has_path(ids[11], ids[0], "depends_on") is False
+    assert indexed.get_connected_blocks(ids[0], "depends_on", depth=2) == {ids[1], ids[2]}
+    assert indexed.get_ready_tasks("depends_on") == [ids[0]]
+
+    assert indexed._execute_query.call_count == loaded
+
+
+def test_keyset_pages_match_sql(dolt, make_manager):
+    ids = _ids(30)
+    for i in range(1, 30):
+        dolt.add(ids[0], ids[i], priority=i % 4, created_at=datetime(2025, 1, 1 + i % 3))
+    sql = make_manager()
+    indexed = make_manager(enable_link_index=True)
+
+    pages = {}
+    for name, manager in (("sql", sql), ("indexed", indexed)):
+        cursor, keys = None, []
+        while True:
+            query = LinkQuery().limit(7)
+            result = manager.links_from(ids[0], query.cursor(cursor) if cursor else query)
+            keys.append(_keys(result))
+            cursor = result.next_cursor
+            if not cursor:
+                break
+        pages[name] = keys
+
+    assert pages["indexed"] == pages["sql"]
+    assert [len(page) for page in pages["indexed"]] == [7, 7, 7, 7, 1]
+
+
+def test_own_writes_update_loaded_snapshot(dolt, make_manager):
+    a, b, c = _ids(3)
+    dolt.add(a, b, "blocks")
+    manager = make_manager(enable_link_index=True)
+    assert manager.get_ready_tasks("blocks") == [a]
+
+    manager.create_link(b, c, "blocks", priority=2)
+    manager.upsert_link(a, b, "blocks", priority=5)
+    manager.delete_link(a, b, "blocks")
+    loads = [q for q in dolt.queries if q.strip().startswith("SELECT from_id, to_id, relation")]
+
+    assert _keys(manager.links_from(b)) == [(b, c, "blocks")]
+    assert manager.links_from(b).links[0].priority == 2
+    assert manager.links_from(a).links == []
+    assert sorted(manager.get_ready_tasks("blocks")) == [b]
+    assert len(loads) == 1
+
+
+def test_poll_applies_dolt_diff_from_other_writers(dolt, make_manager):
+    a, b, c = _ids(3)
+    dolt.add(a, b, "blocks")
+    manager = make_manager(enable_link_index=True, link_index_poll_interval=0)
+    assert _keys(manager.links_from(a)) == [(a, b, "blocks")]
+
+    # Another writer merges a commit removing a->b and adding a->c
+    dolt.head = "commit-2"
+    dolt.working = "working-2"
+    dolt.diff_rows = [
+        {"diff_type": "removed", "from_from_id": a, "from_to_id": b, "from_relation": "blocks"},
+        {
+            "diff_type": "added",
+            "from_from_id": None,
+            "from_to_id": None,
+            "from_relation": None,
+            "to_from_id": a,
+            "to_to_id": c,
+            "to_relation": "blocks",
+            "to_priority": 1,
+            "to_link_metadata": None,
+            "to_created_by": "other",
+            "to_created_at": "2025-02-01 00:00:00",
+        },
+    ]
+
+    result = manager.links_from(a)
+
+    assert _keys(result) == [(a, c, "blocks")]
+    assert result.links[0].created_by == "other"
+    assert manager.get_ready_tasks("blocks", [a, b, c]) == [a, b]
+
+
+def test_failed_diff_reloads_snapshot(dolt, make_manager):
+    a, b, c = _ids(3)
+    dolt.add(a, b)
+    manager = make_manager(enable_link_index=True, link_index_poll_interval=0)
+    manager.links_from(a)
+
+    dolt.add(a, c)
+    dolt.head = "commit-2"
+    dolt.working = "working-2"
+    dolt.diff_rows = None
+
+    assert {link.to_id for link in manager.links_from(a).links} == {b, c}
+
+
+def test_poll_sees_uncommitted_links_from_other_writers(dolt, make_manager):
+    a, b, c = _ids(3)
+    dolt.add(a, b, "blocks")
+    manager = make_manager(enable_link_index=True, link_index_poll_interval=0)
+    assert _keys(manager.links_from(a)) == [(a, b, "blocks")]
+
+    # Another session adds a->c without committing: only the working set moves
+    dolt.working = "working-2"
+    dolt.working_diff_rows = [_added(a, c)]
+    assert sorted(_keys(manager.links_from(a))) == sorted([(a, b, "blocks"), (a, c, "blocks")])
+
+    # ...and deletes it again before committing
+    dolt.working = "working-3"
+    dolt.working_diff_rows = []
+    assert _keys(manager.links_from(a)) == [(a, b, "blocks")]
+    assert len(_link_loads(dolt)) == 1
+
+
+def test_refresh_ignores_branch_that_is_not_checked_out(dolt, make_manager):
+    a, b, c = _ids(3)
+    dolt.add(a, b, "blocks")
+    manager = make_manager(enable_link_index=True, link_index_poll_interval=3600)
+    assert _keys(manager.links_from(a)) == [(a, b, "blocks")]
+
+    # The manager moves to main, whose working set holds an uncommitted a->c
+    active_branch = vars(SQLLinkManager)["active_branch"]
+    active_branch.return_value = "main"
+    dolt.working = "working-main"
+    dolt.working_diff_rows = [_added(a, c)]
+    queries_before = len(dolt.queries)
+
+    manager.refresh_link_index("feature")
+
+    assert len(dolt.queries) == queries_before
+    active_branch.return_value = "feature"
+    assert _keys(manager.links_from(a)) == [(a, b, "blocks")]
+
+
+def test_uncommitted_links_present_at_load_can_be_undone(dolt, make_manager):
+    a, b, c = _ids(3)
+    dolt.add(a, b, "blocks")
+    dolt.add(a, c, "blocks")
+    dolt.working_diff_rows = [_added(a, c)]
+    manager = make_manager(enable_link_index=True, link_index_poll_interval=0)
+    assert len(manager.links_from(a).links) == 2
+
+    # The uncommitted a->c is reverted elsewhere (e.g. DOLT_RESET)
+    dolt.working = "working-2"
+    dolt.working_diff_rows = []
+
+    assert _keys(manager.links_from(a)) == [(a, b, "blocks")]
+    assert len(_link_loads(dolt)) == 1
+
+
+def test_disabled_index_answers_ready_tasks_with_sql(dolt, make_manager):
+    task1, task2, task3 = _ids(3)
+    dolt.add(task3, task2, "blocks")
+    dolt.add(task2, task1, "blocks")
+    manager = make_manager()
+
+    pm_links = ExecutableLinkManager(manager)
+
+    assert pm_links.get_ready_tasks() == [task3]
+    assert pm_links.get_ready_tasks([task1, task2, task3]) == [task3]
+    assert manager._link_snapshots == {}
+
+
+def test_ready_tasks_match_with_and_without_index(dolt, make_manager):
+    a, b, c, d, e = _ids(5)
+    dolt.add(a, b, "blocks")
+    dolt.add(b, c, "blocks")
+    dolt.add(d, a, "related_to")  # d only has outbound links of another relation
+    dolt.add(e, d, "related_to")
+
+    indexed = make_manager(enable_link_index=True)
+    plain = make_manager()
+
+    for relation in ("blocks", "related_to"):
+        assert plain.get_ready_tasks(relation) == indexed.get_ready_tasks(relation)
+    assert plain.get_ready_tasks("blocks") == sorted([a, d, e])
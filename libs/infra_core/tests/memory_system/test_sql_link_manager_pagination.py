@@ -0,0 +1,208 @@
+"""
+Tests for keyset pagination and multi-depth traversal in SQLLinkManager.
+
+The generated SQL is executed against an in-memory SQLite copy of block_links,
+so page boundaries and traversal results are checked end to end without a
+live Dolt server.
+"""
+
+import re
+import sqlite3
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from unittest.mock import patch
+
+from infra_core.memory_system.dolt_mysql_base import DoltConnectionConfig
+from infra_core.memory_system.link_manager import Direction, LinkQuery
+from infra_core.memory_system.sql_link_manager import SQLLinkManager, _page_links
+
+
+class SQLiteLinkTable:
+    """Runs SQLLinkManager's block_links queries on SQLite."""
+
+    def __init__(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute(
+            "CREATE TABLE block_links (to_id TEXT, from_id TEXT, relation TEXT, priority INT, "
+            "link_metadata TEXT, created_by TEXT, created_at TEXT, "
+            "PRIMARY KEY (from_id, to_id, relation))"
+        )
+        self.queries = []
+
+    def add(self, from_id, to_id, relation="related_to", priority=0, created_at=None):
+        created_at = created_at or datetime(2025, 1, 1)
+        self.connection.execute(
+            "INSERT INTO block_links (from_id, to_id, relation, priority, created_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (from_id, to_id, relation, priority, created_at.isoformat(sep=" ")),
+        )
+
+    def execute_query(self, query, params=None):
+        self.queries.append(query)
+        rows = self.connection.execute(query.replace("%s", "?"), tuple(params or ())).fetchall()
+        return [dict(row) for row in rows]
+
+
+def _ids(n):
+    return [str(uuid.UUID(int=i + 1)) for i in range(n)]
+
+
+@pytest.fixture
+def table():
+    return SQLiteLinkTable()
+
+
+@pytest.fixture
+def manager(table):
+    link_manager = SQLLinkManager(DoltConnectionConfig(database="test_db"))
+    with patch.object(link_manager, "_execute_query", side_effect=table.execute_query):
+        yield link_manager
+
+
+def _page_through(fetch, limit):
+    pages, cursor = [], None
+    while True:
+        query = LinkQuery().limit(limit)
+        if cursor:
+            query = query.cursor(cursor)
+        result = fetch(query)
+        pages.append(result.links)
+        cursor = result.next_cursor
+        if not cursor:
+            return pages
+
+
+def test_get_all_links_keyset_pages_cover_every_link_once(manager, table):
+    ids = _ids(60)
+    start = datetime(2025, 1, 1)
+    # Repeated priorities and timestamps force ties to be broken by the ID columns
+    for i in range(1, 60):
+        table.add(ids[0], ids[i], priority=i % 3, created_at=start + timedelta(hours=i % 4))
+        table.add(ids[i], ids[0], relation="mentions", priority=i % 3, created_at=start)
+
+    pages = _page_through(lambda q: manager.get_all_links(q), limit=25)
+
+    links = [link for page in pages for link in page]
+    assert [len(page) for page in pages] == [25, 25, 25, 25, 18]
+    assert len({(link.from_id, link.to_id, link.relation) for link in links}) == 118
+    keys = [
+        (link.priority, link.created_at, link.from_id, link.to_id, link.relation) for link in links
+    ]
+    assert keys == sorted(keys, reverse=True)
+    assert not any("OFFSET" in q for q in table.queries)
+
+
+def test_links_from_pages_with_router_safe_cursor(manager, table):
+    ids = _ids(8)
+    for i in range(1, 8):
+        table.add(ids[0], ids[i], priority=i)
+
+    first = manager.links_from(ids[0], LinkQuery().limit(3))
+
+    assert [link.to_id for link in first.links] == [ids[7], ids[6], ids[5]]
+    assert re.match(r"^[A-Za-z0-9_-]+$", first.next_cursor)
+
+    second = manager.links_from(ids[0], LinkQuery().limit(3).cursor(first.next_cursor))
+    assert [link.to_id for link in second.links] == [ids[4], ids[3], ids[2]]
+
+    last = manager.links_from(ids[0], LinkQuery().limit(3).cursor(second.next_cursor))
+    assert [link.to_id for link in last.links] == [ids[1]]
+    assert last.next_cursor is None
+
+
+def test_exact_page_has_no_next_cursor(manager, table):
+    a, b, c = _ids(3)
+    table.add(a, b)
+    table.add(a, c)
+
+    assert manager.links_from(a, LinkQuery().limit(2)).next_cursor is None
+
+
+def test_null_created_at_pages_like_the_link_snapshot(manager, table):
+    ids = _ids(7)
+    for i in range(1, 7):
+        table.add(ids[0], ids[i], created_at=datetime(2025, 1, i))
+    table.connection.execute(
+        "UPDATE block_links SET created_at = NULL WHERE to_id IN (?, ?, ?)",
+        (ids[2], ids[4], ids[5]),
+    )
+
+    sql_pages = _page_through(lambda query: manager.links_from(ids[0], query), limit=2)
+    links = [link for page in sql_pages for link in page]
+    snapshot_pages = _page_through(lambda query: _page_links(links, query.to_dict()), limit=2)
+
+    assert sorted(link.to_id for link in links) == sorted(ids[1:])
+    assert [[link.to_id for link in page] for page in sql_pages] == [
+        [link.to_id for link in page] for page in snapshot_pages
+    ]
+    # Rows without created_at come last, ordered by the remaining key columns
+    assert [link.to_id for link in links[-3:]] == [ids[5], ids[4], ids[2]]
+
+
+def test_invalid_cursor_raises_value_error(manager):
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        manager.get_all_links(LinkQuery().cursor("not-a-cursor"))
+
+
+def test_links_to_default_and_both_directions(manager, table):
+    a, b, c = _ids(3)
+    table.add(a, b)
+    table.add(b, c)
+
+    assert [link.from_id for link in manager.links_to(b).links] == [a]
+
+    both = manager.links_to(b, LinkQuery().direction(Direction.BOTH))
+    assert {(link.from_id, link.to_id) for link in both.links} == {(a, b), (b, c)}
+
+
+def test_links_from_depth_returns_links_among_reachable_blocks(manager, table):
+    a, b, c, d, e = _ids(5)
+    table.add(a, b, "depends_on")
+    table.add(b, c, "depends_on")
+    table.add(c, d, "depends_on")
+    table.add(e, a, "depends_on")
+
+    result = manager.links_from(a, LinkQuery().relation("depends_on").depth(2))
+    assert {(link.from_id, link.to_id) for link in result.links} == {(a, b), (b, c)}
+
+    result = manager.links_from(
+        a, LinkQuery().relation("depends_on").depth(2).direction(Direction.BOTH)
+    )
+    assert {(link.from_id, link.to_id) for link in result.links} == {(a, b), (b, c), (e, a)}
+
+    result = manager.links_to(c, LinkQuery().depth(3))
+    assert {(link.from_id, link.to_id) for link in result.links} == {(a, b), (b, c), (e, a)}
+
+
+def test_depth_traversal_issues_one_query_per_level(manager, table):
+    ids = _ids(40)
+    # Binary tree: each level is expanded with a single frontier query
+    for i in range(1, 40):
+        table.add(ids[(i - 1) // 2], ids[i], "contains")
+
+    result = manager.links_from(ids[0], LinkQuery().depth(3).limit(1000))
+
+    assert len(result.links) == 14
+    frontier_queries = [q for q in table.queries if "AS neighbor_id" in q]
+    assert len(frontier_queries) == 3
+
+
+def test_depth_traversal_chunks_large_reachable_sets(manager, table):
+    ids = _ids(40)
+    for i in range(1, 40):
+        table.add(ids[(i - 1) // 2], ids[i], "contains", created_at=datetime(2025, 1, 1 + i % 5))
+
+    def pages():
+        return _page_through(lambda q: manager.links_from(ids[0], q.depth(3)), limit=4)
+
+    expected = pages()
+    table.queries.clear()
+    with patch("infra_core.memory_system.sql_link_manager.ID_FILTER_LIMIT", 4):
+        chunked = pages()
+
+    assert chunked == expected
+    assert sum(len(page) for page in chunked) == 14
+    assert max(query.count("%s") for query in table.queries) <= 5
@@ -1576,3 +1576,304 @@ class TestStructuredMemoryBank:
             assert bank.namespace_exists(" Legacy "), (
                 "Default namespace check should handle whitespace"
             )
+
+
+class TestBlockCache:
+    """Read-through block cache keyed by (branch, working-set hash, block_id)."""
+
+    def test_repeated_get_is_served_from_cache(
+        self, memory_bank, mock_dolt_reader, sample_memory_block
+    ):
+        mock_dolt_reader.read_working_set_hash.return_value = "hash-1"
+        mock_dolt_reader.read_memory_block.return_value = sample_memory_block
+
+        first = memory_bank.get_memory_block(sample_memory_block.id)
+        second = memory_bank.get_memory_block(sample_memory_block.id)
+
+        assert first == second == sample_memory_block
+        assert second is not first  # callers get independent copies
+        assert mock_dolt_reader.read_memory_block.call_count == 1
+        stats = memory_bank.block_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_working_set_change_bypasses_stale_entries(
+        self, memory_bank, mock_dolt_reader, sample_memory_block
+    ):
+        mock_dolt_reader.read_memory_block.return_value = sample_memory_block
+        mock_dolt_reader.read_working_set_hash.return_value = "hash-1"
+        memory_bank.get_memory_block(sample_memory_block.id)
+
+        mock_dolt_reader.read_working_set_hash.return_value = "hash-2"
+        memory_bank.get_memory_block(sample_memory_block.id)
+
+        assert mock_dolt_reader.read_memory_block.call_count == 2
+
+    def test_update_invalidates_cached_block(
+        self, memory_bank, mock_dolt_reader, mock_llama_memory, sample_memory_block
+    ):
+        mock_dolt_reader.read_working_set_hash.return_value = "hash-1"
+        mock_dolt_reader.read_memory_block.return_value = sample_memory_block
+        memory_bank.get_memory_block(sample_memory_block.id)
+
+        memory_bank.update_memory_block(sample_memory_block)
+        memory_bank.get_memory_block(sample_memory_block.id)
+
+        assert mock_dolt_reader.read_memory_block.call_count >= 2
+        assert memory_bank.block_cache_stats()["invalidations"] >= 1
+
+    def test_batch_lookup_only_fetches_misses(
+        self, memory_bank, mock_dolt_reader, sample_memory_block
+    ):
+        other = sample_memory_block.model_copy(update={"id": "test-block-002"})
+        mock_dolt_reader.read_working_set_hash.return_value = "hash-1"
+        mock_dolt_reader.read_memory_blocks_by_ids.return_value = [sample_memory_block]
+        memory_bank.get_memory_blocks_by_ids([sample_memory_block.id])
+
+        mock_dolt_reader.read_memory_blocks_by_ids.return_value = [other]
+        result = memory_bank.get_memory_blocks_by_ids([sample_memory_block.id, other.id])
+
+        assert [b.id for b in result] == [sample_memory_block.id, other.id]
+        mock_dolt_reader.read_memory_blocks_by_ids.assert_called_with([other.id], branch="main")
+
+    def test_unknown_working_set_hash_disables_caching(
+        self, memory_bank, mock_dolt_reader, sample_memory_block
+    ):
+        mock_dolt_reader.read_working_set_hash.return_value = None
+        mock_dolt_reader.read_memory_block.return_value = sample_memory_block
+
+        memory_bank.get_memory_block(sample_memory_block.id)
+        memory_bank.get_memory_block(sample_memory_block.id)
+
+        assert mock_dolt_reader.read_memory_block.call_count == 2
+        assert memory_bank.block_cache_stats()["size"] == 0
+
+
+class TestSemanticHydration:
+    """query_semantic hydrates all vector hits in one batch and keeps ranking order."""
+
+    @staticmethod
+    def _hit(block_id, score):
+        hit = MagicMock()
+        hit.node.id_ = block_id
+        hit.score = score
+        return hit
+
+    def test_hits_are_hydrated_in_one_batch_with_scores(
+        self, memory_bank, mock_llama_memory, mock_dolt_reader, sample_memory_block
+    ):
+        second = sample_memory_block.model_copy(update={"id": "test-block-002"})
+        mock_llama_memory.query_vector_store.return_value = [
+            self._hit("test-block-002", 0.91),
+            self._hit("missing-block", 0.85),
+            self._hit(sample_memory_block.id, 0.42),
+        ]
+        # Dolt returns rows in its own order; ranking must come from LlamaIndex
+        mock_dolt_reader.read_memory_blocks_by_ids.return_value = [sample_memory_block, second]
+
+        results = memory_bank.query_semantic_with_scores("test", top_k=3)
+
+        assert [(b.id, s) for b, s in results] == [
+            ("test-block-002", 0.91),
+            (sample_memory_block.id, 0.42),
+        ]
+        mock_dolt_reader.read_memory_blocks_by_ids.assert_called_once_with(
+            ["test-block-002", "missing-block", sample_memory_block.id], branch="main"
+        )
+        mock_dolt_reader.read_memory_block.assert_not_called()
+        assert [b.id for b in memory_bank.query_semantic("test", top_k=3)] == [
+            "test-block-002",
+            sample_memory_block.id,
+        ]
+
+    def test_filters_are_pushed_into_vector_query(self, memory_bank, mock_llama_memory):
+        mock_llama_memory.query_vector_store.return_value = []
+
+        memory_bank.query_semantic_with_scores(
+            "test", top_k=4, type_filter="task", namespace_id="pm", tag_filters=["urgent"]
+        )
+
+        mock_llama_memory.query_vector_store.assert_called_once_with(
+            "test",
+            top_k=4,
+            filters={"type": "task", "namespace_id": "pm", "tag:urgent": True},
+        )
+
+
+class TestBulkDelete:
+    """Set-based delete_memory_blocks: one Dolt transaction, one index delete."""
+
+    def test_deletes_in_one_batch_and_commits_once(
+        self, memory_bank, mock_dolt_writer, mock_llama_memory
+    ):
+        mock_dolt_writer.delete_memory_blocks.return_value = (True, 2)
+
+        assert memory_bank.delete_memory_blocks(["a", "b", "a"]) is True
+
+        mock_dolt_writer.delete_memory_blocks.assert_called_once_with(["a", "b"], branch="main")
+        mock_llama_memory.delete_blocks.assert_called_once_with(["a", "b"])
+        mock_dolt_writer.commit_changes.assert_called_once()
+        mock_dolt_writer.write_block_proofs.assert_called_once_with(
+            block_ids=["a", "b"], operation="delete", commit_hash="mock_commit_hash", branch="main"
+        )
+
+    def test_index_failure_discards_dolt_changes(
+        self, memory_bank, mock_dolt_writer, mock_llama_memory
+    ):
+        mock_dolt_writer.delete_memory_blocks.return_value = (True, 2)
+        mock_llama_memory.delete_blocks.side_effect = RuntimeError("chroma down")
+
+        assert memory_bank.delete_memory_blocks(["a", "b"]) is False
+
+        mock_dolt_writer.discard_changes.assert_called_once()
+        mock_dolt_writer.commit_changes.assert_not_called()
+
+
+
+class TestBulkNamespaceUpdate:
+    """update_blocks_namespace: one Dolt UPDATE, metadata-only index patch, no commit."""
+
+    def test_moves_in_one_batch_and_leaves_commit_to_caller(
+        self, memory_bank, mock_dolt_writer, mock_llama_memory
+    ):
+        mock_dolt_writer.update_blocks_namespace.return_value = (True, 2)
+        mock_dolt_writer.add_to_staging.return_value = (True, "staged")
+
+        assert memory_bank.update_blocks_namespace(["a", "b", "a"], "team") is True
+
+        mock_dolt_writer.update_blocks_namespace.assert_called_once_with(
+            ["a", "b"], "team", branch="main"
+        )
+        mock_llama_memory.update_namespace.assert_called_once_with(["a", "b"], "team")
+        mock_llama_memory.update_block.assert_not_called()
+        mock_dolt_writer.add_to_staging.assert_called_once()
+        mock_dolt_writer.commit_changes.assert_not_called()
+        mock_dolt_writer.write_block_proofs.assert_not_called()
+
+    def test_index_failure_discards_dolt_changes(
+        self, memory_bank, mock_dolt_writer, mock_llama_memory
+    ):
+        mock_dolt_writer.update_blocks_namespace.return_value = (True, 2)
+        mock_llama_memory.update_namespace.side_effect = RuntimeError("chroma down")
+
+        assert memory_bank.update_blocks_namespace(["a", "b"], "team") is False
+
+        mock_dolt_writer.discard_changes.assert_called_once()
+
+
+class TestDiffAwareUpdate:
+    """update_memory_block writes only what changed against the stored block."""
+
+    @pytest.fixture
+    def stored(self, mock_dolt_reader):
+        block = MemoryBlock(
+            id="diff-block",
+            type="knowledge",
+            text="Body",
+            namespace_id="legacy",
+            metadata={"title": "T", "status": "open"},
+        )
+        mock_dolt_reader.read_memory_block.return_value = block
+        with patch(
+            "infra_core.memory_system.structured_memory_bank.embedding_text",
+            side_effect=lambda b: f"{b.metadata.get('title')}|{b.text}",
+        ):
+            yield block
+
+    def test_noop_update_is_skipped(
+        self, memory_bank, stored, mock_dolt_writer, mock_llama_memory
+    ):
+        assert memory_bank.update_memory_block(stored.model_copy()) is True
+
+        mock_dolt_writer.write_memory_block_changes.assert_not_called()
+        mock_dolt_writer.write_memory_block.assert_not_called()
+        mock_llama_memory.update_block.assert_not_called()
+        mock_dolt_writer.write_block_proof.assert_not_called()
+
+    def test_status_change_rewrites_metadata_without_reembedding(
+        self, memory_bank, stored, mock_dolt_writer, mock_llama_memory
+    ):
+        mock_dolt_writer.write_memory_block_changes.return_value = True
+        block = stored.model_copy(update={"metadata": {"title": "T", "status": "done"}})
+
+        assert memory_bank.update_memory_block(block) is True
+
+        mock_dolt_writer.write_memory_block_changes.assert_called_once()
+        mock_dolt_writer.write_memory_block.assert_not_called()
+        mock_llama_memory.update_block_metadata.assert_called_once_with(block)
+        mock_llama_memory.update_block.assert_not_called()
+
+    def test_unindexed_change_leaves_index_alone(
+        self, memory_bank, stored, mock_dolt_writer, mock_llama_memory
+    ):
+        mock_dolt_writer.write_memory_block_changes.return_value = True
+
+        assert memory_bank.update_memory_block(stored.model_copy(update={"block_version": 2}))
+
+        mock_llama_memory.update_block_metadata.assert_not_called()
+        mock_llama_memory.update_block.assert_not_called()
+
+    def test_text_change_reembeds(self, memory_bank, stored, mock_dolt_writer, mock_llama_memory):
+        mock_dolt_writer.write_memory_block_changes.return_value = True
+        block = stored.model_copy(update={"text": "New body"})
+
+        assert memory_bank.update_memory_block(block) is True
+
+        mock_llama_memory.update_block.assert_called_once_with(block)
+        mock_llama_memory.update_block_metadata.assert_not_called()
+
+class TestBulkCreate:
+    """create_memory_blocks: validate all, one Dolt transaction, one bulk index insert."""
+
+    def _blocks(self, namespace_id="legacy"):
+        return [
+            MemoryBlock(type="knowledge", text=f"Block {i}", namespace_id=namespace_id)
+            for i in range(3)
+        ]
+
+    def test_creates_valid_blocks_in_one_batch(
+        self, memory_bank, mock_dolt_writer, mock_llama_memory
+    ):
+        mock_dolt_writer.write_memory_blocks.return_value = True
+        mock_llama_memory.add_blocks.return_value = {"failed_ids": []}
+        blocks = self._blocks()
+
+        errors = memory_bank.create_memory_blocks(blocks)
+
+        assert errors == {block.id: None for block in blocks}
+        mock_dolt_writer.write_memory_blocks.assert_called_once()
+        assert len(mock_dolt_writer.write_memory_blocks.call_args[0][0]) == 3
+        mock_llama_memory.add_blocks.assert_called_once()
+        mock_dolt_writer.commit_changes.assert_called_once()
+        mock_dolt_writer.write_block_proofs.assert_called_once_with(
+            block_ids=[block.id for block in blocks],
+            operation="create",
+            commit_hash="mock_commit_hash",
+            branch="main",
+        )
+
+    def test_index_failure_rolls_back_every_block(
+        self, memory_bank, mock_dolt_writer, mock_llama_memory
+    ):
+        blocks = self._blocks()
+        mock_dolt_writer.write_memory_blocks.return_value = True
+        mock_llama_memory.add_blocks.return_value = {"failed_ids": [blocks[2].id]}
+
+        errors = memory_bank.create_memory_blocks(blocks)
+
+        assert all(error.startswith("Bulk creation failed") for error in errors.values())
+        mock_llama_memory.delete_blocks.assert_called_once_with([blocks[0].id, blocks[1].id])
+        mock_dolt_writer.discard_changes.assert_called_once()
+        mock_dolt_writer.commit_changes.assert_not_called()
+
+    def test_namespace_checked_once_per_batch(self, memory_bank, mock_dolt_writer):
+        mock_dolt_writer.write_memory_blocks.return_value = True
+        with patch(
+            "infra_core.memory_system.structured_memory_bank.validate_namespace_exists",
+            side_effect=KeyError("missing"),
+        ) as validate:
+            errors = memory_bank.create_memory_blocks(self._blocks("team-a"))
+
+        validate.assert_called_once()
+        assert all("Namespace validation failed" in error for error in errors.values())
+        mock_dolt_writer.write_memory_blocks.assert_not_called()
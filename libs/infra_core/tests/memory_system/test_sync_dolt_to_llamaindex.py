@@ -13,7 +13,7 @@ import shutil
 from pathlib import Path
 import logging
 from datetime import datetime, timezone
-from unittest.mock import patch, MagicMock, call
+from unittest.mock import patch, MagicMock
 import importlib
 
 # Configure logging for tests
@@ -36,7 +36,28 @@ DOLTPY_AVAILABLE = importlib.util.find_spec("doltpy") is not None
 # Local imports
 from infra_core.memory_system.schemas.memory_block import MemoryBlock, ConfidenceScore  # noqa: E402
 from infra_core.memory_system.schemas.common import BlockLink  # noqa: E402
-from infra_core.memory_system.scripts.sync_dolt_to_llamaindex import sync_dolt_to_llamaindex  # noqa: E402
+from infra_core.memory_system.scripts.sync_dolt_to_llamaindex import (  # noqa: E402
+    DEFAULT_EMBED_BATCH_SIZE,
+    load_sync_state,
+    save_sync_state,
+    sync_dolt_to_llamaindex,
+)
+
+
+def _metrics(indexed, failed_ids=None):
+    """Build an add_blocks metrics dict for mocked LlamaMemory instances."""
+    failed_ids = failed_ids or []
+    return {
+        "total": indexed + len(failed_ids),
+        "indexed": indexed,
+        "batches": 1,
+        "failed_ids": failed_ids,
+        "embed_seconds": 0.0,
+        "insert_seconds": 0.0,
+        "persist_seconds": 0.0,
+        "elapsed_seconds": 0.5,
+        "blocks_per_second": indexed / 0.5,
+    }
 
 
 def create_test_blocks():
@@ -98,7 +119,6 @@ def create_test_blocks():
 
 
 # Module-level patching to avoid real implementations from being called
-@patch("infra_core.memory_system.scripts.sync_dolt_to_llamaindex.read_memory_blocks")
 @patch("infra_core.memory_system.scripts.sync_dolt_to_llamaindex.LlamaMemory")
 class TestSyncDoltToLlamaIndexUnit(unittest.TestCase):
     """
@@ -113,17 +133,27 @@ class TestSyncDoltToLlamaIndexUnit(unittest.TestCase):
         self.dolt_dir = "/fake/dolt/path"  # Mock path, not used with real Dolt
         self.test_blocks = create_test_blocks()
 
+        # Reader used for head commits and diffs; no head commit unless a test sets one
+        self.reader_patcher = patch(
+            "infra_core.memory_system.scripts.sync_dolt_to_llamaindex.DoltMySQLReader"
+        )
+        self.mock_reader = self.reader_patcher.start().return_value
+        self.mock_reader.read_branch_head.return_value = None
+        self.mock_read_blocks = self.mock_reader.read_memory_blocks
+
     def tearDown(self):
         """Clean up temporary directories."""
+        self.reader_patcher.stop()
         shutil.rmtree(self.temp_dir)
 
-    def test_successful_sync(self, mock_llama_memory_class, mock_read_blocks):
+    def test_successful_sync(self, mock_llama_memory_class):
         """Test successful synchronization with all valid blocks."""
         # Setup mocks
-        mock_read_blocks.return_value = self.test_blocks
+        self.mock_read_blocks.return_value = self.test_blocks
 
         mock_memory = MagicMock()
         mock_memory.is_ready.return_value = True
+        mock_memory.add_blocks.return_value = _metrics(indexed=3)
         mock_llama_memory_class.return_value = mock_memory
 
         # Call the sync function
@@ -134,30 +164,23 @@ class TestSyncDoltToLlamaIndexUnit(unittest.TestCase):
         # Verify success
         self.assertTrue(result, "Sync should report success")
 
-        # Verify that read_memory_blocks was called correctly
-        mock_read_blocks.assert_called_once_with(self.dolt_dir, branch="main")
+        # Verify that blocks were read from the SQL server (working set: no head commit)
+        self.mock_read_blocks.assert_called_once_with(branch="main", as_of=None)
 
         # Verify that LlamaMemory was initialized correctly
         mock_llama_memory_class.assert_called_once_with(chroma_path=self.llama_dir)
 
-        # Verify that each block was added to the memory
-        self.assertEqual(
-            mock_memory.add_block.call_count,
-            3,
-            "Should call add_block for each of the 3 test blocks",
-        )
-
-        # Verify the blocks were added in the right order
-        for i, block in enumerate(self.test_blocks):
-            args, _ = mock_memory.add_block.call_args_list[i]
-            self.assertEqual(
-                args[0].id, block.id, f"Block at position {i} should have ID {block.id}"
-            )
+        # Verify that all blocks were indexed in a single bulk call, in order
+        mock_memory.add_blocks.assert_called_once()
+        args, kwargs = mock_memory.add_blocks.call_args
+        self.assertEqual([b.id for b in args[0]], [b.id for b in self.test_blocks])
+        self.assertEqual(kwargs["batch_size"], DEFAULT_EMBED_BATCH_SIZE)
+        mock_memory.add_block.assert_not_called()
 
-    def test_empty_dolt_db(self, mock_llama_memory_class, mock_read_blocks):
+    def test_empty_dolt_db(self, mock_llama_memory_class):
         """Test sync with an empty Dolt database (no blocks)."""
         # Setup mocks
-        mock_read_blocks.return_value = []
+        self.mock_read_blocks.return_value = []
 
         mock_memory = MagicMock()
         mock_memory.is_ready.return_value = True
@@ -171,10 +194,10 @@ class TestSyncDoltToLlamaIndexUnit(unittest.TestCase):
         # Verify success (even with empty DB)
         self.assertTrue(result, "Sync should report success with empty DB")
 
-        # Verify that add_block was never called (no blocks to add)
-        mock_memory.add_block.assert_not_called()
+        # Verify that nothing was indexed (no blocks to add)
+        mock_memory.add_blocks.assert_not_called()
 
-    def test_llama_memory_not_ready(self, mock_llama_memory_class, mock_read_blocks):
+    def test_llama_memory_not_ready(self, mock_llama_memory_class):
         """Test handling of LlamaMemory initialization failure."""
         # Setup mock - LlamaMemory.is_ready() returns False
         mock_memory = MagicMock()
@@ -190,17 +213,19 @@ class TestSyncDoltToLlamaIndexUnit(unittest.TestCase):
         self.assertFalse(result, "Sync should report failure if LlamaMemory not ready")
 
         # Verify that read_memory_blocks was not called (short-circuit)
-        mock_read_blocks.assert_not_called()
+        self.mock_read_blocks.assert_not_called()
 
-    def test_block_indexing_error(self, mock_llama_memory_class, mock_read_blocks):
+    def test_block_indexing_error(self, mock_llama_memory_class):
         """Test handling of errors during block indexing."""
         # Setup mocks
-        mock_read_blocks.return_value = self.test_blocks
+        self.mock_read_blocks.return_value = self.test_blocks
 
-        # Create a mock LlamaMemory instance that throws an exception on the second add_block call
+        # Create a mock LlamaMemory instance whose bulk insert fails for one block
         mock_memory = MagicMock()
         mock_memory.is_ready.return_value = True
-        mock_memory.add_block.side_effect = [None, Exception("Test indexing error"), None]
+        mock_memory.add_blocks.return_value = _metrics(
+            indexed=2, failed_ids=[self.test_blocks[1].id]
+        )
         mock_llama_memory_class.return_value = mock_memory
 
         # Call the sync function
@@ -211,15 +236,90 @@ class TestSyncDoltToLlamaIndexUnit(unittest.TestCase):
         # Verify failure
         self.assertFalse(result, "Sync should report failure if any block fails during indexing")
 
-        # Verify all blocks were attempted
-        expected_calls = [call(block) for block in self.test_blocks]
-        mock_memory.add_block.assert_has_calls(expected_calls, any_order=False)
+        # Verify all blocks were handed to the bulk indexer
+        args, _ = mock_memory.add_blocks.call_args
+        self.assertEqual(len(args[0]), 3, "Should try to add all blocks even after error")
 
-        # Verify mocks were called the expected number of times
-        self.assertEqual(
-            mock_memory.add_block.call_count, 3, "Should try to add all blocks even after error"
+    def _ready_memory(self, mock_llama_memory_class, indexed=0):
+        mock_memory = MagicMock()
+        mock_memory.is_ready.return_value = True
+        mock_memory.add_blocks.return_value = _metrics(indexed=indexed)
+        mock_llama_memory_class.return_value = mock_memory
+        return mock_memory
+
+    def test_full_sync_records_head_commit(self, mock_llama_memory_class):
+        """A successful sync stores the branch head next to the Chroma collection."""
+        self.mock_read_blocks.return_value = self.test_blocks
+        self._ready_memory(mock_llama_memory_class, indexed=3)
+        self.mock_reader.read_branch_head.return_value = "commit-1"
+
+        self.assertTrue(
+            sync_dolt_to_llamaindex(dolt_db_path=self.dolt_dir, llama_storage_path=self.llama_dir)
         )
 
+        self.mock_read_blocks.assert_called_once_with(branch="main", as_of="commit-1")
+        state = load_sync_state(self.llama_dir)
+        self.assertEqual(state["main"]["commit_hash"], "commit-1")
+
+    def test_incremental_sync_only_touches_changed_blocks(self, mock_llama_memory_class):
+        """Only blocks reported by DOLT_DIFF are re-embedded or deleted."""
+        mock_memory = self._ready_memory(mock_llama_memory_class, indexed=1)
+        save_sync_state(self.llama_dir, "main", "commit-1")
+        self.mock_reader.read_branch_head.return_value = "commit-2"
+        self.mock_reader.read_block_changes.return_value = {
+            "upserted": ["test-block-2"],
+            "deleted": ["gone-block"],
+        }
+        self.mock_reader.read_memory_blocks_by_ids.return_value = [self.test_blocks[1]]
+
+        result = sync_dolt_to_llamaindex(
+            dolt_db_path=self.dolt_dir, llama_storage_path=self.llama_dir, incremental=True
+        )
+
+        self.assertTrue(result)
+        self.mock_read_blocks.assert_not_called()
+        self.mock_reader.read_block_changes.assert_called_once_with("commit-1", "commit-2")
+        self.mock_reader.read_memory_blocks_by_ids.assert_called_once_with(
+            ["test-block-2"], branch="main", as_of="commit-2"
+        )
+        mock_memory.delete_blocks.assert_called_once_with(["gone-block"])
+        args, kwargs = mock_memory.add_blocks.call_args
+        self.assertEqual([b.id for b in args[0]], ["test-block-2"])
+        self.assertTrue(kwargs["replace_existing"])
+        self.assertEqual(load_sync_state(self.llama_dir)["main"]["commit_hash"], "commit-2")
+
+    def test_incremental_sync_up_to_date_is_noop(self, mock_llama_memory_class):
+        """Nothing is read or indexed when the branch head has not moved."""
+        mock_memory = self._ready_memory(mock_llama_memory_class)
+        save_sync_state(self.llama_dir, "main", "commit-1")
+        self.mock_reader.read_branch_head.return_value = "commit-1"
+
+        result = sync_dolt_to_llamaindex(
+            dolt_db_path=self.dolt_dir, llama_storage_path=self.llama_dir, incremental=True
+        )
+
+        self.assertTrue(result)
+        self.mock_reader.read_block_changes.assert_not_called()
+        self.mock_read_blocks.assert_not_called()
+        mock_memory.add_blocks.assert_not_called()
+
+    def test_incremental_sync_falls_back_to_full_when_diff_fails(self, mock_llama_memory_class):
+        """An unusable sync state (e.g. rewritten history) triggers a full resync."""
+        self.mock_read_blocks.return_value = self.test_blocks
+        mock_memory = self._ready_memory(mock_llama_memory_class, indexed=3)
+        save_sync_state(self.llama_dir, "main", "missing-commit")
+        self.mock_reader.read_branch_head.return_value = "commit-2"
+        self.mock_reader.read_block_changes.side_effect = Exception("commit not found")
+
+        result = sync_dolt_to_llamaindex(
+            dolt_db_path=self.dolt_dir, llama_storage_path=self.llama_dir, incremental=True
+        )
+
+        self.assertTrue(result)
+        self.mock_read_blocks.assert_called_once_with(branch="main", as_of="commit-2")
+        self.assertEqual(len(mock_memory.add_blocks.call_args[0][0]), 3)
+        self.assertEqual(load_sync_state(self.llama_dir)["main"]["commit_hash"], "commit-2")
+
 
 @unittest.skipIf(not DOLTPY_AVAILABLE, "doltpy not installed, skipping integration tests")
 class TestSyncDoltToLlamaIndexIntegration(unittest.TestCase):
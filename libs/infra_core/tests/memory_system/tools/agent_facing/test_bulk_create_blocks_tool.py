@@ -13,13 +13,16 @@ from datetime import datetime
 from unittest.mock import Mock, patch
 
 from infra_core.memory_system.tools.agent_facing.bulk_create_blocks_tool import (
+    _core_input,
     bulk_create_blocks,
     BulkCreateBlocksInput,
     BlockSpec,
 )
 from infra_core.memory_system.tools.memory_core.create_memory_block_tool import (
+    create_memory_block,
     CreateMemoryBlockOutput,
 )
+from infra_core.memory_system.structured_memory_bank import StructuredMemoryBank
 
 
 class TestBulkCreateBlocksTool:
@@ -348,3 +351,85 @@ class TestBulkCreateBlocksTool:
             assert result.failed_blocks == 2
             assert len(result.results) == 2
             assert all(not r.success for r in result.results)
+
+
+class TestBulkCreateBlocksBatched:
+    """Tests for the batched path taken with a StructuredMemoryBank."""
+
+    def setup_method(self):
+        """Set up a StructuredMemoryBank mock that creates whatever it is given."""
+        self.mock_memory_bank = Mock(spec=StructuredMemoryBank)
+        self.mock_memory_bank.dolt_writer = Mock()
+        self.mock_memory_bank.dolt_writer.active_branch = "test-branch"
+        self.mock_memory_bank.get_latest_schema_version.return_value = 1
+        self.mock_memory_bank.create_memory_blocks.side_effect = lambda blocks, **_: {
+            block.id: None for block in blocks
+        }
+
+    def _specs(self):
+        return [
+            BlockSpec(type="knowledge", text="Knowledge", metadata={"title": "K"}),
+            BlockSpec(type="task", text="Invalid task", metadata={"status": "not-a-status"}),
+            BlockSpec(type="knowledge", text="More knowledge", metadata={"title": "K2"}),
+        ]
+
+    def test_valid_blocks_created_in_one_call(self):
+        """Test a cached schema lookup per type and a single create_memory_blocks call."""
+        input_data = BulkCreateBlocksInput(blocks=self._specs())
+
+        with patch(
+            "infra_core.memory_system.tools.agent_facing.bulk_create_blocks_tool.create_memory_block"
+        ) as mock_create:
+            result = bulk_create_blocks(input_data, self.mock_memory_bank)
+
+        mock_create.assert_not_called()
+        self.mock_memory_bank.create_memory_blocks.assert_called_once()
+        created = self.mock_memory_bank.create_memory_blocks.call_args[0][0]
+        assert [block.text for block in created] == ["Knowledge", "More knowledge"]
+        assert created[0].metadata["x_tool_id"] == "BulkCreateBlocks"
+        self.mock_memory_bank.get_latest_schema_version.assert_called_once_with("knowledge")
+
+        assert [r.success for r in result.results] == [True, False, True]
+        assert result.results[0].id == created[0].id
+        assert result.results[1].id is None and result.results[1].error
+        assert (result.successful_blocks, result.failed_blocks) == (2, 1)
+
+    def test_stop_on_first_error_keeps_preceding_blocks_only(self):
+        """Test that specs after the first invalid one are neither created nor reported."""
+        input_data = BulkCreateBlocksInput(blocks=self._specs(), stop_on_first_error=True)
+
+        result = bulk_create_blocks(input_data, self.mock_memory_bank)
+
+        created = self.mock_memory_bank.create_memory_blocks.call_args[0][0]
+        assert [block.text for block in created] == ["Knowledge"]
+        assert [r.success for r in result.results] == [True, False]
+        assert result.total_blocks == 3
+
+    def test_failed_batch_reports_every_block(self):
+        """Test that a failed batch persistence fails each pending block."""
+        self.mock_memory_bank.create_memory_blocks.side_effect = lambda blocks, **_: {
+            block.id: "Bulk creation failed: commit" for block in blocks
+        }
+        input_data = BulkCreateBlocksInput(blocks=[self._specs()[0], self._specs()[2]])
+
+        result = bulk_create_blocks(input_data, self.mock_memory_bank)
+
+        assert result.partial_success is False
+        assert all(r.error == "Bulk creation failed: commit" for r in result.results)
+
+    def test_invalid_spec_reports_single_create_error(self):
+        """Test that both paths reject a spec with the same build_memory_block error."""
+        # Pin x_timestamp: otherwise each path stamps its own, and it is part of the error
+        spec = BlockSpec(
+            type="task",
+            text="Invalid task",
+            metadata={"status": "not-a-status", "x_timestamp": datetime(2025, 1, 1)},
+        )
+        input_data = BulkCreateBlocksInput(blocks=[spec])
+
+        bulk = bulk_create_blocks(input_data, self.mock_memory_bank)
+        single = create_memory_block(_core_input(spec, input_data), self.mock_memory_bank)
+
+        assert single.success is False
+        assert bulk.results[0].error == single.error
+        self.mock_memory_bank.create_memory_blocks.assert_not_called()
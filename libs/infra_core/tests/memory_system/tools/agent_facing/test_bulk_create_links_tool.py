@@ -17,6 +17,7 @@ from infra_core.memory_system.tools.agent_facing.bulk_create_links_tool import (
 )
 from infra_core.memory_system.link_manager import LinkError, LinkErrorType
 from infra_core.memory_system.schemas.common import BlockLink
+from infra_core.memory_system.sql_link_manager import SQLLinkManager
 
 
 class TestBulkCreateLinksTool:
@@ -608,3 +609,110 @@ class TestBulkCreateLinksTool:
 
             # Verify bulk_upsert was called
             mock_memory_bank.link_manager.bulk_upsert.assert_called_once()
+
+    def test_link_manager_uses_single_bulk_upsert(self, mock_memory_bank, sample_block_ids):
+        """Test that a real LinkManager gets every spec in one bulk_upsert call."""
+        mock_memory_bank.link_manager = Mock(spec=SQLLinkManager)
+
+        link_specs = [
+            LinkSpec(
+                from_id=sample_block_ids["block1"],
+                to_id=sample_block_ids["block2"],
+                relation="blocks",
+                priority=3,
+                created_by="test_agent",
+                bidirectional=True,
+            ),
+            LinkSpec(
+                from_id=sample_block_ids["block3"],
+                to_id=sample_block_ids["block4"],
+                relation="related_to",
+                metadata={"note": "x"},
+            ),
+        ]
+
+        result = bulk_create_links(
+            BulkCreateLinksInput(links=link_specs, validate_blocks_exist=False), mock_memory_bank
+        )
+
+        assert result.success is True
+        assert result.partial_success is True
+        assert result.successful_specs == 2
+        assert result.failed_specs == 0
+        assert result.total_actual_links == 3
+        assert [r.links_created for r in result.results] == [2, 1]
+        mock_memory_bank.link_manager.upsert_link.assert_not_called()
+        (links,) = mock_memory_bank.link_manager.bulk_upsert.call_args[0]
+        block1, block2, block3, block4 = sample_block_ids.values()
+        assert links == [
+            (block1, block2, "blocks", None, 3, "test_agent"),
+            (block2, block1, "is_blocked_by", None, 3, "test_agent"),
+            (block3, block4, "related_to", {"note": "x"}, 0, None),
+        ]
+
+    def test_rejected_bulk_upsert_falls_back_to_per_link(self, mock_memory_bank, sample_block_ids):
+        """Test that a rejected batch is retried link by link to report each failure."""
+        link_manager = Mock(spec=SQLLinkManager)
+        link_manager.bulk_upsert.side_effect = LinkError(
+            LinkErrorType.CYCLE_DETECTED, "Creating links would introduce a cycle"
+        )
+
+        def mock_upsert(from_id, to_id, relation, **kwargs):
+            if from_id == sample_block_ids["block2"]:
+                raise LinkError(LinkErrorType.CYCLE_DETECTED, "cycle")
+            return BlockLink(from_id=from_id, to_id=to_id, relation=relation)
+
+        link_manager.upsert_link.side_effect = mock_upsert
+        mock_memory_bank.link_manager = link_manager
+
+        link_specs = [
+            LinkSpec(
+                from_id=sample_block_ids["block1"],
+                to_id=sample_block_ids["block2"],
+                relation="depends_on",
+            ),
+            LinkSpec(
+                from_id=sample_block_ids["block2"],
+                to_id=sample_block_ids["block1"],
+                relation="depends_on",
+            ),
+        ]
+
+        result = bulk_create_links(
+            BulkCreateLinksInput(links=link_specs, validate_blocks_exist=False), mock_memory_bank
+        )
+
+        assert result.success is False
+        assert result.partial_success is True
+        assert [r.success for r in result.results] == [True, False]
+        assert link_manager.upsert_link.call_count == 2
+
+    def test_bulk_upsert_connection_error_is_not_retried(self, mock_memory_bank, sample_block_ids):
+        """Test that a non-rejection batch error fails every spec without per-link writes."""
+        link_manager = Mock(spec=SQLLinkManager)
+        link_manager.bulk_upsert.side_effect = ConnectionError("Lost connection to MySQL server")
+        mock_memory_bank.link_manager = link_manager
+
+        link_specs = [
+            LinkSpec(
+                from_id=sample_block_ids["block1"],
+                to_id=sample_block_ids["block2"],
+                relation="depends_on",
+            ),
+            LinkSpec(
+                from_id=sample_block_ids["block3"],
+                to_id=sample_block_ids["block4"],
+                relation="related_to",
+            ),
+        ]
+
+        result = bulk_create_links(
+            BulkCreateLinksInput(links=link_specs, validate_blocks_exist=False), mock_memory_bank
+        )
+
+        assert result.success is False
+        assert result.partial_success is False
+        assert result.failed_specs == 2
+        assert result.total_actual_links == 0
+        assert all("Lost connection" in r.error for r in result.results)
+        link_manager.upsert_link.assert_not_called()
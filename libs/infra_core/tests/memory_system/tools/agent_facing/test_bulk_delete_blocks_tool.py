@@ -23,6 +23,8 @@ from infra_core.memory_system.tools.memory_core.delete_memory_block_models impor
     DeleteMemoryBlockOutput,
     DeleteErrorCode,
 )
+from infra_core.memory_system.dolt_mysql_base import MainBranchProtectionError
+from infra_core.memory_system.structured_memory_bank import StructuredMemoryBank
 
 
 class TestBulkDeleteBlocksTool:
@@ -764,3 +766,114 @@ class TestBulkDeleteBlocksTool:
 
             # Verify all blocks were attempted
             assert mock_delete.call_count == 3
+
+
+class TestBulkDeleteBlocksBatched:
+    """Tests for the batched path taken with a StructuredMemoryBank."""
+
+    BLOCK_IDS = [f"12345678-1234-1234-1234-12345678900{i}" for i in range(1, 5)]
+
+    def setup_method(self):
+        """Set up a StructuredMemoryBank mock holding the first three blocks."""
+        self.mock_memory_bank = Mock(spec=StructuredMemoryBank)
+        self.mock_memory_bank.branch = "test-branch"
+        self.mock_memory_bank.dolt_writer = Mock()
+        self.mock_memory_bank.dolt_writer.active_branch = "test-branch"
+        self.mock_memory_bank.dolt_writer.commit_changes.return_value = (True, "hash_123")
+        self.mock_memory_bank.get_memory_blocks_by_ids.return_value = [
+            Mock(id=block_id, type="task", block_version=1) for block_id in self.BLOCK_IDS[:3]
+        ]
+        self.mock_memory_bank.get_link_sources.return_value = {
+            self.BLOCK_IDS[1]: ["aaaaaaaa-bbbb-cccc-dddd-123456789001"]
+        }
+        self.mock_memory_bank.delete_memory_blocks.return_value = True
+
+    def test_validates_once_and_deletes_in_one_batch(self):
+        """Test one existence read, one dependency query and one delete call."""
+        input_data = BulkDeleteBlocksInput(
+            blocks=[
+                DeleteSpec(block_id=self.BLOCK_IDS[0]),
+                DeleteSpec(block_id=self.BLOCK_IDS[1]),
+                DeleteSpec(block_id=self.BLOCK_IDS[2], validate_dependencies=False),
+                DeleteSpec(block_id=self.BLOCK_IDS[3]),
+            ]
+        )
+
+        with patch(
+            "infra_core.memory_system.tools.agent_facing.bulk_delete_blocks_tool.delete_memory_block_core"
+        ) as mock_delete:
+            result = bulk_delete_blocks(input_data, self.mock_memory_bank)
+
+        mock_delete.assert_not_called()
+        bank = self.mock_memory_bank
+        bank.get_memory_blocks_by_ids.assert_called_once_with(self.BLOCK_IDS)
+        bank.get_link_sources.assert_called_once_with(
+            [self.BLOCK_IDS[0], self.BLOCK_IDS[1], self.BLOCK_IDS[3]]
+        )
+        bank.delete_memory_blocks.assert_called_once_with([self.BLOCK_IDS[0], self.BLOCK_IDS[2]])
+        bank._store_block_proofs.assert_called_once_with(
+            [self.BLOCK_IDS[0], self.BLOCK_IDS[2]], "delete", "hash_123"
+        )
+
+        assert [r.success for r in result.results] == [True, False, True, False]
+        assert result.results[0].deleted_block_type == "task"
+        assert "1 dependent blocks" in result.results[1].error
+        assert result.error_summary == {"DEPENDENCIES_EXIST": 1, "BLOCK_NOT_FOUND": 1}
+        assert result.successful_blocks == 2
+
+    def test_stop_on_first_error_deletes_only_preceding_blocks(self):
+        """Test that specs after the first rejection are skipped, not deleted."""
+        input_data = BulkDeleteBlocksInput(
+            blocks=[DeleteSpec(block_id=block_id) for block_id in self.BLOCK_IDS[:3]],
+            stop_on_first_error=True,
+        )
+
+        result = bulk_delete_blocks(input_data, self.mock_memory_bank)
+
+        self.mock_memory_bank.delete_memory_blocks.assert_called_once_with([self.BLOCK_IDS[0]])
+        assert result.skipped_block_ids == [self.BLOCK_IDS[2]]
+        assert result.successful_blocks == 1
+
+    def test_failed_batch_fails_every_accepted_block(self):
+        """Test that a failed batch delete reports DELETION_FAILED and commits nothing."""
+        self.mock_memory_bank.delete_memory_blocks.return_value = False
+        input_data = BulkDeleteBlocksInput(
+            blocks=[DeleteSpec(block_id=block_id) for block_id in self.BLOCK_IDS[:3]],
+            default_validate_dependencies=False,
+        )
+
+        result = bulk_delete_blocks(input_data, self.mock_memory_bank)
+
+        assert result.partial_success is False
+        assert result.error_summary == {"DELETION_FAILED": 3}
+        self.mock_memory_bank.dolt_writer.commit_changes.assert_not_called()
+
+    def test_branch_protection_fails_every_accepted_block(self):
+        """Test that a protected branch is reported per block instead of raising."""
+        self.mock_memory_bank.delete_memory_blocks.side_effect = MainBranchProtectionError(
+            "delete_memory_blocks", "main"
+        )
+        input_data = BulkDeleteBlocksInput(
+            blocks=[DeleteSpec(block_id=block_id) for block_id in self.BLOCK_IDS[:3]],
+            default_validate_dependencies=False,
+        )
+
+        result = bulk_delete_blocks(input_data, self.mock_memory_bank)
+
+        assert result.error_summary == {"DELETION_FAILED": 3}
+        assert all("main" in r.error for r in result.results)
+        self.mock_memory_bank.dolt_writer.commit_changes.assert_not_called()
+
+    def test_parent_and_child_deleted_together(self):
+        """Test that a link from a parent deleted earlier in the batch does not block its child."""
+        parent_id, child_id = self.BLOCK_IDS[0], self.BLOCK_IDS[1]
+        self.mock_memory_bank.get_link_sources.return_value = {child_id: [parent_id]}
+        input_data = BulkDeleteBlocksInput(
+            blocks=[DeleteSpec(block_id=parent_id), DeleteSpec(block_id=child_id)],
+            default_validate_dependencies=True,
+        )
+
+        result = bulk_delete_blocks(input_data, self.mock_memory_bank)
+
+        assert [r.success for r in result.results] == [True, True]
+        self.mock_memory_bank.delete_memory_blocks.assert_called_once_with([parent_id, child_id])
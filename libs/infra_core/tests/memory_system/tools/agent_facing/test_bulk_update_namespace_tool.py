@@ -15,6 +15,7 @@ from infra_core.memory_system.tools.agent_facing.bulk_update_namespace_tool impo
 )
 from infra_core.memory_system.tools.memory_core.update_memory_block_models import UpdateErrorCode
 from infra_core.memory_system.schemas.memory_block import MemoryBlock
+from infra_core.memory_system.structured_memory_bank import StructuredMemoryBank
 
 
 class TestBulkUpdateNamespaceTool:
@@ -423,3 +424,73 @@ class TestBulkUpdateNamespaceTool:
             # Check error summary
             assert "BLOCK_NOT_FOUND" in result.error_summary
             assert result.error_summary["BLOCK_NOT_FOUND"] == 2
+
+
+class TestBulkUpdateNamespaceBatched:
+    """Tests for the set-based path taken with a StructuredMemoryBank."""
+
+    BLOCK_IDS = [f"12345678-1234-1234-1234-12345678900{i}" for i in range(1, 5)]
+
+    def setup_method(self):
+        """Set up a StructuredMemoryBank mock holding the first three blocks."""
+        self.mock_memory_bank = Mock(spec=StructuredMemoryBank)
+        self.mock_memory_bank.branch = "test-branch"
+        self.mock_memory_bank.dolt_writer = Mock()
+        self.mock_memory_bank.dolt_writer.add_to_staging.return_value = (True, "staged")
+        self.mock_memory_bank.dolt_writer.commit_changes.return_value = (True, "hash_123")
+        namespaces = ["old-namespace", "new-namespace", "old-namespace"]
+        self.mock_memory_bank.get_memory_blocks_by_ids.return_value = [
+            Mock(id=block_id, namespace_id=namespace, block_version=3)
+            for block_id, namespace in zip(self.BLOCK_IDS[:3], namespaces)
+        ]
+        self.mock_memory_bank.update_blocks_namespace.return_value = True
+
+    def _run(self, **kwargs):
+        input_data = BulkUpdateNamespaceInput(
+            blocks=[BlockUpdateSpec(block_id=block_id) for block_id in self.BLOCK_IDS],
+            target_namespace_id="new-namespace",
+            **kwargs,
+        )
+        with patch(
+            "infra_core.memory_system.tools.agent_facing.dolt_namespace_tool.list_namespaces_tool"
+        ) as mock_list_namespaces:
+            mock_namespace = Mock()
+            mock_namespace.id = "new-namespace"
+            mock_list_namespaces.return_value = Mock(success=True, namespaces=[mock_namespace])
+            with patch(
+                "infra_core.memory_system.tools.agent_facing.bulk_update_namespace_tool.update_memory_block_core"
+            ) as mock_update:
+                result = bulk_update_namespace(input_data, self.mock_memory_bank)
+        mock_update.assert_not_called()
+        return result
+
+    def test_moves_blocks_with_one_update_one_commit_and_one_proof_batch(self):
+        """Test one batched read, one namespace update, one commit and one proof insert."""
+        result = self._run()
+
+        bank = self.mock_memory_bank
+        bank.get_memory_blocks_by_ids.assert_called_once_with(self.BLOCK_IDS)
+        bank.update_blocks_namespace.assert_called_once_with(
+            [self.BLOCK_IDS[0], self.BLOCK_IDS[2]], "new-namespace"
+        )
+        bank.dolt_writer.commit_changes.assert_called_once()
+        bank._store_block_proofs.assert_called_once_with(self.BLOCK_IDS[:3], "update", "hash_123")
+
+        assert [r.success for r in result.results] == [True, True, True, False]
+        assert [r.block_version for r in result.results[:3]] == [4, 3, 4]
+        assert result.results[1].previous_namespace == "new-namespace"
+        assert result.results[3].error_code == UpdateErrorCode.BLOCK_NOT_FOUND
+        assert result.successful_blocks == 3
+
+    def test_failed_batch_fails_only_moved_blocks(self):
+        """Test that a failed namespace update fails the moved blocks and skips the commit."""
+        self.mock_memory_bank.update_blocks_namespace.return_value = False
+
+        result = self._run(stop_on_first_error=True)
+
+        assert [r.success for r in result.results] == [False, True, False, False]
+        assert result.results[0].error_code == UpdateErrorCode.PERSISTENCE_FAILURE
+        assert result.skipped_block_ids == []
+        self.mock_memory_bank._store_block_proofs.assert_called_once_with(
+            [self.BLOCK_IDS[1]], "update", "hash_123"
+        )
@@ -0,0 +1,133 @@
+"""
+Tests for GetProjectGraphTool.
+
+The memory bank is mocked so the tests check how the traversal result and the
+batched block hydration are assembled into the nested graph.
+"""
+
+from unittest.mock import MagicMock
+
+from infra_core.memory_system.schemas.memory_block import MemoryBlock
+from infra_core.memory_system.structured_memory_bank import StructuredMemoryBank
+from infra_core.memory_system.tools.agent_facing.get_project_graph_tool import (
+    GetProjectGraphInput,
+    get_project_graph_core,
+    get_project_graph_tool,
+)
+
+
+def _block(block_id, block_type, title, **metadata):
+    return MemoryBlock(
+        id=block_id, type=block_type, text=title, metadata={"title": title, **metadata}
+    )
+
+
+def _link(from_id, to_id, relation):
+    return {"from_id": from_id, "to_id": to_id, "relation": relation, "priority": 0}
+
+
+class TestGetProjectGraphTool:
+    """Test suite for project graph retrieval."""
+
+    def setup_method(self):
+        self.blocks = {
+            "project": _block("project", "project", "Project"),
+            "epic": _block("epic", "epic", "Epic"),
+            "task-a": _block("task-a", "task", "Task A", priority="P0"),
+            "task-b": _block("task-b", "task", "Task B", priority="P1"),
+        }
+        self.memory_bank = MagicMock(spec=StructuredMemoryBank)
+        self.memory_bank.branch = "feature"
+        self.memory_bank.dolt_reader = MagicMock()
+        self.memory_bank.dolt_reader.read_link_graph.return_value = {
+            "depths": {"project": 0, "epic": 1, "task-a": 2, "task-b": 2},
+            "links": [
+                _link("project", "epic", "contains"),
+                _link("task-a", "epic", "child_of"),
+                _link("task-b", "epic", "child_of"),
+                _link("task-b", "task-a", "depends_on"),
+            ],
+        }
+        self.memory_bank.get_memory_blocks_by_ids.side_effect = lambda ids, branch=None: [
+            self.blocks[block_id] for block_id in ids if block_id in self.blocks
+        ]
+
+    def test_builds_nested_graph_from_single_traversal(self):
+        result = get_project_graph_core(
+            GetProjectGraphInput(root_block_id="project", max_depth=4), self.memory_bank
+        )
+
+        assert result.success is True
+        assert result.total_nodes == 4
+        assert result.max_depth_reached == 2
+        self.memory_bank.dolt_reader.read_link_graph.assert_called_once_with(
+            root_id="project",
+            max_depth=4,
+            relations=None,
+            include_inbound=False,
+            namespace_id=None,
+            branch="feature",
+        )
+        self.memory_bank.get_memory_blocks_by_ids.assert_called_once()
+
+        (epic,) = result.root_node.children
+        assert epic.block_id == "epic"
+        assert epic.relationship_type == "contains"
+        assert [c.block_id for c in epic.children] == ["task-a", "task-b"]
+        task_b = epic.children[1]
+        assert [d.block_id for d in task_b.dependencies] == ["task-a"]
+        assert task_b.dependencies[0].children == []
+
+    def test_reverse_dependencies_follow_inbound_links(self):
+        result = get_project_graph_core(
+            GetProjectGraphInput(root_block_id="project", include_reverse_dependencies=True),
+            self.memory_bank,
+        )
+
+        assert self.memory_bank.dolt_reader.read_link_graph.call_args.kwargs["include_inbound"]
+        task_a = result.root_node.children[0].children[0]
+        assert [d.block_id for d in task_a.dependents] == ["task-b"]
+
+    def test_hierarchy_cycle_is_broken(self):
+        self.memory_bank.dolt_reader.read_link_graph.return_value = {
+            "depths": {"project": 0, "epic": 1, "task-a": 1},
+            "links": [
+                _link("project", "epic", "contains"),
+                _link("project", "task-a", "contains"),
+                _link("epic", "task-a", "contains"),
+                _link("task-a", "epic", "contains"),
+            ],
+        }
+
+        result = get_project_graph_core(
+            GetProjectGraphInput(root_block_id="project"), self.memory_bank
+        )
+
+        assert result.success is True
+        assert result.cycles_detected == ["task-a", "epic"]
+        assert result.model_dump()["total_nodes"] == 3
+
+    def test_missing_root_returns_error(self):
+        self.memory_bank.get_memory_blocks_by_ids.side_effect = None
+        self.memory_bank.get_memory_blocks_by_ids.return_value = []
+
+        result = get_project_graph_core(
+            GetProjectGraphInput(root_block_id="project"), self.memory_bank
+        )
+
+        assert result.success is False
+        assert "project" in result.error
+
+    def test_traversal_failure_is_reported(self):
+        self.memory_bank.dolt_reader.read_link_graph.side_effect = Exception("db down")
+
+        result = get_project_graph_core(
+            GetProjectGraphInput(root_block_id="project"), self.memory_bank
+        )
+
+        assert result.success is False
+        assert "db down" in result.error
+
+    def test_tool_initialization(self):
+        assert get_project_graph_tool.name == "GetProjectGraph"
+        assert get_project_graph_tool.memory_linked is True
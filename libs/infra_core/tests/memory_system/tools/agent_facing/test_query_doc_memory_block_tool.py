@@ -31,7 +31,7 @@ def mock_memory_bank():
         success=True, blocks=[], timestamp=datetime.now()
     )
     # This is for the bank instance if called directly, but we'll patch the imported function.
-    bank.query_semantic.return_value = []  # or appropriate mock for core query method
+    bank.query_semantic_with_scores.return_value = []  # or appropriate mock for core query method
     bank.query_memory_blocks_core = MagicMock(return_value=mock_core_output)
     return bank
 
@@ -299,10 +299,10 @@ def test_update_memory_block_tool_no_changes(mock_memory_bank, sample_memory_blo
     result = update_memory_block_tool(input_data, mock_memory_bank)
 
     assert result.success is True
-    # Should still increment version and update timestamp
-    assert result.new_version == 6
-    assert "block_version" in result.fields_updated
-    assert "updated_at" in result.fields_updated
+    # Nothing changed, so the version stays put and nothing is written
+    assert result.new_version == 5
+    assert result.fields_updated == []
+    mock_memory_bank.update_memory_block.assert_not_called()
 
 
 def test_update_memory_block_tool_exception_handling(mock_memory_bank):
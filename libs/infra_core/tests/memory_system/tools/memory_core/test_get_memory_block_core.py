@@ -34,8 +34,8 @@ def sample_input():
 
 def test_get_memory_block_success(mock_memory_bank, sample_input, sample_memory_block):
     """Test successful memory block retrieval."""
-    # Configure mock to return the sample block in a list (since get_all_memory_blocks returns a list)
-    mock_memory_bank.get_all_memory_blocks.return_value = [sample_memory_block]
+    # Configure mock to return the sample block in a list (get_memory_blocks_by_ids returns a list)
+    mock_memory_bank.get_memory_blocks_by_ids.return_value = [sample_memory_block]
 
     # Call the function
     result = get_memory_block_core(sample_input, mock_memory_bank)
@@ -47,13 +47,16 @@ def test_get_memory_block_success(mock_memory_bank, sample_input, sample_memory_
     assert result.error is None
 
     # Verify the mock was called correctly with branch parameter
-    mock_memory_bank.get_all_memory_blocks.assert_called_once_with(branch="main")
+    mock_memory_bank.get_memory_blocks_by_ids.assert_called_once_with(
+        ["test-block-123"], branch="main"
+    )
+    mock_memory_bank.get_all_memory_blocks.assert_not_called()
 
 
 def test_get_memory_block_not_found(mock_memory_bank, sample_input):
     """Test memory block not found scenario."""
     # Configure mock to return empty list (no blocks found)
-    mock_memory_bank.get_all_memory_blocks.return_value = []
+    mock_memory_bank.get_memory_blocks_by_ids.return_value = []
 
     # Call the function
     result = get_memory_block_core(sample_input, mock_memory_bank)
@@ -73,8 +76,8 @@ def test_get_memory_block_multiple_ids(mock_memory_bank, sample_memory_block):
         id="test-block-456", type="task", text="Another test block.", tags=["test"], metadata={}
     )
 
-    # Configure mock to return all blocks (implementation filters by ID internally)
-    mock_memory_bank.get_all_memory_blocks.return_value = [block1, block2]
+    # Configure mock to return the requested blocks
+    mock_memory_bank.get_memory_blocks_by_ids.return_value = [block1, block2]
 
     # Test input with multiple IDs
     input_data = GetMemoryBlockInput(block_ids=["test-block-123", "test-block-456"])
@@ -92,7 +95,7 @@ def test_get_memory_block_partial_found(mock_memory_bank, sample_memory_block):
     """Test retrieval where some blocks are found and some are not."""
 
     # Configure mock to return only the found block
-    mock_memory_bank.get_all_memory_blocks.return_value = [sample_memory_block]
+    mock_memory_bank.get_memory_blocks_by_ids.return_value = [sample_memory_block]
 
     # Test input with multiple IDs (one found, one not)
     input_data = GetMemoryBlockInput(block_ids=["test-block-123", "missing-block"])
@@ -109,7 +112,7 @@ def test_get_memory_block_partial_found(mock_memory_bank, sample_memory_block):
 def test_get_memory_block_exception(mock_memory_bank, sample_input):
     """Test error handling when an exception occurs."""
     # Configure mock to raise an exception
-    mock_memory_bank.get_all_memory_blocks.side_effect = Exception("Database error")
+    mock_memory_bank.get_memory_blocks_by_ids.side_effect = Exception("Database error")
 
     # Call the function
     result = get_memory_block_core(sample_input, mock_memory_bank)
@@ -148,9 +151,18 @@ def sample_blocks():
     ]
 
 
+def _serve_queries_from(mock_memory_bank, blocks):
+    """Answer query_memory_blocks by evaluating the BlockQuery against in-memory blocks."""
+
+    def query_memory_blocks(query, branch=None):
+        return [block for block in blocks if query.matches(block)][: query.page_size]
+
+    mock_memory_bank.query_memory_blocks.side_effect = query_memory_blocks
+
+
 def test_get_memory_blocks_by_type_filter(mock_memory_bank, sample_blocks):
     """Test filtering blocks by type."""
-    mock_memory_bank.get_all_memory_blocks.return_value = sample_blocks
+    _serve_queries_from(mock_memory_bank, sample_blocks)
 
     input_data = GetMemoryBlockInput(type_filter="task")
     result = get_memory_block_core(input_data, mock_memory_bank)
@@ -158,11 +170,12 @@ def test_get_memory_blocks_by_type_filter(mock_memory_bank, sample_blocks):
     assert result.success is True
     assert len(result.blocks) == 2
     assert all(block.type == "task" for block in result.blocks)
+    mock_memory_bank.get_all_memory_blocks.assert_not_called()
 
 
 def test_get_memory_blocks_by_tag_filter(mock_memory_bank, sample_blocks):
     """Test filtering blocks by tags."""
-    mock_memory_bank.get_all_memory_blocks.return_value = sample_blocks
+    _serve_queries_from(mock_memory_bank, sample_blocks)
 
     input_data = GetMemoryBlockInput(tag_filters=["work"])
     result = get_memory_block_core(input_data, mock_memory_bank)
@@ -174,7 +187,7 @@ def test_get_memory_blocks_by_tag_filter(mock_memory_bank, sample_blocks):
 
 def test_get_memory_blocks_by_metadata_filter(mock_memory_bank, sample_blocks):
     """Test filtering blocks by metadata."""
-    mock_memory_bank.get_all_memory_blocks.return_value = sample_blocks
+    _serve_queries_from(mock_memory_bank, sample_blocks)
 
     input_data = GetMemoryBlockInput(metadata_filters={"owner": "alice"})
     result = get_memory_block_core(input_data, mock_memory_bank)
@@ -186,7 +199,7 @@ def test_get_memory_blocks_by_metadata_filter(mock_memory_bank, sample_blocks):
 
 def test_get_memory_blocks_combined_filters(mock_memory_bank, sample_blocks):
     """Test filtering blocks with multiple filter criteria."""
-    mock_memory_bank.get_all_memory_blocks.return_value = sample_blocks
+    _serve_queries_from(mock_memory_bank, sample_blocks)
 
     input_data = GetMemoryBlockInput(
         type_filter="task", tag_filters=["urgent"], metadata_filters={"priority": "high"}
@@ -197,10 +210,17 @@ def test_get_memory_blocks_combined_filters(mock_memory_bank, sample_blocks):
     assert len(result.blocks) == 1
     assert result.blocks[0].id == "task-1"
 
+    query = mock_memory_bank.query_memory_blocks.call_args.args[0]
+    sql, params = query.to_sql()
+    assert "mb.type IN (%s)" in sql
+    assert "JSON_CONTAINS(mb.tags, %s)" in sql
+    assert "FROM block_properties bp" in sql
+    assert params == ["task", '"urgent"', "priority", "high"]
+
 
 def test_get_memory_blocks_with_limit(mock_memory_bank, sample_blocks):
     """Test filtering with limit parameter."""
-    mock_memory_bank.get_all_memory_blocks.return_value = sample_blocks
+    _serve_queries_from(mock_memory_bank, sample_blocks)
 
     input_data = GetMemoryBlockInput(type_filter="task", limit=1)
     result = get_memory_block_core(input_data, mock_memory_bank)
@@ -211,7 +231,7 @@ def test_get_memory_blocks_with_limit(mock_memory_bank, sample_blocks):
 
 def test_get_memory_blocks_no_matches(mock_memory_bank, sample_blocks):
     """Test filtering that returns no matches."""
-    mock_memory_bank.get_all_memory_blocks.return_value = sample_blocks
+    _serve_queries_from(mock_memory_bank, sample_blocks)
 
     input_data = GetMemoryBlockInput(
         type_filter="epic"
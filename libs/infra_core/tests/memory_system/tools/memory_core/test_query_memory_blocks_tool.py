@@ -16,18 +16,25 @@ from infra_core.memory_system.schemas.memory_block import MemoryBlock
 from infra_core.memory_system.structured_memory_bank import StructuredMemoryBank
 
 
+def _scored(blocks):
+    """Pair blocks with descending relevance scores, as query_semantic_with_scores does."""
+    return [(block, round(0.9 - i * 0.1, 2)) for i, block in enumerate(blocks)]
+
+
 @pytest.fixture
 def mock_memory_bank():
     """Create a mock StructuredMemoryBank."""
     bank = MagicMock(spec=StructuredMemoryBank)
-    bank.query_semantic.return_value = [
-        MemoryBlock(
-            type="knowledge", text="Test block 1", tags=["test"], metadata={"key": "value"}
-        ),
-        MemoryBlock(
-            type="task", text="Test block 2", tags=["test", "task"], metadata={"key": "value"}
-        ),
-    ]
+    bank.query_semantic_with_scores.return_value = _scored(
+        [
+            MemoryBlock(
+                type="knowledge", text="Test block 1", tags=["test"], metadata={"key": "value"}
+            ),
+            MemoryBlock(
+                type="task", text="Test block 2", tags=["test", "task"], metadata={"key": "value"}
+            ),
+        ]
+    )
     return bank
 
 
@@ -49,7 +56,38 @@ def test_query_memory_blocks_success(mock_memory_bank, sample_input):
     assert result.error is None
     assert isinstance(result.timestamp, datetime)
 
-    mock_memory_bank.query_semantic.assert_called_once_with(query_text="test query", top_k=5)
+    assert result.scores == {b.id: s for b, s in zip(result.blocks, [0.9, 0.8])}
+    mock_memory_bank.query_semantic_with_scores.assert_called_once_with(
+        query_text="test query",
+        top_k=5,
+        type_filter=None,
+        namespace_id=None,
+        tag_filters=None,
+        metadata_filters=None,
+    )
+
+
+def test_query_memory_blocks_pushes_filters_to_semantic_search(mock_memory_bank):
+    """Filters are forwarded so the vector store returns top_k matching blocks."""
+    input_data = QueryMemoryBlocksInput(
+        query_text="test query",
+        type_filter="task",
+        namespace_id="pm",
+        tag_filters=["test"],
+        metadata_filters={"key": "value"},
+        top_k=3,
+    )
+
+    query_memory_blocks_core(input_data, mock_memory_bank)
+
+    mock_memory_bank.query_semantic_with_scores.assert_called_once_with(
+        query_text="test query",
+        top_k=3,
+        type_filter="task",
+        namespace_id="pm",
+        tag_filters=["test"],
+        metadata_filters={"key": "value"},
+    )
 
 
 def test_query_memory_blocks_with_type_filter(mock_memory_bank):
@@ -92,7 +130,7 @@ def test_query_memory_blocks_with_metadata_filter(mock_memory_bank):
 
 def test_query_memory_blocks_error_handling(mock_memory_bank, sample_input):
     """Test error handling in memory block query."""
-    mock_memory_bank.query_semantic.side_effect = Exception("Test error")
+    mock_memory_bank.query_semantic_with_scores.side_effect = Exception("Test error")
 
     result = query_memory_blocks_core(sample_input, mock_memory_bank)
 
@@ -122,14 +160,16 @@ def test_query_memory_blocks_tool_schema():
 def test_query_memory_blocks_with_epic_type_filter(mock_memory_bank):
     """Test memory block query with epic type filter."""
     # Mock epic blocks
-    mock_memory_bank.query_semantic.return_value = [
-        MemoryBlock(
-            type="epic", text="Epic test block", tags=["epic"], metadata={"status": "ready"}
-        ),
-        MemoryBlock(
-            type="task", text="Task test block", tags=["task"], metadata={"status": "backlog"}
-        ),
-    ]
+    mock_memory_bank.query_semantic_with_scores.return_value = _scored(
+        [
+            MemoryBlock(
+                type="epic", text="Epic test block", tags=["epic"], metadata={"status": "ready"}
+            ),
+            MemoryBlock(
+                type="task", text="Task test block", tags=["task"], metadata={"status": "backlog"}
+            ),
+        ]
+    )
 
     input_data = QueryMemoryBlocksInput(query_text="test query", type_filter="epic", top_k=5)
 
@@ -145,14 +185,16 @@ def test_query_memory_blocks_with_epic_type_filter(mock_memory_bank):
 def test_query_memory_blocks_with_bug_type_filter(mock_memory_bank):
     """Test memory block query with bug type filter."""
     # Mock bug blocks
-    mock_memory_bank.query_semantic.return_value = [
-        MemoryBlock(
-            type="bug", text="Bug test block", tags=["bug"], metadata={"severity": "major"}
-        ),
-        MemoryBlock(
-            type="task", text="Task test block", tags=["task"], metadata={"status": "backlog"}
-        ),
-    ]
+    mock_memory_bank.query_semantic_with_scores.return_value = _scored(
+        [
+            MemoryBlock(
+                type="bug", text="Bug test block", tags=["bug"], metadata={"severity": "major"}
+            ),
+            MemoryBlock(
+                type="task", text="Task test block", tags=["task"], metadata={"status": "backlog"}
+            ),
+        ]
+    )
 
     input_data = QueryMemoryBlocksInput(query_text="test query", type_filter="bug", top_k=5)
 
@@ -168,10 +210,16 @@ def test_query_memory_blocks_with_bug_type_filter(mock_memory_bank):
 def test_query_memory_blocks_with_log_type_filter(mock_memory_bank):
     """Test memory block query with log type filter."""
     # Mock log blocks
-    mock_memory_bank.query_semantic.return_value = [
-        MemoryBlock(type="log", text="Log test block", tags=["log"], metadata={"level": "info"}),
-        MemoryBlock(type="doc", text="Doc test block", tags=["doc"], metadata={"section": "api"}),
-    ]
+    mock_memory_bank.query_semantic_with_scores.return_value = _scored(
+        [
+            MemoryBlock(
+                type="log", text="Log test block", tags=["log"], metadata={"level": "info"}
+            ),
+            MemoryBlock(
+                type="doc", text="Doc test block", tags=["doc"], metadata={"section": "api"}
+            ),
+        ]
+    )
 
     input_data = QueryMemoryBlocksInput(query_text="test query", type_filter="log", top_k=5)
 
@@ -205,26 +253,28 @@ def test_query_memory_blocks_invalid_type_filter():
 def test_query_memory_blocks_combined_filters(mock_memory_bank):
     """Test memory block query with multiple filters combined."""
     # Mock mixed blocks
-    mock_memory_bank.query_semantic.return_value = [
-        MemoryBlock(
-            type="epic",
-            text="Epic with matching tags and metadata",
-            tags=["project", "priority"],
-            metadata={"status": "ready", "priority": "P0"},
-        ),
-        MemoryBlock(
-            type="epic",
-            text="Epic with different metadata",
-            tags=["project", "priority"],
-            metadata={"status": "backlog", "priority": "P1"},
-        ),
-        MemoryBlock(
-            type="task",
-            text="Task with matching tags",
-            tags=["project", "priority"],
-            metadata={"status": "ready", "priority": "P0"},
-        ),
-    ]
+    mock_memory_bank.query_semantic_with_scores.return_value = _scored(
+        [
+            MemoryBlock(
+                type="epic",
+                text="Epic with matching tags and metadata",
+                tags=["project", "priority"],
+                metadata={"status": "ready", "priority": "P0"},
+            ),
+            MemoryBlock(
+                type="epic",
+                text="Epic with different metadata",
+                tags=["project", "priority"],
+                metadata={"status": "backlog", "priority": "P1"},
+            ),
+            MemoryBlock(
+                type="task",
+                text="Task with matching tags",
+                tags=["project", "priority"],
+                metadata={"status": "ready", "priority": "P0"},
+            ),
+        ]
+    )
 
     input_data = QueryMemoryBlocksInput(
         query_text="test query",
@@ -248,7 +298,7 @@ def test_query_memory_blocks_combined_filters(mock_memory_bank):
 
 def test_query_memory_blocks_empty_results(mock_memory_bank):
     """Test handling of empty semantic search results."""
-    mock_memory_bank.query_semantic.return_value = []
+    mock_memory_bank.query_semantic_with_scores.return_value = []
 
     input_data = QueryMemoryBlocksInput(query_text="nonexistent query", top_k=5)
 
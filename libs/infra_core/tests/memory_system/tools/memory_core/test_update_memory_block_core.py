@@ -371,10 +371,37 @@ def test_update_memory_block_no_changes(mock_memory_bank, sample_existing_block)
     result = update_memory_block_core(input_data, mock_memory_bank)
 
     assert result.success is True
-    # Should still increment version and update timestamp
-    assert result.new_version == 6
-    assert "block_version" in result.diff_summary.fields_updated
-    assert "updated_at" in result.diff_summary.fields_updated
+    # Nothing changed, so the version stays put and nothing is written
+    assert result.previous_version == 5
+    assert result.new_version == 5
+    assert result.diff_summary.fields_updated == []
+    mock_memory_bank.update_memory_block.assert_not_called()
+
+
+def test_update_memory_block_identical_patch_skips_write(mock_memory_bank, sample_existing_block):
+    """Re-setting fields to their current values issues no write or commit."""
+    mock_memory_bank.get_memory_block.return_value = sample_existing_block
+
+    input_data = UpdateMemoryBlockInput(
+        block_id="test-block-123",
+        text="Original content",
+        state="draft",
+        tags=["original", "test"],
+        merge_tags=False,
+        metadata={"x_timestamp": "2025-06-01T12:00:00"},
+        merge_metadata=True,
+        previous_block_version=5,
+        author="test_user",
+    )
+
+    result = update_memory_block_core(input_data, mock_memory_bank)
+
+    assert result.success is True
+    assert result.previous_version == 5
+    assert result.new_version == 5
+    assert result.diff_summary.text_changed is False
+    mock_memory_bank.update_memory_block.assert_not_called()
+    mock_memory_bank.dolt_writer.commit_changes.assert_not_called()
 
 
 @pytest.mark.xfail(
@@ -12,8 +12,9 @@ Key Benefits:
 - Reduced maintenance: No manual wrapper updates needed
 """
 
+import functools
 import logging
-from typing import Dict, Any, Callable, Awaitable
+from typing import Dict, Any, Callable, Awaitable, ContextManager, Optional
 from datetime import datetime
 
 from mcp.server.fastmcp import FastMCP
@@ -22,7 +23,9 @@ from infra_core.memory_system.structured_memory_bank import StructuredMemoryBank
 
 try:
     # Try relative imports first (when used as module)
-    from .tool_registry import get_all_cogni_tools
+    from .tool_registry import get_all_cogni_tools, is_read_only_tool
+    from .tool_executor import ToolExecutor, get_tool_executor
+    from .tool_result_cache import ToolResultCache, get_tool_result_cache
     from .mcp_server import inject_current_namespace, mcp_autofix
 except ImportError:
     # Fall back to absolute imports (when run directly)
@@ -30,7 +33,9 @@ except ImportError:
     import os
 
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-    from tool_registry import get_all_cogni_tools
+    from tool_registry import get_all_cogni_tools, is_read_only_tool
+    from tool_executor import ToolExecutor, get_tool_executor
+    from tool_result_cache import ToolResultCache, get_tool_result_cache
 
     # Mock the mcp_server imports for standalone testing
     def inject_current_namespace(input_data):
@@ -43,9 +48,24 @@ except ImportError:
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Opens the memory bank of a branch for the duration of a with block
+MemoryBankLease = Callable[[str], ContextManager[StructuredMemoryBank]]
+
+
+def _call_with_memory_bank_lease(
+    memory_bank_lease: MemoryBankLease, branch: str, func: Callable[..., Any], validated_input
+) -> Any:
+    """Call func(validated_input, memory_bank) while holding a lease on the branch's bank."""
+    with memory_bank_lease(branch) as memory_bank:
+        return func(validated_input, memory_bank)
+
 
 def create_mcp_wrapper_from_cogni_tool(
-    cogni_tool: CogniTool, memory_bank_getter: Callable[[], StructuredMemoryBank]
+    cogni_tool: CogniTool,
+    memory_bank_getter: Callable[[], StructuredMemoryBank],
+    executor: Optional[ToolExecutor] = None,
+    result_cache: Optional[ToolResultCache] = None,
+    memory_bank_lease: Optional[MemoryBankLease] = None,
 ) -> Callable[..., Awaitable[Dict[str, Any]]]:
     """
     Create an MCP-compatible async wrapper function from a CogniTool instance.
@@ -54,9 +74,18 @@ def create_mcp_wrapper_from_cogni_tool(
     leveraging the CogniTool's input model to create individual parameters
     instead of a wrapped input_data object.
 
+    The CogniTool function itself is synchronous, so the wrapper runs it on the
+    ToolExecutor worker pool rather than blocking the event loop. Identical concurrent
+    read-only calls share one execution through the ToolResultCache, and mutating calls
+    invalidate the cached results of their branch.
+
     Args:
         cogni_tool: The CogniTool instance to wrap
         memory_bank_getter: Function to get the memory bank instance
+        executor: ToolExecutor to run the tool on (defaults to the shared executor)
+        result_cache: ToolResultCache for read-only tools (defaults to the shared cache)
+        memory_bank_lease: Keeps the memory bank of a branch open while the tool runs;
+            it is taken on the worker thread, so a timed-out call still holds it
 
     Returns:
         Async function compatible with FastMCP @mcp.tool() decorator with individual parameters
@@ -95,7 +124,7 @@ def create_mcp_wrapper_from_cogni_tool(
         2. Reconstructs input_data from individual parameters
         3. Injects namespace context if needed
         4. Validates input using CogniTool's input_model
-        5. Calls CogniTool's function with memory_bank
+        5. Calls CogniTool's function with memory_bank on the tool executor
         6. Returns serialized result
         """
         logger.debug(
@@ -133,19 +162,50 @@ def create_mcp_wrapper_from_cogni_tool(
             else:
                 actual_memory_bank = None
 
-            # Call the CogniTool's function
-            if cogni_tool.memory_linked:
-                result = cogni_tool._function(validated_input, actual_memory_bank)
-            else:
-                result = cogni_tool._function(validated_input)
-
-            # Serialize result
-            if hasattr(result, "model_dump"):
-                return result.model_dump()
-            elif hasattr(result, "dict"):
-                return result.dict()
+            # Call the CogniTool's function on the worker pool
+            read_only = is_read_only_tool(cogni_tool.name)
+            branch = getattr(actual_memory_bank, "branch", None)
+            tool_function = cogni_tool._function
+            if cogni_tool.memory_linked and memory_bank_lease is not None:
+                tool_function = functools.partial(
+                    _call_with_memory_bank_lease, memory_bank_lease, branch, tool_function
+                )
+                tool_args = (validated_input,)
+            elif cogni_tool.memory_linked:
+                tool_args = (validated_input, actual_memory_bank)
             else:
-                return result
+                tool_args = (validated_input,)
+
+            async def execute() -> Any:
+                result = await (executor or get_tool_executor()).run(
+                    cogni_tool.name,
+                    tool_function,
+                    *tool_args,
+                    read_only=read_only,
+                    branch=branch,
+                )
+
+                # Serialize result
+                if hasattr(result, "model_dump"):
+                    return result.model_dump()
+                elif hasattr(result, "dict"):
+                    return result.dict()
+                else:
+                    return result
+
+            cache = result_cache or get_tool_result_cache()
+            if read_only:
+                return await cache.get_or_run(
+                    cogni_tool.name,
+                    validated_input.model_dump(mode="json"),
+                    execute,
+                    branch=branch,
+                    namespace_id=input_with_namespace.get("namespace_id"),
+                )
+            try:
+                return await execute()
+            finally:
+                cache.invalidate_branch(branch)
 
         except Exception as e:
             logger.error(f"Error in auto-generated wrapper for {cogni_tool.name}: {str(e)}")
@@ -182,7 +242,7 @@ def create_mcp_wrapper_from_cogni_tool(
     2. Reconstructs input_data from individual parameters  
     3. Injects namespace context if needed
     4. Validates input using CogniTool's input_model
-    5. Calls CogniTool's function with memory_bank
+    5. Calls CogniTool's function with memory_bank on the tool executor
     6. Returns serialized result
     """
     mcp_wrapper.__doc__ = docstring_template.format(
@@ -195,7 +255,9 @@ def create_mcp_wrapper_from_cogni_tool(
 
 
 def auto_register_cogni_tools_to_mcp(
-    mcp_app: FastMCP, memory_bank_getter: Callable[[], StructuredMemoryBank]
+    mcp_app: FastMCP,
+    memory_bank_getter: Callable[[], StructuredMemoryBank],
+    memory_bank_lease: Optional[MemoryBankLease] = None,
 ) -> Dict[str, str]:
     """
     Automatically register all CogniTool instances as MCP tools.
@@ -206,6 +268,7 @@ def auto_register_cogni_tools_to_mcp(
     Args:
         mcp_app: FastMCP application instance
         memory_bank_getter: Function to get memory bank instance
+        memory_bank_lease: Keeps a branch's memory bank open while a tool uses it
 
     Returns:
         Dictionary mapping tool names to their registration status
@@ -270,7 +333,9 @@ async def auto_generated_tool({params_str}):
             logger.debug(f"Auto-registering {cogni_tool.name}...")
 
             # Create the MCP wrapper that accepts **kwargs
-            mcp_wrapper = create_mcp_wrapper_from_cogni_tool(cogni_tool, memory_bank_getter)
+            mcp_wrapper = create_mcp_wrapper_from_cogni_tool(
+                cogni_tool, memory_bank_getter, memory_bank_lease=memory_bank_lease
+            )
 
             # Create the tool description from CogniTool
             tool_description = cogni_tool.description
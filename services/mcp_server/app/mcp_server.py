@@ -5,7 +5,11 @@ import importlib.util
 from pathlib import Path
 from datetime import datetime
 import json
+import threading
+import weakref
+from contextlib import contextmanager
 from functools import wraps
+from typing import Iterator, Optional, Tuple
 
 from mcp.server.fastmcp import FastMCP
 from infra_core.memory_system.structured_memory_bank import StructuredMemoryBank
@@ -24,6 +28,9 @@ from infra_core.memory_system.tools.agent_facing.dolt_repo_tool import (
 try:
     # Try relative import first (when run as module)
     from .mcp_auto_generator import auto_register_cogni_tools_to_mcp, get_auto_generation_stats
+    from .tool_executor import get_tool_executor
+    from .session_pool import MemorySession, MemorySessionPool
+    from .tool_result_cache import get_tool_result_cache
 except ImportError:
     # Fall back to direct import (when run as script)
     import sys
@@ -35,6 +42,9 @@ except ImportError:
         sys.path.insert(0, str(app_dir))
 
     from mcp_auto_generator import auto_register_cogni_tools_to_mcp, get_auto_generation_stats
+    from tool_executor import get_tool_executor
+    from session_pool import MemorySession, MemorySessionPool
+    from tool_result_cache import get_tool_result_cache
 
 # Configure logging
 logging.basicConfig(
@@ -57,11 +67,15 @@ project_root = Path(__file__).parent.parent.parent.parent
 sys.path.append(str(project_root))
 
 # Global state for MCP server
-_memory_bank = None
-_link_manager = None
-_pm_links = None
-_current_branch = None
+_session_pool = None
+_dolt_config = None
+_shared_llama_memory = None
+_current_branch = None  # Default branch for clients that have not switched context
 _current_namespace = None  # Add global namespace state
+# Per-client branch/namespace overrides set via SetContext, keyed by MCP client session
+_client_contexts = weakref.WeakKeyDictionary()
+_default_client_context = {}  # Overrides for calls made outside an MCP request
+_state_lock = threading.RLock()
 
 
 # Detect current Git branch or use environment variable
@@ -128,30 +142,68 @@ def get_current_namespace() -> str:
     return "legacy"
 
 
-def _initialize_memory_system():
-    """
-    Lazy initialization of the memory system components.
-    This prevents database connections during module import for testing.
-    """
-    global _memory_bank, _link_manager, _pm_links, _current_branch, _current_namespace
+def _get_dolt_config() -> DoltConnectionConfig:
+    """Build the Dolt connection config and test the connection, once per process."""
+    global _dolt_config
 
-    if _memory_bank is not None:
-        return _memory_bank, _link_manager, _pm_links
+    if _dolt_config is not None:
+        return _dolt_config
 
-    # Log environment variables for debugging
-    logger.info("🔍 [ENV] MCP Server Environment Variables:")
-    logger.info(f"    DOLT_NAMESPACE = '{os.environ.get('DOLT_NAMESPACE', '(not set)')}'")
-    logger.info(f"    DOLT_BRANCH = '{os.environ.get('DOLT_BRANCH', '(not set)')}'")
-    logger.info(f"    DOLT_HOST = '{os.environ.get('DOLT_HOST', '(not set)')}'")
-    logger.info(f"    DOLT_DATABASE = '{os.environ.get('DOLT_DATABASE', '(not set)')}'")
+    # Initialize MySQL connection config for remote Dolt SQL server
+    dolt_config = DoltConnectionConfig(
+        host=os.environ.get("DOLT_HOST", "localhost"),
+        port=int(os.environ.get("DOLT_PORT", "3306")),
+        user=os.environ.get("DOLT_USER", "root"),
+        password=os.environ.get("DOLT_ROOT_PASSWORD", ""),
+        database=os.environ.get(
+            "DOLT_DATABASE", "cogni-dao-memory"
+        ),  # Fixed default to match production
+        pool_size=_dolt_pool_size(),
+    )
 
-    # Get the branch to use for Dolt operations
-    _current_branch = get_current_branch()
+    # Test database connection before proceeding
+    logger.info(f"Testing database connection to {dolt_config.host}:{dolt_config.port}")
+    try:
+        import mysql.connector
+
+        test_conn = mysql.connector.connect(
+            host=dolt_config.host,
+            port=dolt_config.port,
+            user=dolt_config.user,
+            password=dolt_config.password,
+            database=dolt_config.database,
+            connect_timeout=5,
+        )
+        cursor = test_conn.cursor()
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+        cursor.close()
+        test_conn.close()
+        logger.info("✅ Database connection successful")
+    except Exception as db_error:
+        logger.error(f"❌ Database connection failed: {db_error}")
+        logger.error(
+            f"Config: host={dolt_config.host}, port={dolt_config.port}, user={dolt_config.user}, database={dolt_config.database}"
+        )
+        raise
+
+    _dolt_config = dolt_config
+    return _dolt_config
+
+
+def _dolt_pool_size() -> int:
+    """Connections per Dolt connection pool (DOLT_POOL_SIZE, default 8)."""
+    return int(os.environ.get("DOLT_POOL_SIZE", "8"))
 
-    # Get the namespace to use for MCP operations
-    logger.info("🚀 [NAMESPACE] Initializing namespace context...")
-    _current_namespace = get_current_namespace()
-    logger.info(f"🎯 [NAMESPACE] Global namespace context set to: '{_current_namespace}'")
+
+def _create_memory_session(branch: str) -> MemorySession:
+    """
+    Create a memory bank and link managers pinned to one branch for the session pool.
+
+    All sessions share one Dolt config and one LlamaMemory (the vector index is not
+    branch-aware), so only the Dolt connections are per session.
+    """
+    global _shared_llama_memory
 
     # Initialize StructuredMemoryBank using environment variables
     CHROMA_PATH = os.environ.get("CHROMA_PATH", "/tmp/cogni_chroma")  # Make configurable
@@ -161,81 +213,156 @@ def _initialize_memory_system():
     os.makedirs(CHROMA_PATH, exist_ok=True)
 
     try:
-        # Initialize MySQL connection config for remote Dolt SQL server
-        dolt_config = DoltConnectionConfig(
-            host=os.environ.get("DOLT_HOST", "localhost"),
-            port=int(os.environ.get("DOLT_PORT", "3306")),
-            user=os.environ.get("DOLT_USER", "root"),
-            password=os.environ.get("DOLT_ROOT_PASSWORD", ""),
-            database=os.environ.get(
-                "DOLT_DATABASE", "cogni-dao-memory"
-            ),  # Fixed default to match production
-        )
+        dolt_config = _get_dolt_config()
 
-        # Test database connection before proceeding
-        logger.info(f"Testing database connection to {dolt_config.host}:{dolt_config.port}")
-        try:
-            import mysql.connector
-
-            test_conn = mysql.connector.connect(
-                host=dolt_config.host,
-                port=dolt_config.port,
-                user=dolt_config.user,
-                password=dolt_config.password,
-                database=dolt_config.database,
-                connect_timeout=5,
-            )
-            cursor = test_conn.cursor()
-            cursor.execute("SELECT 1")
-            cursor.fetchone()
-            cursor.close()
-            test_conn.close()
-            logger.info("✅ Database connection successful")
-        except Exception as db_error:
-            logger.error(f"❌ Database connection failed: {db_error}")
-            logger.error(
-                f"Config: host={dolt_config.host}, port={dolt_config.port}, user={dolt_config.user}, database={dolt_config.database}"
-            )
-            raise
-
-        # Initialize memory bank with detected branch
-        logger.info(f"Initializing StructuredMemoryBank with branch: {_current_branch}")
-        _memory_bank = StructuredMemoryBank(
+        # Initialize memory bank with the session's branch
+        logger.info(f"Initializing StructuredMemoryBank with branch: {branch}")
+        memory_bank = StructuredMemoryBank(
             chroma_path=CHROMA_PATH,
             chroma_collection=CHROMA_COLLECTION_NAME,
             dolt_connection_config=dolt_config,
-            branch=_current_branch,
+            branch=branch,
+            llama_memory=_shared_llama_memory,
         )
+        _shared_llama_memory = memory_bank.llama_memory
 
         # 🔧 CRITICAL FIX: Enable persistent connections to maintain branch context
         # This ensures all MCP tool operations stay on the correct branch
-        logger.info(f"Enabling persistent connections on branch: {_current_branch}")
-        _memory_bank.use_persistent_connections(_current_branch)
+        logger.info(f"Enabling persistent connections on branch: {branch}")
+        memory_bank.use_persistent_connections(branch)
         logger.info(
-            f"✅ Persistent connections enabled - all operations will use branch: {_memory_bank.branch}"
+            f"✅ Persistent connections enabled - all operations will use branch: {memory_bank.branch}"
         )
 
-        # Initialize LinkManager components with SQL backend using same config
-        _link_manager = SQLLinkManager(dolt_config)
-        _pm_links = ExecutableLinkManager(_link_manager)
+        # Initialize LinkManager components with SQL backend using same config.
+        # LINK_INDEX_ENABLED=true serves link reads from an in-memory snapshot per branch.
+        link_index_enabled = os.environ.get("LINK_INDEX_ENABLED", "false").lower() == "true"
+        link_manager = SQLLinkManager(dolt_config, enable_link_index=link_index_enabled)
+        pm_links = ExecutableLinkManager(link_manager)
 
         # 🔧 CRITICAL FIX: Enable persistent connections on LinkManager too
         # This ensures link operations also maintain branch context
-        logger.info(f"Enabling persistent connections on LinkManager for branch: {_current_branch}")
-        _link_manager.use_persistent_connection(_current_branch)
+        logger.info(f"Enabling persistent connections on LinkManager for branch: {branch}")
+        link_manager.use_persistent_connection(branch)
         logger.info(
-            f"✅ LinkManager persistent connections enabled on branch: {_link_manager.active_branch}"
+            f"✅ LinkManager persistent connections enabled on branch: {link_manager.active_branch}"
         )
 
         # Attach link_manager to memory_bank for tool access
-        _memory_bank.link_manager = _link_manager
+        memory_bank.link_manager = link_manager
+        # SetContext/DoltCheckout re-pin the calling client instead of moving this shared bank
+        memory_bank.session_context_switcher = set_session_context
 
     except Exception as e:
         logger.error(f"Failed to initialize StructuredMemoryBank: {e}")
         logger.error("Please run init_dolt_schema.py to initialize the Dolt database")
         raise RuntimeError(f"Memory system initialization failed: {e}")
 
-    return _memory_bank, _link_manager, _pm_links
+    return MemorySession(
+        branch=branch,
+        memory_bank=memory_bank,
+        link_manager=link_manager,
+        pm_links=pm_links,
+    )
+
+
+def get_session_pool() -> MemorySessionPool:
+    """Get the memory session pool, creating it on first use."""
+    global _session_pool, _current_branch, _current_namespace
+
+    with _state_lock:
+        if _session_pool is not None:
+            return _session_pool
+
+        # Log environment variables for debugging
+        logger.info("🔍 [ENV] MCP Server Environment Variables:")
+        logger.info(f"    DOLT_NAMESPACE = '{os.environ.get('DOLT_NAMESPACE', '(not set)')}'")
+        logger.info(f"    DOLT_BRANCH = '{os.environ.get('DOLT_BRANCH', '(not set)')}'")
+        logger.info(f"    DOLT_HOST = '{os.environ.get('DOLT_HOST', '(not set)')}'")
+        logger.info(f"    DOLT_DATABASE = '{os.environ.get('DOLT_DATABASE', '(not set)')}'")
+
+        # Get the default branch to use for Dolt operations
+        _current_branch = get_current_branch()
+
+        # Get the default namespace to use for MCP operations
+        logger.info("🚀 [NAMESPACE] Initializing namespace context...")
+        _current_namespace = get_current_namespace()
+        logger.info(f"🎯 [NAMESPACE] Global namespace context set to: '{_current_namespace}'")
+
+        # Each session pins pooled persistent connections, so the pool size caps the sessions
+        _session_pool = MemorySessionPool.from_env(
+            _create_memory_session, pool_size=_dolt_pool_size()
+        )
+        return _session_pool
+
+
+def _client_context() -> dict:
+    """Branch/namespace overrides of the MCP client making the current request."""
+    try:
+        client_session = mcp.get_context().session
+    except Exception:
+        # Not inside an MCP request (startup, tests, scripts)
+        return _default_client_context
+
+    with _state_lock:
+        return _client_contexts.setdefault(client_session, {})
+
+
+def get_session_context() -> Tuple[str, str]:
+    """
+    Get the (branch, namespace) the calling MCP client works on.
+
+    Clients start on DOLT_BRANCH / DOLT_NAMESPACE and can switch with SetContext.
+    """
+    overrides = _client_context()
+    branch = overrides.get("branch") or _current_branch or get_current_branch()
+    namespace_id = overrides.get("namespace_id") or _current_namespace or get_current_namespace()
+    return branch, namespace_id
+
+
+def set_session_context(
+    branch: Optional[str] = None, namespace_id: Optional[str] = None
+) -> Tuple[str, str]:
+    """
+    Pin the calling MCP client to a branch and/or namespace for its later tool calls.
+
+    The pooled session for a new branch is opened right away, so switching to a
+    branch that cannot be checked out fails here rather than on the next tool call.
+
+    Args:
+        branch: Branch to switch to (None = no change)
+        namespace_id: Namespace to switch to (None = no change)
+
+    Returns:
+        The client's (branch, namespace) after the switch
+    """
+    if branch is None and namespace_id is None:
+        return get_session_context()
+
+    if branch is not None:
+        get_session_pool().get(branch)
+
+    overrides = _client_context()
+    with _state_lock:
+        if branch is not None:
+            overrides["branch"] = branch
+        if namespace_id is not None:
+            overrides["namespace_id"] = namespace_id
+    logger.info(f"🎯 [SESSION] Client context switched to {get_session_context()}")
+    return get_session_context()
+
+
+def _initialize_memory_system():
+    """
+    Lazy initialization of the memory system components.
+    This prevents database connections during module import for testing.
+
+    Returns the memory bank, link manager and PM links of the pooled session for the
+    calling client's branch.
+    """
+    branch, _ = get_session_context()
+    session = get_session_pool().get(branch)
+    return session.memory_bank, session.link_manager, session.pm_links
 
 
 def get_memory_bank():
@@ -256,6 +383,13 @@ def get_pm_links():
     return pm_links
 
 
+@contextmanager
+def lease_memory_bank(branch: str) -> Iterator[StructuredMemoryBank]:
+    """Yield the memory bank of a branch's pooled session, keeping the session open."""
+    with get_session_pool().lease(branch) as session:
+        yield session.memory_bank
+
+
 def get_current_namespace_context() -> str:
     """
     Get the current namespace context for this MCP session.
@@ -266,7 +400,7 @@ def get_current_namespace_context() -> str:
     Returns:
         The current namespace identifier
     """
-    current_ns = _current_namespace or get_current_namespace()
+    _, current_ns = get_session_context()
     logger.info(f"📋 [NAMESPACE] Current namespace context: '{current_ns}'")
     return current_ns
 
@@ -407,7 +541,9 @@ mcp = FastMCP("cogni-memory")
 # Phase 2: Auto-register all CogniTools as MCP tools
 logger.info("🤖 [PHASE 2] Starting auto-registration of CogniTools...")
 try:
-    registration_results = auto_register_cogni_tools_to_mcp(mcp, get_memory_bank)
+    registration_results = auto_register_cogni_tools_to_mcp(
+        mcp, get_memory_bank, memory_bank_lease=lease_memory_bank
+    )
 
     # Log registration results
     success_count = sum(1 for status in registration_results.values() if status == "SUCCESS")
@@ -436,6 +572,21 @@ except Exception as e:
     logger.info("🤖 [PHASE 2] Continuing with manual tool registrations as fallback")
 
 
+@mcp.resource("cogni://tool-execution-stats")
+def tool_execution_stats() -> str:
+    """Per-tool call counts, queue depth and latency, plus read cache counters."""
+    return json.dumps(
+        {"tools": get_tool_executor().stats(), "read_cache": get_tool_result_cache().stats()},
+        indent=2,
+    )
+
+
+@mcp.resource("cogni://memory-sessions")
+def memory_sessions() -> str:
+    """Open branch memory sessions and pool counters."""
+    return json.dumps(get_session_pool().stats(), indent=2)
+
+
 ## TODO: manual tool registration required for these. CogniTools do not exist yet
 
 
@@ -707,8 +858,18 @@ async def dolt_pull(input):
         # Create input object
         input_data = DoltPullInput(**input)
 
-        # Execute the pull operation
-        result = dolt_pull_tool(input_data, get_memory_bank())
+        # Execute the pull operation on the tool executor (serialized with other writes)
+        branch = get_memory_bank().branch
+
+        def pull():
+            # Lease on the worker so the session stays open until the pull returns
+            with lease_memory_bank(branch) as memory_bank:
+                return dolt_pull_tool(input_data, memory_bank)
+
+        try:
+            result = await get_tool_executor().run("DoltPull", pull, branch=branch)
+        finally:
+            get_tool_result_cache().invalidate_branch(branch)
 
         # Return JSON representation
         return result.model_dump_json(indent=2)
@@ -0,0 +1,263 @@
+"""
+Memory Session Pool for the MCP Server
+
+A StructuredMemoryBank and SQLLinkManager hold persistent connections pinned to one
+Dolt branch. Sharing a single pair between all MCP clients means agents working on
+different branches either thrash DOLT_CHECKOUT or see each other's branch.
+
+MemorySessionPool keeps one memory session per branch instead:
+- Sessions are created lazily on first use by a factory supplied by the server
+- Sessions idle for longer than idle_timeout are closed on the next pool access
+- At most max_sessions are kept open; the least recently used one is closed first
+- Tool calls hold a lease on their session while they run, and eviction skips
+  leased sessions
+
+Namespaces are not part of the key: the memory bank is not namespace-scoped, so
+clients on the same branch share its session whatever namespace they work in.
+
+Each session pins one persistent connection from each of the Dolt connection pools
+(read, write and default kinds). With pooling on, max_sessions is therefore capped at
+DOLT_POOL_SIZE minus POOL_HEADROOM, so per-operation connections are never starved.
+
+Closing a session only closes its persistent connections; after that its memory bank
+and link manager run on the default branch. Hence the leases: a session is never
+closed under a running tool. If every session is leased when a new one is needed, the
+pool holds more than max_sessions until leases are released and it is trimmed back.
+
+Configuration (environment variables):
+- MCP_SESSION_IDLE_TIMEOUT_SECONDS: idle time before a session is closed (default 900)
+- MCP_MAX_SESSIONS: maximum open sessions (default 16, capped by DOLT_POOL_SIZE)
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TIMEOUT_SECONDS = 900.0
+DEFAULT_MAX_SESSIONS = 16
+
+# Pooled connections of each kind left for per-operation use when capping max_sessions
+POOL_HEADROOM = 2
+
+
+@dataclass
+class MemorySession:
+    """Memory bank and link managers pinned to one branch."""
+
+    branch: str
+    memory_bank: Any
+    link_manager: Any
+    pm_links: Any
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    # Tool calls currently using the session; leased sessions are never evicted
+    leases: int = 0
+
+    def close(self) -> None:
+        """Close the persistent connections held by this session."""
+        try:
+            self.memory_bank.close_persistent_connections()
+        except Exception as e:
+            logger.warning(f"Error closing memory bank connections for {self.branch}: {e}")
+
+        try:
+            self.link_manager.close_persistent_connection()
+        except Exception as e:
+            logger.warning(f"Error closing link manager connection for {self.branch}: {e}")
+
+
+class MemorySessionPool:
+    """Lazily created, idle-evicted memory sessions keyed by branch."""
+
+    def __init__(
+        self,
+        factory: Callable[[str], MemorySession],
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            factory: Creates a MemorySession for a branch
+            idle_timeout: Seconds a session may stay unused before it is closed
+            max_sessions: Maximum number of open sessions
+        """
+        self.factory = factory
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max(1, max_sessions)
+        self._sessions: "OrderedDict[str, MemorySession]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "created": 0, "evicted": 0}
+
+    @classmethod
+    def from_env(
+        cls, factory: Callable[[str], MemorySession], pool_size: int = 0
+    ) -> "MemorySessionPool":
+        """
+        Create a pool configured from the MCP_SESSION_* / MCP_MAX_SESSIONS environment variables.
+
+        Args:
+            factory: Creates a MemorySession for a branch
+            pool_size: Dolt connection pool size the sessions draw from (0 = pooling off)
+        """
+        max_sessions = int(os.environ.get("MCP_MAX_SESSIONS", DEFAULT_MAX_SESSIONS))
+        capacity = max(1, pool_size - POOL_HEADROOM)
+        if pool_size > 0 and max_sessions > capacity:
+            logger.warning(
+                f"MCP_MAX_SESSIONS={max_sessions} exceeds what DOLT_POOL_SIZE={pool_size} can "
+                f"hold open; keeping at most {capacity} memory sessions"
+            )
+            max_sessions = capacity
+        return cls(
+            factory,
+            idle_timeout=float(
+                os.environ.get("MCP_SESSION_IDLE_TIMEOUT_SECONDS", DEFAULT_IDLE_TIMEOUT_SECONDS)
+            ),
+            max_sessions=max_sessions,
+        )
+
+    def get(self, branch: str) -> MemorySession:
+        """
+        Get the session for a branch, creating it if necessary.
+
+        Args:
+            branch: Dolt branch the session is pinned to
+
+        Returns:
+            The MemorySession for the branch
+
+        Raises:
+            Exception: Whatever the factory raises when the session cannot be created
+        """
+        return self._get(branch, lease=False)
+
+    @contextmanager
+    def lease(self, branch: str) -> Iterator[MemorySession]:
+        """
+        Get the session for a branch and keep it open until the block exits.
+
+        Args:
+            branch: Dolt branch the session is pinned to
+
+        Yields:
+            The MemorySession for the branch
+        """
+        session = self._get(branch, lease=True)
+        try:
+            yield session
+        finally:
+            with self._lock:
+                session.leases -= 1
+                if self._sessions.get(branch) is session:  # Not closed by close_all()
+                    self._touch(branch, session)
+                overflow = self._pop_overflow()
+            self._close(overflow)
+
+    def _get(self, branch: str, lease: bool) -> MemorySession:
+        with self._lock:
+            expired = self._pop_idle()
+            session = self._sessions.get(branch)
+            if session is not None:
+                self._touch(branch, session)
+                self._counters["hits"] += 1
+                if lease:
+                    session.leases += 1
+        self._close(expired)
+        if session is not None:
+            return session
+
+        # Create outside the lock so a slow connect does not block other branches
+        logger.info(f"Creating MCP memory session for branch '{branch}'")
+        created = self.factory(branch)
+
+        with self._lock:
+            session = self._sessions.get(branch)
+            if session is None:
+                session = created
+                self._sessions[branch] = session
+                self._counters["created"] += 1
+                created = None
+            self._touch(branch, session)
+            if lease:
+                session.leases += 1
+            overflow = self._pop_overflow(keep=session)
+        # Another caller created the same session first
+        self._close([created] if created is not None else [])
+        self._close(overflow)
+        return session
+
+    def evict_idle(self) -> int:
+        """Close sessions that have been idle longer than idle_timeout; return how many."""
+        with self._lock:
+            expired = self._pop_idle()
+        self._close(expired)
+        return len(expired)
+
+    def close_all(self) -> None:
+        """Close every session in the pool."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        self._close(sessions)
+
+    def sessions(self) -> List[str]:
+        """Branches of the open sessions, least recently used first."""
+        with self._lock:
+            return list(self._sessions)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size, configuration and hit/create/evict counters."""
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "open_sessions": len(self._sessions),
+                "max_sessions": self.max_sessions,
+                "idle_timeout_seconds": self.idle_timeout,
+                **self._counters,
+                "sessions": [
+                    {
+                        "branch": branch,
+                        "idle_seconds": round(now - session.last_used, 1),
+                        "leases": session.leases,
+                    }
+                    for branch, session in self._sessions.items()
+                ],
+            }
+
+    def _touch(self, branch: str, session: MemorySession) -> None:
+        session.last_used = time.monotonic()
+        self._sessions.move_to_end(branch)
+
+    def _pop_idle(self) -> List[MemorySession]:
+        if not self.idle_timeout or self.idle_timeout <= 0:
+            return []
+        cutoff = time.monotonic() - self.idle_timeout
+        expired_keys = [
+            key for key, s in self._sessions.items() if s.last_used < cutoff and not s.leases
+        ]
+        self._counters["evicted"] += len(expired_keys)
+        return [self._sessions.pop(key) for key in expired_keys]
+
+    def _pop_overflow(self, keep: Optional[MemorySession] = None) -> List[MemorySession]:
+        """Remove least recently used sessions beyond max_sessions, skipping leased ones."""
+        excess = len(self._sessions) - self.max_sessions
+        if excess <= 0:
+            return []
+        evictable = [key for key, s in self._sessions.items() if not s.leases and s is not keep]
+        evictable = evictable[:excess]
+        self._counters["evicted"] += len(evictable)
+        return [self._sessions.pop(key) for key in evictable]
+
+    def _close(self, sessions: List[MemorySession]) -> None:
+        for session in sessions:
+            logger.info(f"Closing MCP memory session for branch '{session.branch}'")
+            session.close()
@@ -0,0 +1,262 @@
+"""
+Tool Executor for the MCP Server
+
+CogniTool functions are synchronous: they block on Dolt queries and embedding calls.
+Calling them straight from the async MCP wrappers stalls the FastMCP event loop, so
+one slow GetProjectGraph holds up every other connected agent.
+
+ToolExecutor runs tool bodies on a bounded thread pool instead:
+- Each tool has a concurrency limit; calls beyond it wait on the event loop
+- Read-only tools run in parallel; mutating tools serialize per Dolt branch
+- Calls that exceed the timeout return an error to the caller. The worker thread
+  cannot be interrupted, so its concurrency slot (and branch lock) is held until
+  it really finishes
+- Queue depth, wait time and latency are tracked per tool (see stats())
+
+Configuration (environment variables):
+- MCP_TOOL_WORKERS: worker threads (default 8)
+- MCP_TOOL_TIMEOUT_SECONDS: per-call timeout, 0 disables it (default 120)
+- MCP_TOOL_MAX_CONCURRENCY: default concurrent calls per tool (default 4)
+- MCP_TOOL_CONCURRENCY_LIMITS: per-tool overrides, e.g. "GetProjectGraph=2,DoltPull=1"
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_TIMEOUT_SECONDS = 120.0
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Lock key for mutating calls that are not tied to a memory bank branch
+NO_BRANCH = "__no_branch__"
+
+
+class ToolTimeoutError(TimeoutError):
+    """Raised when a tool call does not finish within the executor timeout."""
+
+
+def _parse_concurrency_limits(value: str) -> Dict[str, int]:
+    """Parse "ToolA=2,ToolB=1" into {"ToolA": 2, "ToolB": 1}, skipping malformed entries."""
+    limits = {}
+    for entry in value.split(","):
+        name, _, limit = entry.partition("=")
+        try:
+            limits[name.strip()] = max(1, int(limit))
+        except ValueError:
+            if entry.strip():
+                logger.warning(f"Ignoring malformed MCP tool concurrency limit: '{entry}'")
+    return limits
+
+
+class ToolExecutor:
+    """Runs synchronous tool functions on a bounded worker pool for async callers."""
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: Optional[float] = DEFAULT_TIMEOUT_SECONDS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        concurrency_limits: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Number of worker threads shared by all tools
+            timeout: Default per-call timeout in seconds (None or 0 disables it)
+            max_concurrency: Concurrent calls allowed per tool unless overridden
+            concurrency_limits: Per-tool overrides of max_concurrency
+        """
+        self.max_workers = max_workers
+        self.timeout = timeout or None
+        self.max_concurrency = max_concurrency
+        self.concurrency_limits = dict(concurrency_limits or {})
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mcp-tool")
+        # asyncio primitives are bound to the loop they are first contended on
+        self._loop_primitives = weakref.WeakKeyDictionary()
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._stats_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "ToolExecutor":
+        """Create an executor configured from the MCP_TOOL_* environment variables."""
+        return cls(
+            max_workers=int(os.environ.get("MCP_TOOL_WORKERS", DEFAULT_MAX_WORKERS)),
+            timeout=float(os.environ.get("MCP_TOOL_TIMEOUT_SECONDS", DEFAULT_TIMEOUT_SECONDS)),
+            max_concurrency=int(
+                os.environ.get("MCP_TOOL_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)
+            ),
+            concurrency_limits=_parse_concurrency_limits(
+                os.environ.get("MCP_TOOL_CONCURRENCY_LIMITS", "")
+            ),
+        )
+
+    def _primitives(self) -> Dict[str, Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        primitives = self._loop_primitives.get(loop)
+        if primitives is None:
+            primitives = {"semaphores": {}, "branch_locks": {}}
+            self._loop_primitives[loop] = primitives
+        return primitives
+
+    def _semaphore(self, tool_name: str) -> asyncio.Semaphore:
+        semaphores = self._primitives()["semaphores"]
+        if tool_name not in semaphores:
+            limit = self.concurrency_limits.get(tool_name, self.max_concurrency)
+            semaphores[tool_name] = asyncio.Semaphore(limit)
+        return semaphores[tool_name]
+
+    def _branch_lock(self, branch: Optional[str]) -> asyncio.Lock:
+        locks = self._primitives()["branch_locks"]
+        return locks.setdefault(branch or NO_BRANCH, asyncio.Lock())
+
+    def _record(self, tool_name: str, **changes: float) -> None:
+        with self._stats_lock:
+            stats = self._stats.setdefault(
+                tool_name,
+                {
+                    "calls": 0,
+                    "errors": 0,
+                    "timeouts": 0,
+                    "queued": 0,
+                    "running": 0,
+                    "max_queue_depth": 0,
+                    "total_wait_ms": 0.0,
+                    "total_latency_ms": 0.0,
+                    "max_latency_ms": 0.0,
+                },
+            )
+            for key, delta in changes.items():
+                stats[key] += delta
+            stats["max_queue_depth"] = max(stats["max_queue_depth"], stats["queued"])
+            if "total_latency_ms" in changes:
+                stats["max_latency_ms"] = max(stats["max_latency_ms"], changes["total_latency_ms"])
+
+    async def run(
+        self,
+        tool_name: str,
+        func: Callable[..., Any],
+        *args: Any,
+        read_only: bool = False,
+        branch: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Run func(*args) on the worker pool and return its result.
+
+        Args:
+            tool_name: Name used for the concurrency limit and the stats
+            func: The synchronous function to run
+            *args: Positional arguments for func
+            read_only: Whether the call only reads; mutating calls hold the branch lock
+            branch: Dolt branch the call works on (mutating calls serialize per branch)
+            timeout: Per-call timeout in seconds, defaults to the executor timeout
+
+        Returns:
+            Whatever func returns
+
+        Raises:
+            ToolTimeoutError: If the call does not finish in time
+            Exception: Whatever func raises
+        """
+        timeout = timeout or self.timeout
+        semaphore = self._semaphore(tool_name)
+        branch_lock = None if read_only else self._branch_lock(branch)
+
+        queued_at = time.perf_counter()
+        self._record(tool_name, queued=1)
+        try:
+            await semaphore.acquire()
+            if branch_lock is not None:
+                try:
+                    await branch_lock.acquire()
+                except BaseException:
+                    semaphore.release()
+                    raise
+        finally:
+            self._record(tool_name, queued=-1)
+
+        started_at = time.perf_counter()
+        self._record(tool_name, calls=1, running=1, total_wait_ms=(started_at - queued_at) * 1000)
+
+        def _release(_future=None) -> None:
+            if branch_lock is not None:
+                branch_lock.release()
+            semaphore.release()
+            self._record(
+                tool_name,
+                running=-1,
+                total_latency_ms=(time.perf_counter() - started_at) * 1000,
+            )
+
+        # Copy the caller's context so the tool still sees the MCP request (as asyncio.to_thread)
+        context = contextvars.copy_context()
+        future = asyncio.get_running_loop().run_in_executor(
+            self._pool, functools.partial(context.run, func, *args)
+        )
+        try:
+            result = await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            self._record(tool_name, timeouts=1, errors=1)
+            logger.error(f"Tool {tool_name} timed out after {timeout}s; releasing it on completion")
+            future.add_done_callback(_release)
+            raise ToolTimeoutError(f"{tool_name} timed out after {timeout} seconds")
+        except BaseException:
+            if future.done():
+                self._record(tool_name, errors=1)
+                _release()
+            else:
+                # Cancelled while the worker is still running
+                future.add_done_callback(_release)
+            raise
+        _release()
+        return result
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per-tool execution statistics.
+
+        Returns:
+            Mapping of tool name to calls, errors, timeouts, current queue depth
+            (queued) and running calls, max_queue_depth, and average/maximum
+            latency and queue wait in milliseconds
+        """
+        with self._stats_lock:
+            snapshot = {name: dict(stats) for name, stats in self._stats.items()}
+        for stats in snapshot.values():
+            finished = max(stats["calls"] - stats["running"], 1)
+            stats["avg_wait_ms"] = stats["total_wait_ms"] / max(stats["calls"], 1)
+            stats["avg_latency_ms"] = stats["total_latency_ms"] / finished
+        return snapshot
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the worker pool."""
+        self._pool.shutdown(wait=wait)
+
+
+_executor: Optional[ToolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_tool_executor() -> ToolExecutor:
+    """Get the process-wide ToolExecutor, creating it from the environment if necessary."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ToolExecutor.from_env()
+            logger.info(
+                f"Initialized MCP tool executor: {_executor.max_workers} workers, "
+                f"timeout={_executor.timeout}s, per-tool concurrency={_executor.max_concurrency}"
+            )
+        return _executor
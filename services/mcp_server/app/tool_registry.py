@@ -47,10 +47,9 @@ from infra_core.memory_system.tools.agent_facing.get_linked_blocks_tool import (
     get_linked_blocks_tool_instance,
 )
 
-# DISABLED: GetProjectGraph tool marked as deprecated and broken
-# from infra_core.memory_system.tools.agent_facing.get_project_graph_tool import (
-#     get_project_graph_tool,
-# )
+from infra_core.memory_system.tools.agent_facing.get_project_graph_tool import (
+    get_project_graph_tool,
+)
 from infra_core.memory_system.tools.agent_facing.global_memory_inventory_tool import (
     global_memory_inventory_tool,
 )
@@ -114,6 +113,30 @@ from infra_core.memory_system.tools.agent_facing.dolt_repo_tool import (
 # - create_namespace_tool (function exists, no CogniTool instance)
 # - list_namespaces_tool (function exists, no CogniTool instance)
 
+# Tools that only read memory or Dolt state. The MCP server may run these concurrently;
+# every other tool is treated as mutating and serialized per branch.
+READ_ONLY_TOOL_NAMES = frozenset(
+    {
+        "GetMemoryBlock",
+        "GetMemoryLinks",
+        "GetLinkedBlocks",
+        "GetProjectGraph",
+        "GetActiveWorkItems",
+        "GlobalMemoryInventory",
+        "GlobalSemanticSearch",
+        "HealthCheck",
+        "ListNamespaces",
+        "DoltStatus",
+        "DoltListBranches",
+        "DoltDiff",
+    }
+)
+
+
+def is_read_only_tool(tool_name: str) -> bool:
+    """Return True if the named tool never writes memory or Dolt state."""
+    return tool_name in READ_ONLY_TOOL_NAMES
+
 
 def get_all_cogni_tools() -> List[CogniTool]:
     """
@@ -160,6 +183,8 @@ def get_all_cogni_tools() -> List[CogniTool]:
         tools.append(create_block_link_tool)
     if get_linked_blocks_tool_instance:
         tools.append(get_linked_blocks_tool_instance)
+    if get_project_graph_tool:
+        tools.append(get_project_graph_tool)
 
     # Bulk operations
     if bulk_create_blocks_tool:
@@ -222,10 +247,6 @@ def get_all_cogni_tools() -> List[CogniTool]:
     # if log_interaction_block_tool:
     #     tools.append(log_interaction_block_tool)
 
-    # DISABLED: Deprecated tools (included for completeness)
-    # if get_project_graph_tool:
-    #     tools.append(get_project_graph_tool)
-
     return tools
 
 
@@ -0,0 +1,193 @@
+"""
+Tool Result Cache for the MCP Server
+
+Agent swarms often issue the same read at almost the same moment (GetActiveWorkItems,
+GlobalMemoryInventory, DoltListBranches, GetProjectGraph). ToolResultCache lets those
+calls share work:
+- Single-flight: concurrent identical read-only calls (same tool, normalized input,
+  branch and namespace) share one execution
+- Short TTL cache: successful results are reused until they expire
+- Writes invalidate: a mutating tool call drops every cached result for its branch,
+  and a read that overlapped the write is not cached at all
+- Cancellation stays local: if the caller running a shared call is cancelled, the
+  callers waiting on it run the call again instead of being cancelled too
+
+Cached results are shared between callers and must be treated as read-only.
+
+Configuration (environment variables):
+- MCP_TOOL_CACHE_TTL_SECONDS: how long results are reused, 0 disables caching but
+  keeps single-flight (default 5)
+- MCP_TOOL_CACHE_MAX_ENTRIES: maximum cached results (default 256)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 5.0
+DEFAULT_MAX_ENTRIES = 256
+
+CacheKey = Tuple[str, Optional[str], Optional[str], str]
+
+
+class _RunCancelled(Exception):
+    """Set on an in-flight call whose owner was cancelled; waiters retry it."""
+
+
+def _is_cacheable(result: Any) -> bool:
+    """Only successful results are cached; error responses are always recomputed."""
+    return not (isinstance(result, dict) and result.get("success") is False)
+
+
+class ToolResultCache:
+    """Single-flight and short-lived result cache for read-only tool calls."""
+
+    def __init__(self, ttl: float = DEFAULT_TTL_SECONDS, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a result is reused (0 disables caching, keeping single-flight)
+            max_entries: Maximum number of cached results
+        """
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[CacheKey, asyncio.Future] = {}
+        # Bumped on every write so reads that overlapped it are not cached
+        self._generations: Dict[Optional[str], int] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "coalesced": 0, "invalidations": 0}
+
+    @classmethod
+    def from_env(cls) -> "ToolResultCache":
+        """Create a cache configured from the MCP_TOOL_CACHE_* environment variables."""
+        return cls(
+            ttl=float(os.environ.get("MCP_TOOL_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)),
+            max_entries=int(os.environ.get("MCP_TOOL_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+        )
+
+    @staticmethod
+    def make_key(
+        tool_name: str, input_data: Any, branch: Optional[str], namespace_id: Optional[str]
+    ) -> CacheKey:
+        """Build the cache key from the tool name, normalized input, branch and namespace."""
+        normalized = json.dumps(input_data, sort_keys=True, default=str)
+        return (tool_name, branch, namespace_id, normalized)
+
+    async def get_or_run(
+        self,
+        tool_name: str,
+        input_data: Any,
+        runner: Callable[[], Awaitable[Any]],
+        branch: Optional[str] = None,
+        namespace_id: Optional[str] = None,
+    ) -> Any:
+        """
+        Return a cached or in-flight result for an identical call, or run it.
+
+        Args:
+            tool_name: Name of the read-only tool
+            input_data: JSON-serializable tool input (dict key order does not matter)
+            runner: Coroutine function that executes the tool
+            branch: Branch the call reads from
+            namespace_id: Namespace the call reads from
+
+        Returns:
+            The tool result, possibly shared with other callers
+        """
+        key = self.make_key(tool_name, input_data, branch, namespace_id)
+        owner = False
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry[1]
+            in_flight = self._in_flight.get(key)
+            if in_flight is not None:
+                self._stats["coalesced"] += 1
+            else:
+                self._stats["misses"] += 1
+                in_flight = asyncio.get_running_loop().create_future()
+                self._in_flight[key] = in_flight
+                generation = self._generations.get(branch, 0)
+                owner = True
+
+        if not owner:
+            # Another caller is already running this exact call
+            try:
+                return await asyncio.shield(in_flight)
+            except _RunCancelled:
+                # Its caller went away: run it again, or join whoever got there first
+                return await self.get_or_run(tool_name, input_data, runner, branch, namespace_id)
+
+        try:
+            result = await runner()
+        except BaseException as e:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            if not in_flight.done():
+                if isinstance(e, asyncio.CancelledError):
+                    e = _RunCancelled()
+                in_flight.set_exception(e)
+                # Mark retrieved so an exception nobody else awaited is not logged
+                in_flight.exception()
+            raise
+
+        with self._lock:
+            self._in_flight.pop(key, None)
+            if (
+                self.ttl > 0
+                and _is_cacheable(result)
+                and self._generations.get(branch, 0) == generation
+            ):
+                self._entries[key] = (time.monotonic() + self.ttl, result)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        in_flight.set_result(result)
+        return result
+
+    def invalidate_branch(self, branch: Optional[str]) -> None:
+        """Drop cached results for a branch after a write on it."""
+        with self._lock:
+            self._generations[branch] = self._generations.get(branch, 0) + 1
+            stale = [key for key in self._entries if key[1] == branch]
+            for key in stale:
+                del self._entries[key]
+            self._stats["invalidations"] += 1
+        if stale:
+            logger.debug(f"Invalidated {len(stale)} cached tool results for branch '{branch}'")
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit, miss, coalesced and invalidation counters plus the current size."""
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries), "ttl_seconds": self.ttl}
+
+
+_cache: Optional[ToolResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_tool_result_cache() -> ToolResultCache:
+    """Get the process-wide ToolResultCache, creating it from the environment if necessary."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ToolResultCache.from_env()
+        return _cache
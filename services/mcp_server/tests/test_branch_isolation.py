@@ -429,3 +429,45 @@ class TestBranchIsolationEdgeCases:
             # Verify memory bank and link manager are configured with correct branch
             assert mcp_module.get_memory_bank().branch == "ai-education-team"
             assert mcp_module.get_link_manager().active_branch == "ai-education-team"
+
+    @patch("mysql.connector.connect")
+    @patch("infra_core.memory_system.structured_memory_bank.StructuredMemoryBank")
+    @patch("infra_core.memory_system.sql_link_manager.SQLLinkManager")
+    def test_set_session_context_uses_pooled_session_per_branch(
+        self, mock_link_manager_class, mock_memory_bank_class, mock_mysql_connect
+    ):
+        """Test switching branch pins a separate pooled session instead of checking out."""
+        mock_mysql_connect.return_value = MagicMock()
+
+        def make_bank(**kwargs):
+            bank = MagicMock()
+            bank.branch = kwargs["branch"]
+            return bank
+
+        mock_memory_bank_class.side_effect = make_bank
+        mock_link_manager_class.side_effect = lambda *args, **kwargs: MagicMock()
+
+        with patch.dict(os.environ, {"DOLT_BRANCH": "main", "DOLT_NAMESPACE": "legacy"}):
+            import services.mcp_server.app.mcp_server as mcp_module
+
+            importlib.reload(mcp_module)
+
+            main_bank = mcp_module.get_memory_bank()
+            assert mcp_module.set_session_context(branch="feat-x") == ("feat-x", "legacy")
+            feature_bank = mcp_module.get_memory_bank()
+
+            assert main_bank.branch == "main"
+            assert feature_bank.branch == "feat-x"
+            assert feature_bank is not main_bank
+            main_bank.use_persistent_connections.assert_called_once_with("main")
+            main_bank.dolt_writer.checkout_branch.assert_not_called()
+            assert mcp_module.get_session_pool().sessions() == ["main", "feat-x"]
+
+            # Switching namespace keeps the branch's session
+            assert mcp_module.set_session_context(namespace_id="team") == ("feat-x", "team")
+            assert mcp_module.get_memory_bank() is feature_bank
+
+            # Switching back reuses the open session
+            mcp_module.set_session_context(branch="main")
+            assert mcp_module.get_memory_bank() is main_bank
+            assert mock_memory_bank_class.call_count == 2
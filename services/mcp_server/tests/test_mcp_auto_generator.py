@@ -13,6 +13,7 @@ Coverage:
 """
 
 import pytest
+from contextlib import contextmanager
 from unittest.mock import Mock, patch
 
 from services.mcp_server.app.mcp_auto_generator import (
@@ -20,6 +21,8 @@ from services.mcp_server.app.mcp_auto_generator import (
     auto_register_cogni_tools_to_mcp,
     get_auto_generation_stats,
 )
+from services.mcp_server.app.tool_executor import ToolExecutor
+from services.mcp_server.app.tool_result_cache import ToolResultCache
 from services.mcp_server.app.tool_registry import get_all_cogni_tools
 
 from infra_core.memory_system.tools.base.cogni_tool import CogniTool
@@ -159,6 +162,103 @@ class TestCreateMCPWrapperFromCogniTool:
         assert "Test error" in result["error"]
         assert "current_branch" in result
 
+    @pytest.mark.asyncio
+    async def test_wrapper_runs_tool_on_executor(self, mock_cogni_tool, mock_memory_bank_getter):
+        """Test the wrapper runs the tool body on the given executor and records stats."""
+        executor = ToolExecutor(max_workers=2)
+        wrapper = create_mcp_wrapper_from_cogni_tool(
+            mock_cogni_tool, mock_memory_bank_getter, executor=executor
+        )
+
+        try:
+            result = await wrapper(test_field="pooled")
+        finally:
+            executor.shutdown()
+
+        assert result["success"] is True
+        assert executor.stats()["TestTool"]["calls"] == 1
+        assert executor.stats()["TestTool"]["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_tool_holds_memory_bank_lease_while_running(
+        self, mock_memory_bank, mock_memory_bank_getter
+    ):
+        """Test the tool body gets its memory bank from a lease held around the call."""
+        events = []
+
+        @contextmanager
+        def lease(branch):
+            events.append(("lease", branch))
+            yield mock_memory_bank
+            events.append(("release", branch))
+
+        def leased_function(input_data: MockInputModel, memory_bank=None) -> MockOutputModel:
+            events.append(("run", memory_bank.branch))
+            return mock_function(input_data, memory_bank)
+
+        leased_tool = CogniTool(
+            name="LeasedTool",
+            description="Memory-linked tool",
+            input_model=MockInputModel,
+            output_model=MockOutputModel,
+            function=leased_function,
+            memory_linked=True,
+        )
+        wrapper = create_mcp_wrapper_from_cogni_tool(
+            leased_tool, mock_memory_bank_getter, memory_bank_lease=lease
+        )
+
+        result = await wrapper(test_field="leased")
+
+        assert result["success"] is True
+        assert events == [
+            ("lease", "test-branch"),
+            ("run", "test-branch"),
+            ("release", "test-branch"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_read_only_results_cached_until_write(self, mock_memory_bank_getter):
+        """Test read-only tools are served from the cache until a write on the branch."""
+        calls = []
+
+        def read_function(input_data: MockInputModel, memory_bank=None) -> MockOutputModel:
+            calls.append(input_data.test_field)
+            return MockOutputModel(success=True, result=f"Read {input_data.test_field}")
+
+        read_tool = CogniTool(
+            name="GetMemoryBlock",
+            description="Read-only tool",
+            input_model=MockInputModel,
+            output_model=MockOutputModel,
+            function=read_function,
+            memory_linked=True,
+        )
+        write_tool = CogniTool(
+            name="UpdateMemoryBlock",
+            description="Mutating tool",
+            input_model=MockInputModel,
+            output_model=MockOutputModel,
+            function=mock_function,
+            memory_linked=True,
+        )
+        cache = ToolResultCache(ttl=60)
+        read = create_mcp_wrapper_from_cogni_tool(
+            read_tool, mock_memory_bank_getter, result_cache=cache
+        )
+        write = create_mcp_wrapper_from_cogni_tool(
+            write_tool, mock_memory_bank_getter, result_cache=cache
+        )
+
+        await read(test_field="a", namespace_id="ns")
+        await read(test_field="a", namespace_id="ns")
+        assert calls == ["a"]
+
+        await write(test_field="a", namespace_id="ns")
+        result = await read(test_field="a", namespace_id="ns")
+        assert calls == ["a", "a"]
+        assert result["result"] == "Read a"
+
     @pytest.mark.asyncio
     async def test_wrapper_input_validation_error(self, mock_cogni_tool, mock_memory_bank_getter):
         """Test wrapper handles input validation errors."""
@@ -0,0 +1,184 @@
+"""
+Tests for the MCP MemorySessionPool
+
+Validates that memory sessions are:
+- created lazily, once per branch
+- reused across calls for the same branch
+- closed when idle for longer than the idle timeout
+- closed least-recently-used first when the pool is full
+- never closed while a lease on them is held
+- capped by the Dolt connection pool size
+"""
+
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.mcp_server.app.session_pool import (
+    POOL_HEADROOM,
+    MemorySession,
+    MemorySessionPool,
+)
+
+
+@pytest.fixture
+def factory():
+    """Session factory that records the branches it was called with."""
+
+    def create(branch):
+        create.calls.append(branch)
+        memory_bank = MagicMock()
+        memory_bank.branch = branch
+        return MemorySession(
+            branch=branch,
+            memory_bank=memory_bank,
+            link_manager=MagicMock(),
+            pm_links=MagicMock(),
+        )
+
+    create.calls = []
+    return create
+
+
+class TestMemorySessionPool:
+    """Test session creation, reuse and eviction."""
+
+    def test_sessions_are_created_lazily_per_branch(self, factory):
+        """Test each branch gets its own session, created on first use only."""
+        pool = MemorySessionPool(factory)
+
+        main = pool.get("main")
+        assert pool.get("main") is main
+        feature = pool.get("feat/x")
+
+        assert factory.calls == ["main", "feat/x"]
+        assert feature.memory_bank.branch == "feat/x"
+        assert pool.stats()["hits"] == 1
+        assert pool.stats()["open_sessions"] == 2
+
+    def test_idle_sessions_are_closed(self, factory):
+        """Test sessions unused for longer than idle_timeout are closed and recreated on demand."""
+        pool = MemorySessionPool(factory, idle_timeout=0.05)
+        session = pool.get("main")
+
+        time.sleep(0.1)
+        assert pool.evict_idle() == 1
+
+        session.memory_bank.close_persistent_connections.assert_called_once()
+        session.link_manager.close_persistent_connection.assert_called_once()
+        assert pool.sessions() == []
+        assert pool.get("main") is not session
+
+    def test_least_recently_used_session_is_closed_when_full(self, factory):
+        """Test the pool closes the least recently used session beyond max_sessions."""
+        pool = MemorySessionPool(factory, max_sessions=2)
+        first = pool.get("branch-1")
+        pool.get("branch-2")
+        pool.get("branch-1")  # branch-2 is now least recently used
+        pool.get("branch-3")
+
+        assert pool.sessions() == ["branch-1", "branch-3"]
+        first.memory_bank.close_persistent_connections.assert_not_called()
+        assert pool.stats()["evicted"] == 1
+
+    def test_leased_session_survives_idle_eviction(self, factory):
+        """Test an idle sweep skips a session a tool is still using."""
+        pool = MemorySessionPool(factory, idle_timeout=0.05)
+
+        with pool.lease("main") as session:
+            time.sleep(0.1)
+            assert pool.evict_idle() == 0
+            session.memory_bank.close_persistent_connections.assert_not_called()
+            assert pool.stats()["sessions"][0]["leases"] == 1
+
+        assert pool.evict_idle() == 0  # Releasing the lease counts as a use
+        time.sleep(0.1)
+        assert pool.evict_idle() == 1
+        session.memory_bank.close_persistent_connections.assert_called_once()
+
+    def test_leased_sessions_are_skipped_when_full(self, factory):
+        """Test LRU eviction passes over leased sessions and trims once they are released."""
+        pool = MemorySessionPool(factory, max_sessions=1)
+
+        with pool.lease("branch-1") as first:
+            second = pool.get("branch-2")
+            assert pool.sessions() == ["branch-1", "branch-2"]
+            first.memory_bank.close_persistent_connections.assert_not_called()
+            second.memory_bank.close_persistent_connections.assert_not_called()
+
+        # branch-1 is the session just released, so branch-2 is now least recently used
+        assert pool.sessions() == ["branch-1"]
+        second.memory_bank.close_persistent_connections.assert_called_once()
+        first.memory_bank.close_persistent_connections.assert_not_called()
+
+    def test_concurrent_leases_share_a_session(self, factory):
+        """Test a session stays leased until its last holder releases it."""
+        pool = MemorySessionPool(factory, max_sessions=1)
+
+        with pool.lease("branch-1") as outer:
+            with pool.lease("branch-1") as inner:
+                assert inner is outer
+            pool.get("branch-2")
+            outer.memory_bank.close_persistent_connections.assert_not_called()
+
+        assert pool.sessions() == ["branch-1"]
+
+    def test_concurrent_gets_keep_a_single_session(self, factory):
+        """Test racing callers for the same key end up sharing one session."""
+        pool = MemorySessionPool(factory)
+        results = []
+
+        def worker():
+            results.append(pool.get("main"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(session) for session in results}) == 1
+        assert pool.sessions() == ["main"]
+
+    def test_factory_errors_propagate(self):
+        """Test a failing factory leaves no session behind."""
+
+        def failing_factory(branch):
+            raise RuntimeError("Memory system initialization failed")
+
+        pool = MemorySessionPool(failing_factory)
+
+        with pytest.raises(RuntimeError):
+            pool.get("main")
+        assert pool.sessions() == []
+
+    def test_close_all(self, factory):
+        """Test close_all closes every session."""
+        pool = MemorySessionPool(factory)
+        sessions = [pool.get(f"branch-{i}") for i in range(3)]
+
+        pool.close_all()
+
+        assert pool.sessions() == []
+        for session in sessions:
+            session.memory_bank.close_persistent_connections.assert_called_once()
+
+
+class TestMemorySessionPoolFromEnv:
+    """Test MCP_MAX_SESSIONS is kept within the Dolt connection pool's capacity."""
+
+    def test_max_sessions_capped_by_pool_size(self, factory):
+        """Test sessions cannot pin every pooled connection of a kind."""
+        with patch.dict(os.environ, {"MCP_MAX_SESSIONS": "16"}):
+            pool = MemorySessionPool.from_env(factory, pool_size=8)
+
+        assert pool.max_sessions == 8 - POOL_HEADROOM
+
+    def test_max_sessions_within_capacity_kept(self, factory):
+        """Test a small MCP_MAX_SESSIONS and an unpooled config are left as configured."""
+        with patch.dict(os.environ, {"MCP_MAX_SESSIONS": "4"}):
+            assert MemorySessionPool.from_env(factory, pool_size=8).max_sessions == 4
+            assert MemorySessionPool.from_env(factory, pool_size=0).max_sessions == 4
@@ -0,0 +1,163 @@
+"""
+Tests for the MCP ToolExecutor
+
+Validates that synchronous tool bodies run off the event loop with:
+- read-only tools running in parallel
+- mutating tools serialized per branch
+- per-tool concurrency limits
+- timeouts that release their slot only when the worker finishes
+- per-tool queue depth and latency statistics
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from services.mcp_server.app.tool_executor import (
+    ToolExecutor,
+    ToolTimeoutError,
+    _parse_concurrency_limits,
+)
+
+
+@pytest.fixture
+def executor():
+    """Create a ToolExecutor and shut it down after the test."""
+    tool_executor = ToolExecutor(max_workers=8, timeout=5, max_concurrency=4)
+    yield tool_executor
+    tool_executor.shutdown(wait=True)
+
+
+class Tracker:
+    """Records the maximum number of calls that overlapped."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def work(self, value, duration=0.05):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(duration)
+        with self._lock:
+            self.active -= 1
+        return value
+
+
+class TestToolExecutor:
+    """Test concurrency, timeout and stats behaviour of ToolExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_run_returns_result_and_propagates_errors(self, executor):
+        """Test results are returned and tool exceptions are re-raised."""
+
+        def failing(_):
+            raise ValueError("boom")
+
+        assert await executor.run("Echo", lambda value: value, "ok", read_only=True) == "ok"
+        with pytest.raises(ValueError, match="boom"):
+            await executor.run("Failing", failing, None)
+
+        assert executor.stats()["Failing"]["errors"] == 1
+        assert executor.stats()["Failing"]["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_read_only_tools_run_in_parallel(self, executor):
+        """Test read-only calls overlap on the worker pool."""
+        tracker = Tracker()
+
+        results = await asyncio.gather(
+            *(executor.run("GetMemoryBlock", tracker.work, i, read_only=True) for i in range(4))
+        )
+
+        assert results == [0, 1, 2, 3]
+        assert tracker.max_active > 1
+
+    @pytest.mark.asyncio
+    async def test_writes_serialize_per_branch(self, executor):
+        """Test mutating calls on one branch never overlap, but other branches proceed."""
+        same_branch = Tracker()
+        await asyncio.gather(
+            *(
+                executor.run("UpdateMemoryBlock", same_branch.work, i, branch="main")
+                for i in range(3)
+            )
+        )
+        assert same_branch.max_active == 1
+
+        other_branches = Tracker()
+        await asyncio.gather(
+            *(
+                executor.run("UpdateMemoryBlock", other_branches.work, i, branch=f"feat-{i}")
+                for i in range(3)
+            )
+        )
+        assert other_branches.max_active > 1
+
+    @pytest.mark.asyncio
+    async def test_per_tool_concurrency_limit(self):
+        """Test a per-tool override caps concurrent calls and queue depth is reported."""
+        limited = ToolExecutor(max_workers=8, concurrency_limits={"GetProjectGraph": 1})
+        tracker = Tracker()
+        try:
+            await asyncio.gather(
+                *(
+                    limited.run("GetProjectGraph", tracker.work, i, read_only=True)
+                    for i in range(3)
+                )
+            )
+        finally:
+            limited.shutdown(wait=True)
+
+        stats = limited.stats()["GetProjectGraph"]
+        assert tracker.max_active == 1
+        assert stats["calls"] == 3
+        assert stats["max_queue_depth"] >= 2
+        assert stats["avg_wait_ms"] > 0
+        assert stats["max_latency_ms"] >= stats["avg_latency_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_timeout_holds_branch_lock_until_worker_finishes(self, executor):
+        """Test a timed-out write reports an error but keeps its branch lock until done."""
+        tracker = Tracker()
+
+        with pytest.raises(ToolTimeoutError):
+            await executor.run("DoltPull", tracker.work, 1, 0.3, branch="main", timeout=0.05)
+
+        # The next write on the branch waits for the abandoned call instead of overlapping it
+        await executor.run("DoltPull", tracker.work, 2, 0.01, branch="main")
+
+        stats = executor.stats()["DoltPull"]
+        assert tracker.max_active == 1
+        assert stats["timeouts"] == 1
+        assert stats["running"] == 0
+
+
+def test_parse_concurrency_limits():
+    """Test parsing of MCP_TOOL_CONCURRENCY_LIMITS values."""
+    assert _parse_concurrency_limits("GetProjectGraph=2, DoltPull=1") == {
+        "GetProjectGraph": 2,
+        "DoltPull": 1,
+    }
+    assert _parse_concurrency_limits("Bad, GetMemoryBlock=0,") == {"GetMemoryBlock": 1}
+    assert _parse_concurrency_limits("") == {}
+
+
+def test_from_env(monkeypatch):
+    """Test the executor reads its configuration from the environment."""
+    monkeypatch.setenv("MCP_TOOL_WORKERS", "3")
+    monkeypatch.setenv("MCP_TOOL_TIMEOUT_SECONDS", "0")
+    monkeypatch.setenv("MCP_TOOL_MAX_CONCURRENCY", "2")
+    monkeypatch.setenv("MCP_TOOL_CONCURRENCY_LIMITS", "DoltPull=1")
+
+    tool_executor = ToolExecutor.from_env()
+    tool_executor.shutdown()
+
+    assert tool_executor.max_workers == 3
+    assert tool_executor.timeout is None
+    assert tool_executor.max_concurrency == 2
+    assert tool_executor.concurrency_limits == {"DoltPull": 1}
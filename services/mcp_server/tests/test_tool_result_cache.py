@@ -0,0 +1,141 @@
+"""
+Tests for the MCP ToolResultCache
+
+Validates single-flight coalescing of identical read-only calls, TTL reuse,
+branch-scoped invalidation by writes and owner cancellation.
+"""
+
+import asyncio
+
+import pytest
+
+from services.mcp_server.app.tool_result_cache import ToolResultCache
+
+
+class CountingRunner:
+    """Coroutine runner that counts executions and can be held open."""
+
+    def __init__(self, result=None, delay=0.0):
+        self.calls = 0
+        self.result = result if result is not None else {"success": True, "items": [1, 2]}
+        self.delay = delay
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.result
+
+
+class TestToolResultCache:
+    """Test coalescing, caching and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one_execution(self):
+        """Test identical in-flight calls are coalesced onto one execution."""
+        cache = ToolResultCache(ttl=0)
+        runner = CountingRunner(delay=0.05)
+
+        results = await asyncio.gather(
+            *(
+                cache.get_or_run("GetActiveWorkItems", {"limit": 10}, runner, branch="main")
+                for _ in range(5)
+            )
+        )
+
+        assert runner.calls == 1
+        assert all(result is results[0] for result in results)
+        assert cache.stats()["coalesced"] == 4
+
+    @pytest.mark.asyncio
+    async def test_results_are_reused_within_ttl(self):
+        """Test a result is served from cache regardless of input key order."""
+        cache = ToolResultCache(ttl=60)
+        runner = CountingRunner()
+
+        await cache.get_or_run("GetProjectGraph", {"a": 1, "b": 2}, runner, branch="main")
+        await cache.get_or_run("GetProjectGraph", {"b": 2, "a": 1}, runner, branch="main")
+
+        assert runner.calls == 1
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_key_includes_branch_and_namespace(self):
+        """Test calls on another branch or namespace are not shared."""
+        cache = ToolResultCache(ttl=60)
+        runner = CountingRunner()
+
+        await cache.get_or_run("DoltListBranches", {}, runner, branch="main", namespace_id="a")
+        await cache.get_or_run("DoltListBranches", {}, runner, branch="feat", namespace_id="a")
+        await cache.get_or_run("DoltListBranches", {}, runner, branch="main", namespace_id="b")
+
+        assert runner.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_only_its_branch(self):
+        """Test invalidate_branch drops cached results for that branch only."""
+        cache = ToolResultCache(ttl=60)
+        runner = CountingRunner()
+
+        for branch in ("main", "feat"):
+            await cache.get_or_run("GlobalMemoryInventory", {}, runner, branch=branch)
+        cache.invalidate_branch("main")
+        for branch in ("main", "feat"):
+            await cache.get_or_run("GlobalMemoryInventory", {}, runner, branch=branch)
+
+        assert runner.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_read_overlapping_a_write_is_not_cached(self):
+        """Test a read that was in flight during a write is returned but not cached."""
+        cache = ToolResultCache(ttl=60)
+        runner = CountingRunner(delay=0.05)
+
+        read = asyncio.create_task(cache.get_or_run("GetMemoryBlock", {}, runner, branch="main"))
+        await asyncio.sleep(0.01)
+        cache.invalidate_branch("main")
+        await read
+        await cache.get_or_run("GetMemoryBlock", {}, runner, branch="main")
+
+        assert runner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_shared_but_not_cached(self):
+        """Test failures reach every coalesced caller and failed results are not cached."""
+        cache = ToolResultCache(ttl=60)
+
+        async def failing():
+            await asyncio.sleep(0.02)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            cache.get_or_run("GetMemoryBlock", {}, failing),
+            cache.get_or_run("GetMemoryBlock", {}, failing),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, ValueError) for result in results)
+
+        error_runner = CountingRunner(result={"success": False, "error": "not found"})
+        await cache.get_or_run("GetMemoryBlock", {"id": "x"}, error_runner)
+        await cache.get_or_run("GetMemoryBlock", {"id": "x"}, error_runner)
+        assert error_runner.calls == 2
+        assert cache.stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_owner_does_not_cancel_waiters(self):
+        """Test callers coalesced onto a cancelled call run it again and get a result."""
+        cache = ToolResultCache(ttl=0)
+        runner = CountingRunner(delay=0.05)
+
+        owner = asyncio.create_task(cache.get_or_run("GetProjectGraph", {}, runner))
+        await asyncio.sleep(0.01)
+        waiters = [
+            asyncio.create_task(cache.get_or_run("GetProjectGraph", {}, runner)) for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        owner.cancel()
+
+        results = await asyncio.gather(*waiters)
+
+        assert owner.cancelled()
+        assert all(result == runner.result for result in results)
+        assert runner.calls == 2  # The cancelled run plus one shared retry
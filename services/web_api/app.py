@@ -50,6 +50,7 @@ async def lifespan(app: FastAPI):
             user=os.environ.get("DOLT_USER", "root"),
             password=os.environ.get("DOLT_PASSWORD", ""),
             database=os.environ.get("DOLT_DATABASE", "memory_dolt"),
+            pool_size=int(os.environ.get("DOLT_POOL_SIZE", "8")),
         )
 
         memory_bank_instance = StructuredMemoryBank(
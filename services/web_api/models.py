@@ -159,6 +159,9 @@ class BlocksResponse(BranchContextResponse):
     namespace_context: Optional[str] = Field(
         None, description="Active namespace used for filtering (when namespace filter applied)"
     )
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page when a limit was applied and more blocks may exist"
+    )
 
 
 class BranchesResponse(BranchContextResponse):
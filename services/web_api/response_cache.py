@@ -0,0 +1,213 @@
+"""
+Conditional GET support for the read endpoints.
+
+Dashboards poll /blocks, /links, /branches and /namespaces, and every poll used to
+rebuild the full response from Dolt. Dolt state is content-addressed, so a read
+endpoint can instead:
+1. Look up one hash describing the data it serves (e.g. the branch's working-set hash)
+2. Derive a weak ETag from that hash plus the request path and query parameters
+3. Answer If-None-Match with 304, or replay a cached body for the same ETag
+4. Only rebuild the response when the hash has moved
+
+If the hash cannot be read the endpoint is served as before, without an ETag.
+Only successful (200/206) responses are cached, so a build must raise on read errors
+rather than return an empty result that would be replayed until the hash moves.
+Fields describing the request rather than the data (the branch-context `timestamp`
+and `active_branch`) are left out of the cached body and filled in on every replay.
+
+Configuration (environment variables):
+- WEB_API_RESPONSE_CACHE_SIZE: cached responses kept in memory (default 128, 0 disables
+  the body cache; 304 answers still work)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, NamedTuple, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+# Setup logger
+logger = logging.getLogger(__name__)
+
+# Response headers that are replayed from the cache along with the body
+CACHED_HEADERS = ("content-type", "link")
+
+
+class CachedResponse(NamedTuple):
+    status_code: int
+    body: bytes
+    headers: Dict[str, str]
+
+
+class ResponseCache:
+    """Small LRU cache of response bodies keyed by ETag."""
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, etag: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(etag)
+            if entry is not None:
+                self._entries.move_to_end(etag)
+            return entry
+
+    def put(self, etag: str, entry: CachedResponse) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[etag] = entry
+            self._entries.move_to_end(etag)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+response_cache = ResponseCache(int(os.environ.get("WEB_API_RESPONSE_CACHE_SIZE", "128")))
+
+
+def _state_key(branch: Any, state_hash: Any) -> Optional[str]:
+    # A fresh branch shares its hashes with its parent, so the branch name is part of the key
+    if not isinstance(state_hash, str) or not state_hash:
+        return None
+    return f"{branch}@{state_hash}"
+
+
+def working_set_hash(memory_bank: Any, branch: Optional[str] = None) -> Optional[str]:
+    """Working-set state of a branch (default: the memory bank's branch), or None."""
+    try:
+        branch = branch or memory_bank.branch
+        return _state_key(branch, memory_bank.dolt_reader.read_working_set_hash(branch))
+    except Exception as e:
+        logger.debug(f"Could not read working set hash for ETag: {e}")
+        return None
+
+
+def branches_state_hash(memory_bank: Any) -> Optional[str]:
+    """State of all branch heads and dirty flags plus the active branch, or None."""
+    try:
+        return _state_key(memory_bank.branch, memory_bank.dolt_reader.read_branches_state_hash())
+    except Exception as e:
+        logger.debug(f"Could not read branches state hash for ETag: {e}")
+        return None
+
+
+def branch_context_fields(memory_bank: Any) -> Dict[str, Any]:
+    """Per-request fields of a BranchContextResponse, as create_with_timestamp fills them."""
+    return {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "active_branch": getattr(
+            getattr(memory_bank, "dolt_writer", None), "active_branch", "unknown"
+        ),
+    }
+
+
+def _encode_json(content: Any) -> bytes:
+    # Same encoding as JSONResponse.render
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _without_fields(body: bytes, names: Iterable[str]) -> bytes:
+    """JSON object body with the named top-level fields removed."""
+    content = json.loads(body)
+    for name in names:
+        content.pop(name, None)
+    return _encode_json(content)
+
+
+def _with_fields(body: bytes, fields: Dict[str, Any]) -> bytes:
+    """Append fields to a JSON object body without decoding it."""
+    if not fields:
+        return body
+    head = body.rstrip()[:-1].rstrip()
+    separator = b"" if head == b"{" else b","
+    return head + separator + _encode_json(jsonable_encoder(fields))[1:]
+
+
+def make_etag(request: Request, state_hash: str) -> str:
+    """Weak ETag over the Dolt state hash, request path and sorted query parameters."""
+    query = "&".join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+    digest = hashlib.sha1(f"{state_hash}|{request.url.path}|{query}".encode("utf-8"))
+    return f'W/"{digest.hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match header matches etag (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {candidate.strip() for candidate in header.split(",")}
+    if "*" in candidates:
+        return True
+    return etag.removeprefix("W/") in {c.removeprefix("W/") for c in candidates}
+
+
+async def conditional_get(
+    request: Request,
+    state_hash_fn: Callable[[], Optional[str]],
+    build: Callable[[], Awaitable[Any]],
+    request_fields: Optional[Callable[[], Dict[str, Any]]] = None,
+) -> Any:
+    """
+    Serve a read endpoint with ETag / If-None-Match support.
+
+    Args:
+        request: The incoming request
+        state_hash_fn: Blocking function returning the Dolt hash of the data served,
+            or None to serve without caching
+        build: Coroutine function producing the response (a Response or a model/dict);
+            it must raise, not return an empty result, when the data cannot be read
+        request_fields: Function returning the response's per-request fields (e.g.
+            branch_context_fields); these are not cached but recomputed on each replay
+
+    Returns:
+        A 304 response, a replayed cached response, or the freshly built response
+    """
+    # Wrap blocking I/O in threadpool to prevent event loop blocking
+    loop = asyncio.get_event_loop()
+    state_hash = await loop.run_in_executor(None, state_hash_fn)
+    if not state_hash:
+        return await build()
+
+    etag = make_etag(request, state_hash)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    cached = response_cache.get(etag)
+    if cached is not None:
+        body = cached.body
+        if request_fields is not None:
+            body = _with_fields(body, request_fields())
+        return Response(
+            content=body,
+            status_code=cached.status_code,
+            headers={**cached.headers, "ETag": etag},
+        )
+
+    result = await build()
+    response = result if isinstance(result, Response) else JSONResponse(jsonable_encoder(result))
+    if response.status_code in (200, 206):
+        headers = {
+            name: response.headers[name] for name in CACHED_HEADERS if name in response.headers
+        }
+        body = response.body
+        if request_fields is not None:
+            body = _without_fields(body, request_fields())
+        response_cache.put(etag, CachedResponse(response.status_code, body, headers))
+        response.headers["ETag"] = etag
+    return response
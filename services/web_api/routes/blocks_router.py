@@ -1,8 +1,17 @@
 from fastapi import APIRouter, Request, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 import asyncio
+import json
+from typing import Literal, Optional, Set, Tuple
 
+from infra_core.memory_system.block_query import BlockQuery
 from infra_core.memory_system.schemas.memory_block import MemoryBlock
 from services.web_api.models import ErrorResponse, BlocksResponse, SingleBlockResponse
+from services.web_api.response_cache import (
+    branch_context_fields,
+    conditional_get,
+    working_set_hash,
+)
 # Remove direct import of validate_metadata
 # from infra_core.memory_system.schemas.registry import validate_metadata
 
@@ -28,6 +37,39 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["v1/Blocks"])
 
+# Blocks fetched from Dolt per round trip by the streaming endpoint
+STREAM_PAGE_SIZE = 100
+
+
+def _build_block_query(
+    block_type_filter: Optional[str], case_insensitive: bool, namespace: Optional[str]
+) -> Tuple[BlockQuery, dict]:
+    """Build the BlockQuery for the blocks endpoints and a summary of the filters applied."""
+    filters_applied = {}
+    query = BlockQuery()
+    if block_type_filter:
+        filters_applied["type"] = block_type_filter
+        filters_applied["case_insensitive"] = case_insensitive
+        query.type(block_type_filter, case_insensitive=case_insensitive)
+    if namespace:
+        filters_applied["namespace"] = namespace
+        query.namespace(namespace)
+    return query, filters_applied
+
+
+def _parse_block_fields(value: Optional[str], param: str) -> Optional[Set[str]]:
+    """Parse a comma-separated list of MemoryBlock field names, rejecting unknown ones."""
+    if not value:
+        return None
+    fields = {field.strip() for field in value.split(",") if field.strip()}
+    unknown = fields - set(MemoryBlock.model_fields)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown MemoryBlock field(s) in '{param}': {', '.join(sorted(unknown))}",
+        )
+    return fields
+
 
 @router.get(
     "/blocks",
@@ -48,15 +90,23 @@ async def get_all_blocks(
     case_insensitive: bool = Query(False, description="Case-insensitive type filtering"),
     branch: str = Query("main", description="Dolt branch to read from (default: 'main')"),
     namespace: str = Query("legacy", description="Filter by namespace (default: 'legacy')"),
+    limit: Optional[int] = Query(
+        None, ge=1, le=1000, description="Maximum number of blocks to return (enables paging)"
+    ),
+    cursor: Optional[str] = Query(None, description="next_cursor from a previous page"),
 ) -> BlocksResponse:
     """
     Retrieves memory blocks from the StructuredMemoryBank with branch context.
 
+    Filters are evaluated by the database rather than in Python.
+
     Parameters:
     - type: Optional filter for block type (e.g., "project", "knowledge", "task")
     - case_insensitive: If True, type filtering will be case-insensitive
     - branch: Dolt branch to read from (default: "main")
     - namespace: Filter by namespace (default: "legacy")
+    - limit: Optional page size; when set, results are ordered by ID and next_cursor is returned
+    - cursor: Resume after the last block of a previous page
     """
     # Validate branch name for security
     try:
@@ -64,55 +114,55 @@ async def get_all_blocks(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    # Build the SQL-backed query (use block_type_filter to avoid shadowing built-in type)
+    block_type_filter = type
+    query, filters_applied = _build_block_query(block_type_filter, case_insensitive, namespace)
+    if limit:
+        query.limit(limit)
+    try:
+        query.after(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     try:
         memory_bank = request.app.state.memory_bank
         if not memory_bank:
             logger.error("Memory bank not available in app state during blocks retrieval.")
             raise HTTPException(status_code=500, detail="Memory bank not available")
 
-        # Wrap blocking I/O in threadpool to prevent event loop blocking
-        loop = asyncio.get_event_loop()
-        all_blocks = await loop.run_in_executor(
-            None, lambda: memory_bank.get_all_memory_blocks(branch=branch)
-        )
+        async def build_response() -> BlocksResponse:
+            # Wrap blocking I/O in threadpool to prevent event loop blocking
+            loop = asyncio.get_event_loop()
+            logger.info(f"Querying blocks on branch '{branch}': {query}")
+            page = await loop.run_in_executor(
+                None, lambda: memory_bank.query_memory_block_page(query, branch=branch)
+            )
+            all_blocks = page.blocks
 
-        # Track original count before filtering
-        original_count = len(all_blocks)
-        filters_applied = {}
+            logger.info(f"Retrieved {len(all_blocks)} blocks")
 
-        # Filter blocks by type if specified (use block_type_filter to avoid shadowing built-in type)
-        block_type_filter = type
-        if block_type_filter:
-            logger.info(
-                f"Filtering blocks by type: {block_type_filter} (case_insensitive={case_insensitive})"
-            )
-            filters_applied["type"] = block_type_filter
-            filters_applied["case_insensitive"] = case_insensitive
-            if case_insensitive:
-                all_blocks = [
-                    block for block in all_blocks if block.type.lower() == block_type_filter.lower()
-                ]
-            else:
-                all_blocks = [block for block in all_blocks if block.type == block_type_filter]
-
-        # Filter blocks by namespace (always applied, defaults to 'legacy')
-        if namespace:
-            logger.info(f"Filtering blocks by namespace: {namespace}")
-            filters_applied["namespace"] = namespace
-            all_blocks = [block for block in all_blocks if block.namespace_id == namespace]
-
-        logger.info(f"Retrieved {len(all_blocks)} blocks (filtered from {original_count})")
+            # Follows the last SQL row, so rows that failed to load do not end paging early
+            next_cursor = page.next_cursor
 
-        # Get active branch from memory bank
-        active_branch = getattr(memory_bank.dolt_writer, "active_branch", "unknown")
+            # Get active branch from memory bank
+            active_branch = getattr(memory_bank.dolt_writer, "active_branch", "unknown")
 
-        return BlocksResponse.create_with_timestamp(
-            blocks=all_blocks,  # Now properly typed as List[MemoryBlock]
-            total_count=len(all_blocks),
-            filters_applied=filters_applied if filters_applied else None,
-            namespace_context=namespace,
-            active_branch=active_branch,
-            requested_branch=branch,
+            return BlocksResponse.create_with_timestamp(
+                blocks=all_blocks,  # Now properly typed as List[MemoryBlock]
+                total_count=len(all_blocks),
+                filters_applied=filters_applied if filters_applied else None,
+                namespace_context=namespace,
+                active_branch=active_branch,
+                requested_branch=branch,
+                next_cursor=next_cursor,
+            )
+
+        # Unchanged working set -> 304 or the cached response
+        return await conditional_get(
+            request,
+            lambda: working_set_hash(memory_bank, branch),
+            build_response,
+            request_fields=lambda: branch_context_fields(memory_bank),
         )
     except Exception as e:
         # Log the exception details for debugging
@@ -120,6 +170,120 @@ async def get_all_blocks(
         raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {str(e)}")
 
 
+@router.get(
+    "/blocks/stream",
+    response_class=StreamingResponse,
+    summary="Stream memory blocks as NDJSON or Server-Sent Events",
+    description="Streams memory blocks from the specified Dolt branch page by page as they are read, with optional field projection (e.g. exclude=embedding).",
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid branch name, cursor or field list"},
+        500: {"model": ErrorResponse, "description": "Internal server error"},
+    },
+)
+async def stream_blocks(
+    request: Request,
+    type: str = Query(
+        None, description="Filter by block type (e.g., 'project', 'knowledge', 'task')"
+    ),
+    case_insensitive: bool = Query(False, description="Case-insensitive type filtering"),
+    branch: str = Query("main", description="Dolt branch to read from (default: 'main')"),
+    namespace: str = Query("legacy", description="Filter by namespace (default: 'legacy')"),
+    cursor: Optional[str] = Query(None, description="Resume after the block with this cursor"),
+    format: Literal["ndjson", "sse"] = Query(
+        "ndjson", description="'ndjson' (one block per line) or 'sse' (one event per block)"
+    ),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated MemoryBlock fields to include (default: all)"
+    ),
+    exclude: Optional[str] = Query(
+        None, description="Comma-separated MemoryBlock fields to omit (e.g. 'embedding')"
+    ),
+    page_size: int = Query(
+        STREAM_PAGE_SIZE, ge=1, le=1000, description="Blocks read from Dolt per round trip"
+    ),
+) -> StreamingResponse:
+    """
+    Streams memory blocks instead of building one BlocksResponse document.
+
+    Blocks are read with keyset pagination (ordered by ID), so only one page is held
+    in memory and the first blocks are sent before the rest are read.
+
+    Formats:
+    - ndjson: each line is a (projected) block. A failure mid-stream ends the stream
+      with a line {"error": "..."}
+    - sse: each block is a "block" event whose id is the cursor to resume after it;
+      the stream ends with an "end" event carrying total_count, or an "error" event
+    """
+    # Validate everything up front: once streaming starts the status code is sent
+    try:
+        validate_branch_name(branch)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    include_fields = _parse_block_fields(fields, "fields")
+    exclude_fields = _parse_block_fields(exclude, "exclude")
+
+    block_type_filter = type
+    try:
+        _build_block_query(block_type_filter, case_insensitive, namespace)[0].after(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    memory_bank = getattr(request.app.state, "memory_bank", None)
+    if not memory_bank:
+        logger.error("Memory bank not available in app state during blocks streaming.")
+        raise HTTPException(status_code=500, detail="Memory bank not available")
+
+    def render(event: str, data: dict, event_id: Optional[str] = None) -> str:
+        payload = json.dumps(data)
+        if format == "ndjson":
+            return payload + "\n"
+        prefix = f"id: {event_id}\n" if event_id else ""
+        return f"{prefix}event: {event}\ndata: {payload}\n\n"
+
+    async def generate():
+        loop = asyncio.get_event_loop()
+        page_cursor = cursor
+        total_count = 0
+        try:
+            while True:
+                page_query, _ = _build_block_query(block_type_filter, case_insensitive, namespace)
+                page_query.limit(page_size).after(page_cursor)
+                # Wrap blocking I/O in threadpool to prevent event loop blocking;
+                # query errors propagate so the stream ends with an error line/event
+                page = await loop.run_in_executor(
+                    None, lambda: memory_bank.query_memory_block_page(page_query, branch=branch)
+                )
+                for block in page.blocks:
+                    total_count += 1
+                    data = block.model_dump(
+                        mode="json", include=include_fields, exclude=exclude_fields
+                    )
+                    yield render("block", data, event_id=page_query.next_cursor(block))
+                # Page on the SQL rows: unhydratable rows must not end the stream early
+                page_cursor = page.next_cursor
+                if not page_cursor:
+                    break
+            logger.info(f"Streamed {total_count} blocks from branch '{branch}'")
+            if format == "sse":
+                yield render("end", {"total_count": total_count, "requested_branch": branch})
+        except Exception as e:
+            logger.exception(f"Error streaming blocks: {e}")
+            yield render("error", {"error": str(e)})
+
+    return StreamingResponse(
+        generate(),
+        media_type="application/x-ndjson" if format == "ndjson" else "text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # Every page is read from the requested branch; asking the writer's connection
+            # would block the event loop and may report another request's branch
+            "X-Active-Branch": branch,
+            "X-Requested-Branch": branch,
+        },
+    )
+
+
 @router.get(
     "/blocks/{block_id}",
     response_model=SingleBlockResponse,
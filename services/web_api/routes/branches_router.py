@@ -2,6 +2,11 @@ from fastapi import APIRouter, Request, HTTPException
 import asyncio
 
 from services.web_api.models import ErrorResponse, BranchesResponse
+from services.web_api.response_cache import (
+    branch_context_fields,
+    conditional_get,
+    branches_state_hash,
+)
 from infra_core.memory_system.tools.agent_facing.dolt_repo_tool import (
     dolt_list_branches_tool,
     DoltListBranchesInput,
@@ -43,27 +48,36 @@ async def get_all_branches(request: Request) -> BranchesResponse:
         # Use the existing dolt_list_branches_tool with threadpool to prevent blocking
         input_data = DoltListBranchesInput()
 
-        # Wrap blocking I/O in threadpool to prevent event loop blocking
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None, lambda: dolt_list_branches_tool(input_data, memory_bank)
-        )
+        async def build_response() -> BranchesResponse:
+            # Wrap blocking I/O in threadpool to prevent event loop blocking
+            loop = asyncio.get_event_loop()
+            result = await loop.run_in_executor(
+                None, lambda: dolt_list_branches_tool(input_data, memory_bank)
+            )
 
-        if result.success:
-            logger.info(f"Successfully retrieved {len(result.branches)} branches")
+            if result.success:
+                logger.info(f"Successfully retrieved {len(result.branches)} branches")
 
-            return BranchesResponse.create_with_timestamp(
-                branches=result.branches,  # Now properly typed as List[DoltBranchInfo]
-                total_branches=len(result.branches),
-                active_branch=result.active_branch,
-                requested_branch=None,  # No specific branch requested for listing all
-            )
-        else:
-            logger.error(f"Branch listing failed: {result.error}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to retrieve branches: {result.error or 'Unknown error'}",
-            )
+                return BranchesResponse.create_with_timestamp(
+                    branches=result.branches,  # Now properly typed as List[DoltBranchInfo]
+                    total_branches=len(result.branches),
+                    active_branch=result.active_branch,
+                    requested_branch=None,  # No specific branch requested for listing all
+                )
+            else:
+                logger.error(f"Branch listing failed: {result.error}")
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"Failed to retrieve branches: {result.error or 'Unknown error'}",
+                )
+
+        # Unchanged branch heads -> 304 or the cached response
+        return await conditional_get(
+            request,
+            lambda: branches_state_hash(memory_bank),
+            build_response,
+            request_fields=lambda: branch_context_fields(memory_bank),
+        )
 
     except HTTPException:
         # Re-raise HTTPExceptions as-is
@@ -3,6 +3,8 @@ import logging
 from datetime import datetime
 import httpx
 
+from infra_core.memory_system.connection_pool import get_all_pool_stats
+
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
@@ -63,6 +65,10 @@ async def health_check(request: Request):
             health_status["details"]["database"] = "connection and query successful"
             logger.debug("Health check passed: database connection and query successful")
 
+            pool_stats = get_all_pool_stats()
+            if pool_stats:
+                health_status["details"]["connection_pools"] = pool_stats
+
         except Exception as db_error:
             health_status["status"] = "unhealthy"
             health_status["details"]["database"] = f"connection failed: {str(db_error)}"
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Request, HTTPException, status, Depends
 from fastapi.responses import JSONResponse
 from typing import List, Optional, Dict, Any
+import asyncio
 import logging
 import uuid
 import re
@@ -13,6 +14,7 @@ from infra_core.memory_system.link_manager import (
 )
 from infra_core.memory_system.schemas.common import RelationType, BlockLink
 from services.web_api.models import ErrorResponse
+from services.web_api.response_cache import conditional_get, working_set_hash
 from pydantic import BaseModel, Field, validator
 
 # Setup logger
@@ -127,38 +129,51 @@ async def _paginate_links(
     if cursor:
         query = query.cursor(cursor)
 
-    # Execute query based on function type
-    if block_id:
-        result = query_fn(block_id=block_id, query=query)
-    else:
-        result = query_fn(query=query)
-
-    # Build response
-    response_data = PaginatedLinksResponse(
-        links=result.links, next_cursor=result.next_cursor, page_size=len(result.links)
-    )
-
-    # Determine status code and headers
-    headers = {}
-    if result.next_cursor:
-        # Build next page URL with all relevant parameters
-        url_params = {"cursor": result.next_cursor, "limit": limit}
-        if relation:
-            url_params["relation"] = relation
-        if depth:
-            url_params["depth"] = depth
-        if direction:
-            url_params["direction"] = direction
-
-        next_url = str(request.url.include_query_params(**url_params))
-        headers["Link"] = f'<{next_url}>; rel="next"'
-        status_code = status.HTTP_206_PARTIAL_CONTENT
-    else:
-        status_code = status.HTTP_200_OK
-
-    return JSONResponse(
-        content=response_data.model_dump(mode="json"), status_code=status_code, headers=headers
-    )
+    async def build_response() -> JSONResponse:
+        # Wrap blocking I/O in threadpool to prevent event loop blocking
+        loop = asyncio.get_event_loop()
+        try:
+            # Execute query based on function type
+            if block_id:
+                result = await loop.run_in_executor(
+                    None, lambda: query_fn(block_id=block_id, query=query)
+                )
+            else:
+                result = await loop.run_in_executor(None, lambda: query_fn(query=query))
+        except ValueError as e:
+            # e.g. a cursor that does not decode to a link key
+            raise HTTPException(status_code=400, detail=str(e))
+
+        # Build response
+        response_data = PaginatedLinksResponse(
+            links=result.links, next_cursor=result.next_cursor, page_size=len(result.links)
+        )
+
+        # Determine status code and headers
+        headers = {}
+        if result.next_cursor:
+            # Build next page URL with all relevant parameters
+            url_params = {"cursor": result.next_cursor, "limit": limit}
+            if relation:
+                url_params["relation"] = relation
+            if depth:
+                url_params["depth"] = depth
+            if direction:
+                url_params["direction"] = direction
+
+            next_url = str(request.url.include_query_params(**url_params))
+            headers["Link"] = f'<{next_url}>; rel="next"'
+            status_code = status.HTTP_206_PARTIAL_CONTENT
+        else:
+            status_code = status.HTTP_200_OK
+
+        return JSONResponse(
+            content=response_data.model_dump(mode="json"), status_code=status_code, headers=headers
+        )
+
+    # Unchanged working set -> 304 or the cached page
+    memory_bank = getattr(request.app.state, "memory_bank", None)
+    return await conditional_get(request, lambda: working_set_hash(memory_bank), build_response)
 
 
 def get_link_manager(request: Request):
@@ -2,6 +2,11 @@ from fastapi import APIRouter, Request, HTTPException
 import asyncio
 
 from services.web_api.models import ErrorResponse, NamespacesResponse
+from services.web_api.response_cache import (
+    branch_context_fields,
+    conditional_get,
+    working_set_hash,
+)
 from infra_core.memory_system.tools.agent_facing.dolt_namespace_tool import (
     list_namespaces_tool,
     ListNamespacesInput,
@@ -42,27 +47,36 @@ async def get_all_namespaces(request: Request) -> NamespacesResponse:
         # Use the existing list_namespaces_tool with threadpool to prevent blocking
         input_data = ListNamespacesInput()
 
-        # Wrap blocking I/O in threadpool to prevent event loop blocking
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None, lambda: list_namespaces_tool(input_data, memory_bank)
-        )
+        async def build_response() -> NamespacesResponse:
+            # Wrap blocking I/O in threadpool to prevent event loop blocking
+            loop = asyncio.get_event_loop()
+            result = await loop.run_in_executor(
+                None, lambda: list_namespaces_tool(input_data, memory_bank)
+            )
 
-        if result.success:
-            logger.info(f"Successfully retrieved {len(result.namespaces)} namespaces")
+            if result.success:
+                logger.info(f"Successfully retrieved {len(result.namespaces)} namespaces")
 
-            return NamespacesResponse.create_with_timestamp(
-                namespaces=result.namespaces,  # Now properly typed as List[NamespaceInfo]
-                total_count=result.total_count,
-                active_branch=result.active_branch,
-                requested_branch=None,  # No specific branch requested for listing all
-            )
-        else:
-            logger.error(f"Namespace listing failed: {result.error}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to retrieve namespaces: {result.error or 'Unknown error'}",
-            )
+                return NamespacesResponse.create_with_timestamp(
+                    namespaces=result.namespaces,  # Now properly typed as List[NamespaceInfo]
+                    total_count=result.total_count,
+                    active_branch=result.active_branch,
+                    requested_branch=None,  # No specific branch requested for listing all
+                )
+            else:
+                logger.error(f"Namespace listing failed: {result.error}")
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"Failed to retrieve namespaces: {result.error or 'Unknown error'}",
+                )
+
+        # Unchanged working set -> 304 or the cached response
+        return await conditional_get(
+            request,
+            lambda: working_set_hash(memory_bank),
+            build_response,
+            request_fields=lambda: branch_context_fields(memory_bank),
+        )
 
     except HTTPException:
         # Re-raise HTTPExceptions as-is
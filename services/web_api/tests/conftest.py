@@ -2,6 +2,7 @@ import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import MagicMock
 from services.web_api.app import app
+from infra_core.memory_system.block_query import BlockPage
 from infra_core.memory_system.structured_memory_bank import StructuredMemoryBank
 import respx
 import httpx
@@ -18,6 +19,8 @@ def mock_memory_bank():
     """Provides a MagicMock replacement for the StructuredMemoryBank."""
     mock = MagicMock(spec=StructuredMemoryBank)
     mock.get_all_memory_blocks.return_value = []
+    mock.query_memory_blocks.return_value = []
+    mock.query_memory_block_page.return_value = BlockPage([], 0)
     mock.create_memory_block.return_value = (
         True,
         None,
@@ -3,8 +3,11 @@ from fastapi.testclient import TestClient
 from unittest.mock import MagicMock, patch
 from typing import Dict, Any
 import datetime
+import json
+import uuid
 
 from services.web_api.app import app  # Import your FastAPI app
+from infra_core.memory_system.block_query import BlockPage
 from infra_core.memory_system.schemas.memory_block import MemoryBlock
 from infra_core.memory_system.schemas.common import (
     ConfidenceScore,
@@ -26,6 +29,20 @@ from infra_core.memory_system.tools.agent_facing.get_memory_block_tool import (
 )
 
 
+def _serve_queries_from(mock_memory_bank, blocks):
+    """Answer block queries by evaluating the BlockQuery against in-memory blocks."""
+
+    def query_memory_blocks(query, branch=None):
+        return [block for block in blocks if query.matches(block)][: query.page_size]
+
+    def query_memory_block_page(query, branch=None):
+        matched = query_memory_blocks(query, branch)
+        return query.page([block.model_dump() for block in matched], matched)
+
+    mock_memory_bank.query_memory_blocks.side_effect = query_memory_blocks
+    mock_memory_bank.query_memory_block_page.side_effect = query_memory_block_page
+
+
 # Fixture for TestClient
 @pytest.fixture(scope="module")
 def client():
@@ -80,7 +97,7 @@ def test_get_all_blocks_success(client: TestClient, sample_memory_blocks_data: l
     """Test successful retrieval of all memory blocks."""
     # Mock the StructuredMemoryBank instance with proper active_branch setup
     mock_memory_bank = MagicMock()
-    mock_memory_bank.get_all_memory_blocks.return_value = sample_memory_blocks_data
+    _serve_queries_from(mock_memory_bank, sample_memory_blocks_data)
     mock_memory_bank.dolt_writer = MagicMock()
     mock_memory_bank.dolt_writer.active_branch = "main"
 
@@ -106,9 +123,8 @@ def test_get_all_blocks_success(client: TestClient, sample_memory_blocks_data: l
         assert response_data["total_count"] == len(sample_memory_blocks_data)
         assert len(response_data["blocks"]) == len(sample_memory_blocks_data)
 
-        mock_memory_bank.get_all_memory_blocks.assert_called_once_with(
-            branch="main"
-        )  # Called with default 'main' branch
+        mock_memory_bank.query_memory_block_page.assert_called_once()
+        assert mock_memory_bank.query_memory_block_page.call_args.kwargs["branch"] == "main"
 
         # Clean up app.state.memory_bank if necessary, though TestClient should isolate
         if hasattr(app.state, "memory_bank"):
@@ -139,9 +155,9 @@ def test_get_all_blocks_memory_bank_unavailable(client: TestClient):
 
 
 def test_get_all_blocks_general_exception(client: TestClient):
-    """Test retrieval when get_all_memory_blocks raises an unexpected exception."""
+    """Test retrieval when query_memory_block_page raises an unexpected exception."""
     mock_memory_bank = MagicMock()
-    mock_memory_bank.get_all_memory_blocks.side_effect = Exception("Unexpected DB error")
+    mock_memory_bank.query_memory_block_page.side_effect = Exception("Unexpected DB error")
 
     with patch("services.web_api.app.lifespan", MagicMock()):  # Mock lifespan
         app.state.memory_bank = mock_memory_bank
@@ -150,7 +166,7 @@ def test_get_all_blocks_general_exception(client: TestClient):
 
         assert response.status_code == 500
         assert response.json() == {"detail": "An unexpected error occurred: Unexpected DB error"}
-        mock_memory_bank.get_all_memory_blocks.assert_called_once()
+        mock_memory_bank.query_memory_block_page.assert_called_once()
 
         if hasattr(app.state, "memory_bank"):
             del app.state.memory_bank
@@ -214,13 +230,30 @@ def test_get_all_blocks_bank_unavailable(client_with_mock_bank):
 
 def test_get_all_blocks_bank_exception(client_with_mock_bank, mock_memory_bank):
     """Test error handling when memory bank raises an exception."""
-    mock_memory_bank.get_all_memory_blocks.side_effect = Exception("Dolt connection error")
+    mock_memory_bank.query_memory_block_page.side_effect = Exception("Dolt connection error")
     response = client_with_mock_bank.get("/api/blocks")
     assert response.status_code == 500
     assert "An unexpected error occurred" in response.text
     assert "Dolt connection error" in response.text
 
 
+def test_get_all_blocks_cursor_follows_sql_page(client_with_mock_bank, mock_memory_bank):
+    """Test a full SQL page with an unloadable row still returns next_cursor."""
+    mock_memory_bank.dolt_writer = MagicMock()
+    mock_memory_bank.dolt_writer.active_branch = "main"
+    mock_memory_bank.query_memory_block_page.return_value = BlockPage(
+        blocks=[], row_count=1, next_cursor="cursor-after-bad-row"
+    )
+
+    response = client_with_mock_bank.get("/api/blocks?limit=1")
+
+    assert response.status_code == 200
+    assert response.json()["blocks"] == []
+    assert response.json()["next_cursor"] == "cursor-after-bad-row"
+    query = mock_memory_bank.query_memory_block_page.call_args.args[0]
+    assert query.page_size == 1
+
+
 # Tests for the new GET /api/blocks/{id} endpoint
 @patch("services.web_api.routes.blocks_router.get_memory_block_tool")
 def test_get_block_success(mock_get_block_tool, client_with_mock_bank, sample_memory_block):
@@ -532,7 +565,7 @@ def test_get_blocks_with_type_filter(
 
     # Mock the memory bank with proper active_branch
     mock_memory_bank = MagicMock()
-    mock_memory_bank.get_all_memory_blocks.return_value = test_blocks
+    _serve_queries_from(mock_memory_bank, test_blocks)
     mock_memory_bank.dolt_writer = MagicMock()
     mock_memory_bank.dolt_writer.active_branch = "main"
 
@@ -564,7 +597,7 @@ def test_get_blocks_with_type_filter(
         assert response_data["blocks"] == []
 
         # Verify the memory bank was called each time
-        assert mock_memory_bank.get_all_memory_blocks.call_count == 3
+        assert mock_memory_bank.query_memory_block_page.call_count == 3
 
         if hasattr(app.state, "memory_bank"):
             del app.state.memory_bank
@@ -593,7 +626,7 @@ def test_get_blocks_with_no_type_filter(
 
     # Mock the memory bank with proper active_branch
     mock_memory_bank = MagicMock()
-    mock_memory_bank.get_all_memory_blocks.return_value = test_blocks
+    _serve_queries_from(mock_memory_bank, test_blocks)
     mock_memory_bank.dolt_writer = MagicMock()
     mock_memory_bank.dolt_writer.active_branch = "main"
 
@@ -609,7 +642,7 @@ def test_get_blocks_with_no_type_filter(
         assert len(response_data["blocks"]) == len(test_blocks)
 
         # Verify the memory bank was called
-        mock_memory_bank.get_all_memory_blocks.assert_called_once()
+        mock_memory_bank.query_memory_block_page.assert_called_once()
 
         if hasattr(app.state, "memory_bank"):
             del app.state.memory_bank
@@ -621,7 +654,7 @@ def test_get_blocks_with_empty_type_filter(
     """Test behavior when an empty type filter is provided."""
     # Mock the memory bank with the sample data and proper active_branch
     mock_memory_bank = MagicMock()
-    mock_memory_bank.get_all_memory_blocks.return_value = sample_memory_blocks_data
+    _serve_queries_from(mock_memory_bank, sample_memory_blocks_data)
     mock_memory_bank.dolt_writer = MagicMock()
     mock_memory_bank.dolt_writer.active_branch = "main"
 
@@ -637,7 +670,7 @@ def test_get_blocks_with_empty_type_filter(
         assert len(response_data["blocks"]) == len(sample_memory_blocks_data)
 
         # Verify the memory bank was called
-        mock_memory_bank.get_all_memory_blocks.assert_called_once()
+        mock_memory_bank.query_memory_block_page.assert_called_once()
 
         if hasattr(app.state, "memory_bank"):
             del app.state.memory_bank
@@ -683,7 +716,7 @@ def test_get_blocks_with_case_insensitive_filtering(client: TestClient):
 
     # Mock the memory bank with proper active_branch
     mock_memory_bank = MagicMock()
-    mock_memory_bank.get_all_memory_blocks.return_value = test_blocks
+    _serve_queries_from(mock_memory_bank, test_blocks)
     mock_memory_bank.dolt_writer = MagicMock()
     mock_memory_bank.dolt_writer.active_branch = "main"
 
@@ -714,7 +747,7 @@ def test_get_blocks_with_case_insensitive_filtering(client: TestClient):
         assert response_data["blocks"][0]["id"] == "project-block"
 
         # Verify the memory bank was called each time
-        assert mock_memory_bank.get_all_memory_blocks.call_count == 3
+        assert mock_memory_bank.query_memory_block_page.call_count == 3
 
         if hasattr(app.state, "memory_bank"):
             del app.state.memory_bank
@@ -739,7 +772,7 @@ def test_get_all_blocks_with_explicit_main_branch(client_with_mock_bank, mock_me
             schema_version=1,
         )
     ]
-    mock_memory_bank.get_all_memory_blocks.return_value = test_blocks
+    _serve_queries_from(mock_memory_bank, test_blocks)
 
     response = client_with_mock_bank.get("/api/v1/blocks?branch=main")
 
@@ -759,7 +792,8 @@ def test_get_all_blocks_with_explicit_main_branch(client_with_mock_bank, mock_me
     assert response_data["total_count"] == 1
     assert len(response_data["blocks"]) == 1
     assert response_data["blocks"][0]["id"] == "main-block-1"
-    mock_memory_bank.get_all_memory_blocks.assert_called_once_with(branch="main")
+    mock_memory_bank.query_memory_block_page.assert_called_once()
+    assert mock_memory_bank.query_memory_block_page.call_args.kwargs["branch"] == "main"
 
 
 def test_get_all_blocks_with_different_branch(client_with_mock_bank, mock_memory_bank):
@@ -776,7 +810,7 @@ def test_get_all_blocks_with_different_branch(client_with_mock_bank, mock_memory
             schema_version=1,
         )
     ]
-    mock_memory_bank.get_all_memory_blocks.return_value = test_blocks
+    _serve_queries_from(mock_memory_bank, test_blocks)
 
     response = client_with_mock_bank.get("/api/v1/blocks?branch=feat/test-branch")
 
@@ -789,12 +823,13 @@ def test_get_all_blocks_with_different_branch(client_with_mock_bank, mock_memory
     assert response_data["total_count"] == 1
     assert len(response_data["blocks"]) == 1
     assert response_data["blocks"][0]["id"] == "feature-block-1"
-    mock_memory_bank.get_all_memory_blocks.assert_called_once_with(branch="feat/test-branch")
+    mock_memory_bank.query_memory_block_page.assert_called_once()
+    assert mock_memory_bank.query_memory_block_page.call_args.kwargs["branch"] == "feat/test-branch"
 
 
 def test_get_all_blocks_with_nonexistent_branch(client_with_mock_bank, mock_memory_bank):
     """Test GET /api/v1/blocks with nonexistent branch returns empty array."""
-    mock_memory_bank.get_all_memory_blocks.return_value = []  # Empty for nonexistent branch
+    mock_memory_bank.query_memory_block_page.return_value = BlockPage([], 0)  # Nonexistent branch
 
     response = client_with_mock_bank.get("/api/v1/blocks?branch=nonexistent-branch")
 
@@ -806,7 +841,9 @@ def test_get_all_blocks_with_nonexistent_branch(client_with_mock_bank, mock_memo
     assert response_data["requested_branch"] == "nonexistent-branch"
     assert response_data["total_count"] == 0
     assert response_data["blocks"] == []
-    mock_memory_bank.get_all_memory_blocks.assert_called_once_with(branch="nonexistent-branch")
+    mock_memory_bank.query_memory_block_page.assert_called_once()
+    page_call = mock_memory_bank.query_memory_block_page.call_args
+    assert page_call.kwargs["branch"] == "nonexistent-branch"
 
 
 def test_get_all_blocks_branch_with_type_filter(client_with_mock_bank, mock_memory_bank):
@@ -833,7 +870,7 @@ def test_get_all_blocks_branch_with_type_filter(client_with_mock_bank, mock_memo
             schema_version=1,
         ),
     ]
-    mock_memory_bank.get_all_memory_blocks.return_value = test_blocks
+    _serve_queries_from(mock_memory_bank, test_blocks)
 
     response = client_with_mock_bank.get("/api/v1/blocks?branch=feat/test-branch&type=task")
 
@@ -848,7 +885,8 @@ def test_get_all_blocks_branch_with_type_filter(client_with_mock_bank, mock_memo
     assert response_data["blocks"][0]["id"] == "task-block-1"
     assert response_data["filters_applied"]["type"] == "task"
     assert not response_data["filters_applied"]["case_insensitive"]
-    mock_memory_bank.get_all_memory_blocks.assert_called_once_with(branch="feat/test-branch")
+    mock_memory_bank.query_memory_block_page.assert_called_once()
+    assert mock_memory_bank.query_memory_block_page.call_args.kwargs["branch"] == "feat/test-branch"
 
 
 def test_get_all_blocks_branch_with_case_insensitive_filter(
@@ -867,7 +905,7 @@ def test_get_all_blocks_branch_with_case_insensitive_filter(
             schema_version=1,
         )
     ]
-    mock_memory_bank.get_all_memory_blocks.return_value = test_blocks
+    _serve_queries_from(mock_memory_bank, test_blocks)
 
     response = client_with_mock_bank.get(
         "/api/v1/blocks?branch=feat/test-branch&type=TASK&case_insensitive=true"
@@ -884,7 +922,8 @@ def test_get_all_blocks_branch_with_case_insensitive_filter(
     assert response_data["blocks"][0]["id"] == "task-block-1"
     assert response_data["filters_applied"]["type"] == "TASK"
     assert response_data["filters_applied"]["case_insensitive"]
-    mock_memory_bank.get_all_memory_blocks.assert_called_once_with(branch="feat/test-branch")
+    mock_memory_bank.query_memory_block_page.assert_called_once()
+    assert mock_memory_bank.query_memory_block_page.call_args.kwargs["branch"] == "feat/test-branch"
 
 
 @patch("services.web_api.routes.blocks_router.get_memory_block_tool")
@@ -1043,3 +1082,211 @@ def test_get_block_cross_branch_validation(mock_get_block_tool, client_with_mock
 
     # Verify both calls were made
     assert mock_get_block_tool.call_count == 2
+
+
+# --- Streaming endpoint ---
+
+
+def _stream_blocks(count):
+    return [
+        MemoryBlock(
+            id=f"stream-block-{i}",
+            type="knowledge",
+            text=f"Streamed block {i}",
+            metadata={"source": "stream"},
+            embedding=[0.1] * 384,
+        )
+        for i in range(count)
+    ]
+
+
+def _block_pages(*pages):
+    """
+    query_memory_block_page side effect serving the given pages in turn.
+
+    A page is a list of blocks, a (SQL row blocks, hydrated blocks) tuple, or an
+    exception to raise.
+    """
+    remaining = list(pages)
+
+    def query_memory_block_page(query, branch=None):
+        page = remaining.pop(0)
+        if isinstance(page, Exception):
+            raise page
+        rows, hydrated = page if isinstance(page, tuple) else (page, page)
+        return query.page([block.model_dump() for block in rows], hydrated)
+
+    return query_memory_block_page
+
+
+def test_stream_blocks_ndjson_pages_through_dolt(client_with_mock_bank, mock_memory_bank):
+    """Test GET /api/v1/blocks/stream emits one NDJSON line per block across pages."""
+    blocks = _stream_blocks(3)
+    mock_memory_bank.dolt_writer = MagicMock()
+    mock_memory_bank.dolt_writer.active_branch = "main"
+    mock_memory_bank.query_memory_block_page.side_effect = _block_pages(blocks[:2], blocks[2:])
+
+    response = client_with_mock_bank.get(
+        "/api/v1/blocks/stream?branch=feat/test-branch&page_size=2&exclude=embedding,metadata"
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    # Both headers name the branch the pages are read from, not the writer's connection
+    assert response.headers["x-requested-branch"] == "feat/test-branch"
+    assert response.headers["x-active-branch"] == "feat/test-branch"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["id"] for line in lines] == [block.id for block in blocks]
+    assert all("embedding" not in line and "metadata" not in line for line in lines)
+
+    # Second page resumes after the last block of the first page
+    assert mock_memory_bank.query_memory_block_page.call_count == 2
+    first_query = mock_memory_bank.query_memory_block_page.call_args_list[0].args[0]
+    second_query = mock_memory_bank.query_memory_block_page.call_args_list[1].args[0]
+    assert mock_memory_bank.query_memory_block_page.call_args.kwargs["branch"] == (
+        "feat/test-branch"
+    )
+    assert first_query.page_size == 2
+    assert second_query._cursor == first_query.next_cursor(blocks[1])
+
+
+def test_stream_blocks_pages_on_sql_rows(client_with_mock_bank, mock_memory_bank):
+    """Test a full SQL page with an unhydratable row does not end the stream early."""
+    blocks = _stream_blocks(3)
+    mock_memory_bank.dolt_writer = MagicMock()
+    mock_memory_bank.dolt_writer.active_branch = "main"
+    mock_memory_bank.query_memory_block_page.side_effect = _block_pages(
+        (blocks[:2], blocks[:1]), blocks[2:]
+    )
+
+    response = client_with_mock_bank.get("/api/v1/blocks/stream?page_size=2")
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["id"] for line in lines] == ["stream-block-0", "stream-block-2"]
+    first_query = mock_memory_bank.query_memory_block_page.call_args_list[0].args[0]
+    second_query = mock_memory_bank.query_memory_block_page.call_args_list[1].args[0]
+    # The second page resumes after the last SQL row, not the last hydrated block
+    assert second_query._cursor == first_query.next_cursor(blocks[1])
+
+
+def test_stream_blocks_sse_with_field_projection(client_with_mock_bank, mock_memory_bank):
+    """Test SSE format emits block events with resume ids and a closing end event."""
+    blocks = _stream_blocks(2)
+    mock_memory_bank.dolt_writer = MagicMock()
+    mock_memory_bank.dolt_writer.active_branch = "main"
+    _serve_queries_from(mock_memory_bank, blocks)
+
+    response = client_with_mock_bank.get("/api/v1/blocks/stream?format=sse&fields=id,type")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [event for event in response.text.split("\n\n") if event]
+    assert len(events) == 3
+    assert events[0].startswith("id: ")
+    assert "event: block" in events[0]
+    first_block = json.loads(events[0].split("data: ", 1)[1])
+    assert first_block == {"id": "stream-block-0", "type": "knowledge"}
+    assert "event: end" in events[2]
+    assert json.loads(events[2].split("data: ", 1)[1])["total_count"] == 2
+
+
+def test_stream_blocks_rejects_unknown_fields(client_with_mock_bank, mock_memory_bank):
+    """Test unknown projection fields and bad cursors are rejected before streaming."""
+    assert client_with_mock_bank.get("/api/v1/blocks/stream?exclude=nope").status_code == 400
+    assert client_with_mock_bank.get("/api/v1/blocks/stream?cursor=not-a-cursor").status_code == 400
+    mock_memory_bank.query_memory_block_page.assert_not_called()
+
+
+def test_stream_blocks_reports_errors_in_stream(client_with_mock_bank, mock_memory_bank):
+    """Test a failure after streaming started ends the stream with an error line."""
+    mock_memory_bank.dolt_writer = MagicMock()
+    mock_memory_bank.dolt_writer.active_branch = "main"
+    mock_memory_bank.query_memory_block_page.side_effect = _block_pages(
+        _stream_blocks(1), Exception("DB down")
+    )
+
+    response = client_with_mock_bank.get("/api/v1/blocks/stream?page_size=1")
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[0]["id"] == "stream-block-0"
+    assert lines[-1] == {"error": "DB down"}
+
+
+# --- Conditional GET ---
+
+
+def test_get_all_blocks_etag_and_not_modified(client_with_mock_bank, mock_memory_bank):
+    """Test GET /api/v1/blocks returns an ETag and answers a matching If-None-Match with 304."""
+    mock_memory_bank.dolt_reader = MagicMock()
+    mock_memory_bank.dolt_reader.read_working_set_hash.return_value = uuid.uuid4().hex
+    mock_memory_bank.dolt_writer = MagicMock()
+    mock_memory_bank.dolt_writer.active_branch = "main"
+    mock_memory_bank.query_memory_block_page.return_value = BlockPage(_stream_blocks(2), 2)
+
+    response = client_with_mock_bank.get("/api/v1/blocks?branch=main")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+    mock_memory_bank.dolt_reader.read_working_set_hash.assert_called_with("main")
+
+    not_modified = client_with_mock_bank.get(
+        "/api/v1/blocks?branch=main", headers={"If-None-Match": etag}
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+
+    # Different query parameters get a different ETag
+    other = client_with_mock_bank.get("/api/v1/blocks?branch=main&type=task")
+    assert other.headers["etag"] != etag
+
+
+def test_get_all_blocks_replays_cached_response(client_with_mock_bank, mock_memory_bank):
+    """Test an unchanged working set is served from the response cache without a query."""
+    mock_memory_bank.dolt_reader = MagicMock()
+    mock_memory_bank.dolt_reader.read_working_set_hash.return_value = uuid.uuid4().hex
+    mock_memory_bank.dolt_writer = MagicMock()
+    mock_memory_bank.dolt_writer.active_branch = "main"
+    mock_memory_bank.query_memory_block_page.return_value = BlockPage(_stream_blocks(1), 1)
+
+    first = client_with_mock_bank.get("/api/v1/blocks")
+    mock_memory_bank.dolt_writer.active_branch = "feature/other"
+    second = client_with_mock_bank.get("/api/v1/blocks")
+
+    assert second.status_code == 200
+    assert second.headers["etag"] == first.headers["etag"]
+    assert mock_memory_bank.query_memory_block_page.call_count == 1
+
+    # Per-request branch context is filled in fresh on replay, the data is replayed
+    replayed, original = second.json(), first.json()
+    assert replayed["active_branch"] == "feature/other"
+    assert replayed["timestamp"] >= original["timestamp"]
+    for field in ("active_branch", "timestamp"):
+        del replayed[field], original[field]
+    assert replayed == original
+
+    # A new working set hash rebuilds the response
+    mock_memory_bank.dolt_reader.read_working_set_hash.return_value = uuid.uuid4().hex
+    third = client_with_mock_bank.get("/api/v1/blocks")
+    assert third.headers["etag"] != first.headers["etag"]
+    assert mock_memory_bank.query_memory_block_page.call_count == 2
+
+
+def test_get_all_blocks_does_not_cache_failed_query(client_with_mock_bank, mock_memory_bank):
+    """Test a database error is answered with 500 and not replayed once Dolt recovers."""
+    mock_memory_bank.dolt_reader = MagicMock()
+    mock_memory_bank.dolt_reader.read_working_set_hash.return_value = uuid.uuid4().hex
+    mock_memory_bank.dolt_writer = MagicMock()
+    mock_memory_bank.dolt_writer.active_branch = "main"
+    mock_memory_bank.query_memory_block_page.side_effect = [
+        Exception("DB down"),
+        BlockPage(_stream_blocks(1), 1),
+    ]
+
+    failed = client_with_mock_bank.get("/api/v1/blocks")
+    recovered = client_with_mock_bank.get("/api/v1/blocks")
+
+    assert failed.status_code == 500
+    assert "etag" not in failed.headers
+    assert recovered.status_code == 200
+    assert [block["id"] for block in recovered.json()["blocks"]] == ["stream-block-0"]
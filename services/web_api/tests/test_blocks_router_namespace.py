@@ -59,8 +59,12 @@ def mock_memory_bank():
     # All blocks combined
     all_blocks = legacy_blocks + custom_blocks
 
-    # Mock get_all_memory_blocks to return all blocks (filtering happens in the router)
-    bank.get_all_memory_blocks.return_value = all_blocks
+    # Answer queries by evaluating the BlockQuery against all blocks (filtering happens in SQL)
+    def query_memory_block_page(query, branch=None):
+        matched = [block for block in all_blocks if query.matches(block)]
+        return query.page([block.model_dump() for block in matched], matched)
+
+    bank.query_memory_block_page.side_effect = query_memory_block_page
 
     # Mock dolt_writer for active branch
     bank.dolt_writer.active_branch = "feat/namespaces"
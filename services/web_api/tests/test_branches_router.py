@@ -2,6 +2,7 @@ import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import MagicMock, patch
 import datetime
+import uuid
 
 from services.web_api.app import app
 from infra_core.memory_system.structured_memory_bank import StructuredMemoryBank
@@ -288,3 +289,84 @@ def test_get_all_branches_json_serialization(mock_dolt_tool, client_with_mock_ba
     assert branch["remote"] == "upstream"
     assert branch["branch"] == "test-branch"
     assert branch["dirty"] is True
+
+
+@patch("services.web_api.routes.branches_router.dolt_list_branches_tool")
+def test_get_all_branches_not_modified(
+    mock_dolt_tool, client_with_mock_bank, mock_memory_bank, sample_branches_data
+):
+    """Test unchanged branch heads answer If-None-Match with 304 without listing branches."""
+    mock_memory_bank.branch = "main"
+    mock_memory_bank.dolt_reader = MagicMock()
+    mock_memory_bank.dolt_reader.read_branches_state_hash.return_value = uuid.uuid4().hex
+    mock_dolt_tool.return_value = DoltListBranchesOutput(
+        success=True,
+        branches=sample_branches_data,
+        active_branch="main",
+        message="Found 2 branches. Current branch: main",
+        timestamp=datetime.datetime.utcnow(),
+    )
+
+    response = client_with_mock_bank.get("/api/v1/branches")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    not_modified = client_with_mock_bank.get("/api/v1/branches", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert mock_dolt_tool.call_count == 1
+
+    # A new commit on any branch changes the ETag
+    mock_memory_bank.dolt_reader.read_branches_state_hash.return_value = uuid.uuid4().hex
+    modified = client_with_mock_bank.get("/api/v1/branches", headers={"If-None-Match": etag})
+    assert modified.status_code == 200
+    assert modified.headers["etag"] != etag
+    assert mock_dolt_tool.call_count == 2
+
+
+@patch("services.web_api.routes.branches_router.dolt_list_branches_tool")
+def test_get_all_branches_replay_refreshes_branch_context(
+    mock_dolt_tool, client_with_mock_bank, mock_memory_bank, sample_branches_data
+):
+    """Test a replayed branch listing carries this request's timestamp and active branch."""
+    mock_memory_bank.branch = "main"
+    mock_memory_bank.dolt_reader = MagicMock()
+    mock_memory_bank.dolt_reader.read_branches_state_hash.return_value = uuid.uuid4().hex
+    mock_memory_bank.dolt_writer = MagicMock()
+    mock_memory_bank.dolt_writer.active_branch = "main"
+    mock_dolt_tool.return_value = DoltListBranchesOutput(
+        success=True,
+        branches=sample_branches_data,
+        active_branch="main",
+        message="Found 2 branches. Current branch: main",
+        timestamp=datetime.datetime.utcnow(),
+    )
+
+    first = client_with_mock_bank.get("/api/v1/branches").json()
+    mock_memory_bank.dolt_writer.active_branch = "feat/test-feature"
+    second = client_with_mock_bank.get("/api/v1/branches").json()
+
+    assert mock_dolt_tool.call_count == 1
+    assert second["active_branch"] == "feat/test-feature"
+    assert second["timestamp"] >= first["timestamp"]
+    assert second["branches"] == first["branches"]
+
+
+def test_get_all_branches_does_not_cache_failed_listing(
+    client_with_mock_bank, mock_memory_bank, sample_branches_data
+):
+    """Test a failed branch listing is answered with 500 and not replayed once Dolt recovers."""
+    mock_memory_bank.branch = "main"
+    mock_memory_bank.dolt_reader = MagicMock()
+    mock_memory_bank.dolt_reader.read_branches_state_hash.return_value = uuid.uuid4().hex
+    mock_memory_bank.dolt_reader._execute_query.return_value = [{"branch": "main"}]
+    mock_memory_bank.dolt_reader.list_branches.side_effect = [
+        Exception("DB down"),
+        ([branch.model_dump() for branch in sample_branches_data], "main"),
+    ]
+
+    failed = client_with_mock_bank.get("/api/v1/branches")
+    recovered = client_with_mock_bank.get("/api/v1/branches")
+
+    assert failed.status_code == 500
+    assert recovered.status_code == 200
+    assert recovered.json()["total_branches"] == 2
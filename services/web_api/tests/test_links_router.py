@@ -5,6 +5,7 @@ These tests ensure the links API endpoints work correctly and handle
 error cases appropriately.
 """
 
+import asyncio
 import pytest
 import uuid
 from datetime import datetime
@@ -318,6 +319,32 @@ class TestGetLinksFrom:
             if hasattr(app.state, "memory_bank"):
                 delattr(app.state, "memory_bank")
 
+    def test_get_links_from_runs_query_off_event_loop(
+        self, client, mock_memory_bank, mock_link_manager, valid_uuids
+    ):
+        """Test the blocking link query runs in the threadpool, not on the event loop."""
+        on_event_loop = []
+
+        def links_from(block_id, query):
+            try:
+                asyncio.get_running_loop()
+                on_event_loop.append(True)
+            except RuntimeError:
+                on_event_loop.append(False)
+            return LinkQueryResult(links=[], next_cursor=None)
+
+        mock_link_manager.links_from.side_effect = links_from
+
+        setattr(app.state, "memory_bank", mock_memory_bank)
+        try:
+            response = client.get(f"/api/v1/links/from/{valid_uuids['block_id']}")
+
+            assert response.status_code == 200
+            assert on_event_loop == [False]
+        finally:
+            if hasattr(app.state, "memory_bank"):
+                delattr(app.state, "memory_bank")
+
     def test_get_links_from_with_filters(
         self, client, mock_memory_bank, mock_link_manager, valid_uuids, sample_block_links
     ):
@@ -976,6 +1003,22 @@ class TestLinksPagination:
             if hasattr(app.state, "memory_bank"):
                 delattr(app.state, "memory_bank")
 
+    def test_undecodable_cursor_returns_400(self, client, mock_memory_bank, mock_link_manager):
+        """Test that a well-formed but undecodable cursor is rejected with 400."""
+        mock_link_manager.get_all_links.side_effect = ValueError(
+            "Invalid pagination cursor: stale"
+        )
+
+        setattr(app.state, "memory_bank", mock_memory_bank)
+        try:
+            response = client.get("/api/v1/links?cursor=stale")
+
+            assert response.status_code == 400
+            assert "Invalid pagination cursor" in response.json()["detail"]
+        finally:
+            if hasattr(app.state, "memory_bank"):
+                delattr(app.state, "memory_bank")
+
     def test_pagination_complete_page_returns_200(
         self, client, mock_memory_bank, mock_link_manager, sample_block_links
     ):
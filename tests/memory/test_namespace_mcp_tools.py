@@ -82,11 +82,11 @@ class TestNamespaceMCPTools:
 
         bank.get_all_memory_blocks.side_effect = mock_get_all_memory_blocks
 
-        # Mock query_semantic to return current state of all tracked blocks
-        def mock_query_semantic(query_text, top_k=None):
-            return bank._all_blocks.copy()
+        # Mock semantic search to return current state of all tracked blocks
+        def mock_query_semantic_with_scores(query_text, top_k=None, **filters):
+            return [(block, 1.0) for block in bank._all_blocks]
 
-        bank.query_semantic.side_effect = mock_query_semantic
+        bank.query_semantic_with_scores.side_effect = mock_query_semantic_with_scores
 
         bank.dolt_writer.active_branch = "feat/namespaces"
 